@@ -1,5 +1,9 @@
-"""Build hooks for compiling the frontend during Python package build."""
+"""Build hooks for the Python package build.
 
+Regenerates the static tool manifest and compiles the frontend.
+"""
+
+import importlib.util
 import os
 import shutil
 import subprocess
@@ -19,6 +23,8 @@ class CustomBuildHook(BuildHookInterface):
         """Initialize the build hook and compile frontend if needed."""
         super().initialize(version, build_data)
         
+        self._write_tool_manifest()
+        
         # Only build frontend for wheel builds (not sdist)
         if self.target_name != "wheel":
             return
@@ -50,6 +56,16 @@ class CustomBuildHook(BuildHookInterface):
                 print("Node.js not available, including source files only")
                 print("Users will need Node.js for development mode")
     
+    def _write_tool_manifest(self) -> None:
+        """Regenerate voice_mode/tools/_tool_manifest.py from the tool modules."""
+        builder = Path(self.root) / "voice_mode" / "tools" / "_manifest.py"
+        # Load by path: importing voice_mode.tools would register every tool
+        spec = importlib.util.spec_from_file_location("_voicemode_tool_manifest", builder)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        if module.write_manifest():
+            print(f"Updated tool manifest: {module.MANIFEST_FILE}")
+    
     def _check_nodejs(self) -> bool:
         """Check if Node.js is available."""
         try:
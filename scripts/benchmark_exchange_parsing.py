@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark exchange log parsing over a synthetic month of logs.
+
+Compares the eager parse (stdlib json + ExchangeMetadata for every line)
+with the lazy fast path, with and without orjson, and with the raw-line
+type pre-filter.
+
+Usage:
+    python scripts/benchmark_exchange_parsing.py [--per-day 5000] [--days 30]
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voice_mode.exchanges import models
+from voice_mode.exchanges.models import Exchange, ExchangeMetadata, parse_timestamp
+from voice_mode.exchanges.reader import ExchangeReader
+
+WORDS = "the quick brown fox jumps over a lazy dog while voice mode keeps talking".split()
+
+
+def write_month(base_dir: Path, days: int, per_day: int) -> int:
+    """Write synthetic exchange logs, returning the number of lines."""
+    rng = random.Random(42)
+    logs_dir = base_dir / "logs" / "conversations"
+    logs_dir.mkdir(parents=True, exist_ok=True)
+    start = datetime.now(timezone.utc) - timedelta(days=days - 1)
+    total = 0
+    for day in range(days):
+        day_start = start + timedelta(days=day)
+        log_file = logs_dir / f"exchanges_{day_start.strftime('%Y-%m-%d')}.jsonl"
+        with open(log_file, "w") as f:
+            for i in range(per_day):
+                type_ = "stt" if i % 2 == 0 else "tts"
+                entry = {
+                    "version": 2,
+                    "timestamp": (day_start + timedelta(seconds=i)).isoformat(),
+                    "conversation_id": f"conv_{day}_{i // 20}",
+                    "type": type_,
+                    "text": " ".join(rng.choices(WORDS, k=rng.randint(5, 30))),
+                    "project_path": "/home/user/project",
+                    "metadata": {
+                        "voice_mode_version": "6.1.1",
+                        "model": "whisper-1" if type_ == "stt" else "tts-1",
+                        "voice": None if type_ == "stt" else "af_sky",
+                        "provider": "whisper" if type_ == "stt" else "kokoro",
+                        "transport": "local",
+                        "timing": "record 3.2s, stt 1.4s" if type_ == "stt" else "ttfa 0.4s, gen 1.1s, play 3.0s",
+                    },
+                }
+                f.write(json.dumps(entry) + "\n")
+                total += 1
+    return total
+
+
+def eager_parse(line: str) -> Exchange:
+    """The pre-optimisation parse: stdlib json and eager metadata."""
+    data = json.loads(line)
+    return Exchange(
+        version=data.get("version", 1),
+        timestamp=parse_timestamp(data["timestamp"]),
+        conversation_id=data["conversation_id"],
+        type=data["type"],
+        text=data["text"],
+        project_path=data.get("project_path"),
+        audio_file=data.get("audio_file"),
+        duration_ms=data.get("duration_ms"),
+        metadata=ExchangeMetadata.from_dict(data["metadata"]),
+    )
+
+
+def timed(label: str, lines: int, func) -> float:
+    start = time.perf_counter()
+    count = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed:7.3f}s  {lines / elapsed:>12,.0f} lines/s  ({count} results)")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--per-day", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir = Path(tmp)
+        total = write_month(base_dir, args.days, args.per_day)
+        reader = ExchangeReader(base_dir=base_dir)
+        files = reader._log_files()
+        print(f"{total:,} lines in {len(files)} files (orjson available: {models.ORJSON_AVAILABLE})\n")
+
+        def eager():
+            count = 0
+            for log_file in files:
+                with open(log_file) as f:
+                    for line in f:
+                        count += eager_parse(line).type == "stt"
+            return count
+
+        def lazy():
+            return sum(1 for e in reader._read_all() if e.type == "stt")
+
+        def lazy_prefiltered():
+            return sum(1 for f in files for _ in reader._read_file(f, exchange_type="stt"))
+
+        def lazy_with_metadata():
+            return sum(1 for e in reader._read_all() if e.metadata.provider == "whisper")
+
+        timed("eager (json, metadata per line)", total, eager)
+
+        fast_loads = models._json_loads
+        models._json_loads = json.loads
+        try:
+            timed("lazy (json)", total, lazy)
+        finally:
+            models._json_loads = fast_loads
+
+        if models.ORJSON_AVAILABLE:
+            timed("lazy (orjson)", total, lazy)
+        timed("lazy + type pre-filter", total, lazy_prefiltered)
+        timed("lazy, metadata accessed", total, lazy_with_metadata)
+
+
+if __name__ == "__main__":
+    main()
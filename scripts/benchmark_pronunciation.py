@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark pronunciation rule application for growing rule sets.
+
+Compares applying rules one re.sub at a time (the logging path) with the
+compiled rule set, both without memoisation and with repeated texts served
+from its cache. Rule sets are the bundled defaults plus synthetic
+word-bounded tech terms.
+
+Usage:
+    python scripts/benchmark_pronunciation.py [--sizes 10,100,500] [--texts 2000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voice_mode.pronounce import PronounceManager, PronounceRule
+from voice_mode.pronounce_engine import CompiledRuleSet
+
+WORDS = "the quick brown fox uses AWS and JSON over SSH while python runs 2.4 GHz tee mux".split()
+DEFAULTS = Path(__file__).parent.parent / "voice_mode" / "data" / "default_pronunciation.yaml"
+
+
+def make_rules(size: int, rng: random.Random) -> list:
+    """Default TTS rules topped up with synthetic terms to ``size`` rules."""
+    rules = list(PronounceManager([DEFAULTS]).rules["tts"])
+    for i in range(max(0, size - len(rules))):
+        term = "".join(rng.choices("bcdfghjklmnpqrstvwxz", k=rng.randint(3, 6))) + str(i)
+        rules.append(PronounceRule(f"term_{i}", rf"\b{term}\b", term.upper().replace("", " ").strip()))
+    return rules[:size]
+
+
+def make_texts(count: int, rules: list, rng: random.Random) -> list:
+    terms = [r.pattern[2:-2] for r in rules if r.name.startswith("term_")] or WORDS
+    texts = []
+    for _ in range(count):
+        words = rng.choices(WORDS, k=rng.randint(10, 40)) + rng.choices(terms, k=3)
+        rng.shuffle(words)
+        texts.append(" ".join(words))
+    return texts
+
+
+def sequential(rules: list, text: str) -> str:
+    for rule in rules:
+        text, _ = rule.apply(text)
+    return text
+
+
+def timed(label: str, texts: list, func) -> float:
+    start = time.perf_counter()
+    for text in texts:
+        func(text)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed * 1e6 / len(texts):9.1f} µs/text")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10,100,500", help="Comma-separated rule counts")
+    parser.add_argument("--texts", type=int, default=2000)
+    args = parser.parse_args()
+
+    for size in (int(s) for s in args.sizes.split(",")):
+        rng = random.Random(42)
+        rules = make_rules(size, rng)
+        texts = make_texts(args.texts, rules, rng)
+
+        start = time.perf_counter()
+        engine = CompiledRuleSet(rules, cache_size=0)
+        compile_ms = (time.perf_counter() - start) * 1000
+        assert all(engine.apply(t) == sequential(rules, t) for t in texts[:200])
+
+        print(f"{len(rules)} rules -> {engine.passes} passes (compiled in {compile_ms:.1f} ms)")
+        base = timed("sequential re.sub", texts, lambda t: sequential(rules, t))
+        fast = timed("compiled", texts, engine.apply)
+        cached = CompiledRuleSet(rules)
+        repeated = texts[:50] * (len(texts) // 50)
+        for text in repeated[:50]:
+            cached.apply(text)
+        timed("compiled, repeated texts", repeated, cached.apply)
+        print(f"  speedup {base / fast:.1f}x\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -31,6 +31,8 @@ from flask import Flask, render_template_string, jsonify, send_file, request
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from voice_mode.core import get_audio_path
+from voice_mode.timings import format_timings
+from voice_mode.utils.log_archive import iter_lines, list_log_files
 
 app = Flask(__name__)
 
@@ -124,33 +126,32 @@ def read_jsonl_exchanges() -> List[Dict[str, Any]]:
         return exchanges
     
     # Read all JSONL files
-    for jsonl_file in sorted((LOGS_DIR / "conversations").glob("exchanges_*.jsonl")):
+    for jsonl_file in list_log_files(LOGS_DIR / "conversations", "exchanges_*.jsonl"):
         try:
-            with open(jsonl_file, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            entry = json.loads(line)
-                            # Convert JSONL format to exchange format
-                            exchange = {
-                                "filepath": str(jsonl_file),
-                                "filename": f"{entry['type']}_{entry['timestamp'].replace(':', '-')}.txt",
-                                "metadata": {
-                                    "file_timestamp": entry.get("timestamp"),
-                                    "project_path": entry.get("project_path"),
-                                    "conversation_id": entry.get("conversation_id"),
-                                    "model": entry.get("metadata", {}).get("model"),
-                                    "voice": entry.get("metadata", {}).get("voice"),
-                                    "provider": entry.get("metadata", {}).get("provider"),
-                                    "timing": entry.get("metadata", {}).get("timing"),
-                                },
-                                "transcript": entry.get("text", ""),
-                                "type": entry.get("type", "unknown"),
-                                "audio_path": entry.get("audio_file")
-                            }
-                            exchanges.append(exchange)
-                        except json.JSONDecodeError:
-                            continue
+            for line in iter_lines(jsonl_file):
+                try:
+                    entry = json.loads(line)
+                    # Convert JSONL format to exchange format
+                    exchange = {
+                        "filepath": str(jsonl_file),
+                        "filename": f"{entry['type']}_{entry['timestamp'].replace(':', '-')}.txt",
+                        "metadata": {
+                            "file_timestamp": entry.get("timestamp"),
+                            "project_path": entry.get("project_path"),
+                            "conversation_id": entry.get("conversation_id"),
+                            "model": entry.get("metadata", {}).get("model"),
+                            "voice": entry.get("metadata", {}).get("voice"),
+                            "provider": entry.get("metadata", {}).get("provider"),
+                            # v4 logs carry numeric timings instead of a string
+                            "timing": entry.get("metadata", {}).get("timing") or format_timings(entry.get("timings")) or None,
+                        },
+                        "transcript": entry.get("text", ""),
+                        "type": entry.get("type", "unknown"),
+                        "audio_path": entry.get("audio_file")
+                    }
+                    exchanges.append(exchange)
+                except json.JSONDecodeError:
+                    continue
         except Exception as e:
             print(f"Error reading JSONL file {jsonl_file}: {e}")
     
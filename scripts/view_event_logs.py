@@ -18,6 +18,8 @@ from collections import defaultdict
 from typing import Dict, List, Any, Optional
 import statistics
 
+from voice_mode.utils.log_archive import iter_lines, list_log_files, resolve_log_file
+
 
 def parse_timestamp(ts: str) -> datetime:
     """Parse ISO timestamp string to datetime."""
@@ -35,13 +37,8 @@ def format_duration(seconds: float) -> str:
 
 
 def load_events(log_file: Path) -> List[Dict[str, Any]]:
-    """Load all events from a log file."""
-    events = []
-    with open(log_file, 'r') as f:
-        for line in f:
-            if line.strip():
-                events.append(json.loads(line))
-    return events
+    """Load all events from a log file (plain or compressed)."""
+    return [json.loads(line) for line in iter_lines(log_file)]
 
 
 def group_by_session(events: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
@@ -336,7 +333,7 @@ def main():
             print(f"Log directory not found: {log_dir}")
             sys.exit(1)
         
-        log_files = sorted(log_dir.glob("*.jsonl"))
+        log_files = list_log_files(log_dir, "*.jsonl")
         if not log_files:
             print(f"No log files found in {log_dir}")
             sys.exit(1)
@@ -344,9 +341,12 @@ def main():
         log_file = log_files[-1]
         print(f"Using latest log file: {log_file}")
     
-    if not log_file.exists():
+    # Fall back to the archived copy of an old log
+    resolved = resolve_log_file(log_file)
+    if resolved is None:
         print(f"Log file not found: {log_file}")
         sys.exit(1)
+    log_file = resolved
     
     # Load events
     events = load_events(log_file)
@@ -0,0 +1,135 @@
+"""Tests for cross-process audio arbitration."""
+
+import asyncio
+import subprocess
+import sys
+import time
+
+import pytest
+
+from voice_mode.audio_arbiter import (
+    PRIORITY_HIGH,
+    AudioArbiter,
+    AudioBusyError,
+    fcntl,
+)
+
+pytestmark = pytest.mark.skipif(fcntl is None, reason="requires fcntl")
+
+HOLD_LOCK = """
+import fcntl, os, sys, time
+fd = os.open(sys.argv[1], os.O_RDWR | os.O_CREAT)
+fcntl.flock(fd, fcntl.LOCK_EX)
+print("locked", flush=True)
+time.sleep(float(sys.argv[2]))
+"""
+
+
+@pytest.fixture
+def arbiter(tmp_path):
+    return AudioArbiter(tmp_path / "locks", poll_interval=0.01, local_lock=asyncio.Lock())
+
+
+def hold_in_other_process(arbiter, seconds):
+    arbiter.lock_dir.mkdir(parents=True, exist_ok=True)
+    process = subprocess.Popen(
+        [sys.executable, "-c", HOLD_LOCK, str(arbiter.lock_file), str(seconds)],
+        stdout=subprocess.PIPE, text=True,
+    )
+    assert process.stdout.readline().strip() == "locked"
+    return process
+
+
+def add_ticket(arbiter, priority, pid):
+    arbiter.queue_dir.mkdir(parents=True, exist_ok=True)
+    ticket = arbiter.queue_dir / f"{priority:03d}-{time.time_ns():020d}-{pid}-deadbeef.ticket"
+    ticket.touch()
+    return ticket
+
+
+class TestAudioArbiter:
+    async def test_waits_for_other_process(self, arbiter):
+        process = hold_in_other_process(arbiter, 0.3)
+        try:
+            start = time.perf_counter()
+            async with arbiter.turn():
+                assert arbiter.held
+                waited = time.perf_counter() - start
+        finally:
+            process.wait()
+        assert waited >= 0.2
+        assert not arbiter.held
+        assert list(arbiter.queue_dir.iterdir()) == []
+
+    async def test_timeout_raises_busy(self, arbiter):
+        process = hold_in_other_process(arbiter, 5)
+        try:
+            with pytest.raises(AudioBusyError, match="in use by another VoiceMode session"):
+                async with arbiter.turn(timeout=0.1):
+                    pass
+        finally:
+            process.kill()
+            process.wait()
+        assert not arbiter.local_lock.locked()
+
+    async def test_queue_order_respected(self, arbiter):
+        sleeper = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            ahead = add_ticket(arbiter, PRIORITY_HIGH, sleeper.pid)
+            entered = asyncio.Event()
+
+            async def turn():
+                async with arbiter.turn():
+                    entered.set()
+
+            task = asyncio.ensure_future(turn())
+            await asyncio.sleep(0.1)
+            assert not entered.is_set()  # a live, higher-priority waiter goes first
+            ahead.unlink()
+            await asyncio.wait_for(task, timeout=2)
+            assert entered.is_set()
+        finally:
+            sleeper.kill()
+            sleeper.wait()
+
+    async def test_dead_waiters_are_pruned(self, arbiter):
+        dead = subprocess.Popen([sys.executable, "-c", "pass"])
+        dead.wait()
+        stale = add_ticket(arbiter, PRIORITY_HIGH, dead.pid)
+        async with arbiter.turn(timeout=1):
+            pass
+        assert not stale.exists()
+
+    async def test_lock_handed_to_next_local_turn(self, arbiter):
+        releases = []
+        unlock = arbiter._unlock
+        arbiter._unlock = lambda: (releases.append(arbiter._fd), unlock())
+        order = []
+
+        async def turn(name):
+            async with arbiter.turn():
+                order.append((name, arbiter._fd))
+                await asyncio.sleep(0.02)
+
+        await asyncio.gather(turn("first"), turn("second"))
+        assert [name for name, _ in order] == ["first", "second"]
+        assert order[0][1] == order[1][1]  # same lock, never released in between
+        assert len(releases) == 1 and not arbiter.held
+
+    async def test_no_handoff_when_other_process_waits(self, arbiter):
+        sleeper = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            async def second():
+                async with arbiter.turn():
+                    pass
+
+            async with arbiter.turn():
+                ahead = add_ticket(arbiter, PRIORITY_HIGH, sleeper.pid)
+                waiting = asyncio.ensure_future(second())
+                await asyncio.sleep(0.02)
+            assert not arbiter.held  # released for the other process, not handed over
+            ahead.unlink()
+            await asyncio.wait_for(waiting, timeout=2)
+        finally:
+            sleeper.kill()
+            sleeper.wait()
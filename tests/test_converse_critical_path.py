@@ -3,6 +3,8 @@ Critical path tests for the converse tool.
 These tests ensure the converse tool handles all failure modes gracefully.
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 from datetime import datetime
@@ -284,5 +286,35 @@ class TestConverseMetrics:
             assert 'ms' in result or ': ' in result and 's' in result  # Timing like "gen: 0.0s"
 
 
+class TestConverseTracing:
+    """Test that a failed turn is traced as an error."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("failure, error", [
+        (RuntimeError("popup broke"), "RuntimeError"),
+        (asyncio.CancelledError(), "CancelledError"),
+    ])
+    async def test_failed_turn_span_has_error_status(self, tmp_path, failure, error):
+        """Test that caught errors and cancellation both mark the converse span."""
+        from voice_mode.tools import converse
+        from voice_mode.utils.tracing import Tracer, iter_spans, set_tracer
+
+        tracer = Tracer(tmp_path)
+        previous = set_tracer(tracer)
+        try:
+            with patch('voice_mode.utils.notify_popup.show_popup', AsyncMock(side_effect=failure)), \
+                 patch.object(converse, 'wait_for_services', AsyncMock(return_value={})):
+                try:
+                    await converse.converse.fn(message="Test", transport="notify")
+                except asyncio.CancelledError:
+                    pass
+        finally:
+            set_tracer(previous)
+        tracer.flush()
+        turn = next(r for r in iter_spans(tmp_path) if r["name"] == "converse")
+        assert turn["status"] == "error"
+        assert turn["attributes"]["error"] == error
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -0,0 +1,190 @@
+"""Tests for the VoiceMode daemon and its socket protocol."""
+
+import asyncio
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from voice_mode.daemon import (
+    DaemonError,
+    DaemonUnavailable,
+    VoiceModeDaemon,
+    acall,
+    call,
+    config_fingerprint,
+    daemon_converse,
+    is_running,
+)
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are limited to ~100 bytes, so avoid pytest's long tmp_path
+    directory = tempfile.mkdtemp(prefix="vm-", dir="/tmp")
+    yield Path(directory) / "daemon.sock"
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+async def daemon(socket_path):
+    state = {"cancelled": False}
+
+    async def echo(**params):
+        return params
+
+    async def fail(message):
+        raise ValueError(message)
+
+    async def hang():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            state["cancelled"] = True
+            raise
+
+    server = VoiceModeDaemon(socket_path, handlers={"echo": echo, "fail": fail, "hang": hang})
+    server.state = state
+    await server.start()
+    yield server
+    await server.stop()
+
+
+class TestProtocol:
+    async def test_round_trip(self, daemon):
+        result = await acall("echo", {"voice": "nova", "speed": 1.5}, daemon.socket_path)
+        assert result == {"voice": "nova", "speed": 1.5}
+
+    async def test_blocking_client(self, daemon):
+        result = await asyncio.to_thread(call, "echo", {"a": 1}, daemon.socket_path, 5)
+        assert result == {"a": 1}
+        ping = await asyncio.to_thread(call, "ping", None, daemon.socket_path, 5)
+        assert ping["requests"] == 2 and ping["socket"] == str(daemon.socket_path)
+
+    async def test_errors_are_reported(self, daemon):
+        with pytest.raises(DaemonError) as excinfo:
+            await acall("fail", {"message": "bad voice"}, daemon.socket_path)
+        assert str(excinfo.value) == "bad voice"
+        assert excinfo.value.error_type == "ValueError"
+
+        with pytest.raises(DaemonError, match="Unknown method"):
+            await acall("nope", None, daemon.socket_path)
+        with pytest.raises(DaemonError) as excinfo:
+            await acall("fail", {"wrong": 1}, daemon.socket_path)
+        assert excinfo.value.error_type == "TypeError"
+
+    async def test_disconnect_cancels_request(self, daemon):
+        request = asyncio.ensure_future(acall("hang", None, daemon.socket_path))
+        await asyncio.sleep(0.1)
+        request.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await request
+        for _ in range(50):
+            if daemon.state["cancelled"]:
+                break
+            await asyncio.sleep(0.02)
+        assert daemon.state["cancelled"]
+
+    async def test_shutdown(self, socket_path):
+        server = VoiceModeDaemon(socket_path, handlers={})
+        await server.start()
+        serving = asyncio.ensure_future(server.serve_forever())
+        assert await acall("shutdown", None, socket_path) is True
+        await asyncio.wait_for(serving, timeout=5)
+        assert not socket_path.exists()
+
+
+class TestSocketLifecycle:
+    def test_no_daemon(self, socket_path):
+        assert not is_running(socket_path)
+        with pytest.raises(DaemonUnavailable):
+            call("ping", socket_path=socket_path, timeout=1)
+
+    async def test_stale_socket_is_replaced(self, socket_path):
+        import socket
+        stale = socket.socket(socket.AF_UNIX)
+        stale.bind(str(socket_path))
+        stale.close()  # bound but nobody listening
+        assert not is_running(socket_path)
+
+        server = VoiceModeDaemon(socket_path, handlers={})
+        await server.start()
+        try:
+            assert (await acall("ping", None, socket_path))["requests"] == 1
+            with pytest.raises(RuntimeError, match="already running"):
+                await VoiceModeDaemon(socket_path, handlers={}).start()
+        finally:
+            await server.stop()
+
+
+class TestConfigMatching:
+    async def test_same_settings_forward_to_daemon(self, socket_path):
+        async def converse(**params):
+            return f"spoke {params['message']}"
+
+        server = VoiceModeDaemon(socket_path, handlers={"converse": converse})
+        await server.start()
+        try:
+            assert (await acall("ping", None, socket_path))["config"] == config_fingerprint()
+            remote = await asyncio.to_thread(daemon_converse, socket_path)
+            assert remote is not None
+            assert await remote(message="Hi") == "spoke Hi"
+        finally:
+            await server.stop()
+
+    async def test_different_settings_run_in_process(self, socket_path):
+        async def ping():
+            return {"pid": 1, "config": "fingerprint of another environment"}
+
+        server = VoiceModeDaemon(socket_path, handlers={"ping": ping})
+        await server.start()
+        try:
+            assert await asyncio.to_thread(daemon_converse, socket_path) is None
+        finally:
+            await server.stop()
+
+    def test_fingerprint_covers_shell_settings(self, monkeypatch):
+        base = config_fingerprint()
+        monkeypatch.setenv("VOICEMODE_DAEMON_SOCKET", "/tmp/elsewhere.sock")
+        assert config_fingerprint() == base
+        monkeypatch.setenv("VOICEMODE_VOICES", "nova")
+        assert config_fingerprint() != base
+
+    def test_fingerprint_covers_project_env_file(self, monkeypatch, tmp_path):
+        from voice_mode import config
+
+        monkeypatch.delenv("VOICEMODE_VOICES", raising=False)
+        base = config_fingerprint()
+        (tmp_path / ".voicemode.env").write_text("VOICEMODE_VOICES=nova\n")
+        monkeypatch.chdir(tmp_path)
+        try:
+            config.load_voicemode_env()
+            assert config_fingerprint() != base
+        finally:
+            monkeypatch.undo()
+            config.load_voicemode_env()
+
+    def test_no_daemon(self, socket_path):
+        assert daemon_converse(socket_path) is None
+
+
+class TestCliForwarding:
+    def test_converse_runs_in_daemon(self):
+        from voice_mode.cli import voice_mode_main_cli
+
+        calls = []
+
+        async def remote(**params):
+            calls.append(params)
+            return "✓ Message spoken successfully"
+
+        with patch("voice_mode.daemon.daemon_converse", return_value=remote), \
+             patch("voice_mode.utils.dependencies.checker.check_component_dependencies") as deps:
+            result = CliRunner().invoke(voice_mode_main_cli, ["converse", "-m", "Hi", "--no-wait", "--daemon"])
+
+        assert result.exit_code == 0, result.output
+        assert calls and calls[0]["message"] == "Hi" and calls[0]["wait_for_response"] is False
+        deps.assert_not_called()  # the local audio stack is never touched
@@ -0,0 +1,126 @@
+"""Tests for resumable, segmented downloads against a local HTTP server."""
+
+import hashlib
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from voice_mode.utils import download
+from voice_mode.utils.download import DownloadError, download_with_progress, fetch
+
+PAYLOAD = os.urandom(600 * 1024 + 123)
+SHA256 = hashlib.sha256(PAYLOAD).hexdigest()
+
+
+class Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, self.headers.get("Range")))
+        if self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/file")
+            self.send_header("X-Linked-Etag", f'"{server.published_sha256}"')
+            self.end_headers()
+            return
+        if self.path != "/file":
+            self.send_error(404)
+            return
+        body, status = server.payload, 200
+        start = 0
+        requested = self.headers.get("Range")
+        if requested and server.ranges:
+            first, _, last = requested.removeprefix("bytes=").partition("-")
+            start, end = int(first), int(last) if last else len(body) - 1
+            body, status = body[start:end + 1], 206
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", '"v1"')
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{start + len(body) - 1}/{len(server.payload)}")
+        self.end_headers()
+        if server.cut_after is not None and len(body) > 1:
+            # Drop the connection part way through
+            self.wfile.write(body[:server.cut_after])
+            return
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.payload, httpd.ranges, httpd.cut_after = PAYLOAD, True, None
+    httpd.requests, httpd.published_sha256 = [], SHA256
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def small_segments(monkeypatch):
+    monkeypatch.setattr(download, "MIN_SEGMENT_SIZE", 128 * 1024)
+    monkeypatch.setattr(download, "CHUNK_SIZE", 16 * 1024)
+    monkeypatch.setattr(download, "CHECKPOINT_INTERVAL", 32 * 1024)
+    monkeypatch.setattr(download, "RETRIES", 0)
+
+
+def test_parallel_segments(server, tmp_path):
+    target = tmp_path / "model.bin"
+    progress = []
+    fetch(f"{server.url}/file", target, sha256=SHA256, segments=4, progress=lambda done, total: progress.append((done, total)))
+    assert target.read_bytes() == PAYLOAD
+    assert not list(tmp_path.glob("*.part*"))
+    ranges = sorted(r for _, r in server.requests[1:])
+    assert len(ranges) == 4 and ranges[0].startswith("bytes=0-")
+    assert progress[-1] == (len(PAYLOAD), len(PAYLOAD))
+
+
+def test_resumes_interrupted_download(server, tmp_path):
+    target = tmp_path / "model.bin"
+    server.cut_after = 100 * 1024
+    with pytest.raises(DownloadError):
+        fetch(f"{server.url}/file", target, segments=1)
+    assert not target.exists()
+    state = json.loads((tmp_path / "model.bin.part.json").read_text())
+    assert state["segments"][0]["done"] == 100 * 1024
+    assert (tmp_path / "model.bin.part").stat().st_size == len(PAYLOAD)  # preallocated
+
+    server.cut_after, server.requests = None, []
+    fetch(f"{server.url}/file", target, sha256=SHA256, segments=1)
+    assert target.read_bytes() == PAYLOAD
+    assert server.requests[-1] == ("/file", f"bytes={100 * 1024}-{len(PAYLOAD) - 1}")
+
+
+def test_checksum_mismatch_discards_download(server, tmp_path):
+    target = tmp_path / "model.bin"
+    with pytest.raises(DownloadError, match="SHA-256 mismatch"):
+        fetch(f"{server.url}/file", target, sha256="0" * 64)
+    assert not list(tmp_path.iterdir())
+
+
+def test_verifies_hash_published_on_redirect(server, tmp_path):
+    fetch(f"{server.url}/redirect", tmp_path / "ok.bin")
+    server.published_sha256 = "f" * 64
+    with pytest.raises(DownloadError, match="SHA-256 mismatch"):
+        fetch(f"{server.url}/redirect", tmp_path / "bad.bin")
+
+
+def test_server_without_ranges(server, tmp_path):
+    server.ranges = False
+    fetch(f"{server.url}/file", tmp_path / "model.bin", segments=4)
+    assert (tmp_path / "model.bin").read_bytes() == PAYLOAD
+    assert len(server.requests) == 2  # probe + one full stream
+
+
+def test_download_with_progress_reports_failure(server, tmp_path, capsys):
+    assert download_with_progress(f"{server.url}/file", tmp_path / "model.bin", style="verbose")
+    assert "Download complete: model.bin" in capsys.readouterr().out
+    assert not download_with_progress(f"{server.url}/missing", tmp_path / "missing.bin", quiet=True)
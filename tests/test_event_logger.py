@@ -0,0 +1,88 @@
+"""Tests for the batched event logger."""
+
+import json
+import time
+
+import pytest
+
+from voice_mode.utils.event_logger import EventLogger
+
+
+@pytest.fixture
+def event_logger(temp_dir):
+    event_logger = EventLogger(log_dir=temp_dir, flush_interval=0.05, max_session_events=5)
+    yield event_logger
+    event_logger._cleanup()
+
+
+def _read_events(log_dir):
+    lines = []
+    for log_file in sorted(log_dir.glob("voicemode_events_*.jsonl")):
+        lines.extend(log_file.read_text().splitlines())
+    return [json.loads(line) for line in lines]
+
+
+class TestEventLogger:
+    def test_events_written_with_monotonic_stamps(self, event_logger, temp_dir):
+        event_logger.start_session("conv_test")
+        for i in range(50):
+            event_logger.log_event(EventLogger.TTS_START, {"i": i})
+        assert event_logger.flush()
+
+        events = _read_events(temp_dir)
+        assert len(events) == 51
+        assert events[0]["event_type"] == EventLogger.SESSION_START
+        assert [e["data"]["i"] for e in events[1:]] == list(range(50))
+        stamps = [e["mono_ns"] for e in events]
+        assert stamps == sorted(stamps)
+
+    def test_file_handle_is_reused(self, event_logger):
+        event_logger.log_event(EventLogger.TTS_START)
+        event_logger.flush()
+        handle = event_logger._file
+        event_logger.log_event(EventLogger.TTS_FIRST_AUDIO)
+        event_logger.flush()
+        assert handle is not None and event_logger._file is handle
+
+    def test_idle_logger_flushes_periodically(self, event_logger, temp_dir):
+        event_logger.log_event(EventLogger.STT_START)
+        deadline = time.time() + 2
+        while not _read_events(temp_dir) and time.time() < deadline:
+            time.sleep(0.02)
+        assert len(_read_events(temp_dir)) == 1
+
+    def test_metrics_from_monotonic_stamps(self, event_logger):
+        event_logger.start_session()
+        event_logger.log_event(EventLogger.TTS_START)
+        time.sleep(0.02)
+        event_logger.log_event(EventLogger.TTS_FIRST_AUDIO)
+        # Only the first event of each type counts
+        event_logger.log_event(EventLogger.TTS_FIRST_AUDIO)
+        event_logger.log_event(EventLogger.RECORDING_END)
+        event_logger.log_event(EventLogger.TTS_PLAYBACK_START)
+
+        live = event_logger.get_session_metrics()
+        assert live["ttfa"] >= 0.02
+        assert "session_duration" not in live
+
+        metrics = event_logger.end_session()
+        assert metrics["ttfa"] == live["ttfa"]
+        assert metrics["response_time"] >= 0
+        assert metrics["session_duration"] >= metrics["ttfa"]
+        assert event_logger.get_session_metrics() == {}
+
+    def test_session_history_is_capped(self, event_logger):
+        event_logger.start_session()
+        for i in range(20):
+            event_logger.log_event(EventLogger.STT_COMPLETE, {"i": i})
+        events = event_logger.get_session_events()
+        assert len(events) == 5
+        assert [e.data["i"] for e in events] == list(range(15, 20))
+
+    def test_cleanup_writes_pending_events(self, temp_dir):
+        event_logger = EventLogger(log_dir=temp_dir, flush_interval=60)
+        for _ in range(10):
+            event_logger.log_event(EventLogger.TOOL_REQUEST_START)
+        event_logger._cleanup()
+        assert len(_read_events(temp_dir)) == 10
+        assert event_logger._file is None
@@ -0,0 +1,146 @@
+"""Tests for the FTS5 exchange search index."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from voice_mode.exchanges.index import (
+    ExchangeIndex,
+    build_match_query,
+    HIGHLIGHT_START,
+    HIGHLIGHT_END,
+)
+
+pytestmark = pytest.mark.skipif(
+    not ExchangeIndex.is_available(), reason="SQLite built without FTS5"
+)
+
+
+def _entry(ts, conv_id, type_, text):
+    return {
+        "version": 2,
+        "timestamp": ts.isoformat(),
+        "conversation_id": conv_id,
+        "type": type_,
+        "text": text,
+        "metadata": {"voice_mode_version": "test"},
+    }
+
+
+def _write_log(base_dir, day, entries, mode='w'):
+    logs_dir = base_dir / "logs" / "conversations"
+    logs_dir.mkdir(parents=True, exist_ok=True)
+    log_file = logs_dir / f"exchanges_{day.strftime('%Y-%m-%d')}.jsonl"
+    with open(log_file, mode) as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+    return log_file
+
+
+@pytest.fixture
+def populated(temp_dir):
+    now = datetime.now(timezone.utc)
+    old = now - timedelta(days=30)
+    _write_log(temp_dir, old, [
+        _entry(old, "conv_old", "stt", "Let's talk about the deployment pipeline"),
+        _entry(old + timedelta(seconds=5), "conv_old", "tts", "Sure, the pipeline runs nightly"),
+    ])
+    _write_log(temp_dir, now, [
+        _entry(now - timedelta(minutes=2), "conv_new", "stt", "Deploy the kubernetes cluster please"),
+        _entry(now - timedelta(minutes=1), "conv_new", "tts", "Deploying now. This may take a while."),
+        _entry(now, "conv_new", "stt", "Thanks"),
+    ])
+    with ExchangeIndex(base_dir=temp_dir) as index:
+        index.update()
+        yield index
+
+
+class TestBuildMatchQuery:
+    def test_words_are_quoted(self):
+        assert build_match_query('hello world') == '"hello" "world"'
+
+    def test_fts_syntax_is_neutralised(self):
+        assert build_match_query('NEAR(foo) AND -bar:"x"') == '"NEAR" "foo" "AND" "bar" "x"'
+
+    def test_prefix(self):
+        assert build_match_query('deploy*') == '"deploy"*'
+        assert build_match_query('deploy clu', prefix=True) == '"deploy"* "clu"*'
+
+    def test_empty(self):
+        assert build_match_query('  ?! ') is None
+
+
+class TestExchangeIndex:
+    def test_search_finds_matches(self, populated):
+        hits = populated.search("pipeline")
+        assert {h.exchange.conversation_id for h in hits} == {"conv_old"}
+        assert all(HIGHLIGHT_START in h.snippet and HIGHLIGHT_END in h.snippet for h in hits)
+
+    def test_days_limits_results(self, populated):
+        assert populated.search("pipeline", days=7) == []
+        assert populated.count("pipeline", days=None) == 2
+
+    def test_count_after_search_skips_the_refresh(self, populated):
+        populated.search("pipeline")
+        with patch.object(populated, "update", wraps=populated.update) as update:
+            assert populated.count("pipeline", refresh=False) == 2
+            populated.count("pipeline")
+        assert update.call_count == 1
+
+    def test_prefix_search(self, populated):
+        assert len(populated.search("deploy")) == 1
+        hits = populated.search("deploy*", days=7)
+        assert len(hits) == 2
+        assert {h.exchange.text for h in hits} == {
+            "Deploy the kubernetes cluster please",
+            "Deploying now. This may take a while.",
+        }
+
+    def test_type_filter(self, populated):
+        hits = populated.search("deploy*", exchange_type="tts")
+        assert [h.exchange.type for h in hits] == ["tts"]
+
+    def test_regex_post_filter(self, populated):
+        hits = populated.search(r"kube\w+", regex=True)
+        assert len(hits) == 1
+        assert f"{HIGHLIGHT_START}kubernetes{HIGHLIGHT_END}" in hits[0].snippet
+
+    def test_incremental_update(self, populated, temp_dir):
+        assert populated.update() == 0
+        now = datetime.now(timezone.utc)
+        _write_log(temp_dir, now, [_entry(now, "conv_new", "tts", "Cluster is healthy")], mode='a')
+        assert populated.update() == 1
+        assert len(populated.search("healthy")) == 1
+
+    def test_partial_line_left_for_later(self, populated, temp_dir):
+        now = datetime.now(timezone.utc)
+        log_file = _write_log(temp_dir, now, [], mode='a')
+        line = json.dumps(_entry(now, "conv_new", "tts", "Half written"))
+        with open(log_file, 'a') as f:
+            f.write(line[:20])
+        assert populated.update() == 0
+        with open(log_file, 'a') as f:
+            f.write(line[20:] + "\n")
+        assert populated.update() == 1
+
+    def test_rewritten_file_is_reindexed(self, populated, temp_dir):
+        now = datetime.now(timezone.utc)
+        _write_log(temp_dir, now, [_entry(now, "conv_x", "stt", "replacement")])
+        populated.update()
+        assert populated.search("kubernetes") == []
+        assert len(populated.search("replacement")) == 1
+
+    def test_conversations_from_index(self, populated):
+        hits = populated.search("kubernetes")
+        conversations = populated.conversations_for_hits(hits)
+        assert len(conversations) == 1
+        conv = conversations[0]
+        assert conv.id == "conv_new"
+        assert conv.exchange_count == 3
+        assert [e.text for e in conv.exchanges][-1] == "Thanks"
+
+    def test_rebuild(self, populated):
+        assert populated.rebuild() == 5
+        assert populated.stats() == {'files': 2, 'exchanges': 5, 'conversations': 2}
@@ -0,0 +1,90 @@
+"""Tests for exchange model parsing."""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from voice_mode.exchanges.models import (
+    Exchange,
+    ExchangeMetadata,
+    line_may_match,
+    parse_timestamp,
+)
+from voice_mode.exchanges.reader import ExchangeReader
+
+
+def _line(type_="stt", conv_id="conv_1", text="hello", metadata=None):
+    return json.dumps({
+        "version": 2,
+        "timestamp": "2024-05-01T10:00:00Z",
+        "conversation_id": conv_id,
+        "type": type_,
+        "text": text,
+        "metadata": metadata if metadata is not None else {
+            "voice_mode_version": "6.0.0",
+            "provider": "kokoro",
+            "unknown_field": 1,
+        },
+    })
+
+
+class TestExchangeParsing:
+    def test_parse_timestamp(self):
+        assert parse_timestamp("2024-05-01T10:00:00Z") == datetime(2024, 5, 1, 10, tzinfo=timezone.utc)
+        assert parse_timestamp("2024-05-01T12:00:00+02:00") == datetime(2024, 5, 1, 10, tzinfo=timezone.utc)
+
+    def test_metadata_is_lazy(self):
+        exchange = Exchange.from_jsonl(_line())
+        assert exchange._metadata is None
+        assert exchange.metadata.provider == "kokoro"
+        assert isinstance(exchange._metadata, ExchangeMetadata)
+        assert exchange.metadata is exchange.metadata
+
+    def test_slots(self):
+        exchange = Exchange.from_jsonl(_line())
+        assert not hasattr(exchange, "__dict__")
+        assert not hasattr(exchange.metadata, "__dict__")
+
+    def test_round_trip(self):
+        exchange = Exchange.from_jsonl(_line())
+        assert exchange.to_dict()["metadata"] == {"voice_mode_version": "6.0.0", "provider": "kokoro"}
+        assert Exchange.from_jsonl(exchange.to_jsonl()) == exchange
+
+    def test_missing_or_partial_metadata(self):
+        assert Exchange.from_jsonl(_line(metadata={})).metadata is None
+        metadata = Exchange.from_jsonl(_line(metadata={"model": "tts-1"})).metadata
+        assert metadata.model == "tts-1"
+
+    def test_invalid_json_raises_decode_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            Exchange.from_jsonl("{not json")
+
+
+class TestLineMayMatch:
+    def test_type(self):
+        assert line_may_match(_line("stt"), exchange_type="stt")
+        assert not line_may_match(_line("tts"), exchange_type="stt")
+
+    def test_quoted_text_does_not_fool_filter(self):
+        line = _line("tts", text='he said "type": "stt"')
+        assert not line_may_match(line, exchange_type="stt")
+
+    def test_conversation_id(self):
+        assert line_may_match(_line(conv_id="abc"), conversation_id="abc")
+        assert not line_may_match(_line(conv_id="abc"), conversation_id="xyz")
+
+
+def test_reader_type_prefilter(temp_dir):
+    logs_dir = temp_dir / "logs" / "conversations"
+    logs_dir.mkdir(parents=True)
+    log_file = logs_dir / "exchanges_2024-05-01.jsonl"
+    log_file.write_text("\n".join([
+        _line("stt", text="one"),
+        _line("tts", text='"type": "stt"'),
+        _line("stt", conv_id="conv_2", text="two"),
+    ]) + "\n")
+
+    reader = ExchangeReader(base_dir=temp_dir)
+    assert [e.text for e in reader._read_file(log_file, exchange_type="stt")] == ["one", "two"]
+    assert [e.text for e in reader.read_conversation("conv_2")] == ["two"]
@@ -0,0 +1,120 @@
+"""Tests for columnar exchange statistics."""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from voice_mode.exchanges.models import Exchange
+from voice_mode.exchanges.stats import ExchangeStats, group_summaries
+
+
+def _exchange(ts, type_, conv_id="conv_1", text="hello there", **metadata):
+    metadata.setdefault("voice_mode_version", "test")
+    return Exchange(
+        version=2,
+        timestamp=ts,
+        conversation_id=conv_id,
+        type=type_,
+        text=text,
+        raw_metadata=metadata,
+    )
+
+
+@pytest.fixture
+def stats():
+    base = datetime(2024, 5, 1, 9, 0, tzinfo=timezone.utc)
+    exchanges = []
+    for i in range(10):
+        ts = base + timedelta(minutes=i)
+        exchanges.append(_exchange(
+            ts, "tts", provider="kokoro", transport="local", voice="af_sky",
+            timing=f"ttfa {0.1 * (i + 1):.1f}s, gen 1.0s, play 2.0s",
+        ))
+        exchanges.append(_exchange(
+            ts + timedelta(seconds=5), "stt", provider="whisper", transport="local",
+            timing=f"record {i + 1}.0s, stt 0.5s",
+            silence_detection={"enabled": i % 2 == 0},
+        ))
+    exchanges.append(_exchange(
+        base + timedelta(hours=3), "tts", conv_id="conv_2", provider="openai",
+        timing="ttfa 2.0s, gen 3.0s, play 1.0s", error="Connection timeout",
+    ))
+    return ExchangeStats(exchanges)
+
+
+class TestGroupSummaries:
+    def test_matches_numpy(self):
+        rng = np.random.default_rng(0)
+        codes = rng.integers(0, 4, size=500)
+        values = rng.exponential(size=500)
+        values[::7] = np.nan
+
+        result = group_summaries(codes, values, 5)
+
+        assert set(result) == {0, 1, 2, 3}
+        for code, summary in result.items():
+            group = values[(codes == code) & ~np.isnan(values)]
+            assert summary["count"] == group.size
+            assert summary["avg"] == pytest.approx(group.mean())
+            assert summary["min"] == group.min()
+            assert summary["max"] == group.max()
+            for q in (50, 90, 99):
+                assert summary[f"p{q}"] == pytest.approx(np.percentile(group, q))
+
+
+class TestExchangeStats:
+    def test_timing_percentiles(self, stats):
+        timing = stats.timing_stats()
+        ttfa = timing["tts"]["ttfa"]
+        assert ttfa["count"] == 11
+        assert ttfa["max"] == 2.0
+        assert ttfa["p50"] == pytest.approx(0.6)
+        assert timing["stt"]["record"]["avg"] == pytest.approx(5.5)
+        assert timing["stt"]["processing"]["count"] == 10
+        assert timing["overall"]["turnaround_count"] == 20
+
+    def test_timing_by_provider(self, stats):
+        by_provider = stats.timing_by("provider")
+        assert set(by_provider) == {"kokoro", "whisper", "openai"}
+        assert set(by_provider["whisper"]) == {"record", "processing"}
+        assert by_provider["kokoro"]["ttfa"]["p90"] == pytest.approx(np.percentile(np.arange(1, 11) / 10, 90))
+        assert by_provider["openai"]["ttfa"]["count"] == 1
+
+    def test_timing_by_hour(self, stats):
+        by_hour = stats.timing_by("hour")
+        assert list(by_hour) == [9, 12]
+        assert by_hour[12]["ttfa"]["avg"] == 2.0
+
+    def test_breakdowns(self, stats):
+        assert stats.provider_breakdown() == {"kokoro": 10, "whisper": 10, "openai": 1}
+        assert stats.transport_breakdown() == {"local": 20, "unknown": 1}
+        assert stats.voice_breakdown() == {"af_sky": 10, "unknown": 1}
+        assert stats.hourly_distribution()[9] == 20
+        assert stats.daily_distribution() == {"2024-05-01": 21}
+
+    def test_histogram(self, stats):
+        counts, edges = stats.histogram("ttfa", bins=4)
+        assert sum(counts) == 11
+        assert len(edges) == 5
+
+    def test_conversation_error_and_silence_stats(self, stats):
+        conv = stats.conversation_stats()
+        assert conv["total_conversations"] == 2
+        assert conv["exchanges_per_conversation"]["max"] == 20
+        assert conv["duration_seconds"]["max"] == pytest.approx(545.0)
+
+        errors = stats.error_stats()
+        assert errors["total_errors"] == 1
+        assert errors["error_types"] == {"timeout": 1}
+        assert errors["errors_by_type"] == {"stt": 0, "tts": 1}
+
+        vad = stats.silence_detection_stats()
+        assert vad["vad_enabled_count"] == 5
+        assert vad["avg_record_time_with_vad"] == pytest.approx(5.0)
+
+    def test_empty(self):
+        stats = ExchangeStats([])
+        assert stats.timing_stats() == {"stt": {}, "tts": {}, "overall": {}}
+        assert stats.conversation_stats()["total_conversations"] == 0
+        assert "Total Exchanges: 0" in stats.get_summary_report()
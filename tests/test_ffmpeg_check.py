@@ -1,5 +1,7 @@
 """Tests for FFmpeg detection and error handling."""
 
+import json
+import os
 import pytest
 from unittest.mock import patch, MagicMock
 import sys
@@ -11,7 +13,8 @@ from voice_mode.utils.ffmpeg_check import (
     get_ffmpeg_version,
     get_install_instructions,
     check_and_report_ffmpeg,
-    ensure_ffmpeg_or_exit
+    ensure_ffmpeg_or_exit,
+    probe_ffmpeg,
 )
 
 
@@ -113,6 +116,45 @@ class TestFFmpegDetection:
                 mock_exit.assert_called_once_with(1)
 
 
+class TestFFmpegProbeCache:
+    """Test caching of the FFmpeg probe by binary path and mtime."""
+    
+    def test_probe_is_cached_until_binary_changes(self, temp_dir):
+        """The version probe only reruns when the binary changes."""
+        binary = temp_dir / "ffmpeg"
+        binary.write_text("v1")
+        cache_file = temp_dir / "cache" / "ffmpeg_probe.json"
+        
+        with patch('shutil.which', return_value=str(binary)), \
+                patch('voice_mode.utils.ffmpeg_check.get_ffmpeg_version', return_value="6.1") as version:
+            first = probe_ffmpeg(cache_file=cache_file)
+            second = probe_ffmpeg(cache_file=cache_file)
+            assert first == second == {"ffmpeg": str(binary), "ffprobe": str(binary), "version": "6.1"}
+            assert version.call_count == 1
+            
+            # An upgrade changes the size and mtime, invalidating the entry
+            binary.write_text("version 2")
+            os.utime(binary, ns=(0, 12345))
+            probe_ffmpeg(cache_file=cache_file)
+            assert version.call_count == 2
+    
+    def test_probe_without_ffmpeg(self, temp_dir):
+        """Missing binaries are reported without running a version probe."""
+        with patch('shutil.which', return_value=None), \
+                patch('voice_mode.utils.ffmpeg_check.get_ffmpeg_version') as version:
+            result = probe_ffmpeg(cache_file=temp_dir / "probe.json")
+        assert result == {"ffmpeg": None, "ffprobe": None, "version": None}
+        version.assert_not_called()
+    
+    def test_corrupt_cache_is_ignored(self, temp_dir):
+        """A damaged cache file falls back to probing."""
+        cache_file = temp_dir / "probe.json"
+        cache_file.write_text("{not json")
+        with patch('shutil.which', return_value=None):
+            assert probe_ffmpeg(cache_file=cache_file)["ffmpeg"] is None
+        assert json.loads(cache_file.read_text())["result"]["ffmpeg"] is None
+
+
 class TestFFmpegLinuxDistros:
     """Test Linux distribution detection for install instructions."""
     
@@ -0,0 +1,145 @@
+"""Tests for config and pronunciation-rule hot reload."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import voice_mode.config as config
+from voice_mode.pronounce import PronounceManager
+from voice_mode.utils.file_watch import FileWatcher, _libc
+
+
+@pytest.fixture(params=["poll", "inotify"])
+def make_watcher(request):
+    if request.param == "inotify" and _libc is None:
+        pytest.skip("inotify not available")
+    return lambda paths: FileWatcher(paths, poll_interval=0, use_inotify=request.param == "inotify")
+
+
+class TestFileWatcher:
+    def test_reports_create_edit_delete_once(self, tmp_path, make_watcher):
+        target = tmp_path / "conf" / "voicemode.env"
+        watcher = make_watcher([target])
+        assert not watcher.changed()
+
+        target.parent.mkdir()
+        (target.parent / "unrelated.txt").write_text("x")
+        assert not watcher.changed()
+
+        target.write_text("A=1\n")
+        assert watcher.changed()
+        assert not watcher.changed()
+
+        target.write_text("A=12\n")
+        assert watcher.changed()
+
+        target.unlink()
+        assert watcher.changed()
+
+    def test_editor_style_replace(self, tmp_path, make_watcher):
+        target = tmp_path / "rules.yaml"
+        target.write_text("a")
+        watcher = make_watcher([target])
+        tmp = tmp_path / ".rules.yaml.swp"
+        tmp.write_text("b")
+        os.replace(tmp, target)
+        assert watcher.changed()
+
+    def test_polling_is_rate_limited(self, tmp_path):
+        target = tmp_path / "voicemode.env"
+        watcher = FileWatcher([target], poll_interval=60, use_inotify=False)
+        target.write_text("A=1\n")
+        assert not watcher.changed()
+        watcher._last_poll -= 60
+        assert watcher.changed()
+
+
+@pytest.fixture
+def env_tree(tmp_path, monkeypatch):
+    """A fake home and project, with configuration state restored afterwards."""
+    if _libc is None:
+        pytest.skip("config watchers poll at most once a second without inotify")
+    home = tmp_path / "home"
+    (home / ".voicemode").mkdir(parents=True)
+    (home / ".voicemode" / "voicemode.env").write_text("VOICEMODE_VOICES=nova\n")
+    project = tmp_path / "project" / "src"
+    project.mkdir(parents=True)
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.chdir(project)
+
+    saved = {name: list(getattr(config, name)) for name in ("TTS_BASE_URLS", "STT_BASE_URLS", "TTS_VOICES", "TTS_MODELS")}
+    saved_state = (dict(config._file_env), list(config._loaded_env_files))
+    with patch.dict(os.environ):
+        for key in ("VOICEMODE_VOICES", "VOICEMODE_TTS_MODELS"):
+            os.environ.pop(key, None)
+        config._file_env.clear()
+        config.reload_configuration()
+        yield tmp_path / "project"
+    for name, value in saved.items():
+        getattr(config, name)[:] = value
+    config._file_env, config._loaded_env_files = saved_state
+    config._env_files_cache.clear()
+    config.clear_voice_preferences_cache()
+
+
+class TestConfigHotReload:
+    def test_walk_is_memoized(self, env_tree):
+        with patch.object(config, "_scan_voicemode_env_files", wraps=config._scan_voicemode_env_files) as scan:
+            first = config.find_voicemode_env_files()  # walked by the fixture's reload
+            assert config.find_voicemode_env_files() == first
+            assert scan.call_count == 0
+
+            (env_tree / ".voicemode.env").write_text("VOICEMODE_TTS_MODELS=tts-1-hd\n")
+            assert config.find_voicemode_env_files() == first + [env_tree / ".voicemode.env"]
+            assert scan.call_count == 1
+
+    def test_reload_only_when_changed(self, env_tree):
+        models = config.TTS_MODELS
+        assert config.TTS_VOICES == ["nova"]
+        assert not config.reload_configuration_if_changed()
+
+        project_env = env_tree / ".voicemode.env"
+        project_env.write_text("VOICEMODE_TTS_MODELS=tts-1-hd\n")
+        assert config.reload_configuration_if_changed()
+        assert config.TTS_MODELS is models and models == ["tts-1-hd"]
+        assert not config.reload_configuration_if_changed()
+
+        project_env.write_text("VOICEMODE_TTS_MODELS=gpt-4o-mini-tts,tts-1\n")
+        assert config.reload_configuration_if_changed()
+        assert models == ["gpt-4o-mini-tts", "tts-1"]
+
+        project_env.unlink()
+        assert config.reload_configuration_if_changed()
+        assert "VOICEMODE_TTS_MODELS" not in os.environ
+        assert models == ["tts-1", "tts-1-hd", "gpt-4o-mini-tts"]
+
+    def test_real_environment_wins(self, env_tree):
+        os.environ["VOICEMODE_TTS_MODELS"] = "from-env"
+        (env_tree / ".voicemode.env").write_text("VOICEMODE_TTS_MODELS=from-file\n")
+        assert config.reload_configuration_if_changed()
+        assert config.TTS_MODELS == ["from-env"]
+
+    def test_voice_preferences_follow_edits(self, env_tree):
+        assert config.get_voice_preferences() == ["nova"]
+        (Path(os.environ["HOME"]) / ".voicemode" / "voicemode.env").write_text("VOICEMODE_VOICES=alloy,nova\n")
+        assert config.reload_configuration_if_changed()
+        assert config.get_voice_preferences() == ["alloy", "nova"]
+
+
+def test_pronunciation_rules_reload(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    rules = tmp_path / "rules.yaml"
+    rules.write_text("tts_rules:\n  - name: aws\n    pattern: '\\bAWS\\b'\n    replacement: 'A W S'\n")
+    manager = PronounceManager([rules])
+    assert not manager.reload_if_changed()
+    assert manager.process_tts("AWS") == "A W S"
+
+    rules.write_text("tts_rules:\n  - name: aws\n    pattern: '\\bAWS\\b'\n    replacement: 'amazon'\n")
+    manager._watcher._last_poll -= 60  # in case inotify is unavailable
+    assert manager.reload_if_changed()
+    assert manager.process_tts("AWS") == "amazon"
+
+    assert manager.add_rule("tts", r"\bGCP\b", "G C P", name="gcp")
+    assert not manager.reload_if_changed()  # saving our own rules is not an edit
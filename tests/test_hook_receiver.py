@@ -0,0 +1,136 @@
+"""Tests for the lightweight hook receiver entry point."""
+
+import asyncio
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from voice_mode import hook_receiver
+from voice_mode.daemon import VoiceModeDaemon
+
+# Generous for slow CI machines; a regression that pulls in click or
+# voice_mode.config costs several times this
+IMPORT_BUDGET_SECONDS = 0.15
+
+PROBE = """
+import sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+import voice_mode.hook_receiver
+elapsed = time.perf_counter() - start
+loaded = sorted(m for m in set(sys.modules) - before if m.split(".")[0] not in sys.stdlib_module_names)
+print(elapsed)
+print(",".join(loaded))
+"""
+
+
+def probe_import():
+    # Keep pytest-cov from instrumenting the child interpreter
+    env = {k: v for k, v in os.environ.items() if not k.startswith("COV_CORE")}
+    env["PYTHONPATH"] = str(Path(__file__).parent.parent)
+    out = subprocess.run([sys.executable, "-c", PROBE], capture_output=True, text=True, env=env, check=True).stdout
+    elapsed, loaded = out.splitlines()
+    return float(elapsed), loaded.split(",")
+
+
+class TestImportCost:
+    def test_imports_only_the_standard_library(self):
+        _, loaded = probe_import()
+        assert set(loaded) <= {"voice_mode", "voice_mode.hook_receiver"}
+
+    def test_import_time_budget(self):
+        elapsed = min(probe_import()[0] for _ in range(3))
+        assert elapsed < IMPORT_BUDGET_SECONDS, f"importing voice_mode.hook_receiver took {elapsed * 1000:.0f}ms"
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    for name in ("VOICEMODE_SOUNDFONTS_ENABLED", "VOICEMODE_DAEMON", "VOICEMODE_DAEMON_SOCKET", "VOICEMODE_BASE_DIR"):
+        monkeypatch.delenv(name, raising=False)
+    font = tmp_path / ".voicemode" / "soundfonts" / "default"
+    (font / "PreToolUse" / "bash").mkdir(parents=True)
+    (font / "PreToolUse" / "bash" / "default.mp3").write_bytes(b"")
+    (font / "fallback.wav").write_bytes(b"")
+    os.symlink(font, font.parent / "current")
+    (tmp_path / ".voicemode" / "voicemode.env").write_text("VOICEMODE_SOUNDFONTS_ENABLED=true\n")
+    return tmp_path
+
+
+class TestSettings:
+    def test_env_files_and_environment(self, home, monkeypatch):
+        project = home / "project"
+        project.mkdir()
+        (project / ".voicemode.env").write_text("# comment\nVOICEMODE_DAEMON=false\nVOICEMODE_SOUNDFONTS_ENABLED=false\n")
+        names = ("VOICEMODE_SOUNDFONTS_ENABLED", "VOICEMODE_DAEMON", "VOICEMODE_BASE_DIR")
+        # Like voice_mode.config: the first file to set a name wins
+        assert hook_receiver.read_settings(names, project) == {
+            "VOICEMODE_SOUNDFONTS_ENABLED": "true",
+            "VOICEMODE_DAEMON": "false",
+        }
+        monkeypatch.setenv("VOICEMODE_SOUNDFONTS_ENABLED", "0")
+        assert hook_receiver.read_settings(names, project)["VOICEMODE_SOUNDFONTS_ENABLED"] == "0"
+
+    def test_parse_event(self):
+        task = {"hook_event_name": "PostToolUse", "tool_name": "Task", "tool_input": {"subagent_type": "Explore"}}
+        assert hook_receiver.parse_event(task) == {"event": "PostToolUse", "tool": "Task", "subagent": "Explore"}
+        assert hook_receiver.parse_event({}, tool_name="Bash") == {"event": "PreToolUse", "tool": "Bash", "subagent": None}
+
+
+class TestHandle:
+    def test_disabled(self, home, monkeypatch):
+        monkeypatch.setenv("VOICEMODE_SOUNDFONTS_ENABLED", "false")
+        with patch.object(hook_receiver, "play_file") as play:
+            assert not hook_receiver.handle({"tool_name": "Bash"})
+        play.assert_not_called()
+
+    def test_plays_locally_without_daemon(self, home):
+        with patch.object(hook_receiver, "play_file", return_value=True) as play:
+            assert hook_receiver.handle({"tool_name": "Bash"})
+            assert hook_receiver.handle({"tool_name": "Read", "hook_event_name": "PostToolUse"})
+        played = [call.args[0].name for call in play.call_args_list]
+        assert played == ["default.mp3", "fallback.wav"]
+
+    async def test_forwards_to_daemon(self, home, monkeypatch):
+        directory = tempfile.mkdtemp(prefix="vm-", dir="/tmp")
+        socket_path = Path(directory) / "daemon.sock"
+        monkeypatch.setenv("VOICEMODE_DAEMON_SOCKET", str(socket_path))
+        events = []
+
+        async def hook_sound(event, tool, subagent=None):
+            events.append((event, tool, subagent))
+            return "/sounds/bash.mp3" if tool == "Bash" else None
+
+        server = VoiceModeDaemon(socket_path, handlers={"hook_sound": hook_sound})
+        await server.start()
+        try:
+            with patch.object(hook_receiver, "play_file") as play:
+                assert await asyncio.to_thread(hook_receiver.handle, {"tool_name": "Bash"})
+                assert not await asyncio.to_thread(hook_receiver.handle, {"tool_name": "Task"})
+            play.assert_not_called()
+        finally:
+            await server.stop()
+            shutil.rmtree(directory, ignore_errors=True)
+        assert events == [("PreToolUse", "Bash", None), ("PreToolUse", "Task", "baby-bear")]
+
+    def test_main_always_exits_zero(self, home, monkeypatch):
+        monkeypatch.setattr(sys, "stdin", io.StringIO("not json"))
+        with pytest.raises(SystemExit) as exit_info:
+            hook_receiver.main([])
+        assert exit_info.value.code == 0
+
+        monkeypatch.setattr(sys, "stdin", io.StringIO(json.dumps({"tool_name": "Bash"})))
+        with patch.object(hook_receiver, "handle", side_effect=RuntimeError("boom")), \
+             pytest.raises(SystemExit) as exit_info:
+            hook_receiver.main(["--debug"])
+        assert exit_info.value.code == 0
+
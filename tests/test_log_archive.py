@@ -0,0 +1,222 @@
+"""Tests for compressed JSONL log archival."""
+
+import gzip
+import json
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from voice_mode.utils.log_archive import (
+    FRAMES_SUFFIX,
+    archive_logs,
+    compress_file,
+    iter_lines,
+    iter_lines_reverse,
+    list_log_files,
+    logical_name,
+    read_frame_index,
+    resolve_log_file,
+)
+
+
+def _write_lines(path, count):
+    lines = [json.dumps({"n": i, "text": f"line {i}"}) for i in range(count)]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines) + "\n")
+    return lines
+
+
+class TestCompressFile:
+    def test_round_trip_multiple_frames(self, temp_dir):
+        log = temp_dir / "exchanges_2024-01-01.jsonl"
+        lines = _write_lines(log, 200)
+
+        archive = compress_file(log, frame_size=512)
+
+        assert archive.name == "exchanges_2024-01-01.jsonl.gz"
+        assert not log.exists()
+        assert len(read_frame_index(archive)) > 1
+        assert list(iter_lines(archive)) == lines
+        # Every frame is a standalone gzip member, so plain gzip reads it too
+        assert gzip.decompress(archive.read_bytes()).decode().splitlines() == lines
+
+    def test_unknown_codec(self, temp_dir):
+        log = temp_dir / "exchanges_2024-01-01.jsonl"
+        _write_lines(log, 1)
+        with pytest.raises(ValueError):
+            compress_file(log, codec="lz4")
+        assert log.exists()
+
+
+class TestReverseLines:
+    def test_plain_file(self, temp_dir):
+        log = temp_dir / "exchanges_2024-01-01.jsonl"
+        lines = _write_lines(log, 50)
+        assert list(iter_lines_reverse(log, chunk_size=64)) == lines[::-1]
+
+    def test_archive_with_frame_index(self, temp_dir):
+        log = temp_dir / "exchanges_2024-01-01.jsonl"
+        lines = _write_lines(log, 200)
+        archive = compress_file(log, frame_size=256)
+        assert list(iter_lines_reverse(archive)) == lines[::-1]
+
+    def test_archive_without_frame_index(self, temp_dir):
+        log = temp_dir / "exchanges_2024-01-01.jsonl"
+        lines = _write_lines(log, 200)
+        archive = compress_file(log, frame_size=256)
+        archive.with_name(archive.name + FRAMES_SUFFIX).unlink()
+        assert read_frame_index(archive) is None
+        assert list(iter_lines_reverse(archive)) == lines[::-1]
+
+
+class TestResolution:
+    def test_resolve_prefers_plain_then_archive(self, temp_dir):
+        log = temp_dir / "exchanges_2024-01-01.jsonl"
+        _write_lines(log, 3)
+        assert resolve_log_file(log) == log
+        archive = compress_file(log)
+        assert resolve_log_file(log) == archive
+        assert resolve_log_file(temp_dir / "exchanges_2024-01-02.jsonl") is None
+
+    def test_list_log_files_mixes_plain_and_archived(self, temp_dir):
+        for day in ("2024-01-01", "2024-01-02", "2024-01-03"):
+            _write_lines(temp_dir / f"exchanges_{day}.jsonl", 2)
+        compress_file(temp_dir / "exchanges_2024-01-02.jsonl")
+
+        files = list_log_files(temp_dir, "exchanges_*.jsonl")
+        assert [logical_name(f) for f in files] == [
+            "exchanges_2024-01-01.jsonl",
+            "exchanges_2024-01-02.jsonl",
+            "exchanges_2024-01-03.jsonl",
+        ]
+        assert files[1].suffix == ".gz"
+
+
+class TestArchiveLogs:
+    def test_skips_recent_and_today(self, temp_dir):
+        today = date.today()
+        old = temp_dir / f"exchanges_{(today - timedelta(days=40)).isoformat()}.jsonl"
+        recent = temp_dir / f"exchanges_{(today - timedelta(days=2)).isoformat()}.jsonl"
+        current = temp_dir / f"exchanges_{today.isoformat()}.jsonl"
+        for path in (old, recent, current):
+            _write_lines(path, 5)
+
+        assert archive_logs(temp_dir, "exchanges_*.jsonl", 30, dry_run=True) == [(old, None)]
+        assert old.exists()
+
+        results = archive_logs(temp_dir, "exchanges_*.jsonl", 0)
+        assert [src for src, _ in results] == [old, recent]
+        assert current.exists()
+        assert not old.exists() and not recent.exists()
+
+
+class TestReadersOnArchives:
+    def test_exchange_reader_and_index(self, temp_dir):
+        from voice_mode.exchanges import ExchangeReader, ExchangeIndex
+
+        now = datetime.now(timezone.utc)
+        day = now - timedelta(days=3)
+        log = temp_dir / "logs" / "conversations" / f"exchanges_{day.strftime('%Y-%m-%d')}.jsonl"
+        log.parent.mkdir(parents=True)
+        with open(log, "w") as f:
+            for i, text in enumerate(["archived hello", "archived reply"]):
+                f.write(json.dumps({
+                    "version": 2,
+                    "timestamp": (day + timedelta(seconds=i)).isoformat(),
+                    "conversation_id": "conv_arch",
+                    "type": "stt" if i == 0 else "tts",
+                    "text": text,
+                    "metadata": {},
+                }) + "\n")
+
+        indexed = 0
+        if ExchangeIndex.is_available():
+            with ExchangeIndex(base_dir=temp_dir) as index:
+                indexed = index.update()
+        compress_file(log)
+
+        reader = ExchangeReader(base_dir=temp_dir)
+        exchanges = list(reader.read_date(day.date()))
+        assert [e.text for e in exchanges] == ["archived hello", "archived reply"]
+        latest = reader.get_latest_exchanges(1)
+        assert [e.text for e in latest] == ["archived reply"]
+
+        if ExchangeIndex.is_available():
+            assert indexed == 2
+            with ExchangeIndex(base_dir=temp_dir) as index:
+                # Archiving must not trigger a re-index
+                assert index.update() == 0
+                assert len(index.search("hello", days=None)) == 1
+
+
+def _write_exchanges(log, day, texts):
+    log.parent.mkdir(parents=True, exist_ok=True)
+    with open(log, "a") as f:
+        for i, text in enumerate(texts):
+            f.write(json.dumps({
+                "version": 2,
+                "timestamp": (day + timedelta(seconds=i)).isoformat(),
+                "conversation_id": "conv_arch",
+                "type": "stt",
+                "text": text,
+                "metadata": {},
+            }) + "\n")
+
+
+class TestIndexForwardOnlyArchives:
+    def _log(self, temp_dir):
+        day = datetime.now(timezone.utc) - timedelta(days=3)
+        log = temp_dir / "logs" / "conversations" / f"exchanges_{day.strftime('%Y-%m-%d')}.jsonl"
+        return log, day
+
+    def test_zstd_archive_round_trip(self, temp_dir):
+        pytest.importorskip("zstandard")
+        from voice_mode.exchanges import ExchangeIndex
+        if not ExchangeIndex.is_available():
+            pytest.skip("SQLite FTS5 not available")
+
+        log, day = self._log(temp_dir)
+        _write_exchanges(log, day, ["zebra first"])
+        with ExchangeIndex(base_dir=temp_dir) as index:
+            assert index.update() == 1
+        # Lines written after the last update are indexed from the archive,
+        # which has to be read forward past the stored offset
+        _write_exchanges(log, day, ["zebra second"])
+        archive = compress_file(log, codec="zstd")
+        assert archive.name.endswith(".zst")
+        with ExchangeIndex(base_dir=temp_dir) as index:
+            assert index.update() == 1
+            assert index.update() == 0
+            assert len(index.search("zebra", days=None)) == 2
+
+    def test_non_seekable_stream_is_skipped_forward(self, temp_dir, monkeypatch):
+        import io
+        from voice_mode.exchanges import ExchangeIndex, index as index_module
+        if not ExchangeIndex.is_available():
+            pytest.skip("SQLite FTS5 not available")
+
+        class ForwardOnly(io.RawIOBase):
+            def __init__(self, data):
+                self._data = io.BytesIO(data)
+
+            def readable(self):
+                return True
+
+            def readinto(self, buffer):
+                chunk = self._data.read(len(buffer))
+                buffer[:len(chunk)] = chunk
+                return len(chunk)
+
+        def open_forward_only(path, mode="rt"):
+            # Like the zstd stream_reader: BufferedReader over a raw stream without seek
+            return io.BufferedReader(ForwardOnly(path.read_bytes()))
+
+        log, day = self._log(temp_dir)
+        _write_exchanges(log, day, ["yak first"])
+        with ExchangeIndex(base_dir=temp_dir) as index:
+            assert index.update() == 1
+        _write_exchanges(log, day, ["yak second"])
+        monkeypatch.setattr(index_module, "open_log", open_forward_only)
+        with ExchangeIndex(base_dir=temp_dir) as index:
+            assert index.update() == 1
+            assert len(index.search("yak", days=None)) == 2
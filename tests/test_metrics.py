@@ -0,0 +1,108 @@
+"""Tests for the Prometheus metrics registry."""
+
+import threading
+import urllib.request
+
+import pytest
+
+from voice_mode.metrics import (
+    CONTENT_TYPE,
+    MetricsExporter,
+    MetricsRegistry,
+    observe_timings,
+)
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+class TestMetrics:
+    def test_counter_and_gauge_render(self, registry):
+        attempts = registry.counter("test_attempts_total", "Attempts", ["service", "result"])
+        attempts.inc(service="tts", result="error")
+        attempts.inc(2, service="tts", result="success")
+        gauge = registry.gauge("test_in_progress", "In progress")
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+
+        text = registry.render()
+        assert "# TYPE test_attempts_total counter" in text
+        assert 'test_attempts_total{service="tts",result="error"} 1' in text
+        assert 'test_attempts_total{service="tts",result="success"} 2' in text
+        assert "test_in_progress 1" in text
+        assert text.endswith("\n")
+
+    def test_histogram_buckets_are_cumulative(self, registry):
+        hist = registry.histogram("test_seconds", "Latency", ["stage"], buckets=(0.5, 1.0, 2.0))
+        for value in (0.1, 0.5, 0.7, 1.5, 9.0):
+            hist.observe(value, stage="stt")
+
+        lines = registry.render().splitlines()
+        assert 'test_seconds_bucket{stage="stt",le="0.5"} 2' in lines
+        assert 'test_seconds_bucket{stage="stt",le="1"} 3' in lines
+        assert 'test_seconds_bucket{stage="stt",le="2"} 4' in lines
+        assert 'test_seconds_bucket{stage="stt",le="+Inf"} 5' in lines
+        assert 'test_seconds_count{stage="stt"} 5' in lines
+        assert hist.get_sum(stage="stt") == pytest.approx(11.8)
+
+    def test_label_validation_and_reregistration(self, registry):
+        counter = registry.counter("test_total", "Total", ["kind"])
+        with pytest.raises(ValueError):
+            counter.inc(other="x")
+        with pytest.raises(ValueError):
+            counter.inc(-1, kind="x")
+        assert registry.counter("test_total", "Total", ["kind"]) is counter
+        with pytest.raises(ValueError):
+            registry.gauge("test_total", "Total", ["kind"])
+
+    def test_label_escaping(self, registry):
+        registry.counter("test_total", "Total", ["endpoint"]).inc(endpoint='a"b\\c')
+        assert 'endpoint="a\\"b\\\\c"' in registry.render()
+
+    def test_concurrent_updates(self, registry):
+        counter = registry.counter("test_total", "Total")
+        hist = registry.histogram("test_seconds", "Latency")
+
+        def work():
+            for _ in range(5000):
+                counter.inc()
+                hist.observe(0.3)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert counter.get() == 20000
+        assert hist.get_count() == 20000
+
+    def test_observe_timings_skips_unknown_stages(self):
+        from voice_mode.metrics import STAGE_SECONDS
+        before = STAGE_SECONDS.get_count(stage="stt")
+        observe_timings({"stt": 0.4, "bogus": 1.0, "record": None})
+        assert STAGE_SECONDS.get_count(stage="stt") == before + 1
+
+
+class TestExporter:
+    def test_textfile(self, registry, temp_dir):
+        registry.counter("test_total", "Total").inc()
+        path = temp_dir / "metrics" / "voicemode.prom"
+        exporter = MetricsExporter(registry, textfile=path, interval=60)
+        exporter.start()
+        exporter.stop()
+        assert "test_total 1" in path.read_text()
+        assert list(path.parent.iterdir()) == [path]
+
+    def test_http_listener(self, registry):
+        registry.counter("test_total", "Total").inc(3)
+        exporter = MetricsExporter(registry, port=0)
+        exporter._start_http()
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{exporter.port}/metrics", timeout=5) as response:
+                assert response.headers["Content-Type"] == CONTENT_TYPE
+                assert "test_total 3" in response.read().decode()
+        finally:
+            exporter.stop()
@@ -121,6 +121,84 @@ class TestNotifyPopupModule:
         assert result.response is None
 
 
+# Speaks the helper protocol without Tk: "show" echoes the message upper-cased,
+# "crash" exits once (a marker file remembers it), "hang" never answers.
+FAKE_HELPER = """
+import json, os, sys, select
+marker, idle = sys.argv[1], float(sys.argv[2])
+print(json.dumps({"ready": True}), flush=True)
+while True:
+    if not select.select([sys.stdin], [], [], idle)[0]:
+        sys.exit(0)
+    line = sys.stdin.readline()
+    if not line:
+        sys.exit(0)
+    request = json.loads(line)
+    if request["op"] == "show":
+        if request["message"] == "crash" and not os.path.exists(marker):
+            open(marker, "w").close()
+            sys.exit(1)
+        if request["message"] == "hang":
+            continue
+        reply = {"type": "success", "response": request["message"].upper()}
+    else:
+        reply = {"ok": True}
+    print(json.dumps({"id": request["id"], **reply}), flush=True)
+"""
+
+
+class TestPopupHelper:
+    """Test the resident popup helper channel."""
+
+    @pytest.fixture
+    def helper(self, tmp_path):
+        import sys
+        from voice_mode.utils.notify_popup import PopupHelperClient
+
+        client = PopupHelperClient(
+            command=[sys.executable, "-c", FAKE_HELPER, str(tmp_path / "crashed"), "0.5"],
+            start_timeout=10,
+        )
+        yield client
+        client.stop()
+
+    def test_helper_is_reused(self, helper):
+        assert helper.request("show", timeout=5, message="hi")["response"] == "HI"
+        pid = helper._process.pid
+        assert helper.request("show", timeout=5, message="again")["response"] == "AGAIN"
+        assert helper._process.pid == pid and helper.starts == 1
+
+    def test_restarts_after_crash(self, helper):
+        assert helper.request("show", timeout=5, message="crash")["response"] == "CRASH"
+        assert helper.starts == 2
+
+    def test_restarts_after_idle_exit(self, helper):
+        import time
+
+        helper.request("ping", timeout=5)
+        time.sleep(1)
+        assert not helper.running
+        assert helper.request("ping", timeout=5)["ok"]
+        assert helper.starts == 2
+
+    def test_timeout_closes_popup(self, helper):
+        from voice_mode.utils.notify_popup import PopupConfig, _run_popup
+
+        with patch("voice_mode.utils.notify_popup.get_popup_helper", return_value=helper), \
+             patch.object(helper, "close_popup", wraps=helper.close_popup) as close:
+            result = _run_popup("hang", PopupConfig(timeout=-9.5), [], True)
+        assert result.result_type == "timeout"
+        close.assert_called_once_with("timeout")
+
+    def test_start_failure(self):
+        import sys
+        from voice_mode.utils.notify_popup import PopupHelperClient, PopupHelperUnavailable
+
+        client = PopupHelperClient(command=[sys.executable, "-c", "import sys; sys.exit('no display')"])
+        with pytest.raises(PopupHelperUnavailable, match="no display"):
+            client.request("ping", timeout=5)
+
+
 class TestNotifyTool:
     """Test the notify tool functionality."""
 
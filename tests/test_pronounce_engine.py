@@ -0,0 +1,124 @@
+"""Tests for the compiled pronunciation rule engine."""
+
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+from voice_mode.pronounce import PronounceManager, PronounceRule
+from voice_mode.pronounce_engine import CompiledRuleSet, literal_rule
+
+DEFAULTS = Path(__file__).parent.parent / "voice_mode" / "data" / "default_pronunciation.yaml"
+
+
+def sequential(rules, text):
+    for rule in rules:
+        text, _ = rule.apply(text)
+    return text
+
+
+def rules(*specs):
+    return [PronounceRule(f"r{i}", pattern, replacement) for i, (pattern, replacement) in enumerate(specs)]
+
+
+class TestLiteralDetection:
+    @pytest.mark.parametrize("pattern,expected", [
+        (r"\bAWS\b", {"AWS": "A W S"}),
+        (r"\b(tee mux|t mux)\b", {"tee mux": "A W S", "t mux": "A W S"}),
+        (r"\bTCP/IP\b", {"TCP/IP": "A W S"}),
+        (r"C\+\+", {"C++": "A W S"}),
+    ])
+    def test_literals(self, pattern, expected):
+        assert literal_rule(PronounceRule("r", pattern, "A W S")).replacements == expected
+
+    @pytest.mark.parametrize("pattern", [
+        r"\bPoE\+?\b", r"\b(\d+)\s*GB\b", r"a|b", r"(?i)aws", r"\b\.net\b", r"\bfoo\\b",
+    ])
+    def test_regex_rules_are_not_literal(self, pattern):
+        assert literal_rule(PronounceRule("r", pattern, "x")) is None
+
+    def test_group_references_are_expanded(self):
+        literal = literal_rule(PronounceRule("r", r"\b(neo vim|neovem)\b", r"[\1]"))
+        assert literal.replacements == {"neo vim": "[neo vim]", "neovem": "[neovem]"}
+
+
+class TestCompiledRuleSet:
+    def test_independent_literals_share_one_pass(self):
+        engine = CompiledRuleSet(rules((r"\bAWS\b", "A W S"), (r"\bSSH\b", "S S H"), (r"\bAPI\b", "A P I")))
+        assert engine.passes == 1
+        assert engine.apply("AWS API over SSH, not AWSAPI") == "A W S A P I over S S H, not AWSAPI"
+
+    @pytest.mark.parametrize("specs,text", [
+        # A replacement feeds a later rule
+        (((r"\bgh\b", "github"), (r"\bgithub\b", "git hub")), "gh and github"),
+        # Overlapping multi-word patterns
+        (((r"\bit is\b", "it's"), (r"\bis fine\b", "ok")), "it is fine"),
+        # Replacement with a non-word edge moves word boundaries
+        (((r"\bfoo\b", "foo."), (r"\bbar\b", "baz")), "foo bar foobar"),
+        # Plain literals that overlap or are deleted
+        (((r"ab", ""), (r"ac", "X")), "aabcb"),
+        (((r"a", "b"), (r"bb", "c")), "ab bb"),
+        # A regex rule between literals keeps its place
+        (((r"\bAWS\b", "amazon"), (r"\b[a-z]+on\b", "cloud"), (r"\bGCP\b", "google")), "AWS and GCP"),
+    ])
+    def test_matches_sequential_application(self, specs, text):
+        ordered = rules(*specs)
+        assert CompiledRuleSet(ordered).apply(text) == sequential(ordered, text)
+
+    def test_default_rules_match_sequential(self):
+        manager = PronounceManager([DEFAULTS])
+        rng = random.Random(0)
+        words = ("AWS JSON SSH 2.4 GHz 10 GbE PoE+ PoE TCP/IP tee mux t mux teamux neo vim "
+                 "it is let us me tool cora 7 AI cora python github WiFi 6E 5ms x, y.").split()
+        for direction in ("tts", "stt"):
+            engine = CompiledRuleSet(manager.rules[direction])
+            assert engine.passes < len(manager.rules[direction])
+            for _ in range(300):
+                text = " ".join(rng.choices(words, k=rng.randint(1, 12)))
+                assert engine.apply(text) == sequential(manager.rules[direction], text)
+
+    def test_disabled_rules_are_skipped(self):
+        ordered = rules((r"\bAWS\b", "A W S"), (r"\bGCP\b", "G C P"))
+        ordered[0].enabled = False
+        assert CompiledRuleSet(ordered).apply("AWS GCP") == "AWS G C P"
+
+    def test_results_are_memoised(self):
+        engine = CompiledRuleSet(rules((r"\b\w+on\b", "snake")), cache_size=2)
+        assert engine.apply("python") == "snake"
+        engine.steps.clear()
+        assert engine.apply("python") == "snake"
+        assert engine.apply("a") == "a" and engine.apply("b") == "b"
+        assert engine.apply("python") == "python"  # evicted
+
+
+class TestManagerIntegration:
+    @pytest.fixture
+    def manager(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.delenv("VOICEMODE_PRONUNCIATION_LOG_SUBSTITUTIONS", raising=False)
+        config = tmp_path / "rules.yaml"
+        config.write_text(
+            "tts_rules:\n"
+            "  - name: aws\n    pattern: '\\bAWS\\b'\n    replacement: 'A W S'\n    private: false\n"
+        )
+        return PronounceManager([config])
+
+    def test_changes_invalidate_compiled_rules(self, manager):
+        assert manager.process_tts("AWS GCP") == "A W S GCP"
+        assert manager.add_rule("tts", r"\bGCP\b", "G C P", name="gcp")
+        assert manager.process_tts("AWS GCP") == "A W S G C P"
+        assert manager.disable_rule("tts", "aws")
+        assert manager.process_tts("AWS GCP") == "AWS G C P"
+        assert manager.enable_rule("tts", "aws")
+        assert manager.remove_rule("tts", "gcp")
+        assert manager.process_tts("AWS GCP") == "A W S GCP"
+        manager.reload_rules()
+        assert manager.process_tts("AWS GCP") == "A W S GCP"
+
+    def test_logging_names_each_rule(self, manager, monkeypatch, caplog):
+        monkeypatch.setenv("VOICEMODE_PRONUNCIATION_LOG_SUBSTITUTIONS", "true")
+        manager.reload_rules()
+        with caplog.at_level("INFO", logger="voice_mode.pronounce"):
+            assert manager.process_tts("use AWS") == "use A W S"
+        assert re.search(r"Applied rule 'aws': \"use AWS\" → \"use A W S\"", caplog.text)
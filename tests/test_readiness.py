@@ -0,0 +1,135 @@
+"""Tests for service readiness probing against a local HTTP server."""
+
+import asyncio
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from voice_mode.utils.services import readiness
+from voice_mode.utils.services.readiness import wait_for_services, wait_until_ready, watch_readiness
+
+
+class Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body=b"ok"):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(("GET", self.path))
+        if self.path != "/health":
+            return self._reply(404)
+        # Loading the model: 503 for the first few checks, like whisper-server
+        if server.loading > 0:
+            server.loading -= 1
+            return self._reply(503, b'{"status":"loading model"}')
+        self._reply(200, b'{"status":"ok"}')
+
+    def do_POST(self):
+        server = self.server
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        server.requests.append(("POST", self.path))
+        self._reply(server.inference_status)
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.loading, httpd.inference_status, httpd.requests = 0, 200, []
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    httpd.root = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fast_backoff(monkeypatch):
+    monkeypatch.setattr(readiness, "INITIAL_DELAY", 0.01)
+    monkeypatch.setattr(readiness, "MAX_DELAY", 0.05)
+    monkeypatch.setattr(readiness, "_watches", {})
+
+
+@pytest.mark.asyncio
+async def test_waits_through_loading_then_warms_up(server):
+    server.loading = 3
+    result = await wait_until_ready("whisper", roots=[server.root], timeout=5)
+    assert result["ready"] is True
+    instance = result["instances"][0]
+    assert instance["attempts"] == 4
+    assert instance["warm_ms"] is not None
+    assert server.requests[-1] == ("POST", "/v1/audio/transcriptions")
+
+
+@pytest.mark.asyncio
+async def test_kokoro_warm_up_synthesises_speech(server):
+    result = await wait_until_ready("kokoro", roots=[server.root], timeout=5)
+    assert result["ready"] is True
+    assert ("POST", "/v1/audio/speech") in server.requests
+
+
+@pytest.mark.asyncio
+async def test_health_only_skips_inference(server):
+    result = await wait_until_ready("whisper", roots=[server.root], timeout=5, warm=False)
+    assert result["ready"] is True
+    assert all(method == "GET" for method, _ in server.requests)
+
+
+@pytest.mark.asyncio
+async def test_failed_inference_is_not_ready(server):
+    server.inference_status = 500
+    result = await wait_until_ready("whisper", roots=[server.root], timeout=0.3)
+    assert result["ready"] is False
+    assert "500" in result["error"]
+    # Health passed once and is not re-checked while the inference is retried
+    assert server.requests.count(("GET", "/health")) == 1
+
+
+@pytest.mark.asyncio
+async def test_every_pool_instance_must_be_ready(server):
+    unused = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    dead_root = f"http://127.0.0.1:{unused.server_address[1]}"
+    unused.server_close()
+    result = await wait_until_ready("whisper", roots=[server.root, dead_root], timeout=0.3)
+    assert result["ready"] is False
+    assert [i["ready"] for i in result["instances"]] == [True, False]
+
+
+@pytest.mark.asyncio
+async def test_exited_process_ends_wait_early(server):
+    server.loading = 1000
+    process = subprocess.Popen([sys.executable, "-c", "raise SystemExit(3)"])
+    process.wait()
+    result = await wait_until_ready("whisper", roots=[server.root], timeout=30, process=process)
+    assert result["ready"] is False
+    assert result["error"] == "process exited with code 3"
+    assert result["elapsed_s"] < 5
+
+
+@pytest.mark.asyncio
+async def test_wait_for_services_waits_on_launch_and_probe(server, monkeypatch):
+    monkeypatch.setattr(readiness, "service_roots", lambda name: [server.root])
+    launched = []
+
+    async def launch():
+        launched.append(True)
+        await asyncio.sleep(0.05)
+        return None
+
+    task = watch_readiness("kokoro", launch=launch, timeout=5)
+    assert watch_readiness("kokoro", launch=launch) is task
+    results = await wait_for_services(["whisper", "kokoro"])
+    assert list(results) == ["kokoro"]
+    assert results["kokoro"]["ready"] is True
+    assert launched == [True]
+    # Nothing pending any more, so later calls return at once
+    assert await wait_for_services(["whisper", "kokoro"]) == {}
@@ -0,0 +1,54 @@
+"""Tests for startup initialization running from the MCP server lifespan."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+import voice_mode.config
+from voice_mode import server
+from voice_mode.tools import converse
+
+
+@pytest.fixture
+def startup(monkeypatch):
+    for name in ("WARMUP_ENABLED", "AUTO_START_SERVICES", "AUTO_START_KOKORO"):
+        monkeypatch.setattr(voice_mode.config, name, False)
+    monkeypatch.delenv("VOICE_MODE_AUTO_START_KOKORO", raising=False)
+    mock = AsyncMock()
+    monkeypatch.setattr(converse, "startup_initialization", mock)
+    return mock
+
+
+async def _run_lifespan():
+    async with server._lifespan(server.mcp):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("setting", ["WARMUP_ENABLED", "AUTO_START_SERVICES", "AUTO_START_KOKORO"])
+async def test_startup_runs_at_launch_when_configured(startup, monkeypatch, setting):
+    monkeypatch.setattr(voice_mode.config, setting, True)
+    await _run_lifespan()
+    startup.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_legacy_kokoro_variable_runs_startup_at_launch(startup, monkeypatch):
+    monkeypatch.setenv("VOICE_MODE_AUTO_START_KOKORO", "true")
+    await _run_lifespan()
+    startup.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_startup_waits_for_first_call_by_default(startup):
+    await _run_lifespan()
+    startup.assert_not_called()
+
+
+def test_auto_start_mode(monkeypatch, startup):
+    assert converse.auto_start_mode() is None
+    monkeypatch.setenv("VOICE_MODE_AUTO_START_KOKORO", "1")
+    assert converse.auto_start_mode() == "kokoro"
+    monkeypatch.setattr(voice_mode.config, "AUTO_START_SERVICES", True)
+    assert converse.auto_start_mode() == "services"
@@ -24,7 +24,7 @@ def test_load_service_file_version():
     
     # Test for whisper on Linux
     version = load_service_file_version("whisper", "service")
-    assert version == "1.1.0"
+    assert version == "1.2.0"
 
 
 def test_get_service_config_vars():
@@ -92,5 +92,4 @@ def test_template_placeholders():
         # Whisper templates
         whisper_systemd = load_service_template("whisper")
         assert "{WHISPER_PORT}" in whisper_systemd
-        assert "{WHISPER_BIN}" in whisper_systemd
-        assert "{MODEL_FILE}" in whisper_systemd
\ No newline at end of file
+        assert "{START_SCRIPT_PATH}" in whisper_systemd
\ No newline at end of file
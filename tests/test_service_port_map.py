@@ -0,0 +1,90 @@
+"""Tests for the cached port -> process lookup used by service status."""
+
+import os
+import socket
+from collections import namedtuple
+from unittest.mock import patch
+
+import psutil
+import pytest
+
+from voice_mode.utils.services import common
+from voice_mode.utils.services.common import (
+    find_process_by_port,
+    invalidate_port_map,
+    listening_ports,
+    probe_services,
+)
+
+Addr = namedtuple("Addr", "ip port")
+Conn = namedtuple("Conn", "fd family type laddr raddr status pid")
+
+
+def conn(port, pid, status=psutil.CONN_LISTEN):
+    return Conn(-1, socket.AF_INET, socket.SOCK_STREAM, Addr("127.0.0.1", port), (), status, pid)
+
+
+@pytest.fixture(autouse=True)
+def fresh_map():
+    invalidate_port_map()
+    yield
+    invalidate_port_map()
+
+
+def test_single_scan_serves_every_lookup():
+    table = [conn(2022, 101), conn(8880, 102), conn(443, 103, psutil.CONN_ESTABLISHED)]
+    with patch("psutil.net_connections", return_value=table) as scan:
+        assert listening_ports() == {2022: [101], 8880: [102]}
+        listening_ports()
+        listening_ports()
+    assert scan.call_count == 1
+
+
+def test_max_age_zero_forces_a_new_scan():
+    with patch("psutil.net_connections", return_value=[]) as scan:
+        listening_ports()
+        listening_ports(max_age=0)
+    assert scan.call_count == 2
+
+
+def test_falls_back_to_per_process_scan_when_denied():
+    class FakeProc:
+        pid = 201
+
+        def net_connections(self, kind="inet"):
+            return [conn(2022, None)]
+
+    with patch("psutil.net_connections", side_effect=psutil.AccessDenied()), \
+         patch("psutil.process_iter", return_value=[FakeProc()]):
+        assert listening_ports() == {2022: [201]}
+
+
+def test_find_process_by_port_for_a_real_listener():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        port = sock.getsockname()[1]
+        try:
+            proc = find_process_by_port(port)
+        except psutil.AccessDenied:
+            pytest.skip("connection table not readable here")
+        if proc is None and port not in listening_ports():
+            pytest.skip("connection table not readable here")
+        assert proc.pid == os.getpid()
+
+
+def test_ssh_port_forwards_are_not_local_processes():
+    with patch("psutil.net_connections", return_value=[conn(2022, os.getpid())]), \
+         patch.object(psutil.Process, "name", return_value="ssh"):
+        assert find_process_by_port(2022) is None
+
+
+@pytest.mark.asyncio
+async def test_probe_services_scans_once_for_all_services():
+    with patch("psutil.net_connections", return_value=[conn(2022, os.getpid())]) as scan, \
+         patch.object(common, "is_port_accessible", side_effect=lambda port: port == 7880):
+        result = await probe_services({"whisper": 2022, "kokoro": 8880, "livekit": 7880})
+    assert scan.call_count == 1
+    assert result["whisper"][0] == "local" and result["whisper"][1].pid == os.getpid()
+    assert result["kokoro"] == ("not_available", None)
+    assert result["livekit"] == ("forwarded", None)
@@ -0,0 +1,170 @@
+"""Tests for the resident sound-font player."""
+
+import os
+import struct
+import wave
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+import voice_mode.soundfont_player as soundfont_player
+from voice_mode.cli_commands.hook import find_sound_file
+from voice_mode.daemon import default_handlers
+from voice_mode.soundfont_player import SoundFontIndex, SoundFontPlayer, sound_file_candidates
+
+
+def write_wav(path: Path, frames: int, value: int = 8192, rate: int = 8000) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(struct.pack(f"<{frames}h", *([value] * frames)))
+    return path
+
+
+class FakeStream:
+    opened = 0
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.active = False
+        FakeStream.opened += 1
+
+    def start(self):
+        self.active = True
+
+    def stop(self):
+        self.active = False
+
+    def close(self):
+        self.active = False
+
+
+@pytest.fixture
+def font(tmp_path):
+    fonts = tmp_path / "soundfonts"
+    real = fonts / "default"
+    write_wav(real / "PreToolUse" / "default.wav", 400)
+    write_wav(real / "PreToolUse" / "bash" / "default.wav", 800)
+    write_wav(real / "fallback.wav", 200)
+    os.symlink(real, fonts / "current")
+    return fonts / "current"
+
+
+@pytest.fixture
+def player(font):
+    FakeStream.opened = 0
+    with patch.object(soundfont_player, "sd", SimpleNamespace(OutputStream=FakeStream)):
+        player = SoundFontPlayer(font, sample_rate=8000, channels=2, max_voices=2, blocksize=64)
+        yield player
+        player.close()
+
+
+def mix(player, frames=64):
+    out = np.ones((frames, player.channels), dtype=np.float32)
+    player._callback(out, frames, None, None)
+    return out
+
+
+class TestIndex:
+    def test_candidates_match_hook_lookup(self, font, monkeypatch):
+        monkeypatch.setenv("HOME", str(font.parent.parent))
+        (font.parent.parent / ".voicemode").mkdir()
+        os.symlink(font.parent, font.parent.parent / ".voicemode" / "soundfonts")
+        index = SoundFontIndex(font)
+        for event, tool in (("PreToolUse", "Bash"), ("start", "Read"), ("PostToolUse", "Edit")):
+            assert find_sound_file(event, tool) == index.find(event, tool)
+
+    def test_candidate_order(self):
+        assert sound_file_candidates("start", "Task", "Explore")[:4] == [
+            "PreToolUse/task/subagent/explore.mp3",
+            "PreToolUse/task/subagent/explore.wav",
+            "PreToolUse/task/default.mp3",
+            "PreToolUse/task/default.wav",
+        ]
+        assert sound_file_candidates("PostToolUse", "Bash")[-1] == "fallback.wav"
+
+    def test_reindexes_on_change(self, font):
+        index = SoundFontIndex(font)
+        assert index.find("PreToolUse", "Read").name == "default.wav"
+        assert index.find("PostToolUse", "Read").name == "fallback.wav"
+        generation = index.generation
+
+        write_wav(font / "PostToolUse" / "read" / "default.wav", 100)
+        index._watcher._last_poll -= 60  # in case inotify is unavailable
+        assert index.find("PostToolUse", "Read") == font.resolve() / "PostToolUse" / "read" / "default.wav"
+        assert index.generation == generation + 1
+
+    def test_missing_font(self, tmp_path):
+        assert SoundFontIndex(tmp_path / "none").find("PreToolUse", "Bash") is None
+
+
+class TestPlayer:
+    def test_clips_are_decoded_once(self, player, font):
+        clip = player.clip(font / "fallback.wav")
+        assert clip.shape == (200, 2) and clip.dtype == np.float32
+        assert player.clip(font / "fallback.wav") is clip
+        assert player.preload() == 3
+
+    def test_mixes_into_one_stream(self, player, font):
+        assert player.play_event("PreToolUse", "Bash") == font.resolve() / "PreToolUse" / "bash" / "default.wav"
+        assert player.play(font / "fallback.wav", volume=0.5)
+        assert FakeStream.opened == 1 and player.active_voices == 2
+        assert mix(player)[0, 0] == pytest.approx(0.25 + 0.125)
+
+        for _ in range(3):  # the 200-frame fallback runs out first
+            mix(player)
+        assert player.active_voices == 1
+        for _ in range(10):
+            out = mix(player)
+        assert player.active_voices == 0 and not out.any()
+
+    def test_retrigger_and_voice_limit(self, player, font):
+        bash = font / "PreToolUse" / "bash" / "default.wav"
+        assert player.play(bash)
+        mix(player)
+        assert player.play(bash)
+        assert player.active_voices == 1 and player._voices[0].position == 0
+
+        assert player.play(font / "fallback.wav")
+        assert player.play(font / "PreToolUse" / "default.wav")
+        assert [Path(v.key).name for v in player._voices] == ["fallback.wav", "default.wav"]
+
+    def test_mix_is_clipped(self, player, font):
+        loud = write_wav(font / "loud.wav", 100, value=30000)
+        assert player.play(loud, volume=2.0)
+        assert mix(player).max() == 1.0
+
+    def test_edits_invalidate_decoded_clips(self, player, font):
+        path = font / "fallback.wav"
+        assert len(player.clip(path)) == 200
+        write_wav(path, 300)
+        player.index._watcher._last_poll -= 60
+        player.index.refresh_if_changed()
+        assert len(player.clip(path)) == 300
+
+    def test_undecodable_clip(self, player, tmp_path):
+        bad = tmp_path / "bad.wav"
+        bad.write_bytes(b"not audio")
+        assert not player.play(bad)
+        assert player.active_voices == 0
+
+
+class TestDaemonHandlers:
+    async def test_hook_sound_falls_back_to_ffplay(self, player, font):
+        handlers = default_handlers()
+        with patch.object(soundfont_player, "get_soundfont_player", return_value=player), \
+             patch.object(player, "_ensure_stream", side_effect=OSError("no device")), \
+             patch("voice_mode.tools.sound_fonts.audio_player.Player.play", return_value=True) as ffplay:
+            played = await handlers["hook_sound"](event="PreToolUse", tool="Bash")
+        assert played == str(font.resolve() / "PreToolUse" / "bash" / "default.wav")
+        ffplay.assert_called_once_with(played)
+
+    async def test_hook_sound_without_clip(self, tmp_path):
+        empty = SoundFontPlayer(tmp_path)
+        with patch.object(soundfont_player, "get_soundfont_player", return_value=empty):
+            assert await default_handlers()["hook_sound"](event="PreToolUse", tool="Bash") is None
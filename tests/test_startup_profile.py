@@ -0,0 +1,127 @@
+"""Tests for deferred imports and the startup profiler."""
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from voice_mode.utils import startup_profile
+from voice_mode.utils.lazy import lazy_import, module_available, when_imported
+from voice_mode.utils.startup_profile import (
+    StartupProfile,
+    format_profile,
+    parse_importtime,
+)
+
+
+@pytest.fixture
+def fake_module(temp_dir, monkeypatch):
+    """Create an importable module that records when it is executed."""
+    name = "voicemode_lazy_fixture"
+    (temp_dir / f"{name}.py").write_text(
+        "LOADS = []\nLOADS.append(1)\n"
+        "def greet(who):\n    return f'hello {who}'\n"
+    )
+    monkeypatch.syspath_prepend(str(temp_dir))
+    yield name
+    sys.modules.pop(name, None)
+
+
+class TestLazyImport:
+    def test_import_deferred_until_first_use(self, fake_module):
+        proxy = lazy_import(fake_module)
+        assert fake_module not in sys.modules
+        assert not proxy.is_loaded
+        assert proxy.greet("world") == "hello world"
+        assert proxy.is_loaded
+        assert sys.modules[fake_module].LOADS == [1]
+
+    def test_attribute_proxy_is_callable(self, fake_module):
+        greet = lazy_import(fake_module, "greet")
+        assert fake_module not in sys.modules
+        assert greet("you") == "hello you"
+
+    def test_patch_through_proxy(self, fake_module):
+        proxy = lazy_import(fake_module)
+        with patch.object(proxy, "greet", return_value="patched"):
+            assert proxy.greet("x") == "patched"
+        assert proxy.greet("x") == "hello x"
+
+    def test_missing_module_fails_on_use(self):
+        proxy = lazy_import("voicemode_no_such_module")
+        with pytest.raises(ImportError):
+            proxy.anything
+        assert not module_available("voicemode_no_such_module")
+        assert module_available("json")
+
+
+class TestWhenImported:
+    def test_hook_runs_once_on_first_import(self, fake_module):
+        seen = []
+        when_imported(fake_module, lambda module: seen.append(module.LOADS[:]))
+        assert seen == []
+        __import__(fake_module)
+        __import__(fake_module)
+        assert seen == [[1]]
+
+    def test_hook_runs_immediately_when_loaded(self):
+        seen = []
+        when_imported("json", lambda module: seen.append(module.__name__))
+        assert seen == ["json"]
+
+
+def test_audio_stack_not_imported_with_core():
+    """Importing the TTS core must not import the audio stack."""
+    code = (
+        "import sys, voice_mode.core, voice_mode.simple_failover, voice_mode.streaming\n"
+        "print(sorted(m for m in ('numpy', 'sounddevice', 'pydub', 'openai', 'httpx', 'scipy')"
+        " if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+class TestStartupProfile:
+    IMPORTTIME = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |     _io",
+        "import time:      3000 |       3000 |     httpx._client",
+        "import time:      1000 |       4000 |   httpx",
+        "2026-10-19 12:00:00 - voicemode - INFO - Starting VoiceMode",
+        "import time:       500 |       4500 | voice_mode.server",
+    ])
+
+    def test_parse_importtime(self):
+        records = parse_importtime(self.IMPORTTIME)
+        assert [r.name for r in records] == ["_io", "httpx._client", "httpx", "voice_mode.server"]
+        assert records[1].self_us == 3000 and records[1].depth == 2
+        assert records[2].cumulative_us == 4000 and records[2].depth == 1
+
+    def test_format_profile(self):
+        profile = StartupProfile(
+            wall_seconds=0.5,
+            import_seconds=0.3,
+            setup_seconds=0.05,
+            imports=parse_importtime(self.IMPORTTIME),
+            deferred_loaded=["httpx"],
+        )
+        assert profile.by_package()["httpx"] == pytest.approx(0.004)
+        assert profile.interpreter_seconds == pytest.approx(0.15)
+        report = format_profile(profile)
+        assert "Time to ready:" in report and "500.0 ms" in report
+        assert "voice_mode.server" in report
+        assert "Deferred modules imported at startup: httpx" in report
+
+    def test_profile_run_has_no_server_side_effects(self):
+        summary = '{"import_seconds": 0.2, "setup_seconds": 0.01, "deferred_loaded": []}'
+        done = subprocess.CompletedProcess([], 0, stdout=startup_profile._MARKER + summary,
+                                           stderr=self.IMPORTTIME)
+        with patch("subprocess.run", return_value=done) as run:
+            profile = startup_profile.profile_startup()
+        env = run.call_args.kwargs["env"]
+        assert env["VOICEMODE_METRICS_PORT"] == "0" and env["VOICEMODE_METRICS_FILE"] == ""
+        assert env["VOICEMODE_EVENT_LOG_ENABLED"] == "false" and env["VOICEMODE_SAVE_ALL"] == "false"
+        assert env["VOICEMODE_LOG_ARCHIVE_DAYS"] == "0"
+        assert profile.import_seconds == 0.2
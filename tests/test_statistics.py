@@ -0,0 +1,139 @@
+"""Tests for streaming conversation statistics and their persistence."""
+
+import json
+
+import numpy as np
+import pytest
+
+from voice_mode.statistics import ConversationStatistics, QuantileSketch
+
+
+def _add(tracker, i, success=True, provider="kokoro"):
+    tracker.add_conversation_result(
+        f"message {i}", f"response {i}",
+        timings={"ttfa": 0.1 * (i + 1), "total": 1.0 + i},
+        transport="local", voice_provider=provider, voice_name="af_sky", model="tts-1",
+        success=success,
+    )
+
+
+class TestQuantileSketch:
+    def test_relative_accuracy(self):
+        values = np.random.default_rng(1).lognormal(size=5000)
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(float(value))
+        for q in (0.5, 0.9, 0.99):
+            exact = np.quantile(values, q, method="lower")
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+
+    def test_round_trip_and_zeros(self):
+        sketch = QuantileSketch()
+        for value in (0.0, 0.0, 1.0, 2.0):
+            sketch.add(value)
+        restored = QuantileSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+        assert restored.quantile(0.0) == 0.0
+        assert restored.quantile(1.0) == pytest.approx(2.0, rel=0.01)
+        assert QuantileSketch().quantile(0.5) is None
+
+
+class TestConversationStatistics:
+    def test_aggregates(self):
+        tracker = ConversationStatistics(max_metrics=3)
+        for i in range(10):
+            _add(tracker, i, success=i != 9, provider="openai" if i == 0 else "kokoro")
+
+        stats = tracker.get_session_statistics()
+        assert stats.total_interactions == 10
+        assert stats.failed_interactions == 1
+        # Timing stats cover successful interactions beyond the recent window
+        assert stats.min_ttfa == pytest.approx(0.1)
+        assert stats.max_ttfa == pytest.approx(0.9)
+        assert stats.avg_total_time == pytest.approx(5.0)
+        assert stats.p50_total_time == pytest.approx(5.0, rel=0.02)
+        assert stats.voice_providers_used == {"openai": 1, "kokoro": 9}
+        assert [m.message for m in tracker.get_recent_metrics(10)] == ["message 7", "message 8", "message 9"]
+        assert [m.message for m in tracker.get_recent_metrics(1)] == ["message 9"]
+
+    def test_empty(self):
+        tracker = ConversationStatistics()
+        assert tracker.get_session_statistics().total_interactions == 0
+        assert tracker.get_recent_metrics() == []
+        assert tracker.export_metrics()["metrics"] == []
+
+    def test_persists_across_instances(self, temp_dir):
+        path = temp_dir / "statistics.jsonl"
+        tracker = ConversationStatistics(snapshot_path=path)
+        for i in range(5):
+            _add(tracker, i)
+        before = tracker.get_session_statistics()
+
+        restored = ConversationStatistics(snapshot_path=path)
+        after = restored.get_session_statistics()
+        assert after.total_interactions == 5
+        assert after.start_time == before.start_time
+        assert after.avg_ttfa == pytest.approx(before.avg_ttfa)
+        assert after.p90_total_time == before.p90_total_time
+        assert restored.get_recent_metrics(1)[0].message == "message 4"
+
+    def test_compaction_keeps_totals(self, temp_dir):
+        path = temp_dir / "statistics.jsonl"
+        tracker = ConversationStatistics(snapshot_path=path, max_metrics=4, compact_after=3)
+        for i in range(8):
+            _add(tracker, i)
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert records[0]["type"] == "snapshot"
+        assert len(records) <= 4
+
+        restored = ConversationStatistics(snapshot_path=path, max_metrics=4, compact_after=3)
+        stats = restored.get_session_statistics()
+        assert stats.total_interactions == 8
+        assert stats.max_total_time == pytest.approx(8.0)
+        assert len(restored.get_recent_metrics(10)) == 4
+
+    def test_torn_line_is_skipped(self, temp_dir):
+        path = temp_dir / "statistics.jsonl"
+        tracker = ConversationStatistics(snapshot_path=path)
+        _add(tracker, 0)
+        with open(path, "a") as f:
+            f.write('{"type": "metric", "timest')
+        assert ConversationStatistics(snapshot_path=path).get_session_statistics().total_interactions == 1
+
+    def test_append_after_torn_line_is_kept(self, temp_dir):
+        path = temp_dir / "statistics.jsonl"
+        tracker = ConversationStatistics(snapshot_path=path)
+        _add(tracker, 0)
+        with open(path, "a") as f:
+            f.write('{"type": "metric", "timest')
+        _add(tracker, 1)
+        assert ConversationStatistics(snapshot_path=path).get_session_statistics().total_interactions == 2
+
+    def test_processes_sharing_a_file_keep_each_others_metrics(self, temp_dir):
+        path = temp_dir / "statistics.jsonl"
+        first = ConversationStatistics(snapshot_path=path, compact_after=3)
+        second = ConversationStatistics(snapshot_path=path, compact_after=3)
+        # Interleaved, so each compaction happens after the other one appended
+        for i in range(10):
+            _add(first, i, provider="kokoro")
+            _add(second, i, provider="openai")
+
+        for tracker in (first, second, ConversationStatistics(snapshot_path=path)):
+            stats = tracker.get_session_statistics()
+            assert stats.total_interactions == 20
+            assert stats.voice_providers_used == {"kokoro": 10, "openai": 10}
+
+    def test_clear_resets_file(self, temp_dir):
+        path = temp_dir / "statistics.jsonl"
+        tracker = ConversationStatistics(snapshot_path=path)
+        _add(tracker, 0)
+        tracker.clear_statistics()
+        assert ConversationStatistics(snapshot_path=path).get_session_statistics().total_interactions == 0
+
+    def test_export_and_dashboard(self):
+        tracker = ConversationStatistics()
+        _add(tracker, 0)
+        export = tracker.export_metrics()
+        assert export["statistics"]["total_interactions"] == 1
+        assert len(export["metrics"]) == 1
+        assert "RECENT INTERACTIONS (1 of 1)" in tracker.format_dashboard()
@@ -0,0 +1,117 @@
+"""Tests for structured exchange timings (schema v4)."""
+
+import json
+
+import pytest
+
+from voice_mode.conversation_logger import ConversationLogger
+from voice_mode.exchanges.models import Exchange
+from voice_mode.exchanges.stats import ExchangeStats
+from voice_mode.statistics import ConversationStatistics
+from voice_mode.timings import (
+    TimingStage,
+    format_timings,
+    parse_legacy_timing,
+    to_timings_ms,
+)
+
+
+class TestTimingHelpers:
+    def test_to_timings_ms_keeps_precision_and_drops_unknown(self):
+        assert to_timings_ms({"ttfa": 0.51234, TimingStage.TTS_GEN: 1.2, "bogus": 3.0, "stt": None}) == {
+            "ttfa": 512.34,
+            "tts_gen": 1200.0,
+        }
+        assert to_timings_ms({}) is None
+        assert to_timings_ms({"bogus": 1.0}) is None
+
+    def test_parse_legacy_maps_labels(self):
+        assert parse_legacy_timing("ttfa 0.5s, gen 1.2s, play 2.1s") == {
+            "ttfa": 500.0, "tts_gen": 1200.0, "tts_play": 2100.0,
+        }
+        assert parse_legacy_timing("tts_gen 1.0s, record 3.0s, stt 0.4s, total 4.5s, weird 1s") == {
+            "tts_gen": 1000.0, "record": 3000.0, "stt": 400.0, "total": 4500.0,
+        }
+        assert parse_legacy_timing(None) == {}
+
+    def test_format_round_trips_legacy_string(self):
+        legacy = "ttfa 0.5s, gen 1.2s, play 2.1s"
+        assert format_timings(parse_legacy_timing(legacy)) == legacy
+        assert format_timings({}) == ""
+
+
+class TestConversationLoggerV4:
+    def _entries(self, temp_dir):
+        lines = []
+        for log_file in temp_dir.glob("exchanges_*.jsonl"):
+            lines.extend(log_file.read_text().splitlines())
+        return [json.loads(line) for line in lines]
+
+    def test_logs_numeric_timings(self, temp_dir):
+        logger = ConversationLogger(base_dir=temp_dir)
+        logger.log_tts("Hello", provider="kokoro", timings={"ttfa": 0.4567, "tts_gen": 1.0, "tts_play": 2.0})
+        logger.log_stt("Hi", provider="whisper", timings={"record": 3.25, "stt": 0.5})
+
+        tts, stt = self._entries(temp_dir)
+        assert tts["version"] == 4
+        assert tts["timings"] == {"ttfa": 456.7, "tts_gen": 1000.0, "tts_play": 2000.0}
+        assert "timing" not in tts["metadata"]
+        assert stt["timings"] == {"record": 3250.0, "stt": 500.0}
+
+    def test_legacy_timing_kwarg_is_converted(self, temp_dir):
+        logger = ConversationLogger(base_dir=temp_dir)
+        logger.log_tts("Hello", timing="ttfa 0.5s, gen 1.0s")
+        logger.log_tts("Quiet")
+
+        with_timing, without = self._entries(temp_dir)
+        assert with_timing["timings"] == {"ttfa": 500.0, "tts_gen": 1000.0}
+        assert "timings" not in without
+
+
+class TestReadingTimings:
+    def _line(self, version, **fields):
+        entry = {
+            "version": version,
+            "timestamp": "2024-05-01T10:00:00+00:00",
+            "conversation_id": "conv_1",
+            "type": "tts",
+            "text": "hello",
+            "metadata": {"voice_mode_version": "test"},
+        }
+        entry.update(fields)
+        return json.dumps(entry)
+
+    def test_v4_and_legacy_agree(self):
+        v2 = Exchange.from_jsonl(self._line(2, metadata={"voice_mode_version": "x", "timing": "ttfa 0.5s, gen 1.2s"}))
+        v4 = Exchange.from_jsonl(self._line(4, timings={"ttfa": 500.0, "tts_gen": 1200.0}))
+        assert v2.timings == v4.timings == {"ttfa": 500.0, "tts_gen": 1200.0}
+        assert v2.timing_summary == v4.timing_summary == "ttfa 0.5s, gen 1.2s"
+
+    def test_to_dict_keeps_v4_timings(self):
+        v4 = Exchange.from_jsonl(self._line(4, timings={"ttfa": 123.456}))
+        assert v4.to_dict()["timings"] == {"ttfa": 123.456}
+        assert Exchange.from_jsonl(v4.to_jsonl()) == v4
+
+    def test_stats_use_full_precision(self):
+        stats = ExchangeStats([
+            Exchange.from_jsonl(self._line(4, timings={"ttfa": 123.456})),
+            Exchange.from_jsonl(self._line(3, metadata={"voice_mode_version": "x", "timing": "ttfa 0.2s"})),
+        ])
+        ttfa = stats.timing_stats()["tts"]["ttfa"]
+        assert ttfa["count"] == 2
+        assert ttfa["min"] == pytest.approx(0.123456)
+
+
+class TestConversationStatistics:
+    def test_numeric_timings(self):
+        tracker = ConversationStatistics()
+        tracker.add_conversation_result("hi", "hello", timings={"ttfa": 0.25, "tts_gen": 1.5, "total": 4.0})
+        metric = tracker._metrics[-1]
+        assert (metric.ttfa, metric.tts_generation, metric.total_time) == (0.25, 1.5, 4.0)
+
+    def test_legacy_string_uses_short_labels(self):
+        tracker = ConversationStatistics()
+        tracker.add_conversation_result("hi", "hello", timing_str="ttfa 0.5s, gen 1.2s, play 2.1s, total 4.0s")
+        metric = tracker._metrics[-1]
+        assert metric.tts_generation == pytest.approx(1.2)
+        assert metric.tts_playback == pytest.approx(2.1)
@@ -190,6 +190,47 @@ class TestToolFiltering:
         assert len(tools) > 0  # Should load all tools
 
 
+class TestToolManifest:
+    """Test the prebuilt tool manifest."""
+
+    def test_manifest_is_current(self):
+        """The checked-in manifest matches the tool modules on disk."""
+        from voice_mode.tools._manifest import MANIFEST_FILE, build_manifest, render_manifest
+
+        assert MANIFEST_FILE.read_text() == render_manifest(build_manifest()), \
+            "Tool manifest is stale - run `python voice_mode/tools/_manifest.py`"
+
+    def test_build_manifest(self, tmp_path):
+        """Modules are named, flattened and scanned for @mcp.tool without importing."""
+        from voice_mode.tools._manifest import build_manifest
+
+        (tmp_path / "__init__.py").write_text("")
+        (tmp_path / "_private.py").write_text("")
+        (tmp_path / "alpha.py").write_text(
+            "import missing_dependency\n"
+            "@mcp.tool()\nasync def alpha(): pass\n"
+            "@mcp.tool(name='beta_tool')\ndef beta(): pass\n"
+            "def helper(): pass\n"
+        )
+        (tmp_path / "sound_fonts").mkdir()
+        (tmp_path / "sound_fonts" / "__init__.py").write_text("")
+        (tmp_path / "sound_fonts" / "types.py").write_text("")
+        (tmp_path / "sound_fonts" / "player.py").write_text("@mcp.tool\ndef play(): pass\n")
+
+        assert build_manifest(tmp_path) == {
+            "alpha": {"module": ".alpha", "registers": ["alpha", "beta_tool"]},
+            "sound_fonts_player": {"module": ".sound_fonts.player", "registers": ["play"]},
+        }
+
+    def test_load_unknown_tool_does_not_import(self):
+        """Unknown tool names fail without trial imports."""
+        from voice_mode.tools import load_tool
+
+        with patch('voice_mode.tools.importlib.import_module') as mock_import:
+            assert load_tool("sound_fonts_nonexistent") is False
+            mock_import.assert_not_called()
+
+
 class TestCLIArguments:
     """Test CLI argument handling for tool filtering."""
 
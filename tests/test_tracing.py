@@ -0,0 +1,157 @@
+"""Tests for converse tracing spans and their export formats."""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from voice_mode.utils.tracing import (
+    NOOP_SPAN,
+    Tracer,
+    bind,
+    current_span,
+    iter_spans,
+    last_traces,
+    set_tracer,
+    span,
+    to_chrome_trace,
+    to_otlp_json,
+    traced,
+)
+
+
+@pytest.fixture
+def tracer(temp_dir):
+    tracer = Tracer(temp_dir)
+    previous = set_tracer(tracer)
+    yield tracer
+    set_tracer(previous)
+
+
+def _spans(tracer):
+    tracer.flush()
+    return {record["name"]: record for record in iter_spans(tracer.trace_dir)}
+
+
+class TestSpans:
+    def test_disabled_is_noop(self, temp_dir):
+        previous = set_tracer(None)
+        try:
+            with span("tts", endpoint="x") as s:
+                s.set(bytes=1)
+                s.event("mark")
+            assert s is NOOP_SPAN
+            assert current_span() is NOOP_SPAN
+        finally:
+            set_tracer(previous)
+
+    def test_nesting_attributes_and_events(self, tracer):
+        with span("converse", transport="local") as root:
+            with span("tts.request", endpoint="http://127.0.0.1:8880/v1", format="pcm") as request:
+                request.set(bytes=4096)
+                current_span().event("first_byte", size=512)
+            assert current_span() is root
+
+        spans = _spans(tracer)
+        parent, child = spans["converse"], spans["tts.request"]
+        assert child["parent_id"] == parent["span_id"]
+        assert child["trace_id"] == parent["trace_id"]
+        assert parent["parent_id"] is None
+        assert child["attributes"] == {"endpoint": "http://127.0.0.1:8880/v1", "format": "pcm", "bytes": 4096}
+        assert child["events"][0]["name"] == "first_byte"
+        assert parent["start_ns"] <= child["start_ns"]
+        assert child["duration_ns"] <= parent["duration_ns"]
+
+    def test_error_status(self, tracer):
+        with pytest.raises(ValueError):
+            with span("stt.attempt"):
+                raise ValueError("boom")
+        record = _spans(tracer)["stt.attempt"]
+        assert record["status"] == "error"
+        assert record["attributes"]["error"] == "ValueError"
+
+    def test_children_written_with_root(self, tracer):
+        with span("converse"):
+            with span("chime"):
+                pass
+            assert not tracer.path.exists()
+        assert len(tracer.path.read_text().splitlines()) == 2
+
+    async def test_traced_async_and_bound_executor(self, tracer):
+        def record():
+            with span("record"):
+                return threading.get_ident()
+
+        @traced("stt")
+        async def transcribe():
+            await asyncio.sleep(0)
+
+        with span("converse"):
+            worker = await asyncio.get_running_loop().run_in_executor(None, bind(record))
+            await transcribe()
+
+        spans = _spans(tracer)
+        root_id = spans["converse"]["span_id"]
+        assert spans["record"]["parent_id"] == root_id
+        assert spans["record"]["tid"] == worker
+        assert spans["stt"]["parent_id"] == root_id
+
+    def test_rotation(self, temp_dir):
+        tracer = Tracer(temp_dir, max_bytes=600, backup_count=2)
+        previous = set_tracer(tracer)
+        try:
+            for i in range(20):
+                with span("turn", i=i):
+                    pass
+        finally:
+            set_tracer(previous)
+        files = sorted(p.name for p in temp_dir.iterdir())
+        assert files == ["spans.jsonl", "spans.jsonl.1", "spans.jsonl.2"]
+        indices = [record["attributes"]["i"] for record in iter_spans(temp_dir)]
+        assert indices == sorted(indices) and indices[-1] == 19
+
+
+class TestExport:
+    @pytest.fixture
+    def spans(self, tracer):
+        for turn in range(3):
+            with span("converse", turn=turn):
+                with span("tts.attempt", endpoint="http://localhost:8880/v1", ok=True, ratio=0.5) as s:
+                    s.event("speech_start")
+        return list(iter_spans(tracer.trace_dir))
+
+    def test_last_traces(self, spans):
+        last = last_traces(spans, 1)
+        assert len(last) == 2
+        assert {s["trace_id"] for s in last} == {spans[-1]["trace_id"]}
+
+    def test_chrome_trace(self, spans):
+        document = json.loads(json.dumps(to_chrome_trace(spans)))
+        complete = [e for e in document["traceEvents"] if e["ph"] == "X"]
+        instants = [e for e in document["traceEvents"] if e["ph"] == "i"]
+        assert len(complete) == 6 and len(instants) == 3
+        attempt = next(e for e in complete if e["name"] == "tts.attempt")
+        assert attempt["cat"] == "tts"
+        assert attempt["args"]["endpoint"] == "http://localhost:8880/v1"
+        record = next(s for s in spans if s["span_id"] == attempt["args"]["span_id"])
+        assert attempt["ts"] == record["start_ns"] / 1000
+        assert attempt["dur"] == record["duration_ns"] / 1000
+
+    def test_otlp_json(self, spans):
+        document = to_otlp_json(spans)
+        otlp_spans = document["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        assert len(otlp_spans) == 6
+        child = next(s for s in otlp_spans if s["name"] == "tts.attempt")
+        assert len(child["traceId"]) == 32 and len(child["spanId"]) == 16
+        assert child["parentSpanId"]
+        assert int(child["endTimeUnixNano"]) >= int(child["startTimeUnixNano"])
+        values = {a["key"]: a["value"] for a in child["attributes"]}
+        assert values == {
+            "endpoint": {"stringValue": "http://localhost:8880/v1"},
+            "ok": {"boolValue": True},
+            "ratio": {"doubleValue": 0.5},
+        }
+        root = next(s for s in otlp_spans if s["name"] == "converse")
+        assert "parentSpanId" not in root
+        assert root["attributes"] == [{"key": "turn", "value": {"intValue": "0"}}]
@@ -75,7 +75,8 @@ class TestUnifiedServiceTool:
              patch('subprocess.Popen') as mock_popen, \
              patch('subprocess.run') as mock_run, \
              patch('pathlib.Path.exists', return_value=False), \
-             patch('asyncio.sleep'):
+             patch('voice_mode.tools.service.wait_until_ready',
+                   return_value={"ready": True, "elapsed_s": 1.5, "error": None}) as mock_ready:
             
             mock_process = MagicMock()
             mock_process.poll.return_value = None
@@ -88,6 +89,30 @@ class TestUnifiedServiceTool:
             assert "✅" in result
             assert "started successfully" in result
             assert "PID: 12345" in result
+            assert "ready in 1.5s" in result
+            mock_ready.assert_awaited_once_with("whisper", process=mock_process)
+
+    @pytest.mark.asyncio
+    async def test_direct_start_logs_to_files_not_pipes(self, tmp_path, monkeypatch):
+        """Output nobody reads must not go to pipes that can fill up"""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        with patch('voice_mode.tools.service.find_process_by_port', return_value=None), \
+             patch('voice_mode.tools.service.find_whisper_server', return_value="/path/to/whisper-server"), \
+             patch('voice_mode.tools.service.find_whisper_model', return_value="/path/to/model.bin"), \
+             patch('voice_mode.tools.service.WHISPER_INSTANCES', 1), \
+             patch('subprocess.Popen') as mock_popen, \
+             patch('subprocess.run', return_value=MagicMock(returncode=0)), \
+             patch('voice_mode.tools.service.wait_until_ready',
+                   return_value={"ready": False, "elapsed_s": 0.1, "error": "process exited with code 1"}):
+            def launch(cmd, stdout, stderr, cwd):
+                assert stdout.name.endswith("whisper.out.log") and stderr.name.endswith("whisper.err.log")
+                stderr.write(b"failed to load model\n")
+                stderr.flush()
+                return MagicMock(pid=12345, **{"poll.return_value": 1})
+            mock_popen.side_effect = launch
+
+            result = await service("whisper", "start")
+        assert result == "❌ Whisper failed to start: failed to load model\n"
     
     @pytest.mark.asyncio
     async def test_start_whisper_missing_binary(self):
@@ -0,0 +1,119 @@
+"""Tests for the background warm-up and the caches it fills."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from voice_mode import warmup
+from voice_mode.utils.event_logger import EventLogger
+
+
+@pytest.fixture(autouse=True)
+def reset_warmup(monkeypatch):
+    monkeypatch.setattr(warmup, "_warmup_task", None)
+    event_logger = MagicMock()
+    monkeypatch.setattr(warmup, "get_event_logger", lambda: event_logger)
+    yield event_logger
+
+
+class TestRunWarmup:
+    async def test_records_cold_and_warm_runs(self, reset_warmup):
+        calls = []
+
+        async def step():
+            calls.append(len(calls))
+            if len(calls) == 1:
+                await asyncio.sleep(0.02)  # the cold run does the real work
+
+        results = await warmup.run_warmup([("cache", step)], timeout=5)
+
+        assert calls == [0, 1]
+        [result] = results
+        assert result.status == "ok"
+        assert result.cold_ms > result.warm_ms
+        assert result.delta_ms == pytest.approx(result.cold_ms - result.warm_ms)
+        assert warmup.get_warmup_results() == results
+
+        events = [c.args for c in reset_warmup.log_event.call_args_list]
+        assert events[0][0] == EventLogger.WARMUP_STEP
+        assert events[0][1]["step"] == "cache"
+        assert events[-1][0] == EventLogger.WARMUP_COMPLETE
+        assert events[-1][1]["failed"] == []
+
+    async def test_failures_do_not_stop_later_steps(self, reset_warmup):
+        async def broken():
+            raise OSError("PortAudio library not found")
+
+        async def slow():
+            await asyncio.sleep(1)
+
+        async def fine():
+            pass
+
+        results = await warmup.run_warmup(
+            [("devices", broken), ("tts", slow), ("chimes", fine)], timeout=0.05
+        )
+
+        assert [r.status for r in results] == ["error", "timeout", "ok"]
+        assert "PortAudio" in results[0].error
+        assert results[0].delta_ms is None
+        complete = reset_warmup.log_event.call_args_list[-1].args[1]
+        assert complete["failed"] == ["devices", "tts"]
+
+    def test_model_steps_only_for_local_endpoints(self, monkeypatch):
+        monkeypatch.setattr(warmup, "TTS_BASE_URLS", ["https://api.openai.com/v1"])
+        monkeypatch.setattr(warmup, "STT_BASE_URLS", ["http://127.0.0.1:2022/v1"])
+        names = [name for name, _ in warmup._default_steps()]
+        assert names == ["connections", "devices", "chimes", "stt"]
+
+
+class TestWarmupTask:
+    async def test_start_is_idempotent_and_cancellable(self):
+        started = asyncio.Event()
+
+        async def hang():
+            started.set()
+            await asyncio.sleep(60)
+
+        task = warmup.start_warmup([("hang", hang)])
+        assert warmup.start_warmup() is task
+        await started.wait()
+
+        assert warmup.cancel_warmup() is True
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert warmup.cancel_warmup() is False
+
+    async def test_first_request_is_not_blocked(self):
+        async def hang():
+            await asyncio.sleep(60)
+
+        warmup.start_warmup([("hang", hang)])
+        # Other work on the loop proceeds while the warm-up is pending
+        await asyncio.wait_for(asyncio.sleep(0), timeout=1)
+        warmup.cancel_warmup()
+
+
+class TestWarmedCaches:
+    def test_chime_render_is_cached(self):
+        from voice_mode.core import generate_chime
+
+        first = generate_chime([800, 1000], duration=0.1, sample_rate=24000)
+        second = generate_chime([800, 1000], duration=0.1, sample_rate=24000)
+        assert first is second
+        assert not first.flags.writeable
+        assert generate_chime([1000, 800], duration=0.1, sample_rate=24000) is not first
+
+    async def test_endpoint_client_reused_within_loop(self):
+        from voice_mode import simple_failover
+
+        with patch.object(simple_failover, "AsyncOpenAI") as client_class:
+            client_class.side_effect = lambda **kwargs: MagicMock()
+            first = simple_failover.get_endpoint_client("http://127.0.0.1:8880/v1", "key", 0)
+            again = simple_failover.get_endpoint_client("http://127.0.0.1:8880/v1", "key", 0)
+            other = simple_failover.get_endpoint_client("http://127.0.0.1:2022/v1", "key", 0)
+
+        assert first is again
+        assert other is not first
+        assert client_class.call_count == 2
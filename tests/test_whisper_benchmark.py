@@ -0,0 +1,195 @@
+"""Tests for the Whisper benchmark suite."""
+
+import json
+import stat
+import wave
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from voice_mode.cli import voice_mode_main_cli
+from voice_mode.tools.whisper import model_benchmark, models
+from voice_mode.tools.whisper.model_benchmark import (
+    compare_reports,
+    run_benchmark_suite,
+    summarize,
+    whisper_model_benchmark,
+)
+
+WHISPER_OUTPUT = """\
+whisper_init_from_file_with_params_no_state: loading model from 'ggml-base.bin'
+main: processing 'sample.wav' (40000 samples, 2.5 sec), 4 threads, 1 processors, 5 beams + best of 5, lang = en
+whisper_print_timings:     load time =    95.20 ms
+whisper_print_timings:     fallbacks =   0 p /   0 h
+whisper_print_timings:      mel time =     8.10 ms
+whisper_print_timings:   sample time =    12.00 ms /    40 runs (    0.30 ms per run)
+whisper_print_timings:   encode time =   410.50 ms /     1 runs (  410.50 ms per run)
+whisper_print_timings:   decode time =     3.00 ms /     2 runs (    1.50 ms per run)
+whisper_print_timings:   batchd time =    40.00 ms /    38 runs (    1.05 ms per run)
+whisper_print_timings:   prompt time =     0.00 ms /     1 runs (    0.00 ms per run)
+whisper_print_timings:    total time =   500.00 ms
+"""
+
+
+def write_wav(path, seconds, rate=16000):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(b"\0\0" * int(seconds * rate))
+    return path
+
+
+class FakeRunner:
+    """Single-run benchmark whose total time depends on the settings."""
+
+    def __init__(self, totals=None, fail=()):
+        self.calls = []
+        self.totals = totals or {}
+        self.fail = fail
+
+    def __call__(self, model, sample, threads, beam_size):
+        self.calls.append((model, sample, threads, beam_size))
+        if (model, threads) in self.fail:
+            return {"success": False, "error": "boom"}
+        runs = sum(1 for c in self.calls if c == self.calls[-1])
+        total = self.totals.get((model, threads), 1000.0 / threads) + runs  # a little jitter
+        return {
+            "success": True, "model": model, "load_time_ms": 50.0, "encode_time_ms": total / 2,
+            "decode_time_ms": 10.0, "total_time_ms": total, "wall_time_ms": total + 20,
+            "sample_duration_s": 2.0,
+        }
+
+
+def test_summarize():
+    assert summarize([3.0, 1.0, 2.0, 10.0]) == {"median": 2.5, "mean": 4.0, "stdev": 4.08, "min": 1.0, "max": 10.0}
+    assert summarize([5.0])["stdev"] == 0.0
+
+
+class TestSingleRun:
+    def test_parses_timings_and_measures_duration(self, tmp_path):
+        fake_cli = tmp_path / "whisper-cli"
+        (tmp_path / "out.txt").write_text(WHISPER_OUTPUT)
+        fake_cli.write_text(f"#!/bin/sh\necho \"$@\" > {tmp_path}/args\ncat {tmp_path}/out.txt >&2\n")
+        fake_cli.chmod(fake_cli.stat().st_mode | stat.S_IEXEC)
+        sample = write_wav(tmp_path / "sample.wav", 2.5)
+
+        with patch.object(models, "get_whisper_cli", return_value=fake_cli), \
+             patch.object(models, "is_whisper_model_installed", return_value=True):
+            result = models.benchmark_whisper_model("base", str(sample), threads=4, beam_size=5)
+
+        assert result["success"]
+        assert (result["load_time_ms"], result["encode_time_ms"], result["total_time_ms"]) == (95.2, 410.5, 500.0)
+        assert result["decode_time_ms"] == 43.0
+        assert result["sample_duration_s"] == 2.5
+        assert result["real_time_factor"] == 5.0  # 2.5 s of audio in 500 ms, not the old 11 s assumption
+        assert "--threads 4 --beam-size 5" in (tmp_path / "args").read_text()
+
+    def test_reports_cli_failure(self, tmp_path):
+        fake_cli = tmp_path / "whisper-cli"
+        fake_cli.write_text("#!/bin/sh\necho 'error: failed to open model' >&2\nexit 3\n")
+        fake_cli.chmod(fake_cli.stat().st_mode | stat.S_IEXEC)
+        with patch.object(models, "get_whisper_cli", return_value=fake_cli), \
+             patch.object(models, "is_whisper_model_installed", return_value=True):
+            result = models.benchmark_whisper_model("base", str(write_wav(tmp_path / "s.wav", 1)))
+        assert not result["success"]
+        assert "code 3" in result["error"] and "failed to open model" in result["error"]
+
+
+class TestSuite:
+    def test_sweeps_every_configuration(self):
+        runner = FakeRunner()
+        configs = run_benchmark_suite(["tiny", "base"], ["a.wav", "b.wav"], [2, 4], [1, 5], runs=3, runner=runner)
+        assert len(configs) == 16 and len(runner.calls) == 48
+        config = configs[0]
+        assert (config["model"], config["sample"], config["threads"], config["beam_size"]) == ("tiny", "a.wav", 2, 1)
+        assert config["total_time_ms"]["median"] == 502.0
+        assert config["total_time_ms"]["stdev"] == 1.0
+        assert config["real_time_factor"] == round(2000 / 502, 1)
+
+    def test_failed_configuration_stops_repeating(self):
+        runner = FakeRunner(fail={("base", 4)})
+        configs = run_benchmark_suite(["base"], ["a.wav"], [2, 4], [1], runs=3, runner=runner)
+        assert [c["success"] for c in configs] == [True, False]
+        assert configs[1]["error"] == "boom"
+        assert len(runner.calls) == 4
+
+    def test_best_settings_compare_totals_over_all_samples(self):
+        # 4 threads wins the short sample by a hair but loses the long one badly
+        times = {("short.wav", 2): 110.0, ("short.wav", 4): 100.0,
+                 ("long.wav", 2): 1000.0, ("long.wav", 4): 1500.0}
+
+        def runner(model, sample, threads, beam_size):
+            total = times[(sample, threads)]
+            return {
+                "success": True, "model": model, "load_time_ms": 50.0, "encode_time_ms": total / 2,
+                "decode_time_ms": 10.0, "total_time_ms": total, "wall_time_ms": total + 20,
+                "sample_duration_s": 1.0 if sample == "short.wav" else 10.0,
+            }
+
+        configs = run_benchmark_suite(["base"], ["short.wav", "long.wav"], [2, 4], [1], runs=1, runner=runner)
+        [row] = model_benchmark._best_per_model(configs, ["base"])
+        assert row["threads"] == 2
+        assert row["samples"] == 2
+        assert (row["load_time_ms"], row["encode_time_ms"], row["total_time_ms"]) == (100.0, 555.0, 1110.0)
+        assert row["real_time_factor"] == round(11000 / 1110, 1)
+
+    async def test_saves_report_and_flags_regressions(self, tmp_path):
+        async def benchmark(runner):
+            with patch.object(model_benchmark, "benchmark_whisper_model", runner), \
+                 patch.object(model_benchmark, "is_whisper_model_installed", return_value=True), \
+                 patch.object(model_benchmark, "get_results_dir", return_value=tmp_path):
+                return await whisper_model_benchmark(
+                    models=["tiny", "base"], sample_files=["jfk.wav"], threads=[2, 4],
+                    save_baseline=True, baseline="default" if (tmp_path / "baseline.json").exists() else None,
+                )
+
+        first = await benchmark(FakeRunner())
+        assert first["success"]
+        assert [b["threads"] for b in first["benchmarks"]] == [4, 4]
+        assert "Fastest settings for tiny: --threads 4 --beam-size 1" in first["recommendations"]
+        saved = json.loads((tmp_path / "baseline.json").read_text())
+        assert len(saved["configurations"]) == 4 and saved["runs"] == 3
+
+        second = await benchmark(FakeRunner(totals={("base", 2): 900.0, ("tiny", 4): 100.0}))
+        comparison = second["comparison"]
+        assert comparison["compared"] == 4
+        assert [(r["model"], r["threads"]) for r in comparison["regressions"]] == [("base", 2)]
+        assert [(r["model"], r["threads"]) for r in comparison["improvements"]] == [("tiny", 4)]
+
+    def test_noise_is_not_a_regression(self):
+        def report(median, stdev):
+            total = {"median": median, "stdev": stdev}
+            return {"configurations": [{"model": "base", "sample": "/x/jfk.wav", "threads": 4, "beam_size": 1,
+                                        "success": True, "total_time_ms": total}]}
+
+        assert not compare_reports(report(1150, 100), report(1000, 10))["regressions"]
+        assert compare_reports(report(1150, 10), report(1000, 10))["regressions"]
+        assert not compare_reports(report(1050, 1), report(1000, 1))["regressions"]
+
+    async def test_missing_samples(self, tmp_path):
+        with patch.object(model_benchmark, "is_whisper_model_installed", return_value=True), \
+             patch.object(model_benchmark, "get_default_sample_dir", return_value=tmp_path):
+            result = await whisper_model_benchmark(models=["base"])
+        assert not result["success"] and "No sample files" in result["error"]
+
+
+def test_cli_exits_nonzero_on_regression():
+    result = {
+        "success": True, "benchmarks": [], "configurations": [], "sample_files": ["jfk.wav"], "threads": [4],
+        "beam_sizes": [1], "runs_per_model": 3, "fastest_model": None, "recommendations": [],
+        "comparison": {"threshold": 0.1, "compared": 1, "unmatched": 0, "improvements": [], "regressions": [
+            {"model": "base", "sample": "jfk.wav", "threads": 4, "beam_size": 1,
+             "baseline_ms": 500.0, "current_ms": 700.0, "change": 0.4},
+        ]},
+    }
+
+    async def fake_benchmark(**kwargs):
+        assert kwargs["baseline"] == "default" and kwargs["threads"] == [2, 4]
+        return result
+
+    with patch.object(model_benchmark, "whisper_model_benchmark", fake_benchmark):
+        output = CliRunner().invoke(voice_mode_main_cli, ["whisper", "benchmark", "--compare", "--threads", "2,4"])
+    assert output.exit_code == 1
+    assert "Regression: base jfk.wav threads=4 beam=1: 500 → 700 ms (+40%)" in output.output
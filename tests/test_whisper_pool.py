@@ -0,0 +1,186 @@
+"""Tests for the local Whisper server pool and its client-side balancer."""
+
+import asyncio
+import os
+import shutil
+import signal
+import subprocess
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from voice_mode import config, simple_failover, whisper_pool
+from voice_mode.whisper_pool import WhisperPool, expand_stt_endpoints, instance_threads
+
+URLS = [f"http://127.0.0.1:{2022 + i}/v1" for i in range(3)]
+START_SCRIPT = Path(__file__).parent.parent / "voice_mode" / "templates" / "scripts" / "start-whisper-server.sh"
+
+
+@pytest.fixture
+def three_instances(monkeypatch):
+    monkeypatch.setattr(config, "WHISPER_INSTANCES", 3)
+    monkeypatch.setattr(config, "WHISPER_PORT", 2022)
+    monkeypatch.setattr(whisper_pool, "_pool", None)
+    return whisper_pool.get_whisper_pool()
+
+
+class TestBalancer:
+    def test_prefers_fewest_in_flight(self):
+        pool = WhisperPool(URLS)
+        with pool.track(URLS[0]), pool.track(URLS[1]):
+            assert pool.pick() == URLS[2]
+            with pool.track(URLS[2]), pool.track(URLS[2]):
+                assert pool.pick() == URLS[0]
+
+    def test_weights_by_latency(self):
+        pool = WhisperPool(URLS[:2])
+        for url, cost in ((URLS[0], 0.4), (URLS[1], 0.1)):
+            with patch.object(whisper_pool.time, "perf_counter", side_effect=[0.0, cost]):
+                with pool.track(url):
+                    pass
+        assert pool.pick() == URLS[1]
+        # Two queued on the fast instance still beat one on a 4x slower one
+        with pool.track(URLS[1]), pool.track(URLS[1]):
+            assert pool.pick() == URLS[1]
+            with pool.track(URLS[1]), pool.track(URLS[1]):
+                assert pool.pick() == URLS[0]
+
+    def test_failed_instance_cools_down(self):
+        pool = WhisperPool(URLS)
+        with pytest.raises(ConnectionError):
+            with pool.track(URLS[0]):
+                raise ConnectionError("refused")
+        assert pool.ranked()[-1] == URLS[0]
+        assert pool.snapshot()[0] == {"base_url": URLS[0], "in_flight": 0, "requests": 0,
+                                      "failures": 1, "cooling_down": True}
+        with patch.object(whisper_pool.time, "monotonic", return_value=time.monotonic() + 60):
+            assert pool.ranked()[0] == URLS[0]
+
+    def test_unknown_endpoint_is_not_tracked(self):
+        pool = WhisperPool(URLS)
+        with pool.track("https://api.openai.com/v1"):
+            pass
+        assert all(c["requests"] == 0 for c in pool.snapshot())
+
+
+class TestConfiguration:
+    def test_single_instance_leaves_endpoints_alone(self, monkeypatch):
+        monkeypatch.setattr(config, "WHISPER_INSTANCES", 1)
+        assert whisper_pool.get_whisper_pool() is None
+        assert expand_stt_endpoints(["http://127.0.0.1:2022/v1", "https://api.openai.com/v1"]) == [
+            "http://127.0.0.1:2022/v1", "https://api.openai.com/v1"]
+
+    def test_pool_replaces_local_whisper(self, three_instances):
+        assert expand_stt_endpoints(["http://localhost:2022/v1", "https://api.openai.com/v1"]) == URLS + [
+            "https://api.openai.com/v1"]
+
+    def test_threads_split_cores(self, monkeypatch):
+        monkeypatch.delenv("VOICEMODE_WHISPER_THREADS", raising=False)
+        with patch.object(whisper_pool.os, "cpu_count", return_value=16):
+            assert instance_threads(1) == 8
+            assert instance_threads(3) == 5
+            assert instance_threads(32) == 1
+        monkeypatch.setenv("VOICEMODE_WHISPER_THREADS", "4")
+        monkeypatch.setattr(config, "WHISPER_THREADS", 4)
+        assert instance_threads(3) == 4
+
+
+async def test_concurrent_requests_spread_across_instances(three_instances, monkeypatch, tmp_path):
+    monkeypatch.setattr(simple_failover, "STT_BASE_URLS", ["http://127.0.0.1:2022/v1"])
+    release = asyncio.Event()
+    used = []
+
+    class Transcriptions:
+        def __init__(self, base_url):
+            self.base_url = base_url
+
+        async def create(self, **kwargs):
+            used.append(self.base_url)
+            await release.wait()
+            return "hello"
+
+    class Client:
+        def __init__(self, base_url):
+            self.audio = type("Audio", (), {"transcriptions": Transcriptions(base_url)})()
+
+    monkeypatch.setattr(simple_failover, "get_endpoint_client", lambda base_url, *args: Client(base_url))
+    audio = tmp_path / "a.wav"
+    audio.write_bytes(b"\0" * 1000)
+
+    async def transcribe():
+        with open(audio, "rb") as f:
+            return await simple_failover.simple_stt_failover(f)
+
+    tasks = [asyncio.create_task(transcribe()) for _ in range(3)]
+    while len(used) < 3:
+        await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(*tasks)
+    assert sorted(used) == URLS
+    assert {r["endpoint"] for r in results} == set(URLS)
+    assert [c["requests"] for c in three_instances.snapshot()] == [1, 1, 1]
+
+
+async def test_health_check_covers_each_instance():
+    class Health(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            self.send_response(200 if self.path == "/health" else 404)
+            self.end_headers()
+            self.wfile.write(b'{"status":"ok"}')
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Health)
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    up = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    down = "http://127.0.0.1:9/v1"
+    try:
+        results = await whisper_pool.check_instances([up, down], timeout=2.0)
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert results[0]["healthy"] and results[0]["port"] == server.server_address[1]
+    assert not results[1]["healthy"] and results[1]["error"]
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="needs bash")
+def test_start_script_runs_one_server_per_port(tmp_path):
+    whisper_dir = tmp_path / "whisper"
+    for sub in ("bin", "build/bin", "models"):
+        (whisper_dir / sub).mkdir(parents=True)
+    shutil.copy(START_SCRIPT, whisper_dir / "bin")
+    (whisper_dir / "models" / "ggml-base.bin").write_bytes(b"")
+    server = whisper_dir / "build" / "bin" / "whisper-server"
+    server.write_text(f'#!/bin/sh\necho "$@" >> {tmp_path}/args\nexec sleep 30\n')
+    server.chmod(0o755)
+    (tmp_path / ".voicemode").mkdir()
+    (tmp_path / ".voicemode" / "voicemode.env").write_text(
+        "VOICEMODE_WHISPER_INSTANCES=3\nVOICEMODE_WHISPER_THREADS=2\n")
+
+    env = {"HOME": str(tmp_path), "PATH": os.environ["PATH"]}
+    script = subprocess.Popen(["bash", str(whisper_dir / "bin" / "start-whisper-server.sh")], env=env)
+    try:
+        deadline = time.time() + 10
+        while time.time() < deadline and len((tmp_path / "args").read_text().splitlines()
+                                             if (tmp_path / "args").exists() else []) < 3:
+            time.sleep(0.05)
+        lines = (tmp_path / "args").read_text().splitlines()
+        # The instances start concurrently, so their lines arrive in any order
+        assert sorted(line.split("--port ")[1].split()[0] for line in lines) == ["2022", "2023", "2024"]
+        assert all(line.endswith("--threads 2") for line in lines)
+    finally:
+        script.send_signal(signal.SIGTERM)
+        assert script.wait(timeout=10) == 0
+    # Stopping the script stops every instance (give them a moment to exit)
+    deadline = time.time() + 10
+    while True:
+        leftover = subprocess.run(["pgrep", "-f", f"{tmp_path}"], capture_output=True, text=True).stdout
+        if not leftover.strip() or time.time() >= deadline:
+            break
+        time.sleep(0.05)
+    assert not leftover.strip()
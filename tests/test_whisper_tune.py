@@ -0,0 +1,106 @@
+"""Tests for the Whisper auto-tuner."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from voice_mode.tools.whisper import model_benchmark, model_tune
+from voice_mode.tools.whisper.model_tune import candidate_models, candidate_threads, whisper_model_tune
+from voice_mode.tools.whisper.models import update_whisper_config
+
+# Total time per run in ms for 2 s of audio, 20 ms of it model load;
+# the tuner's RTF = 2000 / (total - 20)
+TIMINGS = {
+    ("large-v3", 4): 1000.0, ("large-v3", 8): 800.0,
+    ("medium", 4): 400.0, ("medium", 8): 250.0,
+    ("base", 4): 100.0, ("base", 8): 80.0,
+}
+
+
+def fake_benchmark(model, sample, threads, beam_size):
+    total = TIMINGS[(model, threads)]
+    return {
+        "success": True, "model": model, "load_time_ms": 20.0, "encode_time_ms": total / 2,
+        "decode_time_ms": 5.0, "total_time_ms": total, "wall_time_ms": total + 10, "sample_duration_s": 2.0,
+    }
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    (tmp_path / ".voicemode").mkdir()
+    return tmp_path
+
+
+async def tune(home, target_rtf, **kwargs):
+    calls = []
+
+    def runner(model, sample, threads, beam_size):
+        calls.append((model, threads))
+        return fake_benchmark(model, sample, threads, beam_size)
+
+    with patch.object(model_benchmark, "benchmark_whisper_model", runner), \
+         patch.object(model_tune, "get_installed_whisper_models", return_value=["base", "medium", "large-v3"]), \
+         patch.object(model_tune, "get_results_dir", return_value=home), \
+         patch.object(model_tune, "get_cpu_topology", return_value={"logical": 8, "physical": 8, "available": 8, "smt": False}):
+        result = await whisper_model_tune(target_rtf, sample_files=["jfk.wav"], runs=1, restart=False, **kwargs)
+    return result, calls
+
+
+class TestCandidates:
+    def test_threads_follow_topology(self):
+        assert candidate_threads({"logical": 8, "physical": 8, "smt": False}) == [4, 8]
+        assert candidate_threads({"logical": 16, "physical": 8, "smt": True}) == [4, 8, 16]
+        assert candidate_threads({"logical": 10, "physical": 10, "smt": False, "performance": 8}) == [5, 8, 10]
+        # Never more threads than CPUs the process may use
+        assert candidate_threads({"logical": 16, "physical": 8, "available": 6, "smt": True}) == [4, 6]
+
+    def test_models_ranked_by_accuracy(self):
+        installed = ["tiny.en", "base", "large-v3", "medium.en", "custom"]
+        assert candidate_models(installed, english=True) == ["large-v3", "medium.en", "base", "tiny.en"]
+        assert candidate_models(installed, english=False) == ["large-v3", "base"]
+
+
+class TestTune:
+    async def test_picks_most_accurate_model_meeting_target(self, home):
+        result, calls = await tune(home, target_rtf=5, english=False)
+        assert result["success"]
+        assert (result["model"], result["threads"], result["real_time_factor"]) == ("medium", 8, 8.7)
+        # Stops before the faster, less accurate base model
+        assert {c[0] for c in calls} == {"large-v3", "medium"}
+
+        env = (home / ".voicemode" / "voicemode.env").read_text()
+        assert "VOICEMODE_WHISPER_MODEL=medium\n" in env and "VOICEMODE_WHISPER_THREADS=8\n" in env
+        report = json.loads((home / result["report_file"].split("/")[-1]).read_text())
+        assert report["tuning"]["choice"]["model"] == "medium" and report["tuning"]["target_rtf"] == 5
+        assert report["tuning"]["rtf_measure"] == model_tune.RTF_MEASURE
+
+    async def test_model_load_does_not_count_against_the_target(self, home):
+        # medium at 8 threads: 8.0x on whisper-cli's total, 8.7x on inference alone
+        result, _ = await tune(home, target_rtf=8.5, english=False, apply=False)
+        assert (result["model"], result["threads"]) == ("medium", 8)
+        medium = next(s for s in result["tested"] if (s["model"], s["threads"]) == ("medium", 8))
+        assert medium["total_time_ms"] == 250.0 and medium["inference_time_ms"] == 230.0
+
+    async def test_dry_run_leaves_config_alone(self, home):
+        result, _ = await tune(home, target_rtf=1, english=False, apply=False)
+        assert result["model"] == "large-v3" and not result["changes"]
+        assert not (home / ".voicemode" / "voicemode.env").exists()
+
+    async def test_unreachable_target(self, home):
+        result, calls = await tune(home, target_rtf=100, english=False)
+        assert not result["success"]
+        assert result["error"] == "No installed model reaches 100x real time (best: base at 33.3x with 8 threads)"
+        assert len(calls) == 6
+        assert not (home / ".voicemode" / "voicemode.env").exists()
+
+
+def test_update_whisper_config_preserves_other_settings(home):
+    config = home / ".voicemode" / "voicemode.env"
+    config.write_text("# Voice\nVOICEMODE_VOICES=af_sky\nVOICEMODE_WHISPER_MODEL=base\n")
+    update_whisper_config({"VOICEMODE_WHISPER_MODEL": "small", "VOICEMODE_WHISPER_THREADS": "6"})
+    assert config.read_text() == (
+        "# Voice\nVOICEMODE_VOICES=af_sky\nVOICEMODE_WHISPER_MODEL=small\n"
+        "\n# Whisper Configuration\nVOICEMODE_WHISPER_THREADS=6\n"
+    )
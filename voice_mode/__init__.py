@@ -7,4 +7,12 @@ This package provides MCP servers for voice interactions through multiple transp
 - Configurable OpenAI-compatible STT/TTS services
 """
 
-from .version import __version__
\ No newline at end of file
+
+def __getattr__(name):
+    # Resolving the version can run git; entry points such as voicemode-hook
+    # import the package without needing it
+    if name == "__version__":
+        from .version import __version__
+        globals()["__version__"] = __version__
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,223 @@
+"""Cross-process arbitration of the microphone and speaker.
+
+``audio_operation_lock`` only serialises turns inside one process. Several
+Claude sessions each run their own VoiceMode MCP server, and without
+coordination they open the same devices at once and fail with device-busy
+errors. The arbiter serialises audio turns across processes:
+
+* The device is owned by whoever holds an ``flock`` on ``device.lock`` in the
+  lock directory; the kernel releases it if the owner dies.
+* Waiters queue as ticket files named ``<priority>-<enqueue ns>-<pid>-<id>``.
+  Only the first ticket in sort order may take the lock, so turns are served
+  by priority (lower number first) and then first come, first served.
+  Tickets of dead processes are removed by whoever sees them.
+* When a turn ends and another turn in the same process is already waiting,
+  and no other process is queued at the same or a better priority, the held
+  lock is handed over directly instead of being released and re-acquired.
+
+Platforms without ``fcntl`` fall back to the in-process lock only.
+"""
+
+import asyncio
+import logging
+import os
+import time
+import uuid
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from .config import AUDIO_ARBITER_ENABLED, AUDIO_ARBITER_TIMEOUT, BASE_DIR, audio_operation_lock
+from .metrics import STAGE_SECONDS
+from .utils.tracing import span
+
+logger = logging.getLogger("voicemode")
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 50
+PRIORITY_LOW = 100
+
+_TICKET_SUFFIX = ".ticket"
+
+
+class AudioBusyError(TimeoutError):
+    """The audio devices stayed in use by other sessions for too long."""
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class AudioArbiter:
+    """Queue for the audio devices shared by every VoiceMode process.
+
+    Args:
+        lock_dir: Directory holding ``device.lock`` and the ticket queue
+        poll_interval: Seconds between queue checks while waiting
+        local_lock: In-process lock taken before queueing (default:
+            ``config.audio_operation_lock``)
+    """
+
+    def __init__(self, lock_dir: Union[str, Path], poll_interval: float = 0.05,
+                 local_lock: Optional[asyncio.Lock] = None):
+        self.lock_dir = Path(lock_dir)
+        self.queue_dir = self.lock_dir / "queue"
+        self.lock_file = self.lock_dir / "device.lock"
+        self.poll_interval = poll_interval
+        self.local_lock = local_lock if local_lock is not None else audio_operation_lock
+        self._fd: Optional[int] = None
+        self._local_waiting = 0
+
+    @property
+    def held(self) -> bool:
+        """Whether this process currently owns the devices."""
+        return self._fd is not None
+
+    def queue(self) -> list:
+        """Ticket names of live waiters in service order, pruning dead ones."""
+        try:
+            names = sorted(p.name for p in self.queue_dir.iterdir() if p.name.endswith(_TICKET_SUFFIX))
+        except FileNotFoundError:
+            return []
+        live = []
+        for name in names:
+            try:
+                pid = int(name.split("-")[2])
+            except (IndexError, ValueError):
+                pid = None
+            if pid is not None and pid != os.getpid() and not _pid_alive(pid):
+                (self.queue_dir / name).unlink(missing_ok=True)
+                continue
+            live.append(name)
+        return live
+
+    def _try_lock(self) -> bool:
+        fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        return True
+
+    def _unlock(self) -> None:
+        if self._fd is not None:
+            fd, self._fd = self._fd, None
+            try:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            finally:
+                os.close(fd)
+
+    def _other_waiter_first(self, priority: int) -> bool:
+        """Whether another process is queued at ``priority`` or better."""
+        own = f"-{os.getpid()}-"
+        return any(int(name.split("-")[0]) <= priority and own not in name for name in self.queue())
+
+    async def _acquire_device(self, priority: int, timeout: Optional[float]) -> None:
+        self.queue_dir.mkdir(parents=True, exist_ok=True)
+        ticket = self.queue_dir / (
+            f"{priority:03d}-{time.time_ns():020d}-{os.getpid()}-{uuid.uuid4().hex[:8]}{_TICKET_SUFFIX}"
+        )
+        ticket.touch()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            while True:
+                waiting = self.queue()
+                if waiting and waiting[0] == ticket.name and self._try_lock():
+                    return
+                if deadline is not None and time.monotonic() >= deadline:
+                    holder = self.lock_file.read_text().strip() if self.lock_file.exists() else "?"
+                    raise AudioBusyError(
+                        f"Audio devices still in use by another VoiceMode session (PID {holder}) "
+                        f"after {timeout:g}s; {len(waiting)} waiting"
+                    )
+                await asyncio.sleep(self.poll_interval)
+        finally:
+            ticket.unlink(missing_ok=True)
+
+    @asynccontextmanager
+    async def turn(self, priority: int = PRIORITY_NORMAL, timeout: Optional[float] = None,
+                   handoff: bool = True) -> AsyncIterator[None]:
+        """Hold the audio devices for one turn.
+
+        Args:
+            priority: Lower numbers are served first
+            timeout: Seconds to wait before raising AudioBusyError (None waits forever)
+            handoff: Pass the held lock straight to the next turn queued in
+                this process when no other process is waiting ahead of it
+
+        Raises:
+            AudioBusyError: If the devices did not become free within ``timeout``
+        """
+        start = time.perf_counter()
+        with span("audio.wait", priority=priority) as wait_span:
+            self._local_waiting += 1
+            try:
+                await self.local_lock.acquire()
+            except BaseException:
+                self._local_waiting -= 1
+                if not self._local_waiting and not self.local_lock.locked():
+                    self._unlock()  # nobody is left to take a handed-over lock
+                raise
+            self._local_waiting -= 1
+            try:
+                handed_off = self.held
+                if not handed_off and fcntl is not None:
+                    remaining = None if timeout is None else max(0.0, timeout - (time.perf_counter() - start))
+                    await self._acquire_device(priority, remaining)
+            except BaseException:
+                self.local_lock.release()
+                raise
+            waited = time.perf_counter() - start
+            wait_span.set(waited_ms=round(waited * 1000, 1), handoff=handed_off)
+        STAGE_SECONDS.observe(waited, stage="audio_wait")
+        if waited >= 1.0:
+            logger.info(f"Waited {waited:.1f}s for the audio devices")
+
+        try:
+            yield
+        finally:
+            try:
+                if not (handoff and self._local_waiting and not self._other_waiter_first(priority)):
+                    self._unlock()
+            finally:
+                self.local_lock.release()
+
+
+_arbiter: Optional[AudioArbiter] = None
+
+
+def get_audio_arbiter() -> AudioArbiter:
+    """Return the process-wide arbiter for ``~/.voicemode/locks``."""
+    global _arbiter
+    if _arbiter is None:
+        _arbiter = AudioArbiter(BASE_DIR / "locks")
+    return _arbiter
+
+
+@asynccontextmanager
+async def audio_turn(priority: int = PRIORITY_NORMAL) -> AsyncIterator[None]:
+    """Serialise an audio turn with every VoiceMode process on this machine.
+
+    With ``VOICEMODE_AUDIO_ARBITER=false`` only the in-process lock is used.
+    """
+    if not AUDIO_ARBITER_ENABLED:
+        async with audio_operation_lock:
+            yield
+        return
+    async with get_audio_arbiter().turn(priority, timeout=AUDIO_ARBITER_TIMEOUT or None):
+        yield
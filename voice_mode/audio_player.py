@@ -9,8 +9,11 @@ import queue
 import threading
 from typing import Optional
 
-import numpy as np
-import sounddevice as sd
+from .metrics import DEVICE_OPENS
+from .utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+sd = lazy_import("sounddevice")
 
 logger = logging.getLogger("voicemode.audio_player")
 
@@ -91,7 +94,7 @@ class NonBlockingAudioPlayer:
             outdata[:] = 0
             logger.debug("Audio queue empty - outputting silence")
 
-    def play(self, samples: np.ndarray, sample_rate: int, blocking: bool = False):
+    def play(self, samples: "np.ndarray", sample_rate: int, blocking: bool = False):
         """Play audio samples using non-blocking callback system.
 
         Args:
@@ -137,6 +140,7 @@ class NonBlockingAudioPlayer:
                 dtype=np.float32
             )
             self.stream.start()
+            DEVICE_OPENS.inc(direction="output")
 
             if blocking:
                 self.wait()
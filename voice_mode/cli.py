@@ -47,8 +47,9 @@ if not os.environ.get('VOICEMODE_DEBUG', '').lower() in ('true', '1', 'yes'):
 @click.option('--debug', is_flag=True, help='Enable debug mode and show all warnings')
 @click.option('--tools-enabled', help='Comma-separated list of tools to enable (whitelist)')
 @click.option('--tools-disabled', help='Comma-separated list of tools to disable (blacklist)')
+@click.option('--profile-startup', is_flag=True, help='Report per-module import times and time-to-ready, then exit')
 @click.pass_context
-def voice_mode_main_cli(ctx, debug, tools_enabled, tools_disabled):
+def voice_mode_main_cli(ctx, debug, tools_enabled, tools_disabled, profile_startup):
     """Voice Mode - MCP server and service management.
 
     Without arguments, starts the MCP server.
@@ -68,6 +69,16 @@ def voice_mode_main_cli(ctx, debug, tools_enabled, tools_disabled):
     if tools_disabled:
         os.environ['VOICEMODE_TOOLS_DISABLED'] = tools_disabled
 
+    if profile_startup and ctx.invoked_subcommand is None:
+        from voice_mode.utils.startup_profile import profile_startup as run_profile, format_profile
+        try:
+            profile = run_profile()
+        except (RuntimeError, subprocess.TimeoutExpired) as e:
+            click.echo(f"❌ Startup profiling failed: {e}", err=True)
+            sys.exit(1)
+        click.echo(format_profile(profile))
+        return
+
     if ctx.invoked_subcommand is None:
         # No subcommand - run MCP server
         # Note: warnings are already suppressed at module level unless debug is enabled
@@ -360,29 +371,20 @@ def whisper_update_service_files():
 
 @whisper_service.command("health")
 def whisper_service_health():
-    """Check Whisper health endpoint."""
-    import subprocess
+    """Check the health endpoint of each Whisper instance."""
+    from voice_mode.whisper_pool import check_instances
     try:
-        result = subprocess.run(
-            ["curl", "-s", "http://127.0.0.1:2022/health"],
-            capture_output=True, text=True, timeout=5
-        )
-        if result.returncode == 0:
-            import json
-            try:
-                health_data = json.loads(result.stdout)
-                click.echo("✅ Whisper is responding")
-                click.echo(f"   Status: {health_data.get('status', 'unknown')}")
-                if 'uptime' in health_data:
-                    click.echo(f"   Uptime: {health_data['uptime']}")
-            except json.JSONDecodeError:
-                click.echo("✅ Whisper is responding (non-JSON response)")
-        else:
-            click.echo("❌ Whisper not responding on port 2022")
-    except subprocess.TimeoutExpired:
-        click.echo("❌ Whisper health check timed out")
+        results = asyncio.run(check_instances(timeout=5.0))
     except Exception as e:
         click.echo(f"❌ Health check failed: {e}")
+        sys.exit(1)
+    for health in results:
+        if health["healthy"]:
+            click.echo(f"✅ Whisper is responding on port {health['port']} ({health['latency_ms']:.0f} ms)")
+        else:
+            click.echo(f"❌ Whisper not responding on port {health['port']}: {health['error']}")
+    if not all(health["healthy"] for health in results):
+        sys.exit(1)
 
 
 @whisper_service.command("install")
@@ -557,6 +559,225 @@ def whisper_uninstall_alias(ctx, remove_models, remove_all_data):
     ctx.forward(whisper_service_uninstall, remove_models=remove_models, remove_all_data=remove_all_data)
 
 
+
+def _parse_int_list(value):
+    if not value:
+        return None
+    try:
+        return [int(v) for v in value.split(',') if v.strip()]
+    except ValueError:
+        raise click.BadParameter(f"expected comma-separated integers, got {value!r}")
+
+
+@whisper.command("benchmark")
+@click.help_option('-h', '--help')
+@click.option('--models', default='installed', help='Models to benchmark: installed, all, or comma-separated list')
+@click.option('--sample', 'samples', multiple=True, type=click.Path(exists=True, dir_okay=False),
+              help='Audio file to benchmark with (repeatable; default: whisper.cpp samples)')
+@click.option('--threads', help='Comma-separated thread counts to sweep (default: all cores, up to 8)')
+@click.option('--beam-sizes', help='Comma-separated beam sizes to sweep (default: 1)')
+@click.option('--runs', default=3, show_default=True, help='Runs per configuration')
+@click.option('--save/--no-save', default=True, help='Save the report under ~/.voicemode/benchmarks/whisper')
+@click.option('--save-baseline', is_flag=True, help='Save this report as the baseline for --compare')
+@click.option('--compare', is_flag=True, help='Flag regressions against the saved baseline')
+@click.option('--baseline', type=click.Path(exists=True, dir_okay=False), help='Flag regressions against this report')
+@click.option('--threshold', default=0.10, show_default=True, help='Slowdown of the median total time that counts as a regression')
+@click.option('--json', 'as_json', is_flag=True, help='Print the full result as JSON')
+def whisper_benchmark(models, samples, threads, beam_sizes, runs, save, save_baseline, compare, baseline,
+                      threshold, as_json):
+    """Benchmark Whisper models, thread counts and beam sizes.
+    
+    Every combination of model, sample, thread count and beam size is run
+    --runs times; load, encode and total time are reported as medians with
+    their spread. The real-time factor uses each sample's measured duration.
+    
+    Exits with status 1 if --compare or --baseline finds a regression.
+    
+    Examples:
+        voicemode whisper benchmark --models base,small --threads 2,4,8
+        voicemode whisper benchmark --save-baseline
+        voicemode whisper benchmark --compare
+    """
+    import json
+    from pathlib import Path
+    from voice_mode.tools.whisper.model_benchmark import whisper_model_benchmark
+    
+    model_list = [m.strip() for m in models.split(',')] if ',' in models else models
+    
+    def progress(config):
+        if as_json:
+            return
+        label = f"{config['model']} {Path(config['sample']).name} threads={config['threads']} beam={config['beam_size']}"
+        if config.get('success'):
+            total = config['total_time_ms']
+            click.echo(f"  {label}: {total['median']:.0f} ms (±{total['stdev']:.0f})", err=True)
+        else:
+            click.echo(f"  {label}: failed - {config.get('error')}", err=True)
+    
+    result = asyncio.run(whisper_model_benchmark(
+        models=model_list,
+        sample_files=list(samples) or None,
+        runs=runs,
+        threads=_parse_int_list(threads),
+        beam_sizes=_parse_int_list(beam_sizes),
+        save=save,
+        baseline=baseline or ("default" if compare else None),
+        save_baseline=save_baseline,
+        threshold=threshold,
+        progress=progress,
+    ))
+    
+    if as_json:
+        click.echo(json.dumps(result, indent=2))
+    elif not result.get('success'):
+        click.echo(f"❌ Benchmark failed: {result.get('error', 'Unknown error')}", err=True)
+    else:
+        _print_whisper_benchmark(result)
+    
+    if not result.get('success'):
+        sys.exit(1)
+    if result.get('comparison', {}).get('regressions'):
+        sys.exit(1)
+
+
+@whisper.command("tune")
+@click.help_option('-h', '--help')
+@click.option('--target-rtf', type=float, required=True,
+              help='Required real-time factor, e.g. 10 = ten seconds of audio per second of processing')
+@click.option('--models', help='Comma-separated models to consider (default: all installed)')
+@click.option('--sample', 'samples', multiple=True, type=click.Path(exists=True, dir_okay=False),
+              help='Audio file to tune with (repeatable; default: whisper.cpp samples)')
+@click.option('--threads', help='Comma-separated thread counts to try (default: from the CPU topology)')
+@click.option('--runs', default=3, show_default=True, help='Runs per configuration')
+@click.option('--english/--multilingual', default=None,
+              help='Allow English-only models (default: when VOICEMODE_WHISPER_LANGUAGE=en)')
+@click.option('--dry-run', is_flag=True, help='Report the choice without changing the configuration')
+@click.option('--no-restart', is_flag=True, help='Write the configuration but do not restart the service')
+def whisper_tune(target_rtf, models, samples, threads, runs, english, dry_run, no_restart):
+    """Pick the Whisper model and thread count for a latency target.
+    
+    Benchmarks installed models from the most to the least accurate at thread
+    counts derived from this machine's physical cores and SMT, and picks the
+    most accurate model that reaches --target-rtf. The choice is written to
+    ~/.voicemode/voicemode.env (VOICEMODE_WHISPER_MODEL, VOICEMODE_WHISPER_THREADS)
+    and the Whisper service is restarted. The tuning report is saved in
+    ~/.voicemode/benchmarks/whisper for later comparison with
+    `voicemode whisper benchmark --baseline`.
+    
+    Examples:
+        voicemode whisper tune --target-rtf 10
+        voicemode whisper tune --target-rtf 5 --models small.en,medium.en --dry-run
+    """
+    from pathlib import Path
+    from voice_mode.tools.whisper.model_tune import whisper_model_tune
+    
+    def progress(config):
+        label = f"{config['model']} {Path(config['sample']).name} threads={config['threads']}"
+        if config.get('success'):
+            # Tuning judges inference alone; the server loads the model once
+            inference = config['total_time_ms']['median'] - config['load_time_ms']['median']
+            duration = config.get('sample_duration_s')
+            click.echo(f"  {label}: {inference:.0f} ms inference"
+                       + (f" ({duration * 1000 / inference:.1f}x)" if duration and inference > 0 else ""))
+        else:
+            click.echo(f"  {label}: failed - {config.get('error')}")
+    
+    click.echo("Benchmarking installed models (most accurate first)...")
+    result = asyncio.run(whisper_model_tune(
+        target_rtf=target_rtf,
+        models=[m.strip() for m in models.split(',')] if models else None,
+        sample_files=list(samples) or None,
+        threads=_parse_int_list(threads),
+        runs=runs,
+        english=english,
+        apply=not dry_run,
+        restart=not no_restart,
+        progress=progress,
+    ))
+    
+    topology = result.get('topology')
+    if topology:
+        smt = "on" if topology['smt'] else "off"
+        click.echo(f"\nCPU: {topology['physical']} physical cores, {topology['logical']} logical (SMT {smt})"
+                   + (f", {topology['performance']} performance cores" if topology.get('performance') else ""))
+        click.echo(f"Thread counts tried: {', '.join(map(str, result['thread_options']))}")
+    
+    if not result.get('success'):
+        click.echo(f"❌ {result.get('error', 'Tuning failed')}", err=True)
+        if result.get('report_file'):
+            click.echo(f"Report: {result['report_file']}")
+        sys.exit(1)
+    
+    previous = result['previous']
+    click.echo(f"\n✅ {click.style(result['model'], fg='green', bold=True)} with {result['threads']} threads: "
+               f"{result['real_time_factor']:.1f}x real time (target {target_rtf:g}x)")
+    click.echo(f"   Measured on {result['rtf_measure']}")
+    click.echo(f"   Previously: {previous['model']} with {previous['threads']} threads")
+    for change in result['changes']:
+        click.echo(f"   {change}")
+    if result.get('restart'):
+        click.echo(result['restart'])
+    elif dry_run:
+        click.echo("   Dry run: configuration not changed")
+    click.echo(f"Report: {result['report_file']}")
+
+def _print_whisper_benchmark(result: dict) -> None:
+    from pathlib import Path
+    
+    click.echo("\n" + "="*78)
+    click.echo("Whisper Model Benchmark Results")
+    click.echo("="*78)
+    click.echo(f"Samples: {', '.join(Path(s).name for s in result['sample_files'])}")
+    click.echo(f"Threads: {', '.join(map(str, result['threads']))}   "
+               f"Beam sizes: {', '.join(map(str, result['beam_sizes']))}   "
+               f"Runs: {result['runs_per_model']} (medians, summed over samples)")
+    click.echo("")
+    
+    click.echo(f"{'Model':<16} {'Threads':<8} {'Beam':<5} {'Load (ms)':<11} {'Encode (ms)':<12} "
+               f"{'Total (ms)':<16} {'Speed':<8}")
+    click.echo("-"*78)
+    for bench in result['benchmarks']:
+        if not bench.get('success'):
+            click.echo(f"{bench['model']:<16} Failed: {bench.get('error', 'Unknown error')}")
+            continue
+        model = f"{bench['model']:<16}"
+        rtf = f"{bench['real_time_factor']:.1f}x" if bench.get('real_time_factor') else "n/a"
+        rtf = f"{rtf:<8}"
+        if bench['model'] == result.get('fastest_model'):
+            model = click.style(model, fg='green', bold=True)
+            rtf = click.style(rtf, fg='green', bold=True)
+        total = f"{bench['total_time_ms']:.1f} ±{bench['total_time_stdev_ms']:.1f}"
+        click.echo(f"{model} {bench['threads']:<8} {bench['beam_size']:<5} {bench['load_time_ms']:<11.1f} "
+                   f"{bench['encode_time_ms']:<12.1f} {total:<16} {rtf}")
+    
+    if result.get('recommendations'):
+        click.echo("\nRecommendations:")
+        for rec in result['recommendations']:
+            click.echo(f"  • {rec}")
+    
+    comparison = result.get('comparison')
+    if comparison:
+        click.echo(f"\nCompared {comparison['compared']} configurations with the baseline "
+                   f"(threshold {comparison['threshold']:.0%})")
+        for label, entries, color in (("Regression", comparison['regressions'], 'red'),
+                                      ("Improvement", comparison['improvements'], 'green')):
+            for entry in entries:
+                click.echo(click.style(
+                    f"  {label}: {entry['model']} {entry['sample']} threads={entry['threads']} "
+                    f"beam={entry['beam_size']}: {entry['baseline_ms']:.0f} → {entry['current_ms']:.0f} ms "
+                    f"({entry['change']:+.0%})", fg=color))
+        if not comparison['regressions']:
+            click.echo("  No regressions")
+        if comparison['unmatched']:
+            click.echo(f"  {comparison['unmatched']} configurations are not in the baseline")
+    
+    if result.get('results_file'):
+        click.echo(f"\nSaved: {result['results_file']}")
+    if result.get('baseline_file'):
+        click.echo(f"Baseline: {result['baseline_file']}")
+    click.echo("\nNote: Speed values show real-time factor (higher is better)")
+    click.echo("      1.0x = real-time, 10x = 10 times faster than real-time")
+
 # Old subcommand structure removed - replaced by unified model command
 # The old @whisper_model group and all its subcommands have been replaced
 # by the unified whisper_model_unified command above
@@ -1692,16 +1913,21 @@ from voice_mode.cli_commands import transcribe as transcribe_cmd
 from voice_mode.cli_commands import pronounce_commands
 from voice_mode.cli_commands import claude
 from voice_mode.cli_commands import hook as hook_cmd
+from voice_mode.cli_commands import trace as trace_cmd
+from voice_mode.cli_commands import daemon as daemon_cmd
 
 # Add subcommands to legacy CLI
 cli.add_command(exchanges_cmd.exchanges)
+cli.add_command(trace_cmd.trace)
 cli.add_command(transcribe_cmd.transcribe)
 cli.add_command(pronounce_commands.pronounce_group)
 cli.add_command(claude.claude_group)
 
 # Add exchanges to main CLI
 voice_mode_main_cli.add_command(exchanges_cmd.exchanges)
+voice_mode_main_cli.add_command(trace_cmd.trace)
 voice_mode_main_cli.add_command(claude.claude_group)
+voice_mode_main_cli.add_command(daemon_cmd.daemon)
 
 # Note: We'll add these commands after the groups are defined
 # audio group will get transcribe and play commands
@@ -1742,9 +1968,11 @@ config.add_command(pronounce_commands.pronounce_group)
 @click.option('--vad-aggressiveness', type=int, help='VAD aggressiveness (0-3)')
 @click.option('--skip-tts/--no-skip-tts', default=None, help='Skip TTS and only show text')
 @click.option('--continuous', '-c', is_flag=True, help='Continuous conversation mode')
+@click.option('--daemon/--no-daemon', 'use_daemon', default=None,
+              help='Run in the VoiceMode daemon if it is running (default: VOICEMODE_DAEMON)')
 def converse(message, wait, duration, min_duration, transport, room_name, voice, tts_provider,
             tts_model, tts_instructions, audio_feedback, audio_format, disable_silence_detection,
-            speed, vad_aggressiveness, skip_tts, continuous):
+            speed, vad_aggressiveness, skip_tts, continuous, use_daemon):
     """Have a voice conversation directly from the command line.
 
     Examples:
@@ -1761,18 +1989,29 @@ def converse(message, wait, duration, min_duration, transport, room_name, voice,
         # Use specific voice
         voicemode converse --voice nova
     """
-    # Check core dependencies before running
-    from voice_mode.utils.dependencies.checker import check_component_dependencies
+    # Hand the conversation to a running daemon, which already has the
+    # audio stack, clients and provider registry loaded
+    from voice_mode.config import DAEMON_ENABLED
 
-    results = check_component_dependencies('core')
-    missing = [pkg for pkg, installed in results.items() if not installed]
+    converse_call = None
+    if DAEMON_ENABLED if use_daemon is None else use_daemon:
+        from voice_mode.daemon import daemon_converse
+        converse_call = daemon_converse()
 
-    if missing:
-        click.echo(f"⚠️  Missing core dependencies: {', '.join(missing)}")
-        click.echo("   Run 'voicemode deps' to install them")
-        return
+    if converse_call is None:
+        # Check core dependencies before running
+        from voice_mode.utils.dependencies.checker import check_component_dependencies
+
+        results = check_component_dependencies('core')
+        missing = [pkg for pkg, installed in results.items() if not installed]
+
+        if missing:
+            click.echo(f"⚠️  Missing core dependencies: {', '.join(missing)}")
+            click.echo("   Run 'voicemode deps' to install them")
+            return
 
-    from voice_mode.tools.converse import converse as converse_fn
+        from voice_mode.tools.converse import converse as converse_fn
+        converse_call = converse_fn.fn
     
     async def run_conversation():
         """Run the conversation asynchronously."""
@@ -1792,7 +2031,7 @@ def converse(message, wait, duration, min_duration, transport, room_name, voice,
                 click.echo("   Press Ctrl+C to exit\n")
                 
                 # First message
-                result = await converse_fn.fn(
+                result = await converse_call(
                     message=message,
                     wait_for_response=True,
                     listen_duration_max=duration,
@@ -1817,7 +2056,7 @@ def converse(message, wait, duration, min_duration, transport, room_name, voice,
                 # Continue conversation
                 while True:
                     # Wait for user's next input
-                    result = await converse_fn.fn(
+                    result = await converse_call(
                         message="",  # Empty message for listening only
                         wait_for_response=True,
                         listen_duration_max=duration,
@@ -1842,7 +2081,7 @@ def converse(message, wait, duration, min_duration, transport, room_name, voice,
                         
                         # Check for exit commands
                         if user_text.lower() in ['exit', 'quit', 'goodbye', 'bye']:
-                            await converse_fn.fn(
+                            await converse_call(
                                 message="Goodbye!",
                                 wait_for_response=False,
                                 voice=voice,
@@ -1855,7 +2094,7 @@ def converse(message, wait, duration, min_duration, transport, room_name, voice,
                             break
             else:
                 # Single conversation
-                result = await converse_fn.fn(
+                result = await converse_call(
                     message=message,
                     wait_for_response=wait,
                     listen_duration_max=duration,
@@ -1902,6 +2141,15 @@ def converse(message, wait, duration, min_duration, transport, room_name, voice,
     asyncio.run(run_conversation())
 
 
+# Status command
+@voice_mode_main_cli.command()
+@click.help_option('-h', '--help')
+def status():
+    """Show the status of Whisper, Kokoro and LiveKit at once."""
+    from voice_mode.tools.service import status_all_services
+    click.echo(asyncio.run(status_all_services()))
+
+
 # Version command
 @voice_mode_main_cli.command()
 def version():
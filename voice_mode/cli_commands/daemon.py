@@ -0,0 +1,107 @@
+"""
+Daemon command group for voice-mode CLI.
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+import click
+
+
+def _socket(socket_path: Optional[str]) -> Path:
+    if socket_path:
+        return Path(socket_path).expanduser()
+    from voice_mode.config import DAEMON_SOCKET
+    return DAEMON_SOCKET
+
+
+socket_option = click.option('--socket', 'socket_path', type=click.Path(dir_okay=False), default=None,
+                             help='Socket path (default: VOICEMODE_DAEMON_SOCKET)')
+
+
+@click.group()
+@click.help_option('-h', '--help', help='Show this message and exit')
+def daemon():
+    """Run a resident VoiceMode process that CLI commands and hooks reuse."""
+    pass
+
+
+@daemon.command()
+@click.help_option('-h', '--help')
+@click.option('--detach', '-d', is_flag=True, help='Run in the background and return once it is ready')
+@click.option('--wait', type=float, default=30.0, show_default=True,
+              help='Seconds to wait for a detached daemon to become ready')
+@socket_option
+def start(detach, wait, socket_path):
+    """Start the daemon (in the foreground unless --detach)."""
+    from voice_mode.daemon import is_running, run_daemon
+
+    path = _socket(socket_path)
+    if is_running(path):
+        click.echo(f"VoiceMode daemon is already running on {path}")
+        return
+
+    if not detach:
+        click.echo(f"VoiceMode daemon listening on {path} (Ctrl+C to stop)")
+        run_daemon(path)
+        return
+
+    from voice_mode.config import LOGS_DIR
+    log_file = LOGS_DIR / "daemon.log"
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_file, "ab") as log:
+        process = subprocess.Popen(
+            [sys.executable, "-c", "import sys; from voice_mode.daemon import run_daemon; run_daemon(sys.argv[1])", str(path)],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        if is_running(path):
+            click.echo(f"✅ VoiceMode daemon started (PID {process.pid}) on {path}")
+            return
+        if process.poll() is not None:
+            break
+        time.sleep(0.1)
+    click.echo(f"❌ VoiceMode daemon did not start; see {log_file}", err=True)
+    sys.exit(1)
+
+
+@daemon.command()
+@click.help_option('-h', '--help')
+@socket_option
+def stop(socket_path):
+    """Ask the running daemon to shut down."""
+    from voice_mode.daemon import DaemonUnavailable, call
+
+    try:
+        call("shutdown", socket_path=_socket(socket_path), timeout=10)
+    except DaemonUnavailable:
+        click.echo("VoiceMode daemon is not running")
+        return
+    click.echo("VoiceMode daemon stopped")
+
+
+@daemon.command()
+@click.help_option('-h', '--help')
+@socket_option
+def status(socket_path):
+    """Show whether the daemon is running."""
+    from voice_mode.daemon import DaemonError, DaemonUnavailable, call
+
+    path = _socket(socket_path)
+    try:
+        info = call("ping", socket_path=path, timeout=2)
+    except (DaemonUnavailable, DaemonError, OSError):
+        click.echo(f"VoiceMode daemon is not running ({path})")
+        sys.exit(1)
+    click.echo(f"VoiceMode daemon v{info['version']} running (PID {info['pid']})")
+    click.echo(f"  Socket:   {info['socket']}")
+    click.echo(f"  Uptime:   {info['uptime']:.0f}s")
+    click.echo(f"  Requests: {info['requests']}")
@@ -2,6 +2,7 @@
 Exchanges command group for voice-mode CLI.
 """
 
+import re
 import sys
 import json
 from datetime import datetime, timedelta
@@ -15,7 +16,8 @@ from voice_mode.exchanges import (
     ExchangeFormatter, 
     ExchangeFilter,
     ConversationGrouper,
-    ExchangeStats
+    ExchangeStats,
+    ExchangeIndex
 )
 
 
@@ -148,7 +150,7 @@ def view(lines, conversation, today, yesterday, date, format, reverse, no_color)
 @click.option('-n', '--max-results', type=int, default=50,
               help='Maximum results to show')
 @click.option('-d', '--days', type=int, default=7,
-              help='Number of days to search')
+              help='Number of days to search (0 for all history)')
 @click.option('--type', 'exchange_type',
               type=click.Choice(['stt', 'tts', 'all']),
               default='all',
@@ -156,6 +158,10 @@ def view(lines, conversation, today, yesterday, date, format, reverse, no_color)
 @click.option('--regex', is_flag=True, help='Use regex search')
 @click.option('-i', '--ignore-case', is_flag=True, default=True,
               help='Case insensitive search')
+@click.option('-p', '--prefix', is_flag=True,
+              help='Match words by prefix (same as appending * to each word)')
+@click.option('--sort', type=click.Choice(['rank', 'time']), default='rank',
+              help='Order results by relevance or time')
 @click.option('--conversation', is_flag=True, 
               help='Show full conversations')
 @click.option('-f', '--format', 
@@ -163,9 +169,74 @@ def view(lines, conversation, today, yesterday, date, format, reverse, no_color)
               default='simple',
               help='Output format')
 @click.option('--no-color', is_flag=True, help='Disable colored output')
-def search(query, max_results, days, exchange_type, regex, ignore_case, 
-           conversation, format, no_color):
-    """Search through exchange logs."""
+def search(query, max_results, days, exchange_type, regex, ignore_case, prefix,
+           sort, conversation, format, no_color):
+    """Search through exchange logs.
+    
+    Uses a full-text index of the logs, updated incrementally on each search.
+    Words ending in * match by prefix, e.g. "deploy*".
+    """
+    formatter = ExchangeFormatter()
+    use_color = not no_color and sys.stdout.isatty()
+    
+    if not ExchangeIndex.is_available():
+        # SQLite without FTS5 - fall back to scanning the logs
+        _search_scan(query, max_results, days, exchange_type, regex, ignore_case,
+                     conversation, format, use_color)
+        return
+    
+    with ExchangeIndex() as exchange_index:
+        if regex:
+            try:
+                hits = exchange_index.search(query, days=days or None, exchange_type=exchange_type,
+                                    limit=None, regex=True, ignore_case=ignore_case,
+                                    order=sort)
+            except re.error as e:
+                raise click.BadParameter(f"Invalid regex: {e}", param_hint='QUERY')
+            total_found = len(hits)
+        else:
+            hits = exchange_index.search(query, days=days or None, exchange_type=exchange_type,
+                                limit=None if conversation else max_results,
+                                prefix=prefix, order=sort)
+            # search() has just refreshed the index
+            total_found = len(hits) if conversation else exchange_index.count(
+                query, days=days or None, exchange_type=exchange_type, prefix=prefix, refresh=False)
+        
+        if conversation:
+            # Show full conversations containing matches, best match first
+            conversations = exchange_index.conversations_for_hits(hits, limit=max_results)
+            for conv in conversations:
+                print(f"\n=== Conversation {conv.id} ===")
+                print(f"Duration: {conv.duration} | Exchanges: {conv.exchange_count}")
+                print()
+                
+                for conv_exchange in conv.exchanges:
+                    if format == 'simple':
+                        output = formatter.simple(conv_exchange, color=use_color)
+                    else:
+                        output = formatter.json(conv_exchange)
+                    print(output)
+            
+            total_found = len({hit.exchange.conversation_id for hit in hits})
+            shown = len(conversations)
+        else:
+            # Show individual matching exchanges with highlighted snippets
+            for hit in hits[:max_results]:
+                if format == 'simple':
+                    output = formatter.simple(hit.exchange, color=use_color,
+                                              snippet=hit.snippet)
+                else:
+                    output = formatter.json(hit.exchange)
+                print(output)
+            shown = min(total_found, max_results)
+    
+    # Summary
+    print(f"\n{shown} of {total_found} results shown", file=sys.stderr)
+
+
+def _search_scan(query, max_results, days, exchange_type, regex, ignore_case,
+                 conversation, format, use_color):
+    """Search by reading and filtering every exchange in the period."""
     reader = ExchangeReader()
     formatter = ExchangeFormatter()
     filter_obj = ExchangeFilter()
@@ -177,7 +248,8 @@ def search(query, max_results, days, exchange_type, regex, ignore_case,
         filter_obj.by_type(exchange_type)
     
     # Read exchanges from recent days
-    exchanges = list(filter_obj.apply(reader.read_recent(days)))
+    source = reader.read_recent(days) if days else reader._read_all()
+    exchanges = list(filter_obj.apply(source))
     
     if conversation:
         # Group by conversation and show full conversations
@@ -197,8 +269,7 @@ def search(query, max_results, days, exchange_type, regex, ignore_case,
                 # Show all exchanges in conversation
                 for conv_exchange in conv.exchanges:
                     if format == 'simple':
-                        output = formatter.simple(conv_exchange, 
-                                                color=not no_color and sys.stdout.isatty())
+                        output = formatter.simple(conv_exchange, color=use_color)
                     else:
                         output = formatter.json(conv_exchange)
                     print(output)
@@ -212,8 +283,7 @@ def search(query, max_results, days, exchange_type, regex, ignore_case,
         # Show individual matching exchanges
         for i, exchange in enumerate(exchanges[:max_results]):
             if format == 'simple':
-                output = formatter.simple(exchange, 
-                                        color=not no_color and sys.stdout.isatty())
+                output = formatter.simple(exchange, color=use_color)
             else:
                 output = formatter.json(exchange)
             print(output)
@@ -224,18 +294,104 @@ def search(query, max_results, days, exchange_type, regex, ignore_case,
     print(f"\n{shown} of {total_found} results shown", file=sys.stderr)
 
 
+@exchanges.command()
+@click.help_option('-h', '--help')
+@click.option('--rebuild', is_flag=True, help='Discard the index and rebuild it from the logs')
+def index(rebuild):
+    """Update the full-text search index."""
+    if not ExchangeIndex.is_available():
+        click.echo("SQLite FTS5 is not available; search will scan log files.", err=True)
+        return
+    
+    with ExchangeIndex() as exchange_index:
+        if rebuild:
+            added = exchange_index.rebuild()
+        else:
+            added = exchange_index.update()
+        info = exchange_index.stats()
+    
+    click.echo(f"Indexed {added} new exchanges")
+    click.echo(f"Index: {info['exchanges']} exchanges in {info['conversations']} "
+               f"conversations from {info['files']} log files")
+
+
+@exchanges.command()
+@click.help_option('-h', '--help')
+@click.option('--older-than', type=int, default=30, show_default=True,
+              help='Compress logs older than N days')
+@click.option('--codec', type=click.Choice(['gzip', 'zstd']), default=None,
+              help='Compression codec (default: VOICEMODE_LOG_ARCHIVE_CODEC or gzip)')
+@click.option('--events/--no-events', default=True,
+              help='Also archive event logs')
+@click.option('--dry-run', is_flag=True, help='Show what would be compressed')
+def archive(older_than, codec, events, dry_run):
+    """Compress old exchange and event logs.
+    
+    Archived logs stay readable by all exchange commands.
+    """
+    from voice_mode.config import LOGS_DIR, EVENT_LOG_DIR, LOG_ARCHIVE_CODEC
+    from voice_mode.utils.log_archive import (
+        ZSTD_AVAILABLE,
+        EXCHANGE_LOG_PATTERN,
+        EVENT_LOG_PATTERN,
+        archive_logs,
+    )
+    
+    codec = codec or LOG_ARCHIVE_CODEC
+    if codec == 'zstd' and not ZSTD_AVAILABLE:
+        raise click.UsageError("zstd compression requires the 'zstandard' package")
+    
+    results = archive_logs(LOGS_DIR / "conversations", EXCHANGE_LOG_PATTERN, older_than,
+                           codec=codec, dry_run=dry_run)
+    if events:
+        results += archive_logs(EVENT_LOG_DIR, EVENT_LOG_PATTERN, older_than,
+                                codec=codec, dry_run=dry_run)
+    
+    if not results:
+        click.echo(f"No logs older than {older_than} days to archive")
+        return
+    
+    for original, target in results:
+        if dry_run:
+            click.echo(f"Would compress {original}")
+        elif target is None:
+            click.echo(f"Failed to compress {original}", err=True)
+        else:
+            click.echo(f"Compressed {original.name} -> {target.name}")
+
+
+def _format_percentiles(values):
+    """Format a timing summary as one line."""
+    return (f"avg={values['avg']:.2f}s p50={values['p50']:.2f}s p90={values['p90']:.2f}s "
+            f"p99={values['p99']:.2f}s max={values['max']:.2f}s (n={values['count']})")
+
+
+def _print_grouped_timing(title, grouped, label=str):
+    """Print per-group timing summaries from ExchangeStats.timing_by()."""
+    print(f"\n{title}:")
+    print("-" * 30)
+    if not grouped:
+        print("No timing data")
+    for group, metrics in grouped.items():
+        print(label(group))
+        for metric, values in metrics.items():
+            print(f"  {metric:<11s} {_format_percentiles(values)}")
+
+
 @exchanges.command()
 @click.help_option('-h', '--help')
 @click.option('-d', '--days', type=int, help='Stats for last N days')
 @click.option('--by-hour', is_flag=True, help='Group by hour')
 @click.option('--by-provider', is_flag=True, help='Group by provider')
 @click.option('--by-transport', is_flag=True, help='Group by transport')
-@click.option('--timing', is_flag=True, help='Show timing statistics')
+@click.option('--timing', is_flag=True, help='Show timing statistics (percentiles per provider/hour when combined with --by-*)')
+@click.option('--histogram', type=click.Choice(['ttfa', 'gen', 'play', 'record', 'stt']),
+              help='Show a histogram of one timing metric')
 @click.option('--conversations', is_flag=True, help='Show conversation stats')
 @click.option('--errors', is_flag=True, help='Show error statistics')
 @click.option('--silence', is_flag=True, help='Show silence detection stats')
 @click.option('--all', 'show_all', is_flag=True, help='Show all statistics')
-def stats(days, by_hour, by_provider, by_transport, timing, conversations, 
+def stats(days, by_hour, by_provider, by_transport, timing, histogram, conversations, 
           errors, silence, show_all):
     """Show statistics about exchanges."""
     reader = ExchangeReader()
@@ -254,10 +410,11 @@ def stats(days, by_hour, by_provider, by_transport, timing, conversations,
     stats_obj = ExchangeStats(exchanges)
     
     # If no specific stats requested, show summary
-    if not any([by_hour, by_provider, by_transport, timing, conversations, 
+    if not any([by_hour, by_provider, by_transport, timing, histogram, conversations, 
                 errors, silence]) or show_all:
         print(stats_obj.get_summary_report())
-        return
+        if not show_all:
+            return
     
     # Show specific stats
     if by_hour or show_all:
@@ -267,12 +424,17 @@ def stats(days, by_hour, by_provider, by_transport, timing, conversations,
         for hour, count in sorted(hourly.items()):
             bar = '█' * (count // 5) if count > 0 else ''
             print(f"{hour:02d}:00  {count:4d}  {bar}")
+        if timing or show_all:
+            _print_grouped_timing("Hourly Latency", stats_obj.timing_by('hour'),
+                                  label=lambda hour: f"{hour:02d}:00")
     
     if by_provider or show_all:
         print("\nProvider Breakdown:")
         print("-" * 30)
         for provider, count in stats_obj.provider_breakdown().items():
             print(f"{provider:20s} {count:6d}")
+        if timing or show_all:
+            _print_grouped_timing("Provider Latency", stats_obj.timing_by('provider'))
     
     if by_transport or show_all:
         print("\nTransport Breakdown:")
@@ -288,21 +450,26 @@ def stats(days, by_hour, by_provider, by_transport, timing, conversations,
         if 'overall' in timing_stats and timing_stats['overall']:
             print("Overall:")
             if 'avg_turnaround' in timing_stats['overall']:
-                print(f"  Avg Turnaround: {timing_stats['overall']['avg_turnaround']:.2f}s")
+                overall = timing_stats['overall']
+                print(f"  Avg Turnaround: {overall['avg_turnaround']:.2f}s "
+                      f"(p50={overall['p50_turnaround']:.2f}s, p90={overall['p90_turnaround']:.2f}s)")
         
-        if 'tts' in timing_stats and timing_stats['tts']:
-            print("\nTTS:")
-            for metric, values in timing_stats['tts'].items():
-                if isinstance(values, dict) and 'avg' in values:
-                    print(f"  {metric}: avg={values['avg']:.2f}s, "
-                          f"min={values['min']:.2f}s, max={values['max']:.2f}s")
-        
-        if 'stt' in timing_stats and timing_stats['stt']:
-            print("\nSTT:")
-            for metric, values in timing_stats['stt'].items():
-                if isinstance(values, dict) and 'avg' in values:
-                    print(f"  {metric}: avg={values['avg']:.2f}s, "
-                          f"min={values['min']:.2f}s, max={values['max']:.2f}s")
+        for type_name in ('tts', 'stt'):
+            if timing_stats.get(type_name):
+                print(f"\n{type_name.upper()}:")
+                for metric, values in timing_stats[type_name].items():
+                    print(f"  {metric:<11s} {_format_percentiles(values)}")
+    
+    if histogram:
+        print(f"\n{histogram} Histogram:")
+        print("-" * 30)
+        counts, edges = stats_obj.histogram(histogram)
+        if not counts:
+            print("No data")
+        peak = max(counts) if counts else 0
+        for i, count in enumerate(counts):
+            bar = '█' * round(40 * count / peak) if peak else ''
+            print(f"{edges[i]:6.2f}-{edges[i + 1]:6.2f}s  {count:5d}  {bar}")
     
     if conversations or show_all:
         print("\nConversation Statistics:")
@@ -41,8 +41,11 @@ def receiver(tool_name, action, subagent_type, event, debug):
         
         # Testing with specific values
         voicemode claude hooks receiver --tool-name Task --action start --subagent-type mama-bear
+    
+    For the lowest latency, point the hook at `voicemode-hook` instead: it
+    accepts the same options and skips loading the CLI and configuration.
     """
-    from voice_mode.tools.sound_fonts.audio_player import Player
+    from voice_mode.hook_receiver import handle
     
     # Try to read JSON from stdin if available
     hook_data = {}
@@ -57,61 +60,17 @@ def receiver(tool_name, action, subagent_type, event, debug):
             # Silent fail for hooks
             sys.exit(0)
     
-    # Extract values from JSON or use command-line overrides/defaults
-    if not tool_name:
-        tool_name = hook_data.get('tool_name', 'Task')
-    
-    if not event:
-        event_name = hook_data.get('hook_event_name', 'PreToolUse')
-    else:
-        event_name = event
-    
-    # Map event to action if not specified
-    if not action:
-        if event_name == 'PreToolUse':
-            action = 'start'
-        elif event_name == 'PostToolUse':
-            action = 'end'
-        else:
-            action = 'start'  # Default
-    
-    # Get subagent_type from tool_input if not specified
-    if not subagent_type and tool_name == 'Task':
-        tool_input = hook_data.get('tool_input', {})
-        subagent_type = tool_input.get('subagent_type', 'baby-bear')
-    elif not subagent_type:
-        subagent_type = None
-    
-    if debug:
-        print(f"[DEBUG] Processing: event={event_name}, tool={tool_name}, "
-              f"action={action}, subagent={subagent_type}", file=sys.stderr)
-    
-    # Check if sound fonts are enabled
-    from voice_mode.config import SOUNDFONTS_ENABLED
-    
-    if not SOUNDFONTS_ENABLED:
+    # Same code path as the lightweight `voicemode-hook` entry point
+    try:
+        success = handle(hook_data, tool_name, event, subagent_type, debug)
         if debug:
-            print(f"[DEBUG] Sound fonts are disabled (VOICEMODE_SOUNDFONTS_ENABLED=false)", file=sys.stderr)
-    else:
-        # Find sound file using filesystem conventions
-        sound_file = find_sound_file(event_name, tool_name, subagent_type)
-        
-        if sound_file:
-            if debug:
-                print(f"[DEBUG] Found sound file: {sound_file}", file=sys.stderr)
-            
-            # Play the sound
-            player = Player()
-            success = player.play(str(sound_file))
-            
-            if debug:
-                if success:
-                    print(f"[DEBUG] Sound played successfully", file=sys.stderr)
-                else:
-                    print(f"[DEBUG] Failed to play sound", file=sys.stderr)
-        else:
-            if debug:
-                print(f"[DEBUG] No sound file found for this event", file=sys.stderr)
+            if success:
+                print(f"[DEBUG] Sound played successfully", file=sys.stderr)
+            else:
+                print(f"[DEBUG] No sound played", file=sys.stderr)
+    except Exception as e:
+        if debug:
+            print(f"[DEBUG] Hook failed: {e}", file=sys.stderr)
     
     # Always exit 0 to not disrupt Claude Code
     sys.exit(0)
@@ -135,57 +94,8 @@ def find_sound_file(event: str, tool: str, subagent: Optional[str] = None) -> Op
     Returns:
         Path to sound file if found, None otherwise
     """
-    # Get base path (follow symlink if exists)
-    base_path = Path.home() / '.voicemode' / 'soundfonts' / 'current'
-    
-    # Resolve symlink if it exists
-    if base_path.is_symlink():
-        base_path = base_path.resolve()
-    
-    if not base_path.exists():
-        return None
-    
-    # Normalize names to lowercase for filesystem
-    event = event.lower() if event else 'pretooluse'
-    tool = tool.lower() if tool else 'default'
-    subagent = subagent.lower() if subagent else None
-    
-    # Map event names to directory names
-    event_map = {
-        'pretooluse': 'PreToolUse',
-        'posttooluse': 'PostToolUse',
-        'start': 'PreToolUse',
-        'end': 'PostToolUse'
-    }
-    event_dir = event_map.get(event, event)
-    
-    # Build list of paths to try (most specific to least specific)
-    paths_to_try = []
-    
-    # 1. Most specific: subagent sound (Task tool only)
-    if tool == 'task' and subagent:
-        # Try mp3 first (smaller), then wav
-        paths_to_try.append(base_path / event_dir / tool / 'subagent' / f'{subagent}.mp3')
-        paths_to_try.append(base_path / event_dir / tool / 'subagent' / f'{subagent}.wav')
-    
-    # 2. Tool-specific default
-    paths_to_try.append(base_path / event_dir / tool / 'default.mp3')
-    paths_to_try.append(base_path / event_dir / tool / 'default.wav')
-    
-    # 3. Event-level default
-    paths_to_try.append(base_path / event_dir / 'default.mp3')
-    paths_to_try.append(base_path / event_dir / 'default.wav')
-    
-    # 4. Global fallback
-    paths_to_try.append(base_path / 'fallback.mp3')
-    paths_to_try.append(base_path / 'fallback.wav')
-    
-    # Find first existing file
-    for path in paths_to_try:
-        if path.exists():
-            return path
-    
-    return None
+    from voice_mode.hook_receiver import find_sound_file as find
+    return find(event, tool, subagent)
 
 
 # Keep the old stdin-receiver command for backwards compatibility (deprecated)
@@ -0,0 +1,116 @@
+"""
+Trace command group for voice-mode CLI.
+"""
+
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+import click
+
+
+def _trace_dir(trace_dir: Optional[str]) -> Path:
+    if trace_dir:
+        return Path(trace_dir).expanduser()
+    from voice_mode.config import TRACE_DIR
+    return TRACE_DIR
+
+
+@click.group()
+@click.help_option('-h', '--help', help='Show this message and exit')
+def trace():
+    """Inspect and export converse tracing spans (VOICEMODE_TRACING=true)."""
+    pass
+
+
+@trace.command()
+@click.help_option('-h', '--help')
+@click.option('-f', '--format', 'output_format',
+              type=click.Choice(['chrome', 'otlp']),
+              default='chrome',
+              show_default=True,
+              help='Chrome trace events or OTLP-JSON (both open in ui.perfetto.dev)')
+@click.option('-o', '--output', type=click.Path(dir_okay=False), default=None,
+              help='Output file (default: stdout)')
+@click.option('-n', '--last', type=int, default=None,
+              help='Only export the last N turns')
+@click.option('--trace-dir', type=click.Path(file_okay=False), default=None,
+              help='Span directory (default: VOICEMODE_TRACE_DIR)')
+def export(output_format, output, last, trace_dir):
+    """Export recorded spans for Perfetto or chrome://tracing."""
+    from voice_mode.utils.tracing import iter_spans, last_traces, to_chrome_trace, to_otlp_json
+
+    spans = list(iter_spans(_trace_dir(trace_dir)))
+    if last:
+        spans = last_traces(spans, last)
+    if not spans:
+        click.echo("No spans recorded. Enable tracing with VOICEMODE_TRACING=true", err=True)
+        sys.exit(1)
+
+    document = to_chrome_trace(spans) if output_format == 'chrome' else to_otlp_json(spans)
+    text = json.dumps(document, separators=(',', ':'))
+    if output:
+        Path(output).write_text(text)
+        click.echo(f"Wrote {len(spans)} spans to {output}", err=True)
+    else:
+        click.echo(text)
+
+
+@trace.command()
+@click.help_option('-h', '--help')
+@click.option('-n', '--last', type=int, default=1, show_default=True,
+              help='Number of turns to show')
+@click.option('--trace-dir', type=click.Path(file_okay=False), default=None,
+              help='Span directory (default: VOICEMODE_TRACE_DIR)')
+def show(last, trace_dir):
+    """Print the span tree of recent turns."""
+    from voice_mode.utils.tracing import iter_spans, last_traces
+
+    spans = last_traces(iter_spans(_trace_dir(trace_dir)), last)
+    if not spans:
+        click.echo("No spans recorded. Enable tracing with VOICEMODE_TRACING=true")
+        return
+
+    children = {}
+    for record in spans:
+        children.setdefault(record.get('parent_id'), []).append(record)
+    ids = {record['span_id'] for record in spans}
+
+    def print_tree(record, depth):
+        duration_ms = (record.get('duration_ns') or 0) / 1e6
+        attrs = " ".join(f"{k}={v}" for k, v in (record.get('attributes') or {}).items())
+        marker = " !" if record.get('status') == 'error' else ""
+        click.echo(f"{'  ' * depth}{record['name']:<{max(1, 28 - 2 * depth)}} {duration_ms:9.1f}ms{marker}  {attrs}")
+        for child in sorted(children.get(record['span_id'], []), key=lambda r: r['start_ns']):
+            print_tree(child, depth + 1)
+
+    # Roots are spans without a parent, or whose parent was rotated away
+    roots = [r for r in spans if r.get('parent_id') is None or r['parent_id'] not in ids]
+    for root in sorted(roots, key=lambda r: r['start_ns']):
+        print_tree(root, 0)
+        click.echo()
+
+
+@trace.command()
+@click.help_option('-h', '--help')
+@click.option('--trace-dir', type=click.Path(file_okay=False), default=None,
+              help='Span directory (default: VOICEMODE_TRACE_DIR)')
+def summary(trace_dir):
+    """Show span counts and total time per stage."""
+    from voice_mode.utils.tracing import iter_spans
+
+    counts = Counter()
+    totals = Counter()
+    for record in iter_spans(_trace_dir(trace_dir)):
+        counts[record['name']] += 1
+        totals[record['name']] += (record.get('duration_ns') or 0) / 1e6
+
+    if not counts:
+        click.echo("No spans recorded. Enable tracing with VOICEMODE_TRACING=true")
+        return
+
+    click.echo(f"{'Stage':<20} {'Count':>7} {'Avg ms':>10} {'Total ms':>12}")
+    for name, total in totals.most_common():
+        click.echo(f"{name:<20} {counts[name]:>7} {total / counts[name]:>10.1f} {total:>12.1f}")
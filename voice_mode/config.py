@@ -13,28 +13,37 @@ from pathlib import Path
 from typing import Dict, Optional
 from datetime import datetime
 
+from .utils.file_watch import FileWatcher
+
 # ==================== ENVIRONMENT CONFIGURATION ====================
 
-def find_voicemode_env_files() -> list[Path]:
-    """
-    Find .voicemode.env files by walking up the directory tree.
-    
-    Looks for (in order of priority - closest to current directory wins):
-    1. .voicemode.env in current or parent directories  
-    2. .voicemode/voicemode.env in current or parent directories
-    3. ~/.voicemode/voicemode.env in user home (global config)
-    
+# Directory-walk results per working directory, each with a watcher over
+# every candidate file the walk looked at
+_env_files_cache: Dict[Path, tuple] = {}
+_config_generation = 0
+_applied_generation = 0
+_loaded_env_files: list = []
+# Variables set from voicemode.env files (and the values set), so a reload
+# can update or remove them without touching real environment variables
+_file_env: Dict[str, str] = {}
+
+
+def _scan_voicemode_env_files(cwd: Path) -> tuple:
+    """Walk up from ``cwd`` for config files.
+
     Returns:
-        List of Path objects in loading order (global first, then project-specific)
+        Tuple of (config files in loading order, every candidate path checked)
     """
     config_files = []
+    candidates = []
     
     # First add global config (lowest priority - loaded first)
     global_config = Path.home() / ".voicemode" / "voicemode.env"
+    old_global = Path.home() / ".voicemode" / ".voicemode.env"
+    candidates.extend([global_config, old_global])
     
     # Backwards compatibility: check for old filename
     if not global_config.exists():
-        old_global = Path.home() / ".voicemode" / ".voicemode.env"
         if old_global.exists():
             global_config = old_global
     
@@ -42,18 +51,20 @@ def find_voicemode_env_files() -> list[Path]:
         config_files.append(global_config)
     
     # Then walk up directory tree for project-specific configs (higher priority)
-    current_dir = Path.cwd()
+    current_dir = cwd
     project_configs = []
     
     while current_dir != current_dir.parent:
         # Check for standalone .voicemode.env first
         standalone_file = current_dir / ".voicemode.env"
+        candidates.append(standalone_file)
         if standalone_file.exists():
             project_configs.append(standalone_file)
             break  # Stop at first found (closest wins)
             
         # Then check .voicemode/voicemode.env  
         dir_file = current_dir / ".voicemode" / "voicemode.env"
+        candidates.append(dir_file)
         # Skip if this is the global config file (already added)
         if dir_file.exists() and dir_file != global_config:
             project_configs.append(dir_file)
@@ -64,11 +75,47 @@ def find_voicemode_env_files() -> list[Path]:
     # Add project configs (they were collected closest-first, so add as-is)
     config_files.extend(project_configs)
     
-    return config_files
+    return config_files, candidates
+
+
+def find_voicemode_env_files() -> list[Path]:
+    """
+    Find .voicemode.env files by walking up the directory tree.
+    
+    Looks for (in order of priority - closest to current directory wins):
+    1. .voicemode.env in current or parent directories  
+    2. .voicemode/voicemode.env in current or parent directories
+    3. ~/.voicemode/voicemode.env in user home (global config)
+    
+    The walk is memoized per working directory and repeated only when one
+    of the files it checked is created, edited or removed.
+    
+    Returns:
+        List of Path objects in loading order (global first, then project-specific)
+    """
+    global _config_generation
+    
+    cwd = Path.cwd()
+    cached = _env_files_cache.get(cwd)
+    if cached is not None:
+        config_files, watcher = cached
+        if not watcher.changed():
+            return list(config_files)
+        _config_generation += 1
+    
+    config_files, candidates = _scan_voicemode_env_files(cwd)
+    if cached is not None:
+        cached[1].watch(candidates)
+        _env_files_cache[cwd] = (config_files, cached[1])
+    else:
+        _env_files_cache[cwd] = (config_files, FileWatcher(candidates))
+    return list(config_files)
 
 
 def load_voicemode_env():
     """Load configuration from voicemode.env files, with cascading from global to project-specific."""
+    global _file_env, _loaded_env_files
+    
     config_files = find_voicemode_env_files()
     
     # If no config files found, create default global config
@@ -156,6 +203,12 @@ def load_voicemode_env():
 # Auto-start Kokoro service (true/false)
 # VOICEMODE_AUTO_START_KOKORO=false
 
+# Start Whisper and Kokoro in parallel when the server starts (true/false)
+# VOICEMODE_AUTO_START_SERVICES=false
+
+# Seconds to wait for a started service to pass its health check and warm-up inference
+# VOICEMODE_SERVICE_READY_TIMEOUT=120
+
 #############
 # Whisper Configuration
 #############
@@ -172,6 +225,13 @@ def load_voicemode_env():
 # Path to Whisper models
 # VOICEMODE_WHISPER_MODEL_PATH=~/.voicemode/services/whisper/models
 
+# CPU threads for whisper-server, per instance (set by `voicemode whisper tune`)
+# VOICEMODE_WHISPER_THREADS=8
+
+# Number of whisper-server instances on consecutive ports from VOICEMODE_WHISPER_PORT;
+# requests go to the least busy one and the cores are split between them (default: 1)
+# VOICEMODE_WHISPER_INSTANCES=1
+
 #############
 # Kokoro Configuration
 #############
@@ -277,6 +337,52 @@ def load_voicemode_env():
 # Log rotation policy (currently only 'daily' supported)
 # VOICEMODE_EVENT_LOG_ROTATION=daily
 
+# Compress exchange and event logs older than N days at server start (0 = never)
+# VOICEMODE_LOG_ARCHIVE_DAYS=0
+
+# Compression for archived logs: gzip, or zstd if the zstandard package is installed
+# VOICEMODE_LOG_ARCHIVE_CODEC=gzip
+
+# Record per-stage tracing spans for each converse turn (true/false, default: false)
+# Export with: voicemode trace export --format chrome
+# VOICEMODE_TRACING=false
+
+# Trace directory (default: ~/.voicemode/logs/traces)
+# VOICEMODE_TRACE_DIR=~/.voicemode/logs/traces
+
+# Rotate the span file at this size in MB, keeping VOICEMODE_TRACE_BACKUPS old files
+# VOICEMODE_TRACE_MAX_MB=10
+# VOICEMODE_TRACE_BACKUPS=3
+
+# Prometheus text-format metrics file, rewritten every VOICEMODE_METRICS_INTERVAL seconds
+# while the server runs (empty to disable)
+# VOICEMODE_METRICS_FILE=~/.voicemode/logs/metrics.prom
+# VOICEMODE_METRICS_INTERVAL=15
+
+# Serve metrics at http://127.0.0.1:<port>/metrics (0 = no listener)
+# VOICEMODE_METRICS_PORT=0
+
+# Conversation statistics file, so voice_statistics survives restarts (empty = memory only)
+# VOICEMODE_STATISTICS_FILE=~/.voicemode/logs/statistics.jsonl
+
+# Warm up connections, audio devices, chimes and local models in the background
+# at server start, so the first converse call is not slower than later ones
+# VOICEMODE_WARMUP=false
+# VOICEMODE_WARMUP_TIMEOUT=30
+
+# Socket of the `voicemode daemon`; CLI commands use the daemon when it is
+# running unless VOICEMODE_DAEMON=false
+# VOICEMODE_DAEMON_SOCKET=~/.voicemode/daemon.sock
+# VOICEMODE_DAEMON=true
+
+# Serialise microphone/speaker use across every VoiceMode process on this machine,
+# waiting up to VOICEMODE_AUDIO_ARBITER_TIMEOUT seconds (0 = no limit) for a turn
+# VOICEMODE_AUDIO_ARBITER=true
+# VOICEMODE_AUDIO_ARBITER_TIMEOUT=300
+
+# Seconds the notify popup helper process stays alive without popups (0 = until exit)
+# VOICEMODE_NOTIFY_HELPER_IDLE_TIMEOUT=600
+
 #############
 # Pronunciation System
 #############
@@ -323,6 +429,9 @@ def load_voicemode_env():
 # Download progress style: auto, rich, simple (default: auto)
 # VOICEMODE_PROGRESS_STYLE=auto
 
+# Parallel connections per model download; interrupted downloads resume (default: 4)
+# VOICEMODE_DOWNLOAD_SEGMENTS=4
+
 #############
 # API Keys (set these in your environment for security)
 #############
@@ -341,8 +450,10 @@ def load_voicemode_env():
             f.write(default_config)
         os.chmod(default_path, 0o600)  # Secure permissions
         config_files = [default_path]
+        _env_files_cache.clear()
     
     # Load configuration from all files in order (global first, project-specific last)
+    values: Dict[str, str] = {}
     for config_path in config_files:
         if config_path.exists():
             with open(config_path, 'r') as f:
@@ -356,9 +467,22 @@ def load_voicemode_env():
                         key, value = line.split('=', 1)
                         key = key.strip()
                         value = value.strip()
-                        # Only set if not already in environment (env vars take precedence)
-                        if key and key not in os.environ:
-                            os.environ[key] = value
+                        if key:
+                            values.setdefault(key, value)
+    
+    file_env = {}
+    for key, value in values.items():
+        # Only set if not already in environment (env vars take precedence),
+        # unless an earlier load set it from a file
+        if key not in os.environ or _file_env.get(key) == os.environ[key]:
+            os.environ[key] = value
+            file_env[key] = value
+    for key, value in _file_env.items():
+        # Drop values whose line was removed from the files
+        if key not in file_env and os.environ.get(key) == value:
+            del os.environ[key]
+    _file_env = file_env
+    _loaded_env_files = list(config_files)
 
 # Load configuration file before other configuration
 load_voicemode_env()
@@ -477,21 +601,40 @@ def clear_voice_preferences_cache():
 
 def reload_configuration():
     """Reload configuration from files and clear all caches."""
+    global _applied_generation
+    
     # Clear voice preferences cache
     clear_voice_preferences_cache()
     
-    # Reload environment configuration
+    # Reload environment configuration, re-walking for config files
+    _env_files_cache.clear()
+    _applied_generation = _config_generation
     load_voicemode_env()
     
-    # Update global configuration variables
-    global TTS_VOICES, TTS_MODELS, TTS_BASE_URLS, STT_BASE_URLS
-    TTS_BASE_URLS = parse_comma_list("VOICEMODE_TTS_BASE_URLS", "http://127.0.0.1:8880/v1,https://api.openai.com/v1")
-    STT_BASE_URLS = parse_comma_list("VOICEMODE_STT_BASE_URLS", "http://127.0.0.1:2022/v1,https://api.openai.com/v1")
-    TTS_VOICES = parse_comma_list("VOICEMODE_VOICES", "af_sky,alloy")
-    TTS_MODELS = parse_comma_list("VOICEMODE_TTS_MODELS", "tts-1,tts-1-hd,gpt-4o-mini-tts")
+    # Update global configuration lists in place so modules that imported them see the change
+    TTS_BASE_URLS[:] = parse_comma_list("VOICEMODE_TTS_BASE_URLS", "http://127.0.0.1:8880/v1,https://api.openai.com/v1")
+    STT_BASE_URLS[:] = parse_comma_list("VOICEMODE_STT_BASE_URLS", "http://127.0.0.1:2022/v1,https://api.openai.com/v1")
+    TTS_VOICES[:] = parse_comma_list("VOICEMODE_VOICES", "af_sky,alloy")
+    TTS_MODELS[:] = parse_comma_list("VOICEMODE_TTS_MODELS", "tts-1,tts-1-hd,gpt-4o-mini-tts")
     
     logger.info("Configuration reloaded successfully")
 
+def reload_configuration_if_changed() -> bool:
+    """Reload configuration if a voicemode.env file was created, edited or removed.
+    
+    Cheap enough to call before every tool call: with nothing changed it is
+    one inotify read (or a rate-limited stat of the known config files).
+    
+    Returns:
+        True if the configuration was reloaded
+    """
+    files = find_voicemode_env_files()
+    if _config_generation == _applied_generation and files == _loaded_env_files:
+        return False
+    logger.info("Configuration files changed, reloading")
+    reload_configuration()
+    return True
+
 # Legacy variables have been removed - use the new list-based configuration:
 # - VOICEMODE_TTS_BASE_URLS (comma-separated list)
 # - VOICEMODE_STT_BASE_URLS (comma-separated list)
@@ -513,6 +656,8 @@ WHISPER_MODEL = os.getenv("VOICEMODE_WHISPER_MODEL", DEFAULT_WHISPER_MODEL)
 WHISPER_PORT = int(os.getenv("VOICEMODE_WHISPER_PORT", "2022"))
 WHISPER_LANGUAGE = os.getenv("VOICEMODE_WHISPER_LANGUAGE", "auto")
 WHISPER_MODEL_PATH = expand_path(os.getenv("VOICEMODE_WHISPER_MODEL_PATH", str(Path.home() / ".voicemode" / "services" / "whisper" / "models")))
+WHISPER_THREADS = int(os.getenv("VOICEMODE_WHISPER_THREADS", "8"))
+WHISPER_INSTANCES = max(1, int(os.getenv("VOICEMODE_WHISPER_INSTANCES", "1")))
 
 # ==================== KOKORO CONFIGURATION ====================
 
@@ -539,6 +684,12 @@ FRONTEND_PORT = int(os.getenv("VOICEMODE_FRONTEND_PORT", "3000"))
 # Auto-enable services after installation
 SERVICE_AUTO_ENABLE = env_bool("VOICEMODE_SERVICE_AUTO_ENABLE", True)
 
+# Start local Whisper and Kokoro when the server starts
+AUTO_START_SERVICES = env_bool("VOICEMODE_AUTO_START_SERVICES", False)
+
+# Seconds a started service gets to become ready (health plus warm-up inference)
+SERVICE_READY_TIMEOUT = float(os.getenv("VOICEMODE_SERVICE_READY_TIMEOUT", "120"))
+
 # ==================== SOUND FONTS CONFIGURATION ====================
 
 # Sound fonts are disabled by default to avoid annoying users with unexpected sounds
@@ -624,6 +775,39 @@ EVENT_LOG_ENABLED = SAVE_ALL or os.getenv("VOICEMODE_EVENT_LOG_ENABLED", "true")
 EVENT_LOG_DIR = os.getenv("VOICEMODE_EVENT_LOG_DIR", str(LOGS_DIR / "events"))
 EVENT_LOG_ROTATION = os.getenv("VOICEMODE_EVENT_LOG_ROTATION", "daily")  # Currently only daily is supported
 
+# Log archival - compress JSONL logs older than N days (0 disables automatic archival)
+LOG_ARCHIVE_DAYS = int(os.getenv("VOICEMODE_LOG_ARCHIVE_DAYS", "0"))
+LOG_ARCHIVE_CODEC = os.getenv("VOICEMODE_LOG_ARCHIVE_CODEC", "gzip").lower()
+
+# Tracing - per-stage spans for converse turns, exportable to Chrome trace / OTLP
+TRACING_ENABLED = env_bool("VOICEMODE_TRACING", False)
+TRACE_DIR = Path(os.path.expanduser(os.getenv("VOICEMODE_TRACE_DIR", str(LOGS_DIR / "traces"))))
+TRACE_MAX_BYTES = int(float(os.getenv("VOICEMODE_TRACE_MAX_MB", "10")) * 1024 * 1024)
+TRACE_BACKUPS = int(os.getenv("VOICEMODE_TRACE_BACKUPS", "3"))
+
+# Metrics - Prometheus text format, written to a file and optionally served over HTTP
+METRICS_FILE = os.path.expanduser(os.getenv("VOICEMODE_METRICS_FILE", str(LOGS_DIR / "metrics.prom")))
+METRICS_INTERVAL = float(os.getenv("VOICEMODE_METRICS_INTERVAL", "15"))
+METRICS_PORT = int(os.getenv("VOICEMODE_METRICS_PORT", "0"))
+
+# Conversation statistics persisted across server restarts (empty keeps them in memory only)
+STATISTICS_FILE = os.path.expanduser(os.getenv("VOICEMODE_STATISTICS_FILE", str(LOGS_DIR / "statistics.jsonl")))
+
+# Background warm-up at server start (seconds allowed per warm-up step)
+WARMUP_ENABLED = env_bool("VOICEMODE_WARMUP", False)
+WARMUP_TIMEOUT = float(os.getenv("VOICEMODE_WARMUP_TIMEOUT", "30"))
+
+# Persistent daemon - CLI commands forward to it over a Unix socket when it is running
+DAEMON_SOCKET = expand_path(os.getenv("VOICEMODE_DAEMON_SOCKET", str(BASE_DIR / "daemon.sock")))
+DAEMON_ENABLED = env_bool("VOICEMODE_DAEMON", True)
+
+# Cross-process audio arbitration - concurrent sessions queue for the devices
+AUDIO_ARBITER_ENABLED = env_bool("VOICEMODE_AUDIO_ARBITER", True)
+AUDIO_ARBITER_TIMEOUT = float(os.getenv("VOICEMODE_AUDIO_ARBITER_TIMEOUT", "300"))
+
+# Resident notify popup helper - exits after this many seconds without popups
+NOTIFY_HELPER_IDLE_TIMEOUT = float(os.getenv("VOICEMODE_NOTIFY_HELPER_IDLE_TIMEOUT", "600"))
+
 # ==================== GLOBAL STATE ====================
 
 # Service management
@@ -961,8 +1145,10 @@ HTTP_CLIENT_CONFIG = {
 # Initialize directories on module import
 initialize_directories()
 
-# Apply sounddevice workaround on module import
-disable_sounddevice_stderr_redirect()
+# Apply sounddevice workaround when sounddevice is first imported, so that
+# importing config does not initialise PortAudio
+from .utils.lazy import when_imported
+when_imported("sounddevice", lambda _module: disable_sounddevice_stderr_redirect())
 
 # Set up logger
 logger = setup_logging()
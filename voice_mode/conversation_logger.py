@@ -15,12 +15,19 @@ from typing import Dict, Any, Optional
 
 from voice_mode.__version__ import __version__
 from voice_mode.config import BASE_DIR
+from voice_mode.timings import parse_legacy_timing, to_timings_ms
+from voice_mode.utils.log_archive import iter_lines_reverse, resolve_log_file
 
 
 class ConversationLogger:
-    """Handles JSONL-based conversation logging."""
+    """Handles JSONL-based conversation logging.
 
-    SCHEMA_VERSION = 3
+    Schema v4 records stage timings as a numeric ``timings`` object
+    (stage name to milliseconds, see ``voice_mode.timings``) instead of the
+    formatted ``metadata.timing`` string used by v1-v3.
+    """
+
+    SCHEMA_VERSION = 4
     CONVERSATION_GAP_MINUTES = 5
 
     def __init__(self, base_dir: Optional[Path] = None):
@@ -77,24 +84,15 @@ class ConversationLogger:
         return self._read_last_line(yesterday_log)
 
     def _read_last_line(self, file_path: Path) -> Optional[Dict[str, Any]]:
-        """Read the last line from a log file."""
-        if not file_path.exists() or file_path.stat().st_size == 0:
+        """Read the last line from a log file (plain or archived)."""
+        file_path = resolve_log_file(file_path)
+        if file_path is None or file_path.stat().st_size == 0:
             return None
 
         try:
             # Read file backwards to get last line efficiently
-            with open(file_path, 'rb') as f:
-                # Go to end of file
-                f.seek(0, 2)
-                file_size = f.tell()
-
-                # Read backwards until we find a newline
-                buffer_size = min(file_size, 1024)
-                f.seek(max(0, file_size - buffer_size))
-
-                lines = f.read().decode('utf-8').strip().split('\n')
-                if lines:
-                    return json.loads(lines[-1])
+            for line in iter_lines_reverse(file_path, chunk_size=1024):
+                return json.loads(line)
         except Exception:
             return None
 
@@ -116,7 +114,8 @@ class ConversationLogger:
                      text: str,
                      audio_file: Optional[str] = None,
                      duration_ms: Optional[int] = None,
-                     metadata: Optional[Dict[str, Any]] = None) -> None:
+                     metadata: Optional[Dict[str, Any]] = None,
+                     timings: Optional[Dict[str, float]] = None) -> None:
         """Log an utterance to the JSONL file.
 
         Args:
@@ -125,6 +124,7 @@ class ConversationLogger:
             audio_file: Path to the audio file (relative to base_dir)
             duration_ms: Duration of the audio in milliseconds
             metadata: Additional metadata about the utterance
+            timings: Stage timings in milliseconds, keyed by TimingStage value
         """
         # Check if we need to start a new conversation
         self._check_conversation_continuity()
@@ -139,6 +139,7 @@ class ConversationLogger:
             "project_path": self.current_project_path,
             "audio_file": audio_file,
             "duration_ms": duration_ms,
+            "timings": timings or None,
             "metadata": {
                 "voice_mode_version": __version__,
                 **(metadata or {})
@@ -177,7 +178,12 @@ class ConversationLogger:
 
     def log_stt(self, text: str, audio_file: Optional[str] = None,
                 duration_ms: Optional[int] = None, **kwargs) -> None:
-        """Log a speech-to-text utterance."""
+        """Log a speech-to-text utterance.
+
+        Stage timings are passed as ``timings``, a dict of TimingStage value
+        to seconds. A formatted ``timing`` string is still accepted and
+        converted.
+        """
         metadata = {
             "model": kwargs.get("model"),
             "provider": kwargs.get("provider"),
@@ -186,7 +192,6 @@ class ConversationLogger:
             "language": kwargs.get("language"),
             "audio_format": kwargs.get("audio_format"),
             "transport": kwargs.get("transport"),
-            "timing": kwargs.get("timing"),
             "silence_detection": kwargs.get("silence_detection"),
             "error": kwargs.get("error"),
             # Fallback information
@@ -197,11 +202,15 @@ class ConversationLogger:
             "total_turnaround_time": kwargs.get("total_turnaround_time"),
         }
 
-        self.log_utterance("stt", text, audio_file, duration_ms, metadata)
+        self.log_utterance("stt", text, audio_file, duration_ms, metadata,
+                           timings=self._timings_from_kwargs(kwargs))
 
     def log_tts(self, text: str, audio_file: Optional[str] = None,
                 duration_ms: Optional[int] = None, **kwargs) -> None:
-        """Log a text-to-speech utterance."""
+        """Log a text-to-speech utterance.
+
+        Takes ``timings`` (TimingStage value to seconds) like ``log_stt``.
+        """
         metadata = {
             "model": kwargs.get("model"),
             "voice": kwargs.get("voice"),
@@ -212,7 +221,6 @@ class ConversationLogger:
             "is_fallback": kwargs.get("is_fallback"),
             "fallback_reason": kwargs.get("fallback_reason"),
             "audio_format": kwargs.get("audio_format"),
-            "timing": kwargs.get("timing"),
             "transport": kwargs.get("transport"),
             "emotion": kwargs.get("emotion"),
             "error": kwargs.get("error"),
@@ -223,7 +231,16 @@ class ConversationLogger:
             "total_turnaround_time": kwargs.get("total_turnaround_time"),
         }
 
-        self.log_utterance("tts", text, audio_file, duration_ms, metadata)
+        self.log_utterance("tts", text, audio_file, duration_ms, metadata,
+                           timings=self._timings_from_kwargs(kwargs))
+
+    @staticmethod
+    def _timings_from_kwargs(kwargs: Dict[str, Any]) -> Optional[Dict[str, float]]:
+        """Stage milliseconds from ``timings`` (seconds) or a legacy ``timing`` string."""
+        timings = to_timings_ms(kwargs.get("timings"))
+        if timings is None and kwargs.get("timing"):
+            timings = parse_legacy_timing(kwargs["timing"]) or None
+        return timings
 
     def log_notify_exchange(
         self,
@@ -275,17 +292,14 @@ class ConversationLogger:
             return exchanges
 
         try:
-            # Read all lines and filter by current conversation
-            with open(log_file, 'r') as f:
-                lines = f.readlines()
-
-            # Process lines in reverse to get most recent first
-            for line in reversed(lines):
+            # Process lines in reverse to get most recent first, reading
+            # only as much of the file as needed
+            for line in iter_lines_reverse(log_file):
                 if len(exchanges) >= limit * 2:  # *2 because each exchange has 2 parts
                     break
 
                 try:
-                    entry = json.loads(line.strip())
+                    entry = json.loads(line)
 
                     # Only include entries from current conversation
                     if entry.get('conversation_id') != self.conversation_id:
@@ -12,14 +12,17 @@ import tempfile
 import gc
 import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-import numpy as np
-from pydub import AudioSegment
-from openai import AsyncOpenAI
 from .provider_discovery import is_local_provider
-import httpx
+from .utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+AudioSegment = lazy_import("pydub", "AudioSegment")
+AsyncOpenAI = lazy_import("openai", "AsyncOpenAI")
+httpx = lazy_import("httpx")
 
 from .config import SAMPLE_RATE
 from .utils import (
@@ -28,6 +31,7 @@ from .utils import (
     log_tts_first_audio
 )
 from .audio_player import NonBlockingAudioPlayer
+from .utils.tracing import span
 
 logger = logging.getLogger("voicemode")
 
@@ -268,15 +272,16 @@ async def text_to_speech(
             from .streaming import stream_tts_audio
             
             # Pass the client directly
-            success, stream_metrics = await stream_tts_audio(
-                text=text,
-                openai_client=openai_clients[client_key],
-                request_params=request_params,
-                debug=debug,
-                save_audio=save_audio,
-                audio_dir=audio_dir,
-                conversation_id=conversation_id
-            )
+            with span("tts.stream", endpoint=tts_base_url, format=validated_format):
+                success, stream_metrics = await stream_tts_audio(
+                    text=text,
+                    openai_client=openai_clients[client_key],
+                    request_params=request_params,
+                    debug=debug,
+                    save_audio=save_audio,
+                    audio_dir=audio_dir,
+                    conversation_id=conversation_id
+                )
             
             if success:
                 metrics['ttfa'] = stream_metrics.ttfa
@@ -299,11 +304,13 @@ async def text_to_speech(
         
         # Original buffered playback
         # Use context manager to ensure response is properly closed
-        async with openai_clients[client_key].audio.speech.with_streaming_response.create(
-            **request_params
-        ) as response:
-            # Read the entire response content
-            response_content = await response.read()
+        with span("tts.request", endpoint=tts_base_url, format=validated_format) as request_span:
+            async with openai_clients[client_key].audio.speech.with_streaming_response.create(
+                **request_params
+            ) as response:
+                # Read the entire response content
+                response_content = await response.read()
+            request_span.set(bytes=len(response_content))
             
         metrics['generation'] = time.perf_counter() - generation_start
         logger.debug(f"TTS API response received, content length: {len(response_content)} bytes")
@@ -344,37 +351,38 @@ async def text_to_speech(
                 # Load audio file based on format
                 logger.debug(f"Loading {validated_format.upper()} audio...")
                 
-                # Get appropriate loader for format
-                loader = get_audio_loader_for_format(validated_format)
-                if not loader:
-                    logger.error(f"No loader available for format: {validated_format}")
-                    # Fallback to generic loader
-                    audio = AudioSegment.from_file(tmp_file.name, format=validated_format)
-                else:
-                    # Special handling for PCM which needs parameters
-                    if validated_format == "pcm":
-                        # Assume 16-bit PCM at standard rate
-                        audio = loader(
-                            tmp_file.name,
-                            sample_width=2,  # 16-bit
-                            frame_rate=SAMPLE_RATE,
-                            channels=1
-                        )
+                with span("tts.decode", format=validated_format, bytes=len(response_content)):
+                    # Get appropriate loader for format
+                    loader = get_audio_loader_for_format(validated_format)
+                    if not loader:
+                        logger.error(f"No loader available for format: {validated_format}")
+                        # Fallback to generic loader
+                        audio = AudioSegment.from_file(tmp_file.name, format=validated_format)
                     else:
-                        audio = loader(tmp_file.name)
+                        # Special handling for PCM which needs parameters
+                        if validated_format == "pcm":
+                            # Assume 16-bit PCM at standard rate
+                            audio = loader(
+                                tmp_file.name,
+                                sample_width=2,  # 16-bit
+                                frame_rate=SAMPLE_RATE,
+                                channels=1
+                            )
+                        else:
+                            audio = loader(tmp_file.name)
                 
-                logger.debug(f"Audio loaded - Duration: {len(audio)}ms, Channels: {audio.channels}, Frame rate: {audio.frame_rate}")
+                    logger.debug(f"Audio loaded - Duration: {len(audio)}ms, Channels: {audio.channels}, Frame rate: {audio.frame_rate}")
                 
-                # Convert to numpy array
-                logger.debug("Converting to numpy array...")
-                samples = np.array(audio.get_array_of_samples())
-                if audio.channels == 2:
-                    samples = samples.reshape((-1, 2))
-                    logger.debug("Reshaped for stereo")
+                    # Convert to numpy array
+                    logger.debug("Converting to numpy array...")
+                    samples = np.array(audio.get_array_of_samples())
+                    if audio.channels == 2:
+                        samples = samples.reshape((-1, 2))
+                        logger.debug("Reshaped for stereo")
                 
-                # Convert to float32 for sounddevice
-                samples = samples.astype(np.float32) / 32767.0
-                logger.debug(f"Audio converted to float32, shape: {samples.shape}")
+                    # Convert to float32 for sounddevice
+                    samples = samples.astype(np.float32) / 32767.0
+                    logger.debug(f"Audio converted to float32, shape: {samples.shape}")
                 
                 # Check audio devices
                 if debug:
@@ -420,9 +428,10 @@ async def text_to_speech(
                             samples_with_buffer = np.vstack([silence, samples])
 
                         # Use non-blocking audio player for concurrent playback support
-                        player = NonBlockingAudioPlayer()
-                        player.play(samples_with_buffer, audio.frame_rate, blocking=False)
-                        player.wait()
+                        with span("tts.playback", sample_rate=audio.frame_rate, channels=audio.channels):
+                            player = NonBlockingAudioPlayer()
+                            player.play(samples_with_buffer, audio.frame_rate, blocking=False)
+                            player.wait()
                         
                         # Log TTS playback end event
                         if event_logger:
@@ -534,7 +543,7 @@ def generate_chime(
     sample_rate: int = SAMPLE_RATE,
     leading_silence: Optional[float] = None,
     trailing_silence: Optional[float] = None
-) -> np.ndarray:
+) -> "np.ndarray":
     """Generate a chime sound with given frequencies.
     
     Args:
@@ -547,9 +556,6 @@ def generate_chime(
     Returns:
         Numpy array of audio samples
     """
-    samples_per_tone = int(sample_rate * duration)
-    fade_samples = int(sample_rate * 0.01)  # 10ms fade
-    
     # Determine amplitude based on output device
     amplitude = 0.0375  # Default (very quiet)
     try:
@@ -568,6 +574,35 @@ def generate_chime(
     except Exception as e:
         logger.debug(f"Could not detect output device type: {e}, using default amplitude {amplitude}")
     
+    # Import config values if not overridden
+    from .config import CHIME_LEADING_SILENCE, CHIME_TRAILING_SILENCE
+
+    # Use parameter overrides or fall back to config
+    actual_leading_silence = leading_silence if leading_silence is not None else CHIME_LEADING_SILENCE
+    actual_trailing_silence = trailing_silence if trailing_silence is not None else CHIME_TRAILING_SILENCE
+
+    return _render_chime(
+        tuple(frequencies), duration, sample_rate,
+        actual_leading_silence, actual_trailing_silence, amplitude,
+    )
+
+
+@lru_cache(maxsize=32)
+def _render_chime(
+    frequencies: tuple,
+    duration: float,
+    sample_rate: int,
+    leading_silence: float,
+    trailing_silence: float,
+    amplitude: float
+) -> "np.ndarray":
+    """Render chime samples; cached because the same few chimes play every turn.
+
+    The returned array is shared between callers, so it is marked read-only.
+    """
+    samples_per_tone = int(sample_rate * duration)
+    fade_samples = int(sample_rate * 0.01)  # 10ms fade
+
     all_samples = []
     
     for freq in frequencies:
@@ -587,28 +622,22 @@ def generate_chime(
     # Concatenate all tones
     chime = np.concatenate(all_samples)
     
-    # Import config values if not overridden
-    from .config import CHIME_LEADING_SILENCE, CHIME_TRAILING_SILENCE
-
-    # Use parameter overrides or fall back to config
-    actual_leading_silence = leading_silence if leading_silence is not None else CHIME_LEADING_SILENCE
-    actual_trailing_silence = trailing_silence if trailing_silence is not None else CHIME_TRAILING_SILENCE
-    
     # Add leading silence for Bluetooth wake-up time
     # This prevents the beginning of the chime from being cut off
-    silence_samples = int(sample_rate * actual_leading_silence)
+    silence_samples = int(sample_rate * leading_silence)
     silence = np.zeros(silence_samples)
     
     # Add trailing silence to prevent end cutoff
-    trailing_silence_samples = int(sample_rate * actual_trailing_silence)
-    trailing_silence = np.zeros(trailing_silence_samples)
+    trailing_silence_samples = int(sample_rate * trailing_silence)
+    trailing = np.zeros(trailing_silence_samples)
     
     # Combine: leading silence + chime + trailing silence
-    chime_with_buffer = np.concatenate([silence, chime, trailing_silence])
+    chime_with_buffer = np.concatenate([silence, chime, trailing])
     
     # Convert to 16-bit integer
     chime_int16 = (chime_with_buffer * 32767).astype(np.int16)
     
+    chime_int16.flags.writeable = False
     return chime_int16
 
 
@@ -0,0 +1,402 @@
+"""Persistent VoiceMode daemon and its Unix socket client.
+
+Every ``voicemode converse`` run or hook invocation otherwise imports the
+whole package, initialises PortAudio and builds fresh clients. ``voicemode
+daemon start`` keeps one process around that owns the audio devices,
+connection pools, caches and provider registry; CLI commands forward their
+work to it when it is running, so each invocation costs a socket round trip.
+
+Protocol: the client connects, writes one JSON object terminated by a
+newline - ``{"method": "converse", "params": {...}}`` - and reads one JSON
+line back: ``{"ok": true, "result": ...}`` or ``{"ok": false, "error":
+"...", "type": "ValueError"}``. Closing the connection before the reply
+cancels the request (e.g. Ctrl+C during a conversation).
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import socket
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+from .config import DAEMON_SOCKET
+
+logger = logging.getLogger("voicemode")
+
+# Requests are small; conversation replies can carry long transcripts
+MAX_MESSAGE_BYTES = 1024 * 1024
+
+Handler = Callable[..., Awaitable[Any]]
+
+
+class DaemonUnavailable(Exception):
+    """No daemon is listening on the socket."""
+
+
+class DaemonError(Exception):
+    """The daemon ran the request and it failed."""
+
+    def __init__(self, message: str, error_type: str = "Exception"):
+        super().__init__(message)
+        self.error_type = error_type
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    """Serialise a protocol message as one JSON line."""
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def decode_message(line: bytes) -> Dict[str, Any]:
+    """Parse one protocol line.
+
+    Raises:
+        ValueError: If the line is not a JSON object
+    """
+    message = json.loads(line.decode("utf-8"))
+    if not isinstance(message, dict):
+        raise ValueError("Protocol messages must be JSON objects")
+    return message
+
+
+# Settings that only say how to reach the daemon, not how to converse
+_TRANSPORT_SETTINGS = {"VOICEMODE_DAEMON", "VOICEMODE_DAEMON_SOCKET"}
+
+
+def config_fingerprint() -> str:
+    """Hash of the settings that shape a conversation in this process.
+
+    Covers every ``VOICEMODE_*`` (and legacy ``VOICE_MODE_*``), ``OPENAI_*``
+    and ``LIVEKIT_*`` variable after the voicemode.env files for the current
+    directory have been applied, i.e. the shell environment plus the nearest
+    project ``.voicemode.env``. Only the hash crosses the socket.
+    """
+    from . import config  # applies the voicemode.env files to os.environ
+    settings = sorted(
+        (name, value) for name, value in os.environ.items()
+        if name.startswith(("VOICEMODE_", "VOICE_MODE_", "OPENAI_", "LIVEKIT_"))
+        and name not in _TRANSPORT_SETTINGS
+    )
+    return hashlib.sha256(json.dumps(settings).encode("utf-8")).hexdigest()
+
+
+def _unwrap(response: Dict[str, Any]) -> Any:
+    if response.get("ok"):
+        return response.get("result")
+    raise DaemonError(response.get("error", "Unknown daemon error"), response.get("type", "Exception"))
+
+
+# ==================== SERVER ====================
+
+class VoiceModeDaemon:
+    """Unix socket server that runs VoiceMode requests in one resident process.
+
+    Args:
+        socket_path: Path of the Unix socket to listen on
+        handlers: Method name -> coroutine function taking the request params
+            as keyword arguments (default: default_handlers())
+    """
+
+    def __init__(self, socket_path: Union[str, Path] = DAEMON_SOCKET,
+                 handlers: Optional[Dict[str, Handler]] = None):
+        self.socket_path = Path(socket_path)
+        self.handlers: Dict[str, Handler] = dict(handlers) if handlers is not None else default_handlers()
+        self.handlers.setdefault("ping", self._ping)
+        self.handlers.setdefault("shutdown", self._shutdown)
+        self.started_at = time.time()
+        self.requests = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._stopped: Optional[asyncio.Event] = None
+        self._shutdown_requested = False
+
+    async def start(self) -> None:
+        """Bind the socket, replacing a stale one left by a dead daemon.
+
+        Raises:
+            RuntimeError: If another daemon is already listening
+        """
+        if self.socket_path.exists():
+            try:
+                await asyncio.wait_for(acall("ping", socket_path=self.socket_path), timeout=2.0)
+            except (DaemonUnavailable, DaemonError, OSError, ValueError, asyncio.TimeoutError):
+                self.socket_path.unlink()
+            else:
+                raise RuntimeError(f"VoiceMode daemon already running on {self.socket_path}")
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._stopped = asyncio.Event()
+        self._server = await asyncio.start_unix_server(
+            self._handle_connection, path=str(self.socket_path), limit=MAX_MESSAGE_BYTES
+        )
+        # The daemon speaks with the user's microphone; keep it private
+        os.chmod(self.socket_path, 0o600)
+        logger.info(f"VoiceMode daemon listening on {self.socket_path} (PID {os.getpid()})")
+
+    async def serve_forever(self) -> None:
+        """Serve until a shutdown request or stop()."""
+        if self._server is None:
+            await self.start()
+        try:
+            await self._stopped.wait()
+        finally:
+            await self.stop()
+
+    async def stop(self) -> None:
+        """Stop listening and remove the socket."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+        if self._stopped is not None:
+            self._stopped.set()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        request = hangup = None
+        try:
+            line = await reader.readline()
+            if not line:
+                return
+            request = asyncio.ensure_future(self._dispatch(line))
+            # A client that hangs up no longer wants the answer
+            hangup = asyncio.ensure_future(reader.read(1))
+            done, _ = await asyncio.wait({request, hangup}, return_when=asyncio.FIRST_COMPLETED)
+            if request not in done and not hangup.result():
+                logger.info("Daemon client disconnected; cancelling its request")
+                return
+            writer.write(encode_message(await request))
+            await writer.drain()
+            if self._shutdown_requested:
+                # Stop only once the shutdown reply has been sent
+                self._stopped.set()
+        except ConnectionError:
+            pass
+        except ValueError as e:
+            # Request line longer than MAX_MESSAGE_BYTES
+            writer.write(encode_message({"ok": False, "error": str(e), "type": "ValueError"}))
+        finally:
+            for task in (request, hangup):
+                if task is not None and not task.done():
+                    task.cancel()
+            writer.close()
+
+    async def _dispatch(self, line: bytes) -> Dict[str, Any]:
+        self.requests += 1
+        try:
+            request = decode_message(line)
+            method = request.get("method")
+            handler = self.handlers.get(method)
+            if handler is None:
+                raise ValueError(f"Unknown method: {method}")
+            params = request.get("params") or {}
+            if not isinstance(params, dict):
+                raise ValueError("params must be a JSON object")
+            return {"ok": True, "result": await handler(**params)}
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"Daemon request failed: {type(e).__name__}: {e}")
+            return {"ok": False, "error": str(e), "type": type(e).__name__}
+
+    async def _ping(self) -> Dict[str, Any]:
+        from .config import reload_configuration_if_changed
+        from .version import __version__
+        # Pick up edits to the daemon's own voicemode.env before comparing
+        reload_configuration_if_changed()
+        return {
+            "pid": os.getpid(),
+            "version": __version__,
+            "uptime": round(time.time() - self.started_at, 1),
+            "requests": self.requests,
+            "socket": str(self.socket_path),
+            "config": config_fingerprint(),
+        }
+
+    async def _shutdown(self) -> bool:
+        self._shutdown_requested = True
+        return True
+
+
+def default_handlers() -> Dict[str, Handler]:
+    """Methods served by ``voicemode daemon``: converse, play_sound and hook_sound."""
+    turn_lock = asyncio.Lock()
+
+    async def converse(**params) -> str:
+        from .tools.converse import converse as converse_tool
+        # The daemon owns the audio devices: one conversation turn at a time
+        async with turn_lock:
+            return await converse_tool.fn(**params)
+
+    async def play_sound(path: str) -> bool:
+        from .soundfont_player import get_soundfont_player
+        from .tools.sound_fonts.audio_player import Player
+        # Mixed from decoded clips; ffplay if there is no usable output stream
+        if await asyncio.to_thread(get_soundfont_player().play, path):
+            return True
+        return Player().play(path)
+
+    async def hook_sound(event: str, tool: str, subagent: Optional[str] = None) -> Optional[str]:
+        from .soundfont_player import get_soundfont_player
+        from .tools.sound_fonts.audio_player import Player
+        player = get_soundfont_player()
+        path = await asyncio.to_thread(player.index.find, event, tool, subagent)
+        if path is None:
+            return None
+        if not await asyncio.to_thread(player.play, path) and not Player().play(str(path)):
+            return None
+        return str(path)
+
+    return {"converse": converse, "play_sound": play_sound, "hook_sound": hook_sound}
+
+
+async def _prepare() -> None:
+    """Load the converse stack and start warming it up in the background."""
+    from .config import EVENT_LOG_DIR, EVENT_LOG_ENABLED, SOUNDFONTS_ENABLED
+    from .tools.converse import startup_initialization
+    from .utils import initialize_event_logger
+    from .warmup import start_warmup
+
+    if EVENT_LOG_ENABLED:
+        initialize_event_logger(log_dir=Path(EVENT_LOG_DIR), enabled=True)
+    await startup_initialization()
+    # Being warm is the point of the daemon, so it always warms up
+    start_warmup()
+    if SOUNDFONTS_ENABLED:
+        from .soundfont_player import get_soundfont_player
+        # Decode the sound font so the first hook event plays without delay
+        asyncio.get_running_loop().run_in_executor(None, _preload_soundfont, get_soundfont_player())
+
+
+def _preload_soundfont(player) -> None:
+    try:
+        count = player.preload()
+        logger.info(f"Sound font ready: {count} clips decoded")
+    except Exception as e:
+        logger.warning(f"Sound font preload failed: {e}")
+
+
+def run_daemon(socket_path: Union[str, Path] = DAEMON_SOCKET) -> None:
+    """Run the daemon in the foreground until it is asked to shut down."""
+    from .config import setup_logging
+
+    setup_logging()
+
+    async def main():
+        daemon = VoiceModeDaemon(socket_path)
+        await daemon.start()
+        try:
+            await _prepare()
+            await daemon.serve_forever()
+        finally:
+            from .soundfont_player import close_soundfont_player
+            from .warmup import cancel_warmup
+            cancel_warmup()
+            close_soundfont_player()
+            await daemon.stop()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+    logger.info("VoiceMode daemon stopped")
+
+
+# ==================== CLIENT ====================
+
+def call(method: str, params: Optional[Dict[str, Any]] = None,
+         socket_path: Union[str, Path] = DAEMON_SOCKET, timeout: Optional[float] = None) -> Any:
+    """Send one request to the daemon and wait for the result (blocking).
+
+    Args:
+        method: Method name, e.g. ``"ping"`` or ``"play_sound"``
+        params: Keyword arguments for the method
+        socket_path: Daemon socket
+        timeout: Seconds to wait for the reply (None waits indefinitely)
+
+    Returns:
+        The method's result
+
+    Raises:
+        DaemonUnavailable: If no daemon is listening
+        DaemonError: If the request failed in the daemon
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(socket_path))
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise DaemonUnavailable(str(e)) from e
+        sock.sendall(encode_message({"method": method, "params": params or {}}))
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if chunk.endswith(b"\n"):
+                break
+    finally:
+        sock.close()
+    if not chunks:
+        raise DaemonUnavailable("Daemon closed the connection without replying")
+    return _unwrap(decode_message(b"".join(chunks)))
+
+
+async def acall(method: str, params: Optional[Dict[str, Any]] = None,
+                socket_path: Union[str, Path] = DAEMON_SOCKET) -> Any:
+    """Async version of call(); cancelling it cancels the request in the daemon."""
+    try:
+        reader, writer = await asyncio.open_unix_connection(str(socket_path), limit=MAX_MESSAGE_BYTES)
+    except (FileNotFoundError, ConnectionRefusedError) as e:
+        raise DaemonUnavailable(str(e)) from e
+    try:
+        writer.write(encode_message({"method": method, "params": params or {}}))
+        await writer.drain()
+        line = await reader.readline()
+    finally:
+        writer.close()
+    if not line:
+        raise DaemonUnavailable("Daemon closed the connection without replying")
+    return _unwrap(decode_message(line))
+
+
+def is_running(socket_path: Union[str, Path] = DAEMON_SOCKET, timeout: float = 2.0) -> bool:
+    """Check whether a daemon answers on the socket."""
+    if not Path(socket_path).exists():
+        return False
+    try:
+        call("ping", socket_path=socket_path, timeout=timeout)
+        return True
+    except (DaemonUnavailable, DaemonError, OSError, ValueError):
+        return False
+
+
+def daemon_converse(socket_path: Union[str, Path] = DAEMON_SOCKET) -> Optional[Handler]:
+    """Return a drop-in for ``converse.fn`` that runs in the daemon, if one is running.
+
+    The daemon uses the configuration it started with. When the caller's
+    settings differ - a project ``.voicemode.env`` or variables exported in
+    its shell - None is returned so the conversation runs in-process with
+    the caller's configuration.
+    """
+    if not Path(socket_path).exists():
+        return None
+    try:
+        info = call("ping", socket_path=socket_path, timeout=2.0)
+    except (DaemonUnavailable, DaemonError, OSError, ValueError):
+        return None
+    if info.get("config") != config_fingerprint():
+        logger.info("VoiceMode daemon runs with different settings; conversing in-process")
+        return None
+
+    async def converse(**params) -> str:
+        return await acall("converse", params, socket_path)
+
+    return converse
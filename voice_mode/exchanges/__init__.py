@@ -10,7 +10,8 @@ from voice_mode.exchanges.reader import ExchangeReader
 from voice_mode.exchanges.formatters import ExchangeFormatter
 from voice_mode.exchanges.filters import ExchangeFilter
 from voice_mode.exchanges.conversations import ConversationGrouper
-from voice_mode.exchanges.stats import ExchangeStats
+from voice_mode.exchanges.stats import ExchangeStats, ExchangeColumns
+from voice_mode.exchanges.index import ExchangeIndex, SearchHit
 
 __all__ = [
     'Exchange',
@@ -21,4 +22,7 @@ __all__ = [
     'ExchangeFilter',
     'ConversationGrouper',
     'ExchangeStats',
+    'ExchangeColumns',
+    'ExchangeIndex',
+    'SearchHit',
 ]
\ No newline at end of file
@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import Optional, List
 
 from voice_mode.exchanges.models import Exchange, Conversation
+from voice_mode.exchanges.highlight import HIGHLIGHT_START, HIGHLIGHT_END
 
 
 class ExchangeFormatter:
@@ -27,7 +28,26 @@ class ExchangeFormatter:
     }
     
     @classmethod
-    def simple(cls, exchange: Exchange, color: bool = True, show_timing: bool = True) -> str:
+    def highlight(cls, snippet: str, color: bool = True) -> str:
+        """Render search snippet highlight markers.
+        
+        Args:
+            snippet: Snippet text with HIGHLIGHT_START/HIGHLIGHT_END markers
+            color: Whether to highlight with color codes (otherwise **bold**)
+            
+        Returns:
+            Snippet with markers replaced
+        """
+        if color:
+            start = cls.COLORS['bold'] + cls.COLORS['yellow']
+            end = cls.COLORS['reset']
+        else:
+            start = end = '**'
+        return snippet.replace(HIGHLIGHT_START, start).replace(HIGHLIGHT_END, end)
+    
+    @classmethod
+    def simple(cls, exchange: Exchange, color: bool = True, show_timing: bool = True,
+               snippet: Optional[str] = None) -> str:
         """One-line format with optional color.
         
         Format: [HH:MM:SS] 🎤/🔊 TYPE [transport] Text [timing]
@@ -36,6 +56,7 @@ class ExchangeFormatter:
             exchange: Exchange to format
             color: Whether to include color codes
             show_timing: Whether to show timing info
+            snippet: Highlighted search snippet to show instead of the text
             
         Returns:
             Formatted string
@@ -58,8 +79,8 @@ class ExchangeFormatter:
         
         # Format timing if available
         timing_str = ""
-        if show_timing and exchange.metadata and exchange.metadata.timing:
-            timing_str = f" [{exchange.metadata.timing}]"
+        if show_timing and exchange.timing_summary:
+            timing_str = f" [{exchange.timing_summary}]"
         
         # Build the output
         parts = []
@@ -84,9 +105,12 @@ class ExchangeFormatter:
             parts.append(f"[{transport}]")
         
         # Text (truncated if too long)
-        text = exchange.text
-        if len(text) > 80:
-            text = text[:77] + "..."
+        if snippet is not None:
+            text = cls.highlight(snippet, color=color)
+        else:
+            text = exchange.text
+            if len(text) > 80:
+                text = text[:77] + "..."
         parts.append(text)
         
         # Timing
@@ -162,8 +186,8 @@ class ExchangeFormatter:
                 lines.append(f"│ {provider_str:<76} │")
             
             # Timing
-            if exchange.metadata.timing:
-                lines.append(f"│ Timing: {exchange.metadata.timing:<68} │")
+            if exchange.timing_summary:
+                lines.append(f"│ Timing: {exchange.timing_summary:<68} │")
             
             # Audio format
             if exchange.metadata.audio_format:
@@ -254,7 +278,7 @@ class ExchangeFormatter:
         provider = exchange.metadata.provider if exchange.metadata else ""
         model = exchange.metadata.model if exchange.metadata else ""
         voice = exchange.metadata.voice if exchange.metadata else ""
-        timing = exchange.metadata.timing if exchange.metadata else ""
+        timing = exchange.timing_summary
         
         return f"{exchange.timestamp.isoformat()},{exchange.conversation_id},{exchange.type},{text},{transport},{provider},{model},{voice},{timing}"
     
@@ -0,0 +1,10 @@
+"""
+Markers wrapped around matched terms in search snippets.
+
+Kept apart from the SQLite index so formatters can use them without
+importing it. Control characters never occur in transcribed text, so
+formatters can safely replace them.
+"""
+
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_END = "\x03"
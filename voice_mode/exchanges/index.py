@@ -0,0 +1,466 @@
+"""
+SQLite FTS5 full-text index over exchange logs.
+
+The index lives next to the JSONL logs and is updated incrementally: each
+log file's indexed byte offset is remembered, so an update only reads the
+lines appended since the last run. The raw JSONL line is stored alongside
+the searchable text so results can be rebuilt into Exchange objects without
+touching the log files again.
+"""
+
+import logging
+import re
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from voice_mode.exchanges.highlight import HIGHLIGHT_START, HIGHLIGHT_END
+from voice_mode.exchanges.models import Exchange, Conversation
+from voice_mode.config import BASE_DIR
+from voice_mode.utils.log_archive import codec_for_path, list_log_files, logical_name, open_log
+
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    offset INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS exchanges (
+    id INTEGER PRIMARY KEY,
+    file TEXT NOT NULL,
+    ts REAL NOT NULL,
+    conversation_id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    text TEXT NOT NULL,
+    line TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_exchanges_ts ON exchanges(ts);
+CREATE INDEX IF NOT EXISTS idx_exchanges_conversation ON exchanges(conversation_id, ts);
+CREATE INDEX IF NOT EXISTS idx_exchanges_file ON exchanges(file);
+CREATE VIRTUAL TABLE IF NOT EXISTS exchanges_fts USING fts5(
+    text,
+    content='exchanges',
+    content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+"""
+
+# Words (optionally ending in * for prefix search) extracted from queries
+_TOKEN_RE = re.compile(r'[^\W_]+\*?', re.UNICODE)
+
+
+@dataclass
+class SearchHit:
+    """A single search result."""
+    exchange: Exchange
+    rank: float
+    snippet: str
+
+
+def build_match_query(query: str, prefix: bool = False) -> Optional[str]:
+    """Turn free text into a safe FTS5 MATCH expression.
+
+    Every word becomes a quoted term so punctuation in the query can't be
+    interpreted as FTS5 syntax. A trailing ``*`` on a word (or ``prefix=True``
+    for all words) turns it into a prefix query.
+
+    Args:
+        query: User supplied search text
+        prefix: Treat every word as a prefix
+
+    Returns:
+        MATCH expression, or None if the query contains no searchable words
+    """
+    terms = []
+    for token in _TOKEN_RE.findall(query):
+        is_prefix = prefix or token.endswith('*')
+        word = token.rstrip('*')
+        if not word:
+            continue
+        terms.append(f'"{word}"*' if is_prefix else f'"{word}"')
+
+    return " ".join(terms) if terms else None
+
+
+def _skip_to(f, offset: int) -> None:
+    """Position a log stream at an uncompressed byte offset.
+
+    zstd streams only read forward, so the bytes before the offset are
+    decompressed and discarded.
+    """
+    if f.seekable():
+        f.seek(offset)
+        return
+    remaining = offset
+    while remaining > 0:
+        chunk = f.read(min(remaining, 1 << 20))
+        if not chunk:
+            break
+        remaining -= len(chunk)
+
+
+class ExchangeIndex:
+    """Incrementally maintained full-text index of exchange logs."""
+
+    INDEX_FILENAME = "exchanges_index.sqlite"
+
+    def __init__(self, base_dir: Optional[Path] = None, db_path: Optional[Path] = None):
+        """Initialize the index.
+
+        Args:
+            base_dir: Base directory for logs. Defaults to ~/.voicemode
+            db_path: Location of the index database. Defaults to the
+                conversations log directory.
+        """
+        self.base_dir = Path(base_dir) if base_dir else Path(BASE_DIR)
+        self.logs_dir = self.base_dir / "logs" / "conversations"
+        self.logs_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = Path(db_path) if db_path else self.logs_dir / self.INDEX_FILENAME
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def is_available() -> bool:
+        """Check whether the local SQLite build supports FTS5."""
+        try:
+            conn = sqlite3.connect(":memory:")
+            try:
+                conn.execute("CREATE VIRTUAL TABLE t USING fts5(x)")
+            finally:
+                conn.close()
+            return True
+        except sqlite3.Error:
+            return False
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Lazily opened database connection."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.db_path))
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> 'ExchangeIndex':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ---------------------------------------------------------------- updates
+
+    def _log_files(self) -> List[Path]:
+        """All exchange log files, plain or archived, oldest first."""
+        return list_log_files(self.logs_dir, "exchanges_*.jsonl")
+
+    def update(self) -> int:
+        """Index lines appended to the logs since the last update.
+
+        Files are tracked by their uncompressed name, so archiving a log
+        doesn't re-index it. Plain files that shrank are re-indexed from
+        scratch, and files that disappeared are dropped from the index.
+
+        Returns:
+            Number of newly indexed exchanges
+        """
+        conn = self.conn
+        known = {
+            row[0]: (row[1], row[2], row[3])
+            for row in conn.execute("SELECT path, size, mtime, offset FROM files")
+        }
+
+        added = 0
+        seen = set()
+        with conn:
+            for log_file in self._log_files():
+                key = logical_name(log_file)
+                seen.add(key)
+                try:
+                    stat = log_file.stat()
+                except OSError:
+                    continue
+
+                size, mtime, offset = known.get(key, (0, 0.0, 0))
+                if key in known and stat.st_size == size and stat.st_mtime == mtime:
+                    continue
+
+                if codec_for_path(log_file) is None and stat.st_size < offset:
+                    # File was truncated or rewritten; start over
+                    self._drop_file(key)
+                    offset = 0
+
+                count, offset = self._index_file(log_file, key, offset)
+                added += count
+                conn.execute(
+                    "INSERT OR REPLACE INTO files (path, size, mtime, offset) VALUES (?, ?, ?, ?)",
+                    (key, stat.st_size, stat.st_mtime, offset)
+                )
+
+            for key in set(known) - seen:
+                self._drop_file(key)
+                conn.execute("DELETE FROM files WHERE path = ?", (key,))
+
+        if added:
+            logger.debug(f"Indexed {added} new exchanges")
+        return added
+
+    def rebuild(self) -> int:
+        """Drop the index contents and index all logs again.
+
+        Returns:
+            Number of indexed exchanges
+        """
+        conn = self.conn
+        with conn:
+            conn.execute("DELETE FROM files")
+            conn.execute("DELETE FROM exchanges")
+            conn.execute("INSERT INTO exchanges_fts(exchanges_fts) VALUES ('delete-all')")
+        added = self.update()
+        with conn:
+            conn.execute("INSERT INTO exchanges_fts(exchanges_fts) VALUES ('optimize')")
+        return added
+
+    def _drop_file(self, key: str) -> None:
+        """Remove every indexed exchange that came from a log file."""
+        conn = self.conn
+        conn.execute(
+            "INSERT INTO exchanges_fts(exchanges_fts, rowid, text) "
+            "SELECT 'delete', id, text FROM exchanges WHERE file = ?",
+            (key,)
+        )
+        conn.execute("DELETE FROM exchanges WHERE file = ?", (key,))
+
+    def _index_file(self, log_file: Path, key: str, offset: int) -> Tuple[int, int]:
+        """Index complete lines of a log file starting at a byte offset.
+
+        A trailing line without a newline is left for the next update, since
+        the logger may still be writing it.
+
+        Returns:
+            Tuple of (exchanges indexed, new offset)
+        """
+        conn = self.conn
+        count = 0
+        try:
+            with open_log(log_file, 'rb') as f:
+                # Offsets are in uncompressed bytes
+                _skip_to(f, offset)
+                for raw in f:
+                    if not raw.endswith(b'\n'):
+                        break
+                    offset += len(raw)
+                    line = raw.decode('utf-8', errors='replace').strip()
+                    if not line:
+                        continue
+                    try:
+                        exchange = Exchange.from_jsonl(line)
+                    except Exception as e:
+                        logger.debug(f"Skipping unparseable line in {log_file}: {e}")
+                        continue
+
+                    cursor = conn.execute(
+                        "INSERT INTO exchanges (file, ts, conversation_id, type, text, line) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, exchange.timestamp.timestamp(), exchange.conversation_id,
+                         exchange.type, exchange.text, line)
+                    )
+                    conn.execute(
+                        "INSERT INTO exchanges_fts(rowid, text) VALUES (?, ?)",
+                        (cursor.lastrowid, exchange.text)
+                    )
+                    count += 1
+        except (OSError, EOFError, RuntimeError) as e:
+            logger.error(f"Error reading file {log_file}: {e}")
+
+        return count, offset
+
+    # ---------------------------------------------------------------- queries
+
+    @staticmethod
+    def _scope(days: Optional[int], exchange_type: Optional[str]) -> Tuple[List[str], list]:
+        """Build WHERE clauses restricting results by age and type."""
+        clauses = []
+        params: list = []
+        if days:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+            clauses.append("e.ts >= ?")
+            params.append(cutoff.timestamp())
+        if exchange_type and exchange_type != 'all':
+            clauses.append("e.type = ?")
+            params.append(exchange_type)
+        return clauses, params
+
+    def search(self,
+               query: str,
+               days: Optional[int] = None,
+               exchange_type: Optional[str] = None,
+               limit: Optional[int] = 50,
+               regex: bool = False,
+               ignore_case: bool = True,
+               prefix: bool = False,
+               order: str = 'rank') -> List[SearchHit]:
+        """Search indexed exchanges.
+
+        In regex mode the pattern is applied as a post-filter on candidates
+        read from the index, so only matching rows are decoded into
+        Exchange objects.
+
+        Args:
+            query: Search words, or a regular expression when regex is True
+            days: Only search the last N days (None for all history)
+            exchange_type: "stt", "tts", or None/"all"
+            limit: Maximum number of hits (None for no limit)
+            regex: Treat the query as a regular expression
+            ignore_case: Case insensitive regex matching
+            prefix: Treat every word as a prefix
+            order: "rank" for best matches first, "time" for chronological
+
+        Returns:
+            List of search hits
+        """
+        self.update()
+
+        clauses, params = self._scope(days, exchange_type)
+
+        if regex:
+            compiled = re.compile(query, re.IGNORECASE if ignore_case else 0)
+            where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+            sql = f"SELECT e.text, e.line FROM exchanges e {where} ORDER BY e.ts"
+            hits = []
+            for text, line in self.conn.execute(sql, params):
+                match = compiled.search(text)
+                if not match:
+                    continue
+                snippet = (text[:match.start()] + HIGHLIGHT_START + match.group(0)
+                           + HIGHLIGHT_END + text[match.end():])
+                hits.append(SearchHit(Exchange.from_jsonl(line), 0.0, snippet))
+                if order != 'rank' and limit and len(hits) >= limit:
+                    break
+            return hits[:limit] if limit else hits
+
+        match_query = build_match_query(query, prefix=prefix)
+        if match_query is None:
+            return []
+
+        clauses.insert(0, "exchanges_fts MATCH ?")
+        params.insert(0, match_query)
+        order_by = "rank" if order == 'rank' else "e.ts"
+        sql = (
+            "SELECT e.line, bm25(exchanges_fts) AS rank, "
+            f"snippet(exchanges_fts, 0, '{HIGHLIGHT_START}', '{HIGHLIGHT_END}', '…', 16) "
+            "FROM exchanges_fts JOIN exchanges e ON e.id = exchanges_fts.rowid "
+            f"WHERE {' AND '.join(clauses)} ORDER BY {order_by}"
+        )
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        return [
+            SearchHit(Exchange.from_jsonl(line), rank, snippet)
+            for line, rank, snippet in self.conn.execute(sql, params)
+        ]
+
+    def count(self,
+              query: str,
+              days: Optional[int] = None,
+              exchange_type: Optional[str] = None,
+              prefix: bool = False,
+              refresh: bool = True) -> int:
+        """Count exchanges matching a full-text query.
+
+        Args:
+            query: Search words
+            days: Only count the last N days (None for all history)
+            exchange_type: "stt", "tts", or None/"all"
+            prefix: Treat every word as a prefix
+            refresh: Update the index first; pass False when a search for
+                the same query has just done so
+
+        Returns:
+            Number of matching exchanges
+        """
+        match_query = build_match_query(query, prefix=prefix)
+        if match_query is None:
+            return 0
+
+        if refresh:
+            self.update()
+        clauses, params = self._scope(days, exchange_type)
+        clauses.insert(0, "exchanges_fts MATCH ?")
+        params.insert(0, match_query)
+        sql = (
+            "SELECT COUNT(*) FROM exchanges_fts JOIN exchanges e ON e.id = exchanges_fts.rowid "
+            f"WHERE {' AND '.join(clauses)}"
+        )
+        return self.conn.execute(sql, params).fetchone()[0]
+
+    def conversations_for_hits(self, hits: List[SearchHit],
+                               limit: Optional[int] = None) -> List[Conversation]:
+        """Load the full conversations containing search hits.
+
+        Conversations are returned in the order of their best hit, and their
+        exchanges are read from the index rather than the log files.
+
+        Args:
+            hits: Search hits, best first
+            limit: Maximum number of conversations
+
+        Returns:
+            List of conversations
+        """
+        conversation_ids: List[str] = []
+        for hit in hits:
+            if hit.exchange.conversation_id not in conversation_ids:
+                conversation_ids.append(hit.exchange.conversation_id)
+                if limit and len(conversation_ids) >= limit:
+                    break
+
+        return [
+            conversation for conversation in
+            (self.get_conversation(conv_id) for conv_id in conversation_ids)
+            if conversation is not None
+        ]
+
+    def get_conversation(self, conversation_id: str) -> Optional[Conversation]:
+        """Build a conversation from the indexed exchanges."""
+        exchanges = [
+            Exchange.from_jsonl(line) for (line,) in self.conn.execute(
+                "SELECT line FROM exchanges WHERE conversation_id = ? ORDER BY ts",
+                (conversation_id,)
+            )
+        ]
+        if not exchanges:
+            return None
+
+        project_path = next((e.project_path for e in exchanges if e.project_path), None)
+        return Conversation(
+            id=conversation_id,
+            start_time=exchanges[0].timestamp,
+            end_time=exchanges[-1].timestamp,
+            project_path=project_path,
+            exchanges=exchanges
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """Basic index statistics."""
+        self.update()
+        conn = self.conn
+        return {
+            'files': conn.execute("SELECT COUNT(*) FROM files").fetchone()[0],
+            'exchanges': conn.execute("SELECT COUNT(*) FROM exchanges").fetchone()[0],
+            'conversations': conn.execute(
+                "SELECT COUNT(DISTINCT conversation_id) FROM exchanges"
+            ).fetchone()[0],
+        }
@@ -7,8 +7,52 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Optional, Literal, Dict, Any, List
 
+from voice_mode.timings import STT_STAGES, TTS_STAGES, format_timings, parse_legacy_timing
 
-@dataclass
+try:
+    import orjson
+    _json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
+
+def parse_timestamp(timestamp_str: str) -> datetime:
+    """Parse an ISO 8601 timestamp as written to the exchange logs."""
+    # Handle both formats: with Z suffix and with timezone offset
+    if timestamp_str[-1:] == 'Z':
+        timestamp_str = timestamp_str[:-1] + '+00:00'
+    return datetime.fromisoformat(timestamp_str)
+
+
+def line_may_match(line: str,
+                   exchange_type: Optional[str] = None,
+                   conversation_id: Optional[str] = None) -> bool:
+    """Cheaply reject a JSONL line before decoding it.
+
+    Looks for the raw ``"key": "value"`` text of top-level fields. Quotes
+    inside string values are escaped in JSON, so a missing match means the
+    line cannot match; a hit still needs the full parse to confirm.
+
+    Args:
+        line: Raw JSONL line
+        exchange_type: Required type ("stt" or "tts"), None for any
+        conversation_id: Required conversation ID, None for any
+
+    Returns:
+        False if the line definitely does not match
+    """
+    if exchange_type is not None:
+        if (f'"type": "{exchange_type}"' not in line
+                and f'"type":"{exchange_type}"' not in line):
+            return False
+    if conversation_id is not None and f'"{conversation_id}"' not in line:
+        return False
+    return True
+
+
+@dataclass(slots=True)
 class ExchangeMetadata:
     """Metadata for an exchange."""
     voice_mode_version: str
@@ -34,56 +78,138 @@ class ExchangeMetadata:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ExchangeMetadata':
         """Create from dictionary."""
-        return cls(**{k: v for k, v in data.items() if k in cls.__annotations__})
+        known = {k: v for k, v in data.items() if k in cls.__annotations__}
+        # Metadata is built lazily, long after the line was read, so a
+        # malformed entry must not raise here
+        known.setdefault('voice_mode_version', 'unknown')
+        return cls(**known)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary, excluding None values."""
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        result = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is not None:
+                result[name] = value
+        return result
 
 
-@dataclass
+@dataclass(slots=True, init=False, eq=False)
 class Exchange:
-    """Single exchange (STT or TTS) entry."""
+    """Single exchange (STT or TTS) entry.
+    
+    Exchanges parsed from JSONL keep their metadata as the raw dict until
+    ``metadata`` is first accessed, so filtering and counting don't pay for
+    building an ExchangeMetadata per line.
+    
+    ``timings`` maps stage names to milliseconds (schema v4). For older
+    entries it is derived from the ``metadata.timing`` string.
+    """
     version: int
     timestamp: datetime
     conversation_id: str
     type: Literal["stt", "tts"]
     text: str
-    project_path: Optional[str] = None
-    audio_file: Optional[str] = None
-    duration_ms: Optional[int] = None
-    metadata: Optional[ExchangeMetadata] = None
+    project_path: Optional[str]
+    audio_file: Optional[str]
+    duration_ms: Optional[int]
+    _metadata: Optional[ExchangeMetadata] = field(repr=False)
+    _raw_metadata: Optional[Dict[str, Any]] = field(repr=False)
+    _timings: Optional[Dict[str, float]] = field(repr=False)
     
-    @classmethod
-    def from_jsonl(cls, line: str) -> 'Exchange':
-        """Parse from JSONL line."""
-        data = json.loads(line)
-        
-        # Parse timestamp
-        timestamp_str = data['timestamp']
-        # Handle both formats: with Z suffix and with timezone offset
-        if timestamp_str.endswith('Z'):
-            timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+    def __init__(self,
+                 version: int,
+                 timestamp: datetime,
+                 conversation_id: str,
+                 type: Literal["stt", "tts"],
+                 text: str,
+                 project_path: Optional[str] = None,
+                 audio_file: Optional[str] = None,
+                 duration_ms: Optional[int] = None,
+                 metadata: Optional[ExchangeMetadata] = None,
+                 raw_metadata: Optional[Dict[str, Any]] = None,
+                 timings: Optional[Dict[str, float]] = None):
+        self.version = version
+        self.timestamp = timestamp
+        self.conversation_id = conversation_id
+        self.type = type
+        self.text = text
+        self.project_path = project_path
+        self.audio_file = audio_file
+        self.duration_ms = duration_ms
+        self._metadata = metadata
+        # Only consulted while _metadata is unset
+        self._raw_metadata = raw_metadata or None
+        self._timings = timings or None
+    
+    @property
+    def metadata(self) -> Optional[ExchangeMetadata]:
+        """Exchange metadata, built from the raw log dict on first access."""
+        if self._metadata is None and self._raw_metadata is not None:
+            self._metadata = ExchangeMetadata.from_dict(self._raw_metadata)
+            self._raw_metadata = None
+        return self._metadata
+    
+    @metadata.setter
+    def metadata(self, value: Optional[ExchangeMetadata]) -> None:
+        self._metadata = value
+        self._raw_metadata = None
+    
+    def metadata_get(self, name: str, default: Any = None) -> Any:
+        """Read one metadata field without materializing the metadata.
+
+        Args:
+            name: ExchangeMetadata field name
+            default: Value returned when the field is missing or None
+        """
+        if self._metadata is not None:
+            value = getattr(self._metadata, name, None)
+        elif self._raw_metadata is not None:
+            value = self._raw_metadata.get(name)
         else:
-            timestamp = datetime.fromisoformat(timestamp_str)
-        
-        # Parse metadata
-        metadata = None
-        if 'metadata' in data and data['metadata']:
-            metadata = ExchangeMetadata.from_dict(data['metadata'])
-        
+            value = None
+        return default if value is None else value
+
+    @property
+    def timings(self) -> Dict[str, float]:
+        """Stage timings in milliseconds, parsed from the legacy string for v1-v3 logs."""
+        if self._timings is not None:
+            return self._timings
+        return parse_legacy_timing(self.metadata_get('timing'))
+    
+    @property
+    def timing_summary(self) -> str:
+        """Human-readable timing, e.g. "ttfa 0.5s, gen 1.2s, play 2.1s"."""
+        if self._timings is None:
+            return self.metadata_get('timing', '')
+        return format_timings(self._timings, TTS_STAGES if self.is_tts else STT_STAGES)
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Exchange):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Exchange':
+        """Create from a decoded JSONL entry."""
         return cls(
             version=data.get('version', 1),  # Default to v1 for backward compatibility
-            timestamp=timestamp,
+            timestamp=parse_timestamp(data['timestamp']),
             conversation_id=data['conversation_id'],
             type=data['type'],
             text=data['text'],
             project_path=data.get('project_path'),
             audio_file=data.get('audio_file'),
             duration_ms=data.get('duration_ms'),
-            metadata=metadata
+            raw_metadata=data.get('metadata'),
+            timings=data.get('timings'),
         )
     
+    @classmethod
+    def from_jsonl(cls, line: str) -> 'Exchange':
+        """Parse from JSONL line."""
+        return cls.from_dict(_json_loads(line))
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         result = {
@@ -101,6 +227,8 @@ class Exchange:
             result['audio_file'] = self.audio_file
         if self.duration_ms is not None:
             result['duration_ms'] = self.duration_ms
+        if self._timings:
+            result['timings'] = self._timings
         if self.metadata:
             result['metadata'] = self.metadata.to_dict()
         
@@ -142,7 +270,7 @@ class Exchange:
         return " | ".join(parts) if parts else "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class Conversation:
     """A complete conversation with multiple exchanges."""
     id: str
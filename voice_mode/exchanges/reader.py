@@ -10,8 +10,14 @@ from pathlib import Path
 from typing import Iterator, List, Optional, Union, Dict
 import subprocess
 
-from voice_mode.exchanges.models import Exchange
+from voice_mode.exchanges.models import Exchange, line_may_match
 from voice_mode.config import BASE_DIR
+from voice_mode.utils.log_archive import (
+    iter_lines,
+    iter_lines_reverse,
+    list_log_files,
+    resolve_log_file,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -40,29 +46,37 @@ class ExchangeReader:
         filename = f"exchanges_{date.strftime('%Y-%m-%d')}.jsonl"
         return self.logs_dir / filename
     
-    def read_date(self, target_date: Union[date, datetime]) -> Iterator[Exchange]:
+    def _log_files(self) -> List[Path]:
+        """Get all log files, plain or archived, sorted by date."""
+        return list_log_files(self.logs_dir, "exchanges_*.jsonl")
+    
+    def read_date(self, target_date: Union[date, datetime],
+                  exchange_type: Optional[str] = None) -> Iterator[Exchange]:
         """Read exchanges for a specific date.
         
         Args:
             target_date: Date to read exchanges for
+            exchange_type: Only read "stt" or "tts" entries (None for all)
             
         Yields:
             Exchange objects from that date
         """
-        log_file = self._get_log_file_path(target_date)
+        log_file = resolve_log_file(self._get_log_file_path(target_date))
         
-        if not log_file.exists():
+        if log_file is None:
             logger.debug(f"No log file found for {target_date}")
             return
         
-        yield from self._read_file(log_file)
+        yield from self._read_file(log_file, exchange_type=exchange_type)
     
-    def read_range(self, start: datetime, end: datetime) -> Iterator[Exchange]:
+    def read_range(self, start: datetime, end: datetime,
+                   exchange_type: Optional[str] = None) -> Iterator[Exchange]:
         """Read exchanges in date range.
         
         Args:
             start: Start datetime (inclusive)
             end: End datetime (inclusive)
+            exchange_type: Only read "stt" or "tts" entries (None for all)
             
         Yields:
             Exchange objects within the date range
@@ -71,7 +85,7 @@ class ExchangeReader:
         end_date = end.date()
         
         while current_date <= end_date:
-            for exchange in self.read_date(current_date):
+            for exchange in self.read_date(current_date, exchange_type=exchange_type):
                 # Filter by exact timestamp
                 if start <= exchange.timestamp <= end:
                     yield exchange
@@ -93,8 +107,8 @@ class ExchangeReader:
         exchanges = []
         
         # Search all log files
-        for log_file in sorted(self.logs_dir.glob("exchanges_*.jsonl")):
-            for exchange in self._read_file(log_file):
+        for log_file in self._log_files():
+            for exchange in self._read_file(log_file, conversation_id=conversation_id):
                 if exchange.conversation_id == conversation_id:
                     exchanges.append(exchange)
         
@@ -136,20 +150,19 @@ class ExchangeReader:
                 logger.error(f"Error tailing file: {e}")
         else:
             # Just read the file once
-            if today_file.exists():
-                exchanges = list(self._read_file(today_file))
-                
-                # Return last N lines if specified
-                if lines > 0 and len(exchanges) > lines:
-                    exchanges = exchanges[-lines:]
-                
-                yield from exchanges
+            if lines > 0:
+                # Only read the tail of the file
+                yield from reversed(self._read_latest(today_file, lines))
+            elif today_file.exists():
+                yield from self._read_file(today_file)
     
-    def read_recent(self, days: int = 7) -> Iterator[Exchange]:
+    def read_recent(self, days: int = 7,
+                    exchange_type: Optional[str] = None) -> Iterator[Exchange]:
         """Read exchanges from recent days.
         
         Args:
             days: Number of days to look back
+            exchange_type: Only read "stt" or "tts" entries (None for all)
             
         Yields:
             Exchange objects from recent days
@@ -158,7 +171,7 @@ class ExchangeReader:
         end_date = datetime.now(timezone.utc)
         start_date = end_date - timedelta(days=days)
         
-        yield from self.read_range(start_date, end_date)
+        yield from self.read_range(start_date, end_date, exchange_type=exchange_type)
     
     def get_all_conversations(self, days: Optional[int] = None) -> Dict[str, List[Exchange]]:
         """Get all conversations grouped by ID.
@@ -183,11 +196,18 @@ class ExchangeReader:
         
         return dict(conversations)
     
-    def _read_file(self, file_path: Path) -> Iterator[Exchange]:
+    def _read_file(self, file_path: Path,
+                   exchange_type: Optional[str] = None,
+                   conversation_id: Optional[str] = None) -> Iterator[Exchange]:
         """Read exchanges from a single file.
         
+        Lines that cannot match ``exchange_type`` or ``conversation_id`` are
+        rejected by a raw text check before they are decoded.
+        
         Args:
-            file_path: Path to the JSONL file
+            file_path: Path to the JSONL file, plain or compressed
+            exchange_type: Only yield "stt" or "tts" entries (None for all)
+            conversation_id: Only yield entries of this conversation
             
         Yields:
             Exchange objects from the file
@@ -195,23 +215,58 @@ class ExchangeReader:
         if not file_path.exists():
             return
         
+        prefilter = exchange_type is not None or conversation_id is not None
+        
         try:
-            with open(file_path, 'r') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
+            for line_num, line in enumerate(iter_lines(file_path), 1):
+                if prefilter and not line_may_match(line, exchange_type, conversation_id):
+                    continue
+                try:
+                    exchange = Exchange.from_jsonl(line)
+                    if prefilter and (
+                        (exchange_type is not None and exchange.type != exchange_type)
+                        or (conversation_id is not None
+                            and exchange.conversation_id != conversation_id)
+                    ):
                         continue
-                    
-                    try:
-                        yield Exchange.from_jsonl(line)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Failed to parse line {line_num} in {file_path}: {e}")
-                    except Exception as e:
-                        logger.error(f"Error processing line {line_num} in {file_path}: {e}")
+                    yield exchange
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Failed to parse line {line_num} in {file_path}: {e}")
+                except Exception as e:
+                    logger.error(f"Error processing line {line_num} in {file_path}: {e}")
         
         except Exception as e:
             logger.error(f"Error reading file {file_path}: {e}")
     
+    def _read_latest(self, file_path: Path, count: int) -> List[Exchange]:
+        """Read the last exchanges of a file without reading all of it.
+        
+        Args:
+            file_path: Path to the JSONL file (plain path; archives are resolved)
+            count: Maximum number of exchanges
+            
+        Returns:
+            Exchanges from the file, newest first
+        """
+        resolved = resolve_log_file(file_path)
+        if resolved is None:
+            return []
+        
+        exchanges = []
+        try:
+            for line in iter_lines_reverse(resolved):
+                try:
+                    exchanges.append(Exchange.from_jsonl(line))
+                except Exception as e:
+                    logger.warning(f"Failed to parse line in {resolved}: {e}")
+                    continue
+                if len(exchanges) >= count:
+                    break
+        except Exception as e:
+            logger.error(f"Error reading file {resolved}: {e}")
+        
+        return exchanges
+    
     def _read_all(self) -> Iterator[Exchange]:
         """Read all exchanges from all log files.
         
@@ -219,9 +274,7 @@ class ExchangeReader:
             All exchanges in chronological order
         """
         # Get all log files sorted by date
-        log_files = sorted(self.logs_dir.glob("exchanges_*.jsonl"))
-        
-        for log_file in log_files:
+        for log_file in self._log_files():
             yield from self._read_file(log_file)
     
     def get_latest_exchanges(self, count: int = 20) -> List[Exchange]:
@@ -233,21 +286,19 @@ class ExchangeReader:
         Returns:
             List of the most recent exchanges
         """
-        # Read from today and work backwards if needed
+        # Read from the end of today's log and work backwards if needed
         exchanges = []
         current_date = datetime.now().date()
         
         while len(exchanges) < count:
-            # Try to read from current date
-            daily_exchanges = list(self.read_date(current_date))
+            # Only the tail of each day's file is read
+            daily_exchanges = self._read_latest(
+                self._get_log_file_path(current_date), count - len(exchanges)
+            )
             
             if daily_exchanges:
                 # Add to beginning since we're going backwards
-                exchanges = daily_exchanges + exchanges
-                
-                # Trim to requested count
-                if len(exchanges) > count:
-                    exchanges = exchanges[-count:]
+                exchanges = list(reversed(daily_exchanges)) + exchanges
             
             # Go to previous day
             current_date -= timedelta(days=1)
@@ -1,33 +1,241 @@
 """
 Statistics calculation for exchanges.
+
+Exchanges are converted once into a columnar form (NumPy arrays of
+timestamps, type/provider/transport codes and the timing metrics), and
+every view is computed from those arrays with vectorized group-bys.
 """
 
-from collections import defaultdict, Counter
-from datetime import datetime, timedelta
+from collections import Counter
 from typing import Dict, List, Any, Optional, Tuple
-import re
+
+import numpy as np
 
 from voice_mode.exchanges.models import Exchange
+from voice_mode.timings import TimingStage
+
+
+# Metric columns, with the exchange type they belong to and the name used
+# in reports
+METRICS = {
+    'record': ('stt', 'record'),
+    'stt': ('stt', 'processing'),
+    'ttfa': ('tts', 'ttfa'),
+    'gen': ('tts', 'generation'),
+    'play': ('tts', 'playback'),
+}
+
+# Timing stage each metric column is read from
+METRIC_STAGES = {
+    'record': TimingStage.RECORD.value,
+    'stt': TimingStage.STT.value,
+    'ttfa': TimingStage.TTFA.value,
+    'gen': TimingStage.TTS_GEN.value,
+    'play': TimingStage.TTS_PLAY.value,
+}
+
+PERCENTILES = (50, 90, 99)
+
+TYPE_CODES = {'stt': 0, 'tts': 1}
+
+
+class _Codes:
+    """Assigns small integer codes to string labels."""
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.names: List[str] = []
+
+    def __call__(self, label: str) -> int:
+        code = self.codes.get(label)
+        if code is None:
+            code = self.codes[label] = len(self.names)
+            self.names.append(label)
+        return code
+
+
+class ExchangeColumns:
+    """Columnar view of a list of exchanges.
+
+    Attributes:
+        timestamps: Epoch seconds (float64)
+        hours: Hour of day of the logged timestamp (int8)
+        days: Proleptic ordinal of the logged date (int32)
+        types: 0 for STT, 1 for TTS (int8)
+        providers, transports, models, voices, conversations: Integer codes
+            (int32) into the matching ``*_names`` lists
+        metrics: Metric name to float64 seconds, NaN where not recorded
+        words: Word count of the text (int32)
+        errors: Whether metadata recorded an error (bool)
+        vad: 1 if silence detection was enabled, 0 if disabled, -1 if unknown
+    """
+
+    def __init__(self, exchanges: List[Exchange]):
+        """Extract all columns in a single pass over the exchanges.
+
+        Args:
+            exchanges: Exchanges to convert
+        """
+        self.size = len(exchanges)
+        providers, transports, models, voices, conversations = (
+            _Codes(), _Codes(), _Codes(), _Codes(), _Codes()
+        )
+        metric_types = {name: TYPE_CODES[type_] for name, (type_, _) in METRICS.items()}
+
+        # Python lists are far cheaper to fill than element-wise array stores
+        timestamps, hours, days, types, words = [], [], [], [], []
+        provider_codes, transport_codes, model_codes, voice_codes, conversation_codes = [], [], [], [], []
+        errors, vad = [], []
+        metrics = {name: [] for name in METRICS}
+        nan = float('nan')
+
+        for exchange in exchanges:
+            timestamp = exchange.timestamp
+            type_code = 0 if exchange.is_stt else 1
+            timestamps.append(timestamp.timestamp())
+            hours.append(timestamp.hour)
+            days.append(timestamp.toordinal())
+            types.append(type_code)
+            conversation_codes.append(conversations(exchange.conversation_id))
+            words.append(len(exchange.text.split()))
+
+            get = exchange.metadata_get
+            provider_codes.append(providers(get('provider', 'unknown')))
+            transport_codes.append(transports(get('transport', 'unknown')))
+            model_codes.append(models(get('model', 'unknown')))
+            voice_codes.append(voices(get('voice', 'unknown')))
+            errors.append(bool(get('error')))
+            silence = get('silence_detection')
+            vad.append((1 if silence.get('enabled') else 0) if silence else -1)
+
+            timings = exchange.timings
+            for metric, column in metrics.items():
+                value = timings.get(METRIC_STAGES[metric]) if metric_types[metric] == type_code else None
+                column.append(nan if value is None else value / 1000.0)
+
+        self.timestamps = np.array(timestamps, dtype=np.float64)
+        self.hours = np.array(hours, dtype=np.int8)
+        self.days = np.array(days, dtype=np.int32)
+        self.types = np.array(types, dtype=np.int8)
+        self.providers = np.array(provider_codes, dtype=np.int32)
+        self.transports = np.array(transport_codes, dtype=np.int32)
+        self.models = np.array(model_codes, dtype=np.int32)
+        self.voices = np.array(voice_codes, dtype=np.int32)
+        self.conversations = np.array(conversation_codes, dtype=np.int32)
+        self.words = np.array(words, dtype=np.int32)
+        self.errors = np.array(errors, dtype=bool)
+        self.vad = np.array(vad, dtype=np.int8)
+        self.metrics = {name: np.array(column, dtype=np.float64) for name, column in metrics.items()}
+
+        self.provider_names = providers.names
+        self.transport_names = transports.names
+        self.model_names = models.names
+        self.voice_names = voices.names
+        self.conversation_names = conversations.names
+
+
+def summarize(values: np.ndarray) -> Dict[str, float]:
+    """Summary statistics for one metric, ignoring NaN.
+
+    Returns:
+        Dictionary with avg, min, max, count and p50/p90/p99, or an empty
+        dictionary when there are no values
+    """
+    values = values[~np.isnan(values)]
+    if values.size == 0:
+        return {}
+    summary = {
+        'avg': float(values.mean()),
+        'min': float(values.min()),
+        'max': float(values.max()),
+        'count': int(values.size),
+    }
+    for q, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+        summary[f'p{q}'] = float(value)
+    return summary
+
+
+def group_summaries(codes: np.ndarray, values: np.ndarray,
+                    n_groups: int) -> Dict[int, Dict[str, float]]:
+    """Per-group summaries of a metric in one sort.
+
+    Values are sorted by (group, value) so every group is a contiguous,
+    ordered run; percentiles are then read off each run with the same
+    linear interpolation ``np.percentile`` uses.
+
+    Args:
+        codes: Group code per row
+        values: Metric per row, NaN where missing
+        n_groups: Number of possible codes
+
+    Returns:
+        Group code to summary, for groups with at least one value
+    """
+    mask = ~np.isnan(values)
+    codes = codes[mask].astype(np.intp)
+    values = values[mask]
+    if values.size == 0:
+        return {}
+
+    counts = np.bincount(codes, minlength=n_groups)
+    sums = np.bincount(codes, weights=values, minlength=n_groups)
+    values = values[np.lexsort((values, codes))]
+    present = np.flatnonzero(counts)
+    counts = counts[present]
+    starts = np.cumsum(counts) - counts
+    ends = starts + counts - 1
+
+    columns = {
+        'avg': sums[present] / counts,
+        'min': values[starts],
+        'max': values[ends],
+        'count': counts,
+    }
+    for q in PERCENTILES:
+        position = starts + (counts - 1) * (q / 100.0)
+        lower = np.floor(position).astype(np.intp)
+        upper = np.minimum(lower + 1, ends)
+        fraction = position - lower
+        columns[f'p{q}'] = values[lower] + (values[upper] - values[lower]) * fraction
+
+    result = {}
+    for row, code in enumerate(present):
+        summary = {key: float(column[row]) for key, column in columns.items()}
+        summary['count'] = int(summary['count'])
+        result[int(code)] = summary
+    return result
 
 
 class ExchangeStats:
     """Calculate statistics from exchanges."""
-    
+
     def __init__(self, exchanges: List[Exchange]):
         """Initialize with list of exchanges.
-        
+
         Args:
             exchanges: List of exchanges to analyze
         """
         self.exchanges = exchanges
-        
+
         # Separate by type for convenience
         self.stt_exchanges = [e for e in exchanges if e.is_stt]
         self.tts_exchanges = [e for e in exchanges if e.is_tts]
-    
+
+        self.columns = ExchangeColumns(exchanges)
+
+    def _metric_stats(self, exchange_type: str) -> Dict[str, Any]:
+        """Summaries of every metric belonging to one exchange type."""
+        stats = {}
+        for metric, (type_, label) in METRICS.items():
+            if type_ == exchange_type:
+                summary = summarize(self.columns.metrics[metric])
+                if summary:
+                    stats[label] = summary
+        return stats
+
     def timing_stats(self) -> Dict[str, Any]:
         """Calculate timing statistics.
-        
+
         Returns:
             Dictionary with timing metrics
         """
@@ -36,273 +244,185 @@ class ExchangeStats:
             'tts': self._calculate_tts_timing_stats(),
             'overall': {}
         }
-        
-        # Calculate overall turnaround times
-        turnaround_times = []
-        
-        for i in range(len(self.exchanges) - 1):
-            current = self.exchanges[i]
-            next_ex = self.exchanges[i + 1]
-            
-            # Only count when switching between STT and TTS
-            if current.type != next_ex.type:
-                turnaround = (next_ex.timestamp - current.timestamp).total_seconds()
-                turnaround_times.append(turnaround)
-        
-        if turnaround_times:
-            stats['overall']['avg_turnaround'] = sum(turnaround_times) / len(turnaround_times)
-            stats['overall']['min_turnaround'] = min(turnaround_times)
-            stats['overall']['max_turnaround'] = max(turnaround_times)
-            stats['overall']['turnaround_count'] = len(turnaround_times)
-        
+
+        # Turnaround is the gap whenever the log switches between STT and TTS
+        cols = self.columns
+        switches = cols.types[1:] != cols.types[:-1]
+        turnaround_times = np.diff(cols.timestamps)[switches]
+
+        if turnaround_times.size:
+            stats['overall']['avg_turnaround'] = float(turnaround_times.mean())
+            stats['overall']['min_turnaround'] = float(turnaround_times.min())
+            stats['overall']['max_turnaround'] = float(turnaround_times.max())
+            stats['overall']['turnaround_count'] = int(turnaround_times.size)
+            for q, value in zip(PERCENTILES, np.percentile(turnaround_times, PERCENTILES)):
+                stats['overall'][f'p{q}_turnaround'] = float(value)
+
         return stats
-    
+
     def _calculate_stt_timing_stats(self) -> Dict[str, Any]:
         """Calculate STT-specific timing stats."""
-        record_times = []
-        stt_times = []
-        
-        for exchange in self.stt_exchanges:
-            if exchange.metadata and exchange.metadata.timing:
-                # Parse timing string: "record 3.2s, stt 1.4s"
-                timing_match = re.findall(r'(\w+)\s+([\d.]+)s', exchange.metadata.timing)
-                for metric, value in timing_match:
-                    if metric == 'record':
-                        record_times.append(float(value))
-                    elif metric == 'stt':
-                        stt_times.append(float(value))
-        
-        stats = {}
-        
-        if record_times:
-            stats['record'] = {
-                'avg': sum(record_times) / len(record_times),
-                'min': min(record_times),
-                'max': max(record_times),
-                'count': len(record_times)
-            }
-        
-        if stt_times:
-            stats['processing'] = {
-                'avg': sum(stt_times) / len(stt_times),
-                'min': min(stt_times),
-                'max': max(stt_times),
-                'count': len(stt_times)
-            }
-        
-        return stats
-    
+        return self._metric_stats('stt')
+
     def _calculate_tts_timing_stats(self) -> Dict[str, Any]:
         """Calculate TTS-specific timing stats."""
-        ttfa_times = []
-        gen_times = []
-        play_times = []
-        
-        for exchange in self.tts_exchanges:
-            if exchange.metadata and exchange.metadata.timing:
-                # Parse timing string: "ttfa 1.2s, gen 2.3s, play 5.6s"
-                timing_match = re.findall(r'(\w+)\s+([\d.]+)s', exchange.metadata.timing)
-                for metric, value in timing_match:
-                    if metric == 'ttfa':
-                        ttfa_times.append(float(value))
-                    elif metric == 'gen':
-                        gen_times.append(float(value))
-                    elif metric == 'play':
-                        play_times.append(float(value))
-        
-        stats = {}
-        
-        if ttfa_times:
-            stats['ttfa'] = {
-                'avg': sum(ttfa_times) / len(ttfa_times),
-                'min': min(ttfa_times),
-                'max': max(ttfa_times),
-                'count': len(ttfa_times)
-            }
-        
-        if gen_times:
-            stats['generation'] = {
-                'avg': sum(gen_times) / len(gen_times),
-                'min': min(gen_times),
-                'max': max(gen_times),
-                'count': len(gen_times)
-            }
-        
-        if play_times:
-            stats['playback'] = {
-                'avg': sum(play_times) / len(play_times),
-                'min': min(play_times),
-                'max': max(play_times),
-                'count': len(play_times)
-            }
-        
-        return stats
-    
+        return self._metric_stats('tts')
+
+    def timing_by(self, group: str) -> Dict[Any, Dict[str, Dict[str, float]]]:
+        """Timing summaries broken down by provider or hour of day.
+
+        Args:
+            group: "provider", "transport" or "hour"
+
+        Returns:
+            Group (provider name or hour) to metric label to summary
+        """
+        cols = self.columns
+        if group == 'hour':
+            codes, names = cols.hours, list(range(24))
+        elif group == 'provider':
+            codes, names = cols.providers, cols.provider_names
+        elif group == 'transport':
+            codes, names = cols.transports, cols.transport_names
+        else:
+            raise ValueError(f"Unknown group: {group}")
+
+        result: Dict[Any, Dict[str, Dict[str, float]]] = {}
+        for metric, (_, label) in METRICS.items():
+            for code, summary in group_summaries(codes, cols.metrics[metric], len(names)).items():
+                result.setdefault(names[code], {})[label] = summary
+        return dict(sorted(result.items()))
+
+    def histogram(self, metric: str, bins: int = 10) -> Tuple[List[int], List[float]]:
+        """Histogram of one timing metric.
+
+        Args:
+            metric: Metric column (record, stt, ttfa, gen, play)
+            bins: Number of equal-width bins
+
+        Returns:
+            Tuple of (counts, bin edges); empty lists when there is no data
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric: {metric}")
+        values = self.columns.metrics[metric]
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return [], []
+        counts, edges = np.histogram(values, bins=bins)
+        return counts.tolist(), edges.tolist()
+
+    def _breakdown(self, codes: np.ndarray, names: List[str],
+                   mask: Optional[np.ndarray] = None) -> Dict[str, int]:
+        """Count rows per code, in order of first appearance."""
+        if mask is not None:
+            codes = codes[mask]
+        counts = np.bincount(codes, minlength=len(names))
+        return {names[code]: int(count) for code, count in enumerate(counts) if count}
+
     def provider_breakdown(self) -> Dict[str, int]:
         """Count exchanges by provider.
-        
+
         Returns:
             Dictionary mapping provider names to counts
         """
-        provider_counts = Counter()
-        
-        for exchange in self.exchanges:
-            if exchange.metadata and exchange.metadata.provider:
-                provider_counts[exchange.metadata.provider] += 1
-            else:
-                provider_counts['unknown'] += 1
-        
-        return dict(provider_counts)
-    
+        return self._breakdown(self.columns.providers, self.columns.provider_names)
+
     def model_breakdown(self) -> Dict[str, Dict[str, int]]:
         """Count exchanges by model, separated by type.
-        
+
         Returns:
             Dictionary with 'stt' and 'tts' sub-dictionaries of model counts
         """
-        stt_models = Counter()
-        tts_models = Counter()
-        
-        for exchange in self.exchanges:
-            model = 'unknown'
-            if exchange.metadata and exchange.metadata.model:
-                model = exchange.metadata.model
-            
-            if exchange.is_stt:
-                stt_models[model] += 1
-            else:
-                tts_models[model] += 1
-        
+        cols = self.columns
         return {
-            'stt': dict(stt_models),
-            'tts': dict(tts_models)
+            'stt': self._breakdown(cols.models, cols.model_names, cols.types == 0),
+            'tts': self._breakdown(cols.models, cols.model_names, cols.types == 1),
         }
-    
+
     def voice_breakdown(self) -> Dict[str, int]:
         """Count TTS exchanges by voice.
-        
+
         Returns:
             Dictionary mapping voice names to counts
         """
-        voice_counts = Counter()
-        
-        for exchange in self.tts_exchanges:
-            if exchange.metadata and exchange.metadata.voice:
-                voice_counts[exchange.metadata.voice] += 1
-            else:
-                voice_counts['unknown'] += 1
-        
-        return dict(voice_counts)
-    
+        cols = self.columns
+        return self._breakdown(cols.voices, cols.voice_names, cols.types == 1)
+
     def transport_breakdown(self) -> Dict[str, int]:
         """Count exchanges by transport type.
-        
+
         Returns:
             Dictionary mapping transport types to counts
         """
-        transport_counts = Counter()
-        
-        for exchange in self.exchanges:
-            if exchange.metadata and exchange.metadata.transport:
-                transport_counts[exchange.metadata.transport] += 1
-            else:
-                transport_counts['unknown'] += 1
-        
-        return dict(transport_counts)
-    
+        return self._breakdown(self.columns.transports, self.columns.transport_names)
+
     def hourly_distribution(self) -> Dict[int, int]:
         """Distribution of exchanges by hour of day.
-        
+
         Returns:
             Dictionary mapping hour (0-23) to count
         """
-        hour_counts = defaultdict(int)
-        
-        for exchange in self.exchanges:
-            hour = exchange.timestamp.hour
-            hour_counts[hour] += 1
-        
-        # Ensure all hours are represented
-        return {hour: hour_counts.get(hour, 0) for hour in range(24)}
-    
+        counts = np.bincount(self.columns.hours.astype(np.intp), minlength=24)
+        return {hour: int(counts[hour]) for hour in range(24)}
+
     def daily_distribution(self) -> Dict[str, int]:
         """Distribution of exchanges by date.
-        
+
         Returns:
             Dictionary mapping date string (YYYY-MM-DD) to count
         """
-        daily_counts = defaultdict(int)
-        
-        for exchange in self.exchanges:
-            date_str = exchange.timestamp.date().isoformat()
-            daily_counts[date_str] += 1
-        
-        return dict(sorted(daily_counts.items()))
-    
+        from datetime import date
+        days, counts = np.unique(self.columns.days, return_counts=True)
+        return {date.fromordinal(int(day)).isoformat(): int(count)
+                for day, count in zip(days, counts)}
+
     def conversation_stats(self) -> Dict[str, Any]:
         """Conversation-level statistics.
-        
+
         Returns:
             Dictionary with conversation metrics
         """
-        # Group by conversation ID
-        conversations = defaultdict(list)
-        for exchange in self.exchanges:
-            conversations[exchange.conversation_id].append(exchange)
-        
-        # Calculate stats per conversation
-        conv_lengths = []
-        conv_durations = []
-        conv_exchange_counts = []
-        
-        for conv_id, conv_exchanges in conversations.items():
-            if len(conv_exchanges) > 0:
-                conv_exchange_counts.append(len(conv_exchanges))
-                
-                # Sort by timestamp
-                conv_exchanges.sort(key=lambda e: e.timestamp)
-                
-                # Calculate duration
-                duration = (conv_exchanges[-1].timestamp - conv_exchanges[0].timestamp).total_seconds()
-                conv_durations.append(duration)
-                
-                # Calculate total word count
-                total_words = sum(len(e.text.split()) for e in conv_exchanges)
-                conv_lengths.append(total_words)
-        
-        stats = {
-            'total_conversations': len(conversations),
-            'exchanges_per_conversation': {
-                'avg': sum(conv_exchange_counts) / len(conv_exchange_counts) if conv_exchange_counts else 0,
-                'min': min(conv_exchange_counts) if conv_exchange_counts else 0,
-                'max': max(conv_exchange_counts) if conv_exchange_counts else 0,
-            },
-            'duration_seconds': {
-                'avg': sum(conv_durations) / len(conv_durations) if conv_durations else 0,
-                'min': min(conv_durations) if conv_durations else 0,
-                'max': max(conv_durations) if conv_durations else 0,
-            },
-            'word_count': {
-                'avg': sum(conv_lengths) / len(conv_lengths) if conv_lengths else 0,
-                'min': min(conv_lengths) if conv_lengths else 0,
-                'max': max(conv_lengths) if conv_lengths else 0,
-            }
+        cols = self.columns
+        n_conversations = len(cols.conversation_names)
+
+        def _avg_min_max(values: np.ndarray) -> Dict[str, float]:
+            if values.size == 0:
+                return {'avg': 0, 'min': 0, 'max': 0}
+            return {'avg': float(values.mean()), 'min': values.min().item(), 'max': values.max().item()}
+
+        if n_conversations:
+            codes = cols.conversations.astype(np.intp)
+            exchange_counts = np.bincount(codes, minlength=n_conversations)
+            word_counts = np.bincount(codes, weights=cols.words, minlength=n_conversations).astype(np.int64)
+            # Sort timestamps within each conversation, then reduce each run
+            order = np.lexsort((cols.timestamps, codes))
+            timestamps = cols.timestamps[order]
+            starts = np.cumsum(exchange_counts) - exchange_counts
+            durations = timestamps[starts + exchange_counts - 1] - timestamps[starts]
+        else:
+            exchange_counts = word_counts = durations = np.empty(0)
+
+        return {
+            'total_conversations': n_conversations,
+            'exchanges_per_conversation': _avg_min_max(exchange_counts),
+            'duration_seconds': _avg_min_max(durations),
+            'word_count': _avg_min_max(word_counts),
         }
-        
-        return stats
-    
+
     def error_stats(self) -> Dict[str, Any]:
         """Statistics about errors.
-        
+
         Returns:
             Dictionary with error metrics
         """
-        error_exchanges = [e for e in self.exchanges if e.metadata and e.metadata.error]
-        
+        cols = self.columns
+        error_indices = np.flatnonzero(cols.errors)
+
         error_types = Counter()
-        for exchange in error_exchanges:
+        for index in error_indices:
             # Try to categorize error
-            error_msg = exchange.metadata.error.lower()
+            error_msg = str(self.exchanges[index].metadata_get('error')).lower()
             if 'timeout' in error_msg:
                 error_types['timeout'] += 1
             elif 'auth' in error_msg or 'unauthorized' in error_msg:
@@ -313,113 +433,98 @@ class ExchangeStats:
                 error_types['network'] += 1
             else:
                 error_types['other'] += 1
-        
+
+        total_errors = int(error_indices.size)
         return {
-            'total_errors': len(error_exchanges),
-            'error_rate': len(error_exchanges) / len(self.exchanges) if self.exchanges else 0,
+            'total_errors': total_errors,
+            'error_rate': total_errors / cols.size if cols.size else 0,
             'error_types': dict(error_types),
             'errors_by_type': {
-                'stt': sum(1 for e in error_exchanges if e.is_stt),
-                'tts': sum(1 for e in error_exchanges if e.is_tts),
+                'stt': int(np.count_nonzero(cols.errors & (cols.types == 0))),
+                'tts': int(np.count_nonzero(cols.errors & (cols.types == 1))),
             }
         }
-    
+
     def silence_detection_stats(self) -> Dict[str, Any]:
         """Statistics about silence detection usage.
-        
+
         Returns:
             Dictionary with silence detection metrics
         """
-        stt_with_vad = []
-        stt_without_vad = []
-        
-        for exchange in self.stt_exchanges:
-            if exchange.metadata and exchange.metadata.silence_detection:
-                if exchange.metadata.silence_detection.get('enabled'):
-                    stt_with_vad.append(exchange)
-                else:
-                    stt_without_vad.append(exchange)
-        
-        # Calculate average recording times
-        with_vad_times = []
-        without_vad_times = []
-        
-        for exchange in stt_with_vad:
-            if exchange.metadata and exchange.metadata.timing:
-                match = re.search(r'record\s+([\d.]+)s', exchange.metadata.timing)
-                if match:
-                    with_vad_times.append(float(match.group(1)))
-        
-        for exchange in stt_without_vad:
-            if exchange.metadata and exchange.metadata.timing:
-                match = re.search(r'record\s+([\d.]+)s', exchange.metadata.timing)
-                if match:
-                    without_vad_times.append(float(match.group(1)))
-        
+        cols = self.columns
+        stt = cols.types == 0
+        with_vad = stt & (cols.vad == 1)
+        without_vad = stt & (cols.vad == 0)
+        stt_count = int(np.count_nonzero(stt))
+
         stats = {
-            'vad_enabled_count': len(stt_with_vad),
-            'vad_disabled_count': len(stt_without_vad),
-            'vad_usage_rate': len(stt_with_vad) / len(self.stt_exchanges) if self.stt_exchanges else 0,
+            'vad_enabled_count': int(np.count_nonzero(with_vad)),
+            'vad_disabled_count': int(np.count_nonzero(without_vad)),
+            'vad_usage_rate': np.count_nonzero(with_vad) / stt_count if stt_count else 0,
         }
-        
-        if with_vad_times:
-            stats['avg_record_time_with_vad'] = sum(with_vad_times) / len(with_vad_times)
-        
-        if without_vad_times:
-            stats['avg_record_time_without_vad'] = sum(without_vad_times) / len(without_vad_times)
-        
+
+        record = cols.metrics['record']
+        with_vad_times = record[with_vad & ~np.isnan(record)]
+        without_vad_times = record[without_vad & ~np.isnan(record)]
+
+        if with_vad_times.size:
+            stats['avg_record_time_with_vad'] = float(with_vad_times.mean())
+
+        if without_vad_times.size:
+            stats['avg_record_time_without_vad'] = float(without_vad_times.mean())
+
         return stats
-    
+
     def get_summary_report(self) -> str:
         """Generate a human-readable summary report.
-        
+
         Returns:
             Formatted string report
         """
         lines = ["Exchange Statistics Summary", "=" * 40, ""]
-        
+
         # Basic counts
         lines.append(f"Total Exchanges: {len(self.exchanges)}")
         lines.append(f"  STT: {len(self.stt_exchanges)}")
         lines.append(f"  TTS: {len(self.tts_exchanges)}")
         lines.append("")
-        
+
         # Date range
         if self.exchanges:
-            sorted_exchanges = sorted(self.exchanges, key=lambda e: e.timestamp)
-            start = sorted_exchanges[0].timestamp
-            end = sorted_exchanges[-1].timestamp
+            start = self.exchanges[int(np.argmin(self.columns.timestamps))].timestamp
+            end = self.exchanges[int(np.argmax(self.columns.timestamps))].timestamp
             lines.append(f"Date Range: {start.date()} to {end.date()}")
             lines.append(f"Duration: {end - start}")
             lines.append("")
-        
+
         # Providers
         lines.append("Providers:")
         for provider, count in self.provider_breakdown().items():
             lines.append(f"  {provider}: {count}")
         lines.append("")
-        
+
         # Transports
         lines.append("Transports:")
         for transport, count in self.transport_breakdown().items():
             lines.append(f"  {transport}: {count}")
         lines.append("")
-        
+
         # Timing
         timing = self.timing_stats()
         if timing.get('overall') and timing['overall'].get('avg_turnaround'):
             lines.append("Timing:")
             lines.append(f"  Avg Turnaround: {timing['overall']['avg_turnaround']:.2f}s")
-            
+
             if timing.get('tts') and timing['tts'].get('ttfa'):
-                lines.append(f"  Avg TTFA: {timing['tts']['ttfa']['avg']:.2f}s")
-            
+                ttfa = timing['tts']['ttfa']
+                lines.append(f"  TTFA: avg {ttfa['avg']:.2f}s, p50 {ttfa['p50']:.2f}s, p90 {ttfa['p90']:.2f}s")
+
             lines.append("")
-        
+
         # Conversations
         conv_stats = self.conversation_stats()
         lines.append(f"Conversations: {conv_stats['total_conversations']}")
         lines.append(f"  Avg Exchanges: {conv_stats['exchanges_per_conversation']['avg']:.1f}")
         lines.append(f"  Avg Duration: {conv_stats['duration_seconds']['avg']:.1f}s")
-        
-        return "\n".join(lines)
\ No newline at end of file
+
+        return "\n".join(lines)
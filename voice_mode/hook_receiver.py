@@ -0,0 +1,283 @@
+"""Lightweight Claude Code hook receiver (``voicemode-hook``).
+
+Claude Code runs the hook command synchronously around every tool call, so
+its start-up time is added to the agent loop. ``voicemode claude hooks
+receiver`` pays for the click CLI and ``voice_mode.config`` (which loads and
+validates the whole configuration) before it reads a few bytes of JSON.
+
+This module imports only the standard library. It reads the few settings it
+needs from the environment and ``voicemode.env`` files itself, forwards the
+event to a running ``voicemode daemon`` over its socket, and only imports
+the rest of VoiceMode when it has to find and play a sound locally. Keep it
+that way: ``tests/test_hook_receiver.py`` fails if importing it pulls in
+anything outside the standard library or exceeds the import-time budget.
+
+Usage in ``~/.claude/settings.json``::
+
+    {"hooks": {"PreToolUse": [{"hooks": [{"type": "command", "command": "voicemode-hook"}]}]}}
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+AUDIO_EXTENSIONS = (".mp3", ".wav")
+
+_EVENT_DIRS = {
+    "pretooluse": "PreToolUse",
+    "posttooluse": "PostToolUse",
+    "start": "PreToolUse",
+    "end": "PostToolUse",
+}
+
+_TRUE = ("true", "1", "yes", "on")
+
+
+def sound_file_candidates(event: str, tool: str, subagent: Optional[str] = None) -> List[str]:
+    """Relative paths to try for a hook event, most specific first.
+
+    Tries (mp3 preferred over wav for size):
+    1. ``{event}/{tool}/subagent/{subagent}`` (Task tool only)
+    2. ``{event}/{tool}/default``
+    3. ``{event}/default``
+    4. ``fallback``
+
+    Args:
+        event: Event name (PreToolUse, PostToolUse, start, end)
+        tool: Tool name
+        subagent: Optional subagent type
+
+    Returns:
+        Paths relative to the sound font root, using forward slashes
+    """
+    event = event.lower() if event else "pretooluse"
+    tool = tool.lower() if tool else "default"
+    subagent = subagent.lower() if subagent else None
+    event_dir = _EVENT_DIRS.get(event, event)
+
+    stems = []
+    if tool == "task" and subagent:
+        stems.append(f"{event_dir}/{tool}/subagent/{subagent}")
+    stems += [f"{event_dir}/{tool}/default", f"{event_dir}/default", "fallback"]
+    return [stem + ext for stem in stems for ext in AUDIO_EXTENSIONS]
+
+
+def parse_event(hook_data: Dict, tool_name: Optional[str] = None, event: Optional[str] = None,
+                subagent_type: Optional[str] = None) -> Dict[str, Optional[str]]:
+    """Work out event, tool and subagent from the hook JSON and any overrides."""
+    tool_name = tool_name or hook_data.get("tool_name", "Task")
+    event = event or hook_data.get("hook_event_name", "PreToolUse")
+    if not subagent_type and tool_name == "Task":
+        tool_input = hook_data.get("tool_input") or {}
+        subagent_type = tool_input.get("subagent_type", "baby-bear")
+    return {"event": event, "tool": tool_name, "subagent": subagent_type or None}
+
+
+def _env_files(cwd: Path) -> List[Path]:
+    # Same files, in the same order, as voice_mode.config.find_voicemode_env_files
+    home = Path.home() / ".voicemode"
+    files = [home / "voicemode.env"]
+    if not files[0].exists():
+        files = [home / ".voicemode.env"]
+    directory = cwd
+    while directory != directory.parent:
+        standalone = directory / ".voicemode.env"
+        if standalone.exists():
+            files.append(standalone)
+            break
+        nested = directory / ".voicemode" / "voicemode.env"
+        if nested.exists() and nested != files[0]:
+            files.append(nested)
+            break
+        directory = directory.parent
+    return files
+
+
+def read_settings(names: Sequence[str], cwd: Optional[Path] = None) -> Dict[str, str]:
+    """Values for ``names`` as voice_mode.config would see them.
+
+    Environment variables win; otherwise the first voicemode.env file that
+    sets a name provides it. Unset names are left out.
+    """
+    settings = {name: os.environ[name] for name in names if name in os.environ}
+    missing = set(names) - set(settings)
+    if not missing:
+        return settings
+    for path in _env_files(cwd or Path.cwd()):
+        try:
+            lines = path.read_text().splitlines()
+        except OSError:
+            continue
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            key, value = line.split("=", 1)
+            key = key.strip()
+            if key in missing and key not in settings:
+                settings[key] = value.strip()
+    return settings
+
+
+def _expand(path: str) -> Path:
+    return Path(os.path.expanduser(os.path.expandvars(path)))
+
+
+def play_in_daemon(socket_path: Path, event: Dict[str, Optional[str]], timeout: float = 2.0) -> Optional[str]:
+    """Ask a running daemon to play the sound for ``event``.
+
+    Speaks the daemon's one-line JSON protocol directly so that
+    ``voice_mode.daemon`` (and the configuration it imports) stays unloaded.
+
+    Returns:
+        The played file ("" if the sound font has none for this event)
+
+    Raises:
+        OSError: If no daemon answered
+        ValueError: If the reply was not a successful response
+    """
+    import socket
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        request = {"method": "hook_sound", "params": event}
+        sock.sendall(json.dumps(request, separators=(",", ":")).encode("utf-8") + b"\n")
+        reply = b""
+        while not reply.endswith(b"\n"):
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            reply += chunk
+    finally:
+        sock.close()
+    if not reply:
+        raise OSError("Daemon closed the connection without replying")
+    response = json.loads(reply.decode("utf-8"))
+    if not isinstance(response, dict) or not response.get("ok"):
+        raise ValueError(response.get("error", "Unknown daemon error") if isinstance(response, dict) else reply)
+    return response.get("result") or ""
+
+
+def find_sound_file(event: str, tool: str, subagent: Optional[str] = None,
+                    root: Optional[Path] = None) -> Optional[Path]:
+    """First existing sound file for the event in the active sound font."""
+    base_path = root or Path.home() / ".voicemode" / "soundfonts" / "current"
+    if base_path.is_symlink():
+        base_path = base_path.resolve()
+    if not base_path.exists():
+        return None
+    for candidate in sound_file_candidates(event, tool, subagent):
+        path = base_path / candidate
+        if path.exists():
+            return path
+    return None
+
+
+def handle(hook_data: Dict, tool_name: Optional[str] = None, event: Optional[str] = None,
+           subagent_type: Optional[str] = None, debug: bool = False) -> bool:
+    """Play the sound for one hook event; returns whether a sound played.
+
+    Never raises for missing sounds, daemons or devices: hooks must not
+    disturb Claude Code.
+    """
+    def log(message: str) -> None:
+        if debug:
+            print(f"[DEBUG] {message}", file=sys.stderr)
+
+    parsed = parse_event(hook_data, tool_name, event, subagent_type)
+    log(f"Processing: event={parsed['event']}, tool={parsed['tool']}, subagent={parsed['subagent']}")
+
+    settings = read_settings(("VOICEMODE_SOUNDFONTS_ENABLED", "VOICEMODE_DAEMON",
+                              "VOICEMODE_DAEMON_SOCKET", "VOICEMODE_BASE_DIR"))
+    if settings.get("VOICEMODE_SOUNDFONTS_ENABLED", "").lower() not in _TRUE:
+        log("Sound fonts are disabled (VOICEMODE_SOUNDFONTS_ENABLED=false)")
+        return False
+
+    daemon_enabled = settings.get("VOICEMODE_DAEMON", "").lower()
+    if not daemon_enabled or daemon_enabled in _TRUE:
+        base_dir = _expand(settings.get("VOICEMODE_BASE_DIR", str(Path.home() / ".voicemode")))
+        socket_path = _expand(settings.get("VOICEMODE_DAEMON_SOCKET", str(base_dir / "daemon.sock")))
+        if socket_path.exists():
+            try:
+                played = play_in_daemon(socket_path, parsed)
+            except (OSError, ValueError) as e:
+                log(f"Daemon unavailable, playing locally: {e}")
+            else:
+                log(f"Daemon played: {played}" if played else "No sound file found for this event")
+                return bool(played)
+
+    sound_file = find_sound_file(parsed["event"], parsed["tool"], parsed["subagent"])
+    if sound_file is None:
+        log("No sound file found for this event")
+        return False
+    log(f"Found sound file: {sound_file}")
+    return play_file(sound_file)
+
+
+def play_file(path: Path) -> bool:
+    """Play ``path`` in the background with ffplay; returns whether it started.
+
+    Same command as ``voice_mode.tools.sound_fonts.audio_player.Player``,
+    which is not imported because loading ``voice_mode.tools`` registers
+    every MCP tool.
+    """
+    import subprocess
+
+    try:
+        subprocess.Popen(
+            ["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet", str(path)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        return True
+    except OSError:
+        return False
+
+
+def _parse_args(argv: Sequence[str]):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="voicemode-hook", description="Play sound fonts for Claude Code hook events.")
+    parser.add_argument("--tool-name", help="Override tool name (for testing)")
+    parser.add_argument("--action", choices=["start", "end"], help="Override action (for testing)")
+    parser.add_argument("--subagent-type", help="Override subagent type (for testing)")
+    parser.add_argument("--event", choices=["PreToolUse", "PostToolUse"], help="Override event (for testing)")
+    parser.add_argument("--debug", action="store_true", help="Enable debug output")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Console entry point: read the hook JSON from stdin and play its sound."""
+    argv = sys.argv[1:] if argv is None else argv
+    # Claude Code passes no arguments; skip argparse unless testing by hand
+    args = _parse_args(argv) if argv else None
+    debug = bool(args and args.debug)
+
+    hook_data = {}
+    if not sys.stdin.isatty():
+        try:
+            hook_data = json.load(sys.stdin)
+        except Exception as e:
+            if debug:
+                print(f"[DEBUG] Failed to parse JSON from stdin: {e}", file=sys.stderr)
+            sys.exit(0)
+        if debug:
+            print(f"[DEBUG] Received JSON: {json.dumps(hook_data, indent=2)}", file=sys.stderr)
+
+    try:
+        played = handle(hook_data, args and args.tool_name, args and args.event, args and args.subagent_type, debug)
+        if debug:
+            print(f"[DEBUG] {'Sound played successfully' if played else 'No sound played'}", file=sys.stderr)
+    except Exception as e:
+        if debug:
+            print(f"[DEBUG] Hook failed: {e}", file=sys.stderr)
+    # Always exit 0 to not disrupt Claude Code
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
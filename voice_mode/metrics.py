@@ -0,0 +1,392 @@
+"""
+Prometheus-style metrics for voice mode.
+
+A small in-process registry of counters, gauges and fixed-bucket
+histograms, rendered in the Prometheus text exposition format. Stage
+latencies, failover attempts, playback underruns, audio device opens and
+cache lookups are recorded as they happen; the registry can be written to
+a text file periodically (for node_exporter's textfile collector or any
+scraper that reads files) and optionally served over a local HTTP
+listener while the server runs.
+
+Updates only touch a dict slot under a per-metric lock, so they are O(1)
+and safe to call from PortAudio callback threads.
+"""
+
+import bisect
+import logging
+import math
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger("voicemode.metrics")
+
+# Seconds; covers sub-second TTFA through long recordings
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape_label(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric:
+    """Base class holding one value slot per label combination."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Mapping[str, object]) -> LabelValues:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        try:
+            return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError as e:
+            raise ValueError(f"{self.name} is missing label {e}") from None
+
+    def _header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        """Increase the counter for a label combination."""
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: object) -> float:
+        """Current value for a label combination."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        lines = self._header()
+        for key, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: object) -> None:
+        self.inc(-amount, **labels)
+
+    def get(self, **labels: object) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        lines = self._header()
+        for key, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    """Distribution over fixed buckets.
+
+    Per-bucket counts are stored non-cumulatively so an observation updates a
+    single slot; they are accumulated only when rendering.
+    """
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Iterable[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        bounds = sorted(float(b) for b in buckets if not math.isinf(b))
+        if not bounds:
+            raise ValueError("Histogram needs at least one finite bucket")
+        self.buckets = tuple(bounds)
+        # key -> [bucket counts..., +Inf count, sum]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        """Record one observation."""
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            slots = self._values.get(key)
+            if slots is None:
+                slots = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            slots[index] += 1
+            slots[-1] += value
+
+    def get_count(self, **labels: object) -> int:
+        slots = self._values.get(self._key(labels))
+        return int(sum(slots[:-1])) if slots else 0
+
+    def get_sum(self, **labels: object) -> float:
+        slots = self._values.get(self._key(labels))
+        return slots[-1] if slots else 0.0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, list(slots)) for key, slots in self._values.items())
+        lines = self._header()
+        for key, slots in items:
+            cumulative = 0.0
+            for bound, count in zip(self.buckets + (math.inf,), slots[:-1]):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {_format_value(cumulative)}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(slots[-1])}")
+            lines.append(f"{self.name}_count{labels} {_format_value(cumulative)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} already registered with a different type or labels")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Iterable[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: Union[str, Path]) -> None:
+        """Write the rendered metrics atomically so scrapers never see a partial file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(self.render(), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+
+# ==================== VOICE MODE METRICS ====================
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "voicemode_stage_seconds",
+    "Duration of converse stages (ttfa, tts_gen, tts_play, record, stt, total, audio_wait) in seconds",
+    ["stage"],
+)
+INTERACTIONS = REGISTRY.counter(
+    "voicemode_interactions_total",
+    "Voice interactions by transport and outcome",
+    ["transport", "success"],
+)
+FAILOVER_ATTEMPTS = REGISTRY.counter(
+    "voicemode_failover_attempts_total",
+    "Provider endpoint attempts by service, endpoint and result",
+    ["service", "endpoint", "result"],
+)
+PLAYBACK_UNDERRUNS = REGISTRY.counter(
+    "voicemode_playback_underruns_total",
+    "Streaming playback buffer underruns (output callbacks or writes that ran dry)",
+)
+DEVICE_OPENS = REGISTRY.counter(
+    "voicemode_audio_device_opens_total",
+    "Audio streams opened by direction",
+    ["direction"],
+)
+CACHE_LOOKUPS = REGISTRY.counter(
+    "voicemode_audio_cache_lookups_total",
+    "Cached TTS audio lookups (repeat requests) by result",
+    ["result"],
+)
+CONVERSE_IN_PROGRESS = REGISTRY.gauge(
+    "voicemode_converse_in_progress",
+    "Converse calls currently running",
+)
+START_TIME = REGISTRY.gauge(
+    "voicemode_start_time_seconds",
+    "Unix time the process started recording metrics",
+)
+START_TIME.set(time.time())
+
+
+def observe_timings(timings: Optional[Mapping[str, float]]) -> None:
+    """Record converse stage timings (seconds) in the stage histogram.
+
+    Args:
+        timings: TimingStage name to seconds; non-numeric values are skipped
+    """
+    if not timings:
+        return
+    from voice_mode.timings import STAGES
+    for stage, value in timings.items():
+        name = getattr(stage, "value", stage)
+        if name in STAGES and isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0:
+            STAGE_SECONDS.observe(value, stage=name)
+
+
+# ==================== EXPORT ====================
+
+class MetricsExporter:
+    """Writes the registry to a text file on an interval and optionally serves it over HTTP.
+
+    Args:
+        registry: Registry to export
+        textfile: Path rewritten every ``interval`` seconds (None to skip)
+        interval: Seconds between textfile writes
+        port: Port for the HTTP listener (0 disables it)
+        host: Address the listener binds to
+    """
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY,
+                 textfile: Optional[Union[str, Path]] = None,
+                 interval: float = 15.0, port: int = 0, host: str = "127.0.0.1"):
+        self.registry = registry
+        self.textfile = Path(textfile) if textfile else None
+        self.interval = interval
+        self.port = port
+        self.host = host
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._server = None
+
+    def start(self) -> None:
+        """Start the writer thread and HTTP listener as configured."""
+        if self.textfile is not None and self._thread is None:
+            self._thread = threading.Thread(target=self._write_loop, name="voicemode-metrics", daemon=True)
+            self._thread.start()
+        if self.port and self._server is None:
+            self._start_http()
+
+    def stop(self) -> None:
+        """Stop exporting, writing the textfile one last time."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def write(self) -> None:
+        if self.textfile is None:
+            return
+        try:
+            self.registry.write_textfile(self.textfile)
+        except OSError as e:
+            logger.warning(f"Failed to write metrics file {self.textfile}: {e}")
+
+    def _write_loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.write()
+        self.write()
+
+    def _start_http(self) -> None:
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self.registry
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(f"metrics request: {format % args}")
+
+        try:
+            self._server = ThreadingHTTPServer((self.host, self.port), MetricsHandler)
+        except OSError as e:
+            logger.warning(f"Metrics listener could not bind {self.host}:{self.port}: {e}")
+            return
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, name="voicemode-metrics-http", daemon=True).start()
+        logger.info(f"Serving metrics on http://{self.host}:{self.port}/metrics")
@@ -13,9 +13,16 @@ import yaml
 from dataclasses import dataclass, field
 import os
 
+from .pronounce_engine import CompiledRuleSet
+from .utils.file_watch import FileWatcher
+
 logger = logging.getLogger(__name__)
 
 
+def _log_substitutions() -> bool:
+    return os.environ.get('VOICEMODE_PRONUNCIATION_LOG_SUBSTITUTIONS', '').lower() == 'true'
+
+
 @dataclass
 class PronounceRule:
     """A single pronunciation rule."""
@@ -64,8 +71,12 @@ class PronounceManager:
             'tts': [],
             'stt': []
         }
+        self._default_paths = not config_paths
         self.config_paths = config_paths or self._get_default_config_paths()
+        self._engines: Dict[str, tuple] = {}
+        self.log_substitutions = _log_substitutions()
         self._load_all_rules()
+        self._watcher = FileWatcher(self._watched_paths())
     
     def _get_default_config_paths(self) -> List[Path]:
         """Get default configuration file paths."""
@@ -96,9 +107,30 @@ class PronounceManager:
         
         return paths
     
+    def _watched_paths(self) -> List[Path]:
+        """Rule files to watch, including default locations that may appear later."""
+        paths = list(self.config_paths)
+        if self._default_paths:
+            paths.append(Path.home() / '.voicemode' / 'config' / 'pronunciation.yaml')
+            paths.append(Path.cwd() / '.pronunciation.yaml')
+        return list(dict.fromkeys(paths))
+    
+    def reload_if_changed(self) -> bool:
+        """Reload rules if a rule file was created, edited or removed.
+        
+        Returns:
+            True if the rules were reloaded
+        """
+        if not self._watcher.changed():
+            return False
+        logger.info("Pronunciation rule files changed, reloading")
+        self.reload_rules()
+        return True
+    
     def _load_all_rules(self):
         """Load rules from all configured paths."""
         self.rules = {'tts': [], 'stt': []}
+        self._invalidate()
         
         for config_path in self.config_paths:
             try:
@@ -161,15 +193,7 @@ class PronounceManager:
         Returns:
             Modified text with pronunciation improvements
         """
-        log_substitutions = os.environ.get('VOICEMODE_PRONUNCIATION_LOG_SUBSTITUTIONS', '').lower() == 'true'
-        
-        for rule in self.rules['tts']:
-            original = text
-            text, applied = rule.apply(text)
-            if applied and log_substitutions:
-                logger.info(f"Pronunciation TTS: Applied rule '{rule.name}': \"{original}\" → \"{text}\"")
-        
-        return text
+        return self._process('tts', text)
     
     def process_stt(self, text: str) -> str:
         """
@@ -181,16 +205,36 @@ class PronounceManager:
         Returns:
             Corrected text
         """
-        log_substitutions = os.environ.get('VOICEMODE_PRONUNCIATION_LOG_SUBSTITUTIONS', '').lower() == 'true'
+        return self._process('stt', text)
+    
+    def _process(self, direction: str, text: str) -> str:
+        """Apply the rules for one direction, logging each substitution if enabled."""
+        if not self.log_substitutions:
+            return self._engine(direction).apply(text)
         
-        for rule in self.rules['stt']:
+        # Logging names the rule behind every change, so apply them one by one
+        label = direction.upper()
+        for rule in self.rules[direction]:
             original = text
             text, applied = rule.apply(text)
-            if applied and log_substitutions:
-                logger.info(f"Pronunciation STT: Applied rule '{rule.name}': \"{original}\" → \"{text}\"")
+            if applied:
+                logger.info(f"Pronunciation {label}: Applied rule '{rule.name}': \"{original}\" → \"{text}\"")
         
         return text
     
+    def _engine(self, direction: str) -> CompiledRuleSet:
+        """Compiled rules for a direction, rebuilt when the rule list changes."""
+        rules = self.rules[direction]
+        cached = self._engines.get(direction)
+        if cached is None or cached[0] is not rules or cached[1] != len(rules):
+            cached = (rules, len(rules), CompiledRuleSet(rules))
+            self._engines[direction] = cached
+        return cached[2]
+    
+    def _invalidate(self):
+        """Drop compiled rules after the rule set changed."""
+        self._engines = {}
+    
     # CRUD Operations
     def add_rule(self, direction: str, pattern: str, replacement: str,
                  name: Optional[str] = None, description: str = "",
@@ -240,6 +284,7 @@ class PronounceManager:
         
         self.rules[direction].append(rule)
         self.rules[direction].sort(key=lambda r: r.order)
+        self._invalidate()
         
         # Save to user config
         self._save_user_rules()
@@ -254,6 +299,7 @@ class PronounceManager:
         self.rules[direction] = [r for r in self.rules[direction] if r.name != name]
         
         if len(self.rules[direction]) < original_count:
+            self._invalidate()
             self._save_user_rules()
             return True
         return False
@@ -307,6 +353,7 @@ class PronounceManager:
                     logger.warning(f"Cannot enable private rule '{name}' via API")
                     return False
                 rule.enabled = True
+                self._invalidate()
                 self._save_user_rules()
                 return True
         return False
@@ -322,6 +369,7 @@ class PronounceManager:
                     logger.warning(f"Cannot disable private rule '{name}' via API")
                     return False
                 rule.enabled = False
+                self._invalidate()
                 self._save_user_rules()
                 return True
         return False
@@ -337,7 +385,11 @@ class PronounceManager:
     
     def reload_rules(self):
         """Reload all rules from configuration files."""
+        self.log_substitutions = _log_substitutions()
+        if self._default_paths:
+            self.config_paths = self._get_default_config_paths()
         self._load_all_rules()
+        self._watcher.watch(self._watched_paths())
         logger.info("Reloaded pronunciation rules")
     
     def _save_user_rules(self):
@@ -377,6 +429,9 @@ class PronounceManager:
         with open(user_config, 'w') as f:
             yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False)
         
+        # Our own write is not an external edit
+        self._watcher.watch(self._watched_paths())
+        
         logger.info(f"Saved pronunciation rules to {user_config}")
 
 
@@ -385,10 +440,12 @@ _manager: Optional[PronounceManager] = None
 
 
 def get_manager() -> PronounceManager:
-    """Get or create the global pronunciation manager."""
+    """Get or create the global pronunciation manager, picking up edited rule files."""
     global _manager
     if _manager is None:
         _manager = PronounceManager()
+    else:
+        _manager.reload_if_changed()
     return _manager
 
 
@@ -0,0 +1,285 @@
+"""Compiled pronunciation rules.
+
+Applying rules one ``re.sub`` at a time costs O(rules x text) per utterance,
+which adds up with large user dictionaries of tech terms. Most of those
+rules are plain words such as ``\\bAWS\\b`` or ``\\b(tee mux|t mux)\\b``.
+``CompiledRuleSet`` merges consecutive literal rules into one trie-shaped
+alternation that rewrites the text in a single pass through a replacement
+map, and keeps every other rule as its own ordered step.
+
+Merging must not change results, so a literal rule only joins the current
+group when it cannot interact with the rules already in it:
+
+* Word-bounded literals (``\\b...\\b`` around text that starts and ends with a
+  word character) only ever match whole runs of words. Two of them can
+  overlap only if they share a word, and a replacement can only create a
+  later match if it contains one of that rule's words. Replacements must
+  also start and end with a word character so that word boundaries around
+  them stay where they were.
+* Plain literals (no ``\\b``) may overlap anywhere, so they conflict when
+  either string overlaps the other or a replacement overlaps a later
+  pattern, and an empty replacement ends the group.
+
+Anything else - character classes, quantifiers, inline flags, group
+references in partial matches - runs as its own ``re.sub`` in rule order.
+"""
+
+import re
+from collections import OrderedDict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+_WORD = re.compile(r"\w")
+_TOKENS = re.compile(r"\w+")
+_META = set(".^$*+?{}[]()|")
+
+
+class LiteralRule(NamedTuple):
+    """A rule whose pattern is a fixed set of strings."""
+    name: str
+    bounded: bool  # wrapped in \b...\b
+    replacements: Dict[str, str]  # matched literal -> expanded replacement
+
+
+def _unescape(text: str) -> Optional[str]:
+    """Turn an escaped regex fragment into its literal string, or None if it is not literal."""
+    out = []
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if ch == "\\":
+            if i + 1 >= len(text) or text[i + 1].isalnum() or text[i + 1] == "_":
+                return None  # \d, \s, \1, ... are not literals
+            out.append(text[i + 1])
+            i += 2
+            continue
+        if ch in _META:
+            return None
+        out.append(ch)
+        i += 1
+    return "".join(out)
+
+
+def _split_alternatives(core: str) -> Optional[List[str]]:
+    """Split ``(a|b)`` / ``(?:a|b)`` / ``a`` into its literal alternatives."""
+    body = core
+    for opener in ("(?:", "("):
+        if core.startswith(opener) and core.endswith(")") and not core.endswith("\\)"):
+            body = core[len(opener):-1]
+            break
+
+    alternatives, current, i = [], [], 0
+    while i < len(body):
+        ch = body[i]
+        if ch == "\\":
+            current.append(body[i:i + 2])
+            i += 2
+            continue
+        if ch == "|":
+            alternatives.append("".join(current))
+            current = []
+        else:
+            current.append(ch)
+        i += 1
+    alternatives.append("".join(current))
+
+    if body is core and len(alternatives) > 1:
+        return None  # a top-level | binds looser than the \b anchors
+    literals = [_unescape(alt) for alt in alternatives]
+    if any(not literal for literal in literals):
+        return None
+    return literals
+
+
+def _is_bounded(pattern: str) -> bool:
+    if len(pattern) < 4 or not pattern.startswith(r"\b") or not pattern.endswith(r"\b"):
+        return False
+    # The trailing \b must not be an escaped backslash followed by "b"
+    backslashes = len(pattern[:-1]) - len(pattern[:-1].rstrip("\\"))
+    return backslashes % 2 == 1
+
+
+def literal_rule(rule) -> Optional[LiteralRule]:
+    """Describe ``rule`` as a LiteralRule if its pattern matches only fixed strings.
+
+    Args:
+        rule: A PronounceRule with a compiled pattern
+
+    Returns:
+        LiteralRule, or None if the rule needs the regex engine
+    """
+    compiled = getattr(rule, "_compiled", None)
+    if compiled is None or compiled.flags & ~re.UNICODE:
+        return None
+    bounded = _is_bounded(rule.pattern)
+    core = rule.pattern[2:-2] if bounded else rule.pattern
+    literals = _split_alternatives(core)
+    if literals is None:
+        return None
+
+    replacements: Dict[str, str] = {}
+    for literal in literals:
+        if bounded and not (_WORD.match(literal[0]) and _WORD.match(literal[-1])):
+            return None
+        match = compiled.match(literal)
+        if match is None:
+            return None  # our reading of the pattern is wrong; stay on the safe path
+        if match.end() != len(literal):
+            continue  # an earlier alternative always wins at this position
+        try:
+            replacements.setdefault(literal, match.expand(rule.replacement))
+        except (re.error, IndexError):
+            return None
+    if not replacements:
+        return None
+    return LiteralRule(rule.name, bounded, replacements)
+
+
+def _mergeable(rule: LiteralRule) -> bool:
+    """Whether a bounded rule's replacements leave surrounding word boundaries intact."""
+    if not rule.bounded:
+        return True
+    return all(r and _WORD.match(r[0]) and _WORD.match(r[-1]) for r in rule.replacements.values())
+
+
+def _overlaps(a: str, b: str) -> bool:
+    """Whether occurrences of ``a`` and ``b`` can share characters."""
+    if not a or not b:
+        return False
+    if a in b or b in a:
+        return True
+    return any(a.endswith(b[:k]) or b.endswith(a[:k]) for k in range(1, min(len(a), len(b))))
+
+
+def _tokens(strings: Iterable[str]) -> set:
+    return {token for s in strings for token in _TOKENS.findall(s)}
+
+
+class _Group:
+    """Consecutive literal rules applied together in one pass."""
+
+    def __init__(self, bounded: bool):
+        self.bounded = bounded
+        self.rules: List[LiteralRule] = []
+        self._pattern_tokens: set = set()
+        self._replacement_tokens: set = set()
+
+    def accepts(self, rule: LiteralRule) -> bool:
+        if rule.bounded != self.bounded:
+            return False
+        if self.bounded:
+            tokens = _tokens(rule.replacements)
+            return not (tokens & self._pattern_tokens or tokens & self._replacement_tokens)
+        for earlier in self.rules:
+            if any(not r for r in earlier.replacements.values()):
+                return False
+            for literal in rule.replacements:
+                if any(_overlaps(literal, other) for other in earlier.replacements):
+                    return False
+                if any(_overlaps(literal, r) for r in earlier.replacements.values()):
+                    return False
+        return True
+
+    def add(self, rule: LiteralRule) -> None:
+        self.rules.append(rule)
+        self._pattern_tokens |= _tokens(rule.replacements)
+        self._replacement_tokens |= _tokens(rule.replacements.values())
+
+    def compile(self) -> Tuple[re.Pattern, Dict[str, str]]:
+        literals: List[str] = []
+        replacements: Dict[str, str] = {}
+        for rule in self.rules:
+            for literal, replacement in rule.replacements.items():
+                literals.append(literal)
+                replacements[literal] = replacement
+        body = _trie_pattern(literals) if _prefix_free(literals) else "|".join(map(re.escape, literals))
+        pattern = rf"\b(?:{body})\b" if self.bounded else f"(?:{body})"
+        return re.compile(pattern), replacements
+
+
+def _prefix_free(literals: List[str]) -> bool:
+    ordered = sorted(literals)
+    return all(not b.startswith(a) for a, b in zip(ordered, ordered[1:]))
+
+
+def _trie_pattern(literals: Iterable[str]) -> str:
+    """Regex alternation factored on common prefixes (for prefix-free sets)."""
+    trie: dict = {}
+    for literal in literals:
+        node = trie
+        for ch in literal:
+            node = node.setdefault(ch, {})
+        node[""] = None
+
+    def build(node: dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return build(trie)
+
+
+Step = Union[Tuple[re.Pattern, Dict[str, str]], object]
+
+
+class CompiledRuleSet:
+    """Ordered pronunciation rules compiled for single-pass application.
+
+    Args:
+        rules: PronounceRules in application order (disabled ones are skipped)
+        cache_size: Number of recent texts whose results are memoized
+    """
+
+    def __init__(self, rules: Iterable, cache_size: int = 256):
+        self.steps: List[Step] = []
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+
+        group: Optional[_Group] = None
+        for rule in rules:
+            if not rule.enabled or getattr(rule, "_compiled", None) is None:
+                continue
+            literal = literal_rule(rule)
+            if literal is not None and not _mergeable(literal):
+                literal = None
+            if literal is not None and group is not None and group.accepts(literal):
+                group.add(literal)
+                continue
+            if group is not None:
+                self.steps.append(group.compile())
+                group = None
+            if literal is not None:
+                group = _Group(literal.bounded)
+                group.add(literal)
+            else:
+                self.steps.append(rule)
+        if group is not None:
+            self.steps.append(group.compile())
+
+    @property
+    def passes(self) -> int:
+        """Number of passes over the text per call."""
+        return len(self.steps)
+
+    def apply(self, text: str) -> str:
+        """Apply every rule to ``text``, reusing the result for repeated texts."""
+        cached = self._cache.get(text)
+        if cached is not None:
+            self._cache.move_to_end(text)
+            return cached
+
+        result = text
+        for step in self.steps:
+            if isinstance(step, tuple):
+                pattern, replacements = step
+                result = pattern.sub(lambda m: replacements[m.group(0)], result)
+            else:
+                result, _ = step.apply(result)
+
+        if self.cache_size:
+            self._cache[text] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
@@ -15,12 +15,13 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 
-import httpx
-from openai import AsyncOpenAI
-
 from . import config
+from .utils.lazy import lazy_import
 from .config import TTS_BASE_URLS, STT_BASE_URLS, OPENAI_API_KEY
 
+httpx = lazy_import("httpx")
+AsyncOpenAI = lazy_import("openai", "AsyncOpenAI")
+
 logger = logging.getLogger("voicemode")
 
 
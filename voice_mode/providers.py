@@ -7,11 +7,13 @@ working with the dynamic provider discovery system.
 
 import logging
 from typing import Dict, Optional, List, Any, Tuple
-from openai import AsyncOpenAI
+from .utils.lazy import lazy_import
 
 from .config import TTS_VOICES, TTS_MODELS, TTS_BASE_URLS, OPENAI_API_KEY, get_voice_preferences
 from .provider_discovery import provider_registry, EndpointInfo, is_local_provider
 
+AsyncOpenAI = lazy_import("openai", "AsyncOpenAI")
+
 logger = logging.getLogger("voicemode")
 
 
@@ -265,6 +265,8 @@ async def environment_variables() -> str:
         ("VOICEMODE_PREFER_LOCAL", "Prefer local providers over cloud (true/false)"),
         ("VOICEMODE_ALWAYS_TRY_LOCAL", "Always attempt local providers (true/false)"),
         ("VOICEMODE_AUTO_START_KOKORO", "Auto-start Kokoro service (true/false)"),
+        ("VOICEMODE_AUTO_START_SERVICES", "Start Whisper and Kokoro in parallel at server start (true/false)"),
+        ("VOICEMODE_SERVICE_READY_TIMEOUT", "Seconds to wait for a started service to become ready"),
         ("VOICEMODE_TTS_BASE_URLS", "Comma-separated list of TTS endpoints"),
         ("VOICEMODE_STT_BASE_URLS", "Comma-separated list of STT endpoints"),
         ("VOICEMODE_VOICES", "Comma-separated list of preferred voices"),
@@ -278,6 +280,8 @@ async def environment_variables() -> str:
         ("VOICEMODE_WHISPER_PORT", "Whisper server port"),
         ("VOICEMODE_WHISPER_LANGUAGE", "Language for transcription"),
         ("VOICEMODE_WHISPER_MODEL_PATH", "Path to Whisper models"),
+        ("VOICEMODE_WHISPER_THREADS", "CPU threads per whisper-server instance"),
+        ("VOICEMODE_WHISPER_INSTANCES", "Number of load-balanced whisper-server instances"),
         # Kokoro Configuration
         ("VOICEMODE_KOKORO_PORT", "Kokoro server port"),
         ("VOICEMODE_KOKORO_MODELS_DIR", "Directory for Kokoro models"),
@@ -299,6 +303,17 @@ async def environment_variables() -> str:
         ("VOICEMODE_EVENT_LOG_ENABLED", "Enable event logging (true/false)"),
         ("VOICEMODE_EVENT_LOG_DIR", "Directory for event logs"),
         ("VOICEMODE_EVENT_LOG_ROTATION", "Log rotation policy (daily/weekly/monthly)"),
+        ("VOICEMODE_LOG_ARCHIVE_DAYS", "Compress JSONL logs older than N days (0 = never)"),
+        ("VOICEMODE_LOG_ARCHIVE_CODEC", "Compression for archived logs (gzip/zstd)"),
+        ("VOICEMODE_TRACING", "Record per-stage tracing spans (true/false)"),
+        ("VOICEMODE_TRACE_DIR", "Directory for tracing span files"),
+        ("VOICEMODE_METRICS_FILE", "Prometheus metrics file (empty to disable)"),
+        ("VOICEMODE_METRICS_PORT", "Local HTTP port for /metrics (0 = off)"),
+        ("VOICEMODE_WARMUP", "Warm up connections and local models at server start (true/false)"),
+        ("VOICEMODE_DAEMON", "Forward CLI commands to a running voicemode daemon (true/false)"),
+        ("VOICEMODE_AUDIO_ARBITER", "Queue for audio devices across VoiceMode processes (true/false)"),
+        ("VOICEMODE_NOTIFY_HELPER_IDLE_TIMEOUT", "Seconds the notify popup helper stays alive when idle"),
+        ("VOICEMODE_DOWNLOAD_SEGMENTS", "Parallel connections per model download"),
         # API Keys
         ("OPENAI_API_KEY", "OpenAI API key for cloud TTS/STT"),
     ]
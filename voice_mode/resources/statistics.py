@@ -154,6 +154,19 @@ async def statistics_summary(format: str = "json") -> str:
         return json.dumps({"error": str(e)}, indent=2)
 
 
+@mcp.resource("voice://metrics")
+async def prometheus_metrics() -> str:
+    """
+    Voice mode metrics in the Prometheus text exposition format.
+    
+    Counters and histograms for stage latencies (TTFA, TTS, recording, STT),
+    failover attempts, playback underruns, audio device opens and cached
+    audio lookups since the server started.
+    """
+    from ..metrics import REGISTRY
+    return REGISTRY.render()
+
+
 @mcp.resource("voice://statistics/export/{timestamp}")
 async def statistics_export(timestamp: str = "latest") -> str:
     """
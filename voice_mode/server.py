@@ -1,10 +1,34 @@
 #!/usr/bin/env python
 """VoiceMode MCP Server - Modular version using FastMCP patterns."""
 
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+
 from fastmcp import FastMCP
 
+
+# Server lifespan: runs startup initialization (and with it the optional
+# warm-up and service auto-start) as soon as the server starts instead of on
+# the first converse call, so that call does not wait for models to load
+@asynccontextmanager
+async def _lifespan(server):
+    task = None
+    if "voice_mode.tools.converse" in sys.modules:
+        from .tools.converse import auto_start_mode, startup_initialization
+        if config.WARMUP_ENABLED or auto_start_mode():
+            task = asyncio.create_task(startup_initialization())
+    try:
+        yield
+    finally:
+        if task is not None:
+            task.cancel()
+            from .warmup import cancel_warmup
+            cancel_warmup()
+
+
 # Create FastMCP instance
-mcp = FastMCP("voicemode")
+mcp = FastMCP("voicemode", lifespan=_lifespan)
 
 # Import shared configuration and utilities
 from . import config
@@ -15,15 +39,17 @@ from . import tools
 from . import prompts 
 from . import resources
 
-# Main entry point
-def main():
-    """Run the VoiceMode MCP server."""
+# Everything the server does between import and mcp.run lives here so
+# `voicemode --profile-startup` can time it without starting stdio
+def initialize_server():
+    """Prepare the VoiceMode MCP server to accept requests."""
     import os
     import sys
     import warnings
     from .config import setup_logging, EVENT_LOG_ENABLED, EVENT_LOG_DIR
+    from .config import BASE_DIR, LOGS_DIR, LOG_ARCHIVE_DAYS, LOG_ARCHIVE_CODEC
     from .utils import initialize_event_logger
-    from .utils.ffmpeg_check import check_ffmpeg, check_ffprobe, get_install_instructions
+    from .utils.ffmpeg_check import probe_ffmpeg, get_install_instructions
     from pathlib import Path
     
     # Suppress known deprecation warnings from dependencies
@@ -37,10 +63,9 @@ def main():
     # MCP servers use stdio with stdin/stdout connected to pipes, not terminals
     is_mcp_mode = not sys.stdin.isatty() or not sys.stdout.isatty()
     
-    # Check FFmpeg availability
-    ffmpeg_installed, _ = check_ffmpeg()
-    ffprobe_installed, _ = check_ffprobe()
-    ffmpeg_available = ffmpeg_installed and ffprobe_installed
+    # Check FFmpeg availability (the version probe is cached per binary)
+    ffmpeg = probe_ffmpeg(cache_file=BASE_DIR / "cache" / "ffmpeg_probe.json")
+    ffmpeg_available = bool(ffmpeg["ffmpeg"] and ffmpeg["ffprobe"])
     
     if not ffmpeg_available and not is_mcp_mode:
         # Interactive mode - show error and exit
@@ -67,6 +92,7 @@ def main():
         # Store this globally so tools can check it
         config.FFMPEG_AVAILABLE = False
     else:
+        logger.debug(f"FFmpeg {ffmpeg['version'] or '(unknown version)'} found at {ffmpeg['ffmpeg']}")
         config.FFMPEG_AVAILABLE = True
     
     # Initialize event logger
@@ -79,6 +105,38 @@ def main():
     else:
         logger.info("Event logging disabled")
     
+    # Compress old logs in the background; archives are written atomically
+    # so it's safe for the thread to die with the server
+    if LOG_ARCHIVE_DAYS > 0:
+        import threading
+        from .utils.log_archive import archive_voicemode_logs
+        threading.Thread(
+            target=archive_voicemode_logs,
+            args=(LOGS_DIR / "conversations", EVENT_LOG_DIR, LOG_ARCHIVE_DAYS),
+            kwargs={"codec": LOG_ARCHIVE_CODEC},
+            name="voicemode-log-archive",
+            daemon=True,
+        ).start()
+    
+    # Export Prometheus metrics while the server runs
+    from .config import METRICS_FILE, METRICS_INTERVAL, METRICS_PORT
+    if METRICS_FILE or METRICS_PORT:
+        from .metrics import MetricsExporter
+        metrics_exporter = MetricsExporter(
+            textfile=METRICS_FILE or None,
+            interval=METRICS_INTERVAL,
+            port=METRICS_PORT,
+        )
+        metrics_exporter.start()
+        import atexit
+        atexit.register(metrics_exporter.stop)
+
+
+# Main entry point
+def main():
+    """Run the VoiceMode MCP server."""
+    initialize_server()
+    
     # Run the server
     mcp.run(transport="stdio")
 
@@ -5,17 +5,58 @@ This module provides a direct try-and-failover approach without health checks.
 Connection refused errors are instant, so there's no performance penalty.
 """
 
+import asyncio
 import logging
+import os
+import weakref
+from contextlib import nullcontext
 from typing import Optional, Tuple, Dict, Any
-from openai import AsyncOpenAI
+from .utils.lazy import lazy_import
 from .openai_error_parser import OpenAIErrorParser
 from .provider_discovery import is_local_provider
 
 from .config import TTS_BASE_URLS, STT_BASE_URLS, OPENAI_API_KEY
 from .provider_discovery import detect_provider_type
+from .metrics import FAILOVER_ATTEMPTS
+from .utils.tracing import span
+from .whisper_pool import expand_stt_endpoints, get_whisper_pool
+
+AsyncOpenAI = lazy_import("openai", "AsyncOpenAI")
 
 logger = logging.getLogger("voicemode")
 
+# Endpoint clients reused across attempts, per event loop (an httpx
+# connection pool cannot be shared between loops)
+_endpoint_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[tuple, Any]]" = weakref.WeakKeyDictionary()
+
+
+def get_endpoint_client(base_url: str, api_key: str, max_retries: int = 0):
+    """Return a pooled AsyncOpenAI client for an endpoint.
+
+    Reusing the client keeps its connections open between turns, and lets
+    the warm-up task open them before the first request.
+
+    Args:
+        base_url: Endpoint base URL
+        api_key: API key for the endpoint
+        max_retries: Retries for the client (0 for local endpoints)
+
+    Returns:
+        AsyncOpenAI client bound to the running event loop
+    """
+    loop = asyncio.get_running_loop()
+    clients = _endpoint_clients.setdefault(loop, {})
+    key = (base_url, api_key, max_retries)
+    client = clients.get(key)
+    if client is None:
+        client = clients[key] = AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=30.0,  # Reasonable timeout
+            max_retries=max_retries
+        )
+    return client
+
 
 async def simple_tts_failover(
     text: str,
@@ -75,12 +116,7 @@ async def simple_tts_failover(
 
         # Disable retries for local endpoints - they either work or don't
         max_retries = 0 if is_local_provider(base_url) else 2
-        client = AsyncOpenAI(
-            api_key=api_key,
-            base_url=base_url,
-            timeout=30.0,  # Reasonable timeout
-            max_retries=max_retries
-        )
+        client = get_endpoint_client(base_url, api_key, max_retries)
 
         # Create clients dict for text_to_speech
         openai_clients = {'tts': client}
@@ -89,15 +125,19 @@ async def simple_tts_failover(
         # Wrap in try/catch to get actual exception details
         last_exception = None
         try:
-            success, metrics = await text_to_speech(
-                text=text,
-                openai_clients=openai_clients,
-                tts_model=model,
-                tts_voice=selected_voice,
-                tts_base_url=base_url,
-                conversation_id=conversation_id,
-                **kwargs
-            )
+            with span("tts.attempt", endpoint=base_url, provider=provider_type,
+                      voice=selected_voice, model=model) as attempt:
+                success, metrics = await text_to_speech(
+                    text=text,
+                    openai_clients=openai_clients,
+                    tts_model=model,
+                    tts_voice=selected_voice,
+                    tts_base_url=base_url,
+                    conversation_id=conversation_id,
+                    **kwargs
+                )
+                attempt.set(success=success)
+            FAILOVER_ATTEMPTS.inc(service="tts", endpoint=base_url, result="success" if success else "error")
 
             if success:
                 config = {
@@ -115,6 +155,7 @@ async def simple_tts_failover(
                 last_exception = Exception("TTS request failed")
 
         except Exception as e:
+            FAILOVER_ATTEMPTS.inc(service="tts", endpoint=base_url, result="error")
             last_exception = e
 
         # Handle the error (either from exception or False return)
@@ -155,6 +196,14 @@ async def simple_tts_failover(
     return False, None, error_config
 
 
+def _audio_size(audio_file) -> Optional[int]:
+    try:
+        return os.fstat(audio_file.fileno()).st_size
+    except (AttributeError, OSError, ValueError):
+        getbuffer = getattr(audio_file, "getbuffer", None)
+        return len(getbuffer()) if getbuffer else None
+
+
 async def simple_stt_failover(
     audio_file,
     model: str = "whisper-1",
@@ -163,6 +212,9 @@ async def simple_stt_failover(
     """
     Simple STT failover - try each endpoint in order until one works.
 
+    With a Whisper pool (VOICEMODE_WHISPER_INSTANCES > 1) the local Whisper
+    endpoint stands for all instances, least busy first.
+
     Returns:
         Dict with transcription result or error information:
         - Success: {"text": "...", "provider": "...", "endpoint": "..."}
@@ -173,12 +225,16 @@ async def simple_stt_failover(
     successful_but_empty = False
     successful_provider = None
 
+    endpoints = expand_stt_endpoints(STT_BASE_URLS)
+    pool = get_whisper_pool()
+    audio_size = _audio_size(audio_file) if pool else None
+
     # Log STT request details
     logger.info("STT: Starting speech-to-text conversion")
-    logger.info(f"  Available endpoints: {STT_BASE_URLS}")
+    logger.info(f"  Available endpoints: {endpoints}")
 
     # Try each STT endpoint in order
-    for i, base_url in enumerate(STT_BASE_URLS):
+    for i, base_url in enumerate(endpoints):
         try:
             # Detect provider type for logging
             provider_type = detect_provider_type(base_url)
@@ -193,21 +249,20 @@ async def simple_stt_failover(
 
             # Disable retries for local endpoints - they either work or don't
             max_retries = 0 if is_local_provider(base_url) else 2
-            client = AsyncOpenAI(
-                api_key=api_key,
-                base_url=base_url,
-                timeout=30.0,
-                max_retries=max_retries
-            )
+            client = get_endpoint_client(base_url, api_key, max_retries)
 
             # Try STT with this endpoint
-            transcription = await client.audio.transcriptions.create(
-                model=model,
-                file=audio_file,
-                response_format="text"
-            )
-
-            text = transcription.strip() if isinstance(transcription, str) else transcription.text.strip()
+            tracking = pool.track(base_url, audio_size) if pool else nullcontext()
+            with span("stt.attempt", endpoint=base_url, provider=provider_type, model=model) as attempt, tracking:
+                transcription = await client.audio.transcriptions.create(
+                    model=model,
+                    file=audio_file,
+                    response_format="text"
+                )
+
+                text = transcription.strip() if isinstance(transcription, str) else transcription.text.strip()
+                attempt.set(chars=len(text))
+            FAILOVER_ATTEMPTS.inc(service="stt", endpoint=base_url, result="success" if text else "empty")
 
             if text:
                 logger.info(f"✓ STT succeeded with {provider_type} at {base_url}")
@@ -221,6 +276,7 @@ async def simple_stt_failover(
                 successful_provider = provider_type
 
         except Exception as e:
+            FAILOVER_ATTEMPTS.inc(service="stt", endpoint=base_url, result="error")
             error_str = str(e)
             provider_type = detect_provider_type(base_url)
 
@@ -245,7 +301,7 @@ async def simple_stt_failover(
             })
 
             # Log failure with appropriate level based on whether we have fallbacks
-            if i < len(STT_BASE_URLS) - 1:
+            if i < len(endpoints) - 1:
                 logger.warning(f"STT failed for {base_url} ({provider_type}): {e}")
                 logger.info("  Will try next endpoint...")
             else:
@@ -261,7 +317,7 @@ async def simple_stt_failover(
         return {"error_type": "no_speech", "provider": successful_provider}
     elif connection_errors:
         # All endpoints failed with connection/auth errors
-        logger.error(f"✗ All STT endpoints failed after {len(STT_BASE_URLS)} attempts")
+        logger.error(f"✗ All STT endpoints failed after {len(endpoints)} attempts")
         return {"error_type": "connection_failed", "attempted_endpoints": connection_errors}
     else:
         # Should not reach here, but handle it gracefully
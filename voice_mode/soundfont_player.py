@@ -0,0 +1,279 @@
+"""Resident sound-font player for Claude Code hook events.
+
+Hook sounds used to cost a filesystem walk to find the clip and an
+``ffplay`` process that decoded it again on every event, so bursts of
+PreToolUse/PostToolUse events lagged and piled up. ``SoundFontPlayer`` is
+meant to live in a long-running process (``voicemode daemon``):
+
+* ``SoundFontIndex`` lists the active sound font once and answers lookups
+  from memory, rebuilding only when a file or directory in the tree (or the
+  ``current`` symlink) changes.
+* Clips are decoded once to float32 PCM at the stream's rate and cached.
+* Everything plays through a single open output stream whose callback mixes
+  the active voices. At most ``max_voices`` play at once (the oldest is
+  dropped to make room) and re-triggering a clip that is still playing
+  restarts it instead of stacking another copy.
+"""
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from .hook_receiver import AUDIO_EXTENSIONS, sound_file_candidates
+from .metrics import DEVICE_OPENS
+from .utils.file_watch import FileWatcher
+from .utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+sd = lazy_import("sounddevice")
+AudioSegment = lazy_import("pydub", "AudioSegment")
+
+logger = logging.getLogger("voicemode")
+
+
+def default_soundfont_root() -> Path:
+    """The active sound font (``~/.voicemode/soundfonts/current``)."""
+    return Path.home() / ".voicemode" / "soundfonts" / "current"
+
+
+class SoundFontIndex:
+    """In-memory listing of a sound font tree.
+
+    Args:
+        root: Sound font directory (default: the active sound font)
+    """
+
+    def __init__(self, root: Optional[Union[str, Path]] = None):
+        self.root = Path(root) if root is not None else default_soundfont_root()
+        self.files: Dict[str, Path] = {}
+        self.generation = 0
+        self._watcher: Optional[FileWatcher] = None
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """List every audio file under the root."""
+        files: Dict[str, Path] = {}
+        # The parent shows the ``current`` symlink being pointed elsewhere
+        watched = [self.root.parent, self.root]
+        base = self.root.resolve() if self.root.exists() else self.root
+        if base.is_dir():
+            for path in sorted(base.rglob("*")):
+                if path.is_dir():
+                    watched.append(path)
+                elif path.suffix.lower() in AUDIO_EXTENSIONS:
+                    files[path.relative_to(base).as_posix()] = path
+                    watched.append(path)
+        self.files = files
+        self.generation += 1
+        if self._watcher is None:
+            self._watcher = FileWatcher(watched)
+        else:
+            self._watcher.watch(watched)
+
+    def refresh_if_changed(self) -> bool:
+        """Rebuild the index if the tree changed since it was built."""
+        if not self._watcher.changed():
+            return False
+        logger.info(f"Sound font changed, re-indexing {self.root}")
+        self.rebuild()
+        return True
+
+    def find(self, event: str, tool: str, subagent: Optional[str] = None) -> Optional[Path]:
+        """Sound file for a hook event, or None if the font has none."""
+        self.refresh_if_changed()
+        for candidate in sound_file_candidates(event, tool, subagent):
+            path = self.files.get(candidate)
+            if path is not None:
+                return path
+        return None
+
+
+class _Voice:
+    __slots__ = ("key", "samples", "position", "gain")
+
+    def __init__(self, key: str, samples, gain: float):
+        self.key = key
+        self.samples = samples
+        self.position = 0
+        self.gain = gain
+
+
+class SoundFontPlayer:
+    """Mix sound-font clips into one long-lived output stream.
+
+    Args:
+        root: Sound font directory (default: the active sound font)
+        sample_rate: Output stream rate; clips are resampled to it when decoded
+        channels: Output channels
+        max_voices: Clips that may sound at once
+        blocksize: Frames per stream callback
+    """
+
+    def __init__(
+        self,
+        root: Optional[Union[str, Path]] = None,
+        sample_rate: int = 44100,
+        channels: int = 2,
+        max_voices: int = 4,
+        blocksize: int = 512,
+    ):
+        self.index = SoundFontIndex(root)
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.max_voices = max_voices
+        self.blocksize = blocksize
+        self._clips: Dict[Path, "np.ndarray"] = {}
+        self._clips_generation = self.index.generation
+        self._clip_lock = threading.Lock()
+        self._voices: List[_Voice] = []
+        self._voice_lock = threading.Lock()
+        self._stream = None
+
+    # ---- decoding ----
+
+    def clip(self, path: Union[str, Path]) -> "np.ndarray":
+        """Decoded samples for ``path`` (frames x channels float32), cached."""
+        if self._clips_generation != self.index.generation:
+            # The font was edited since these were decoded
+            with self._clip_lock:
+                self._clips.clear()
+                self._clips_generation = self.index.generation
+        key = Path(path).resolve()
+        cached = self._clips.get(key)
+        if cached is not None:
+            return cached
+        with self._clip_lock:
+            cached = self._clips.get(key)
+            if cached is None:
+                cached = self._decode(key)
+                self._clips[key] = cached
+        return cached
+
+    def _decode(self, path: Path) -> "np.ndarray":
+        start = time.perf_counter()
+        audio = (
+            AudioSegment.from_file(str(path))
+            .set_frame_rate(self.sample_rate)
+            .set_channels(self.channels)
+            .set_sample_width(2)
+        )
+        samples = np.frombuffer(audio.raw_data, dtype=np.int16).astype(np.float32) / 32768.0
+        samples = samples.reshape(-1, self.channels)
+        samples.flags.writeable = False
+        logger.debug(f"Decoded {path.name} ({len(samples)} frames) in {(time.perf_counter() - start) * 1000:.0f}ms")
+        return samples
+
+    def preload(self) -> int:
+        """Decode every clip in the active sound font; returns the number cached."""
+        self.index.refresh_if_changed()
+        loaded = 0
+        for path in self.index.files.values():
+            try:
+                self.clip(path)
+                loaded += 1
+            except Exception as e:
+                logger.warning(f"Could not decode sound font clip {path}: {e}")
+        return loaded
+
+    # ---- playback ----
+
+    def _callback(self, outdata, frames, time_info, status):
+        outdata.fill(0)
+        with self._voice_lock:
+            voices = list(self._voices)
+        finished = []
+        for voice in voices:
+            chunk = voice.samples[voice.position:voice.position + frames]
+            outdata[:len(chunk)] += chunk * voice.gain if voice.gain != 1.0 else chunk
+            voice.position += frames
+            if voice.position >= len(voice.samples):
+                finished.append(voice)
+        if voices:
+            np.clip(outdata, -1.0, 1.0, out=outdata)
+        if finished:
+            with self._voice_lock:
+                self._voices = [v for v in self._voices if v not in finished]
+
+    def _ensure_stream(self) -> None:
+        if self._stream is not None:
+            if self._stream.active:
+                return
+            self._stream.close()  # stopped after a device error; reopen
+        self._stream = sd.OutputStream(
+            samplerate=self.sample_rate,
+            channels=self.channels,
+            dtype="float32",
+            blocksize=self.blocksize,
+            callback=self._callback,
+        )
+        self._stream.start()
+        DEVICE_OPENS.inc(direction="output")
+
+    def play(self, path: Union[str, Path], volume: float = 1.0) -> bool:
+        """Start playing a clip; returns False if it could not be decoded or played."""
+        try:
+            samples = self.clip(path)
+        except Exception as e:
+            logger.warning(f"Could not decode {path}: {e}")
+            return False
+        voice = _Voice(str(Path(path).resolve()), samples, max(0.0, min(2.0, volume)))
+        with self._voice_lock:
+            # Re-triggering a clip restarts it; beyond max_voices the oldest is dropped
+            voices = [v for v in self._voices if v.key != voice.key]
+            voices.append(voice)
+            self._voices = voices[-self.max_voices:]
+        try:
+            self._ensure_stream()
+        except Exception as e:
+            logger.warning(f"Could not open output stream for sound fonts: {e}")
+            with self._voice_lock:
+                self._voices = [v for v in self._voices if v is not voice]
+            return False
+        return True
+
+    def play_event(self, event: str, tool: str, subagent: Optional[str] = None) -> Optional[Path]:
+        """Play the clip for a hook event; returns its path, or None if nothing played."""
+        path = self.index.find(event, tool, subagent)
+        if path is None or not self.play(path):
+            return None
+        return path
+
+    @property
+    def active_voices(self) -> int:
+        return len(self._voices)
+
+    def close(self) -> None:
+        """Stop all voices and close the output stream."""
+        with self._voice_lock:
+            self._voices = []
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            try:
+                stream.stop()
+                stream.close()
+            except Exception as e:
+                logger.debug(f"Error closing sound font stream: {e}")
+
+
+_player: Optional[SoundFontPlayer] = None
+_player_lock = threading.Lock()
+
+
+def get_soundfont_player() -> SoundFontPlayer:
+    """The process-wide player for the active sound font."""
+    global _player
+    with _player_lock:
+        if _player is None:
+            _player = SoundFontPlayer()
+        return _player
+
+
+def close_soundfont_player() -> None:
+    """Close the process-wide player, if one was created."""
+    global _player
+    with _player_lock:
+        player, _player = _player, None
+    if player is not None:
+        player.close()
@@ -5,17 +5,28 @@ This module provides real-time tracking of voice conversation performance metric
 including turnaround times, processing speeds, and session statistics.
 """
 
-import time
+import itertools
 import json
+import math
+import os
 import threading
-from typing import Dict, List, Optional, Any
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Optional, Union
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
-from statistics import mean, median
 from pathlib import Path
 
 import logging
 
+try:
+    import fcntl
+except ImportError:  # Windows: only the in-process lock applies
+    fcntl = None
+
+from voice_mode.timings import TimingStage, parse_legacy_timing
+
 logger = logging.getLogger("voicemode")
 
 
@@ -52,6 +63,8 @@ class SessionStatistics:
     avg_ttfa: Optional[float] = None
     min_ttfa: Optional[float] = None
     max_ttfa: Optional[float] = None
+    p50_ttfa: Optional[float] = None
+    p90_ttfa: Optional[float] = None
     
     avg_tts_generation: Optional[float] = None
     min_tts_generation: Optional[float] = None
@@ -68,6 +81,8 @@ class SessionStatistics:
     avg_total_time: Optional[float] = None
     min_total_time: Optional[float] = None
     max_total_time: Optional[float] = None
+    p50_total_time: Optional[float] = None
+    p90_total_time: Optional[float] = None
     
     # Provider usage counts
     voice_providers_used: Dict[str, int] = None
@@ -89,68 +104,374 @@ class SessionStatistics:
             self.models_used = {}
 
 
-class ConversationStatistics:
-    """Thread-safe conversation statistics tracker."""
+class QuantileSketch:
+    """Streaming quantile estimate with bounded relative error.
+
+    Positive values are counted in logarithmic bins (a DDSketch-style
+    layout), so inserts are O(1), memory depends only on the value range and
+    any quantile is within ``relative_accuracy`` of the true value.
+    """
+    
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.count = 0
+        self.zeros = 0
+        self.bins: Dict[int, int] = {}
+    
+    def add(self, value: float) -> None:
+        self.count += 1
+        if value <= 0:
+            self.zeros += 1
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self.bins[index] = self.bins.get(index, 0) + 1
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the q-quantile (0..1), or None if nothing was added."""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            if rank < seen:
+                # Midpoint of the bin (gamma^(i-1), gamma^i] in relative terms
+                return 2 * self._gamma ** index / (1 + self._gamma)
+        return 2 * self._gamma ** max(self.bins) / (1 + self._gamma)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "count": self.count,
+            "zeros": self.zeros,
+            "bins": {str(k): v for k, v in self.bins.items()},
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'QuantileSketch':
+        sketch = cls(data.get("relative_accuracy", 0.01))
+        sketch.count = data.get("count", 0)
+        sketch.zeros = data.get("zeros", 0)
+        sketch.bins = {int(k): v for k, v in data.get("bins", {}).items()}
+        return sketch
+
+
+class RunningStat:
+    """Count, sum, min, max and quantile sketch of one timing, updated per value."""
+    
+    __slots__ = ("count", "total", "min", "max", "sketch")
     
     def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.sketch = QuantileSketch()
+    
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        self.sketch.add(value)
+    
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "sketch": self.sketch.to_dict(),
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RunningStat':
+        stat = cls()
+        stat.count = data.get("count", 0)
+        stat.total = data.get("total", 0.0)
+        stat.min = data.get("min")
+        stat.max = data.get("max")
+        if "sketch" in data:
+            stat.sketch = QuantileSketch.from_dict(data["sketch"])
+        return stat
+
+
+# ConversationMetric attributes aggregated over successful interactions
+TIMING_FIELDS = ("ttfa", "tts_generation", "tts_playback", "stt_processing", "total_time")
+
+# ConversationMetric attribute -> usage counter name
+USAGE_FIELDS = {
+    "voice_provider": "voice_providers",
+    "transport": "transports",
+    "voice_name": "voices",
+    "model": "models",
+}
+
+
+class ConversationStatistics:
+    """Thread-safe conversation statistics tracker.
+    
+    Aggregates (counts, sums, min/max, quantile sketches and usage counters)
+    are updated as each interaction is added, so reading statistics costs
+    the same regardless of history length. Only the most recent
+    ``max_metrics`` interactions are kept individually.
+    
+    With a ``snapshot_path`` every interaction is appended to that JSONL
+    file, and the file is periodically compacted into a single snapshot
+    line, so statistics survive server restarts. Several processes can
+    share the file: appends and compaction happen under a file lock after
+    replaying what the other processes appended.
+    
+    Args:
+        snapshot_path: Append-only statistics file (None keeps stats in memory)
+        max_metrics: Number of recent interactions kept in full
+        compact_after: Appended interactions before the file is compacted
+    """
+    
+    def __init__(self,
+                 snapshot_path: Optional[Union[str, Path]] = None,
+                 max_metrics: int = 1000,
+                 compact_after: int = 1000):
         self._lock = threading.Lock()
-        self._metrics: List[ConversationMetric] = []
-        self._session_start = time.time()
-        self._max_metrics = 1000  # Keep last 1000 interactions
+        self._max_metrics = max_metrics  # Keep last 1000 interactions
+        self._snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self._compact_after = compact_after
+        self._loaded = self._snapshot_path is None
+        # Position in the statistics file replayed so far (see _sync)
+        self._inode: Optional[int] = None
+        self._offset = 0
+        self._reset_state(time.time())
+    
+    def _reset_state(self, session_start: float) -> None:
+        self._session_start = session_start
+        self._metrics: Deque[ConversationMetric] = deque(maxlen=self._max_metrics)
+        self._total = 0
+        self._successful = 0
+        self._timings = {name: RunningStat() for name in TIMING_FIELDS}
+        self._usage: Dict[str, Dict[str, int]] = {name: {} for name in USAGE_FIELDS.values()}
+        self._appended = 0
+    
+    def _update_aggregates(self, metric: ConversationMetric) -> None:
+        self._metrics.append(metric)
+        self._total += 1
+        if metric.success:
+            self._successful += 1
+            for name, stat in self._timings.items():
+                value = getattr(metric, name)
+                if value is not None:
+                    stat.add(value)
+        for attr, counter_name in USAGE_FIELDS.items():
+            value = getattr(metric, attr)
+            if value:
+                counts = self._usage[counter_name]
+                counts[value] = counts.get(value, 0) + 1
+    
+    # ---- persistence ----
+    
+    def _snapshot_record(self) -> Dict[str, Any]:
+        return {
+            "type": "snapshot",
+            "session_start": self._session_start,
+            "total": self._total,
+            "successful": self._successful,
+            "timings": {name: stat.to_dict() for name, stat in self._timings.items()},
+            "usage": self._usage,
+            "recent": [asdict(m) for m in self._metrics],
+        }
+    
+    def _restore_snapshot(self, record: Dict[str, Any]) -> None:
+        self._reset_state(record.get("session_start", time.time()))
+        self._total = record.get("total", 0)
+        self._successful = record.get("successful", 0)
+        for name, data in record.get("timings", {}).items():
+            if name in self._timings:
+                self._timings[name] = RunningStat.from_dict(data)
+        for name, counts in record.get("usage", {}).items():
+            if name in self._usage:
+                self._usage[name] = dict(counts)
+        fields = ConversationMetric.__dataclass_fields__
+        for data in record.get("recent", []):
+            self._metrics.append(ConversationMetric(**{k: v for k, v in data.items() if k in fields}))
+    
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Exclusive lock shared by every process using the statistics file.
+        
+        The lock lives in a sidecar file because compaction replaces the
+        statistics file itself. Caller holds the thread lock.
+        """
+        if fcntl is None:
+            yield
+            return
+        path = self._snapshot_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path.with_name(path.name + ".lock"), "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    
+    def _sync(self) -> None:
+        """Catch up with lines other processes wrote since the last sync.
         
+        If another process compacted the file (a new inode), the new file
+        already holds everything and is replayed from the start. Caller
+        holds the file lock.
+        """
+        path = self._snapshot_path
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            self._reset_state(self._session_start)
+            self._inode, self._offset = stat.st_ino, 0
+        if stat.st_size == self._offset:
+            return
+        fields = ConversationMetric.__dataclass_fields__
+        with open(path, "rb") as f:
+            f.seek(self._offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Still being written (or torn by a crash); read it next time
+                    break
+                self._offset += len(line)
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if record.get("type") == "snapshot":
+                    self._restore_snapshot(record)
+                elif record.get("type") == "metric":
+                    data = {k: v for k, v in record.items() if k in fields}
+                    self._update_aggregates(ConversationMetric(**data))
+                    self._appended += 1
+    
+    def _ensure_loaded(self) -> None:
+        """Replay new lines of the statistics file. Caller holds the lock.
+        
+        The file is shared by every VoiceMode process, so this runs on each
+        access, not just the first; it only reads what was appended since.
+        """
+        if self._snapshot_path is None:
+            return
+        path = self._snapshot_path
+        try:
+            with self._file_lock():
+                self._sync()
+        except (OSError, TypeError) as e:
+            logger.warning(f"Could not load statistics from {path}: {e}")
+            if not self._loaded:
+                self._reset_state(time.time())
+        else:
+            if not self._loaded:
+                logger.debug(f"Loaded {self._total} interactions from {path}")
+        self._loaded = True
+    
+    def _append(self, metric: ConversationMetric) -> None:
+        """Count and persist one interaction, compacting the file when due. Caller holds the lock."""
+        if self._snapshot_path is None:
+            return
+        counted = False
+        try:
+            with self._file_lock():
+                # Fold in other processes' lines first, so neither the append
+                # offset nor a compaction loses them
+                self._sync()
+                self._update_aggregates(metric)
+                counted = True
+                # A new file starts with a snapshot so the session start survives;
+                # the snapshot already includes this metric
+                if self._appended >= self._compact_after or not self._snapshot_path.exists():
+                    self._write_snapshot()
+                else:
+                    with open(self._snapshot_path, "ab") as f:
+                        # Unread bytes under the lock are a line torn by a crash;
+                        # end it so this record starts on a line of its own
+                        if f.tell() > self._offset:
+                            f.write(b"\n")
+                        f.write((json.dumps({"type": "metric", **asdict(metric)}) + "\n").encode("utf-8"))
+                        self._offset = f.tell()
+                    self._appended += 1
+        except OSError as e:
+            logger.warning(f"Could not persist statistics to {self._snapshot_path}: {e}")
+            if not counted:
+                self._update_aggregates(metric)
+    
+    def _write_snapshot(self) -> None:
+        """Replace the file with one snapshot line (atomic). Caller holds the file lock."""
+        path = self._snapshot_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        data = (json.dumps(self._snapshot_record()) + "\n").encode("utf-8")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self._inode, self._offset = path.stat().st_ino, len(data)
+        self._appended = 0
+    
+    # ---- public API ----
+    
     def add_metric(self, metric: ConversationMetric) -> None:
         """Add a new conversation metric."""
         with self._lock:
-            self._metrics.append(metric)
-            
-            # Keep only the most recent metrics to prevent memory bloat
-            if len(self._metrics) > self._max_metrics:
-                self._metrics = self._metrics[-self._max_metrics:]
+            if self._snapshot_path is None:
+                # The deque drops the oldest metric once full
+                self._update_aggregates(metric)
+                return
+            self._loaded = True
+            self._append(metric)
                 
     def parse_timing_string(self, timing_str: str) -> Dict[str, float]:
-        """Parse timing string from conversation tools response."""
-        timings = {}
-        if not timing_str:
-            return timings
-            
-        # Example: "ttfa 0.5s, tts_gen 1.2s, tts_play 2.1s, tts_total 3.3s, record 15.0s, stt 0.8s, total 19.1s"
-        parts = timing_str.split(", ")
-        for part in parts:
-            if " " in part:
-                key, value = part.split(" ", 1)
-                if value.endswith("s"):
-                    try:
-                        timings[key] = float(value[:-1])
-                    except ValueError:
-                        continue
-        return timings
+        """Parse a legacy timing string into stage seconds.
+        
+        Example: "ttfa 0.5s, gen 1.2s, play 2.1s, record 15.0s, stt 0.8s, total 19.1s"
+        """
+        return {stage: ms / 1000.0 for stage, ms in parse_legacy_timing(timing_str).items()}
         
     def add_conversation_result(self, 
                               message: str, 
                               response: str,
                               timing_str: Optional[str] = None,
+                              timings: Optional[Dict[str, float]] = None,
                               transport: Optional[str] = None,
                               voice_provider: Optional[str] = None,
                               voice_name: Optional[str] = None,
                               model: Optional[str] = None,
                               success: bool = True,
                               error_message: Optional[str] = None) -> None:
-        """Add a conversation result with parsed timing data."""
+        """Add a conversation result.
+        
+        Args:
+            timings: Stage seconds keyed by TimingStage value; preferred over
+                the legacy ``timing_str``, which is only parsed when absent
+        """
         
-        # Parse timing information
-        timings = self.parse_timing_string(timing_str) if timing_str else {}
+        if timings is None:
+            timings = self.parse_timing_string(timing_str) if timing_str else {}
         
         metric = ConversationMetric(
             timestamp=time.time(),
             message=message[:100] + "..." if len(message) > 100 else message,
             response=response[:200] + "..." if len(response) > 200 else response,
-            ttfa=timings.get('ttfa'),
-            tts_generation=timings.get('tts_gen'),
-            tts_playback=timings.get('tts_play'),
-            tts_total=timings.get('tts_total'),
-            stt_processing=timings.get('stt'),
-            recording_duration=timings.get('record'),
-            total_time=timings.get('total'),
+            ttfa=timings.get(TimingStage.TTFA.value),
+            tts_generation=timings.get(TimingStage.TTS_GEN.value),
+            tts_playback=timings.get(TimingStage.TTS_PLAY.value),
+            tts_total=timings.get(TimingStage.TTS_TOTAL.value),
+            stt_processing=timings.get(TimingStage.STT.value),
+            recording_duration=timings.get(TimingStage.RECORD.value),
+            total_time=timings.get(TimingStage.TOTAL.value),
             transport=transport,
             voice_provider=voice_provider,
             voice_name=voice_name,
@@ -162,107 +483,94 @@ class ConversationStatistics:
         self.add_metric(metric)
         
     def get_session_statistics(self) -> SessionStatistics:
-        """Calculate current session statistics."""
+        """Return current session statistics from the running aggregates."""
         with self._lock:
-            if not self._metrics:
-                return SessionStatistics(start_time=self._session_start)
-                
-            successful_metrics = [m for m in self._metrics if m.success]
+            self._ensure_loaded()
+            return self._session_statistics()
+    
+    def _session_statistics(self) -> SessionStatistics:
+        if not self._total:
+            return SessionStatistics(start_time=self._session_start)
+        
+        ttfa = self._timings["ttfa"]
+        tts_gen = self._timings["tts_generation"]
+        tts_play = self._timings["tts_playback"]
+        stt = self._timings["stt_processing"]
+        total = self._timings["total_time"]
+        
+        return SessionStatistics(
+            start_time=self._session_start,
+            total_interactions=self._total,
+            successful_interactions=self._successful,
+            failed_interactions=self._total - self._successful,
             
-            def safe_stat(values: List[float], stat_func):
-                """Safely calculate statistics, handling empty lists."""
-                if not values:
-                    return None
-                return stat_func(values)
+            # TTFA statistics
+            avg_ttfa=ttfa.mean,
+            min_ttfa=ttfa.min,
+            max_ttfa=ttfa.max,
+            p50_ttfa=ttfa.sketch.quantile(0.5),
+            p90_ttfa=ttfa.sketch.quantile(0.9),
             
-            def safe_values(metrics: List[ConversationMetric], attr: str) -> List[float]:
-                """Extract non-None values for an attribute."""
-                return [getattr(m, attr) for m in metrics if getattr(m, attr) is not None]
+            # TTS generation statistics
+            avg_tts_generation=tts_gen.mean,
+            min_tts_generation=tts_gen.min,
+            max_tts_generation=tts_gen.max,
             
-            # Calculate timing statistics from successful interactions
-            ttfa_values = safe_values(successful_metrics, 'ttfa')
-            tts_gen_values = safe_values(successful_metrics, 'tts_generation')
-            tts_play_values = safe_values(successful_metrics, 'tts_playback')
-            stt_values = safe_values(successful_metrics, 'stt_processing')
-            total_values = safe_values(successful_metrics, 'total_time')
+            # TTS playback statistics
+            avg_tts_playback=tts_play.mean,
+            min_tts_playback=tts_play.min,
+            max_tts_playback=tts_play.max,
             
-            # Count provider usage
-            voice_providers = {}
-            transports = {}
-            voices = {}
-            models = {}
+            # STT statistics
+            avg_stt_processing=stt.mean,
+            min_stt_processing=stt.min,
+            max_stt_processing=stt.max,
             
-            for metric in self._metrics:
-                if metric.voice_provider:
-                    voice_providers[metric.voice_provider] = voice_providers.get(metric.voice_provider, 0) + 1
-                if metric.transport:
-                    transports[metric.transport] = transports.get(metric.transport, 0) + 1
-                if metric.voice_name:
-                    voices[metric.voice_name] = voices.get(metric.voice_name, 0) + 1
-                if metric.model:
-                    models[metric.model] = models.get(metric.model, 0) + 1
+            # Total time statistics
+            avg_total_time=total.mean,
+            min_total_time=total.min,
+            max_total_time=total.max,
+            p50_total_time=total.sketch.quantile(0.5),
+            p90_total_time=total.sketch.quantile(0.9),
             
-            stats = SessionStatistics(
-                start_time=self._session_start,
-                total_interactions=len(self._metrics),
-                successful_interactions=len(successful_metrics),
-                failed_interactions=len(self._metrics) - len(successful_metrics),
-                
-                # TTFA statistics
-                avg_ttfa=safe_stat(ttfa_values, mean),
-                min_ttfa=safe_stat(ttfa_values, min),
-                max_ttfa=safe_stat(ttfa_values, max),
-                
-                # TTS generation statistics
-                avg_tts_generation=safe_stat(tts_gen_values, mean),
-                min_tts_generation=safe_stat(tts_gen_values, min),
-                max_tts_generation=safe_stat(tts_gen_values, max),
-                
-                # TTS playback statistics
-                avg_tts_playback=safe_stat(tts_play_values, mean),
-                min_tts_playback=safe_stat(tts_play_values, min),
-                max_tts_playback=safe_stat(tts_play_values, max),
-                
-                # STT statistics
-                avg_stt_processing=safe_stat(stt_values, mean),
-                min_stt_processing=safe_stat(stt_values, min),
-                max_stt_processing=safe_stat(stt_values, max),
-                
-                # Total time statistics
-                avg_total_time=safe_stat(total_values, mean),
-                min_total_time=safe_stat(total_values, min),
-                max_total_time=safe_stat(total_values, max),
-                
-                # Provider usage
-                voice_providers_used=voice_providers,
-                transports_used=transports,
-                voices_used=voices,
-                models_used=models,
-                
-                # Session duration
-                session_duration=time.time() - self._session_start
-            )
+            # Provider usage
+            voice_providers_used=dict(self._usage["voice_providers"]),
+            transports_used=dict(self._usage["transports"]),
+            voices_used=dict(self._usage["voices"]),
+            models_used=dict(self._usage["models"]),
             
-            return stats
+            # Session duration
+            session_duration=time.time() - self._session_start
+        )
     
     def get_recent_metrics(self, limit: int = 10) -> List[ConversationMetric]:
         """Get the most recent conversation metrics."""
         with self._lock:
-            return self._metrics[-limit:] if self._metrics else []
+            self._ensure_loaded()
+            if limit <= 0:
+                return []
+            return list(itertools.islice(reversed(self._metrics), limit))[::-1]
     
     def clear_statistics(self) -> None:
         """Clear all statistics and restart the session."""
         with self._lock:
-            self._metrics.clear()
-            self._session_start = time.time()
+            self._loaded = True
+            self._reset_state(time.time())
+            if self._snapshot_path is not None:
+                try:
+                    with self._file_lock():
+                        self._write_snapshot()
+                except OSError as e:
+                    logger.warning(f"Could not reset statistics file {self._snapshot_path}: {e}")
     
     def export_metrics(self) -> Dict[str, Any]:
         """Export all metrics and statistics as a dictionary."""
         with self._lock:
+            self._ensure_loaded()
             return {
                 'session_start': self._session_start,
                 'metrics': [asdict(m) for m in self._metrics],
-                'statistics': asdict(self.get_session_statistics())
+                'statistics': asdict(self._session_statistics())
             }
     
     def format_dashboard(self) -> str:
@@ -309,6 +617,11 @@ class ConversationStatistics:
             
             if stats.avg_total_time is not None:
                 lines.append(format_stat("Total Turnaround:", stats.avg_total_time, stats.min_total_time, stats.max_total_time))
+            
+            if stats.p50_ttfa is not None:
+                lines.append(f"{'TTFA p50 / p90:':20} {stats.p50_ttfa:6.2f}s / {stats.p90_ttfa:.2f}s")
+            if stats.p50_total_time is not None:
+                lines.append(f"{'Turnaround p50 / p90:':20} {stats.p50_total_time:6.2f}s / {stats.p90_total_time:.2f}s")
         
         # Provider usage
         if any([stats.voice_providers_used, stats.transports_used, stats.voices_used]):
@@ -332,7 +645,7 @@ class ConversationStatistics:
         
         # Recent interactions
         if recent:
-            lines.append(f"\n📝 RECENT INTERACTIONS ({len(recent)} of {len(self._metrics)})")
+            lines.append(f"\n📝 RECENT INTERACTIONS ({len(recent)} of {stats.total_interactions})")
             lines.append("-" * 30)
             
             for i, metric in enumerate(reversed(recent), 1):
@@ -345,18 +658,26 @@ class ConversationStatistics:
         return "\n".join(lines)
 
 
-# Global statistics tracker instance
-_statistics_tracker = ConversationStatistics()
+# Global statistics tracker instance, created on first use
+_statistics_tracker: Optional[ConversationStatistics] = None
+_tracker_lock = threading.Lock()
 
 
 def get_statistics_tracker() -> ConversationStatistics:
     """Get the global statistics tracker instance."""
+    global _statistics_tracker
+    if _statistics_tracker is None:
+        with _tracker_lock:
+            if _statistics_tracker is None:
+                from voice_mode.config import STATISTICS_FILE
+                _statistics_tracker = ConversationStatistics(snapshot_path=STATISTICS_FILE or None)
     return _statistics_tracker
 
 
 def track_conversation(message: str, 
                       response: str,
                       timing_str: Optional[str] = None,
+                      timings: Optional[Dict[str, float]] = None,
                       transport: Optional[str] = None,
                       voice_provider: Optional[str] = None,
                       voice_name: Optional[str] = None,
@@ -368,10 +689,11 @@ def track_conversation(message: str,
     
     This should be called from the conversation tools after each interaction.
     """
-    _statistics_tracker.add_conversation_result(
+    get_statistics_tracker().add_conversation_result(
         message=message,
         response=response,
         timing_str=timing_str,
+        timings=timings,
         transport=transport,
         voice_provider=voice_provider,
         voice_name=voice_name,
@@ -4,14 +4,17 @@ This module contains tracking functions that can be imported by tools
 without causing the statistics tools themselves to be loaded.
 """
 
-from typing import Optional
+from typing import Dict, Optional
 from .statistics import track_conversation
 from .config import logger
+from .metrics import INTERACTIONS, observe_timings
+from .timings import parse_legacy_timing
 
 
 def track_voice_interaction(message: str, 
                            response: str,
                            timing_str: Optional[str] = None,
+                           timings: Optional[Dict[str, float]] = None,
                            transport: Optional[str] = None,
                            voice_provider: Optional[str] = None,
                            voice_name: Optional[str] = None,
@@ -22,12 +25,15 @@ def track_voice_interaction(message: str,
     Track a voice interaction for statistics.
     
     This function should be called from conversation tools to record metrics.
+    ``timings`` maps TimingStage values to seconds; ``timing_str`` is the
+    legacy formatted form and is only parsed when ``timings`` is not given.
     """
     try:
         track_conversation(
             message=message,
             response=response,
             timing_str=timing_str,
+            timings=timings,
             transport=transport,
             voice_provider=voice_provider,
             voice_name=voice_name,
@@ -36,6 +42,11 @@ def track_voice_interaction(message: str,
             error_message=error_message
         )
         logger.debug(f"Tracked voice interaction: {len(message)} chars, success={success}")
+
+        INTERACTIONS.inc(transport=transport or "unknown", success=str(bool(success)).lower())
+        if timings is None and timing_str:
+            timings = {stage: ms / 1000.0 for stage, ms in parse_legacy_timing(timing_str).items()}
+        observe_timings(timings)
         
     except Exception as e:
         logger.error(f"Error tracking voice interaction: {e}")
@@ -14,10 +14,6 @@ import threading
 from typing import Optional, Tuple, AsyncIterator
 from dataclasses import dataclass
 from pathlib import Path
-import numpy as np
-
-import sounddevice as sd
-from pydub import AudioSegment
 
 from .config import (
     STREAM_CHUNK_SIZE,
@@ -27,6 +23,12 @@ from .config import (
     logger
 )
 from .utils import get_event_logger
+from .utils.lazy import lazy_import
+from .metrics import DEVICE_OPENS, PLAYBACK_UNDERRUNS
+
+np = lazy_import("numpy")
+sd = lazy_import("sounddevice")
+AudioSegment = lazy_import("pydub", "AudioSegment")
 
 # Opus decoder support (optional)
 try:
@@ -97,6 +99,7 @@ class AudioStreamPlayer:
             
         try:
             # Fill output buffer from queue
+            underruns = 0
             for i in range(frames):
                 try:
                     sample = self.audio_queue.get_nowait()
@@ -105,7 +108,11 @@ class AudioStreamPlayer:
                     # Buffer underrun
                     outdata[i] = 0
                     if self.playing:
-                        self.metrics.buffer_underruns += 1
+                        underruns += 1
+            if underruns:
+                # One registry update per callback, not per sample
+                self.metrics.buffer_underruns += underruns
+                PLAYBACK_UNDERRUNS.inc()
                         
             # Track playback progress
             if self.playing:
@@ -125,6 +132,7 @@ class AudioStreamPlayer:
             dtype='float32'
         )
         self.stream.start()
+        DEVICE_OPENS.inc(direction="output")
         logger.debug("Audio stream started")
     
     async def add_chunk(self, chunk: bytes) -> bool:
@@ -167,7 +175,7 @@ class AudioStreamPlayer:
             
         return first_chunk and self.playback_started
     
-    async def _decode_chunk(self, data: bytes) -> Optional[np.ndarray]:
+    async def _decode_chunk(self, data: bytes) -> Optional["np.ndarray"]:
         """Decode audio chunk to samples."""
         if self.format == "pcm":
             # PCM is raw samples - just convert
@@ -202,7 +210,7 @@ class AudioStreamPlayer:
                 
         return None
     
-    async def _queue_samples(self, samples: np.ndarray):
+    async def _queue_samples(self, samples: "np.ndarray"):
         """Add samples to the playback queue."""
         for sample in samples:
             try:
@@ -281,6 +289,7 @@ async def stream_pcm_audio(
             # Note: Can't use callback and write() together
         )
         stream.start()
+        DEVICE_OPENS.inc(direction="output")
         
         # Log TTS playback start when we start the stream
         event_logger = get_event_logger()
@@ -317,7 +326,9 @@ async def stream_pcm_audio(
                     audio_array = np.frombuffer(chunk, dtype=np.int16)
                     
                     # Play the chunk immediately
-                    stream.write(audio_array)
+                    if stream.write(audio_array):
+                        # write() reports whether the device ran dry before this block
+                        PLAYBACK_UNDERRUNS.inc()
                     
                     # Save chunk if enabled
                     if save_buffer:
@@ -482,6 +493,7 @@ async def stream_with_buffering(
             dtype='float32'
         )
         stream.start()
+        DEVICE_OPENS.inc(direction="output")
         
         # Don't add stream parameter - Kokoro defaults to true, OpenAI doesn't support it
         
@@ -521,7 +533,8 @@ async def stream_with_buffering(
                             logger.info(f"Buffered streaming started - TTFA: {metrics.ttfa:.3f}s")
                             
                             # Play audio
-                            stream.write(samples)
+                            if stream.write(samples):
+                                PLAYBACK_UNDERRUNS.inc()
                             metrics.chunks_played += len(samples) // 1024
                             
                             # Reset buffer for next batch
@@ -541,7 +554,8 @@ async def stream_with_buffering(
                 if not audio_started:
                     metrics.ttfa = time.perf_counter() - start_time
                     
-                stream.write(samples)
+                if stream.write(samples):
+                    PLAYBACK_UNDERRUNS.inc()
                 metrics.chunks_played += len(samples) // 1024
                 
             except Exception as e:
@@ -0,0 +1,111 @@
+"""
+Structured timing measurements for voice exchanges.
+
+Exchange logs from schema v4 carry a numeric ``timings`` object mapping
+stage names to milliseconds. Older logs only have a formatted string in
+``metadata.timing`` (e.g. "ttfa 0.5s, gen 1.2s, play 2.1s"), which
+``parse_legacy_timing`` converts to the same shape.
+"""
+
+import re
+from enum import Enum
+from typing import Dict, Iterable, Mapping, Optional
+
+
+class TimingStage(str, Enum):
+    """Stages of a voice exchange that are timed."""
+    TTFA = "ttfa"            # Time to first audio
+    TTS_GEN = "tts_gen"      # TTS generation
+    TTS_PLAY = "tts_play"    # TTS playback
+    TTS_TOTAL = "tts_total"  # Whole TTS step
+    RECORD = "record"        # Recording the user
+    STT = "stt"              # Transcription
+    TOTAL = "total"          # End-to-end
+
+
+STAGES = frozenset(stage.value for stage in TimingStage)
+
+TTS_STAGES = (TimingStage.TTFA, TimingStage.TTS_GEN, TimingStage.TTS_PLAY)
+STT_STAGES = (TimingStage.RECORD, TimingStage.STT)
+
+# Labels used in formatted timing strings that differ from the stage name
+LEGACY_LABELS = {
+    "gen": TimingStage.TTS_GEN.value,
+    "play": TimingStage.TTS_PLAY.value,
+}
+
+# Short labels used when formatting timings for display
+DISPLAY_LABELS = {
+    TimingStage.TTS_GEN.value: "gen",
+    TimingStage.TTS_PLAY.value: "play",
+}
+
+_LEGACY_RE = re.compile(r'(\w+)\s+([\d.]+)s')
+
+
+def to_timings_ms(seconds: Optional[Mapping[str, float]]) -> Optional[Dict[str, float]]:
+    """Convert stage timings in seconds to the logged millisecond form.
+
+    Unknown stage names and non-numeric values are dropped.
+
+    Args:
+        seconds: Stage name (or TimingStage) to seconds
+
+    Returns:
+        Stage name to milliseconds, or None if nothing remains
+    """
+    if not seconds:
+        return None
+    result = {}
+    for stage, value in seconds.items():
+        name = stage.value if isinstance(stage, TimingStage) else stage
+        if name not in STAGES or isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        # Microsecond resolution is plenty and keeps lines short
+        result[name] = round(value * 1000.0, 3)
+    return result or None
+
+
+def parse_legacy_timing(timing: Optional[str]) -> Dict[str, float]:
+    """Parse a v1-v3 timing string into stage milliseconds.
+
+    Args:
+        timing: String like "ttfa 0.5s, gen 1.2s" or "record 3.2s, stt 1.4s"
+
+    Returns:
+        Stage name to milliseconds; unknown labels are ignored
+    """
+    if not timing:
+        return {}
+    result = {}
+    for label, value in _LEGACY_RE.findall(timing):
+        name = LEGACY_LABELS.get(label, label)
+        if name not in STAGES:
+            continue
+        try:
+            result[name] = float(value) * 1000.0
+        except ValueError:
+            continue
+    return result
+
+
+def format_timings(timings_ms: Optional[Mapping[str, float]],
+                   stages: Optional[Iterable[str]] = None) -> str:
+    """Format stage milliseconds for display, e.g. "ttfa 0.5s, gen 1.2s".
+
+    Args:
+        timings_ms: Stage name to milliseconds
+        stages: Stages to include, in order (defaults to enum order)
+
+    Returns:
+        Formatted string, empty if there is nothing to show
+    """
+    if not timings_ms:
+        return ""
+    order = stages if stages is not None else [stage.value for stage in TimingStage]
+    parts = []
+    for stage in order:
+        name = stage.value if isinstance(stage, TimingStage) else stage
+        if name in timings_ms:
+            parts.append(f"{DISPLAY_LABELS.get(name, name)} {timings_ms[name] / 1000.0:.1f}s")
+    return ", ".join(parts)
@@ -1,38 +1,26 @@
-"""Auto-import all tools for registration with FastMCP."""
+"""Register tools with FastMCP from the prebuilt tool manifest."""
 import os
 import importlib
-from pathlib import Path
 import logging
 
 logger = logging.getLogger("voicemode")
 
-# Get the directory containing this file
-tools_dir = Path(__file__).parent
+try:
+    from ._tool_manifest import TOOL_MANIFEST
+except ImportError:
+    # Source checkout without a generated manifest - scan once instead
+    from ._manifest import build_manifest
+    logger.warning("Tool manifest missing; run `python voice_mode/tools/_manifest.py` to generate it")
+    TOOL_MANIFEST = build_manifest()
 
 def get_all_available_tools() -> set[str]:
     """
-    Get all available tool names from the filesystem.
+    Get all available tool names from the tool manifest.
 
     Returns:
-        Set of tool module names (without .py extension)
+        Set of tool names (flattened as subdir_module for subdirectory tools)
     """
-    available_tools = set()
-
-    # Get tools from main directory
-    for file in tools_dir.glob("*.py"):
-        if file.name != "__init__.py" and not file.name.startswith("_"):
-            available_tools.add(file.stem)
-
-    # Get tools from all subdirectories
-    for subdir in tools_dir.iterdir():
-        if subdir.is_dir() and not subdir.name.startswith("_") and not subdir.name.startswith("."):
-            for file in subdir.glob("*.py"):
-                if file.name != "__init__.py" and not file.name.startswith("_") and file.name != "helpers.py" and file.name != "types.py":
-                    # Use flattened naming: subdir_toolname
-                    tool_name = f"{subdir.name}_{file.stem}"
-                    available_tools.add(tool_name)
-
-    return available_tools
+    return set(TOOL_MANIFEST)
 
 def parse_tool_list(tool_string: str) -> set[str]:
     """
@@ -116,48 +104,24 @@ def load_tool(tool_name: str) -> bool:
     """
     Load a single tool by name.
 
+    Only the tool's own module is imported, so tools that are not enabled
+    are never registered.
+
     Args:
         tool_name: Name of the tool to load
 
     Returns:
         True if successfully loaded, False otherwise
     """
-    try:
-        # First check if it exists as a regular tool in the main directory
-        tool_file = tools_dir / f"{tool_name}.py"
-        if tool_file.exists():
-            logger.debug(f"Loading tool: {tool_name}")
-            importlib.import_module(f".{tool_name}", package=__name__)
-            return True
-
-        # If not found and contains underscore, try as a subdirectory tool
-        if "_" in tool_name:
-            # Special case for sound_fonts directory (has underscore in name)
-            if tool_name.startswith("sound_fonts_"):
-                tool_file = tool_name.replace("sound_fonts_", "")
-                module_path = f".sound_fonts.{tool_file}"
-                try:
-                    logger.debug(f"Loading sound_fonts tool: {tool_name}")
-                    importlib.import_module(module_path, package=__name__)
-                    return True
-                except ImportError:
-                    pass
-
-            # Standard subdirectory pattern
-            parts = tool_name.split("_", 1)
-            if len(parts) == 2:
-                subdir_name, tool_file = parts
-                module_path = f".{subdir_name}.{tool_file}"
-                try:
-                    logger.debug(f"Loading subdirectory tool: {tool_name}")
-                    importlib.import_module(module_path, package=__name__)
-                    return True
-                except ImportError:
-                    pass
-
+    entry = TOOL_MANIFEST.get(tool_name)
+    if entry is None:
         logger.warning(f"Tool not found: {tool_name}")
         return False
 
+    try:
+        logger.debug(f"Loading tool: {tool_name} ({', '.join(entry['registers']) or 'no MCP tools'})")
+        importlib.import_module(entry["module"], package=__name__)
+        return True
     except ImportError as e:
         logger.error(f"Failed to import tool {tool_name}: {e}")
         return False
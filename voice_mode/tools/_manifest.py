@@ -0,0 +1,130 @@
+"""Build the static tool manifest used by ``voice_mode.tools``.
+
+The manifest maps each tool name to its module and the MCP tools the module
+registers, so the server can load tools without walking the package or
+trying imports. It is generated into ``_tool_manifest.py`` by the build hook
+and checked in; regenerate it after adding or removing a tool module::
+
+    python voice_mode/tools/_manifest.py
+
+This module only uses the standard library and never imports tool modules,
+so the build hook can load it by file path.
+"""
+
+import ast
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+TOOLS_DIR = Path(__file__).parent
+MANIFEST_FILE = TOOLS_DIR / "_tool_manifest.py"
+
+# Files in tool subdirectories that never hold tools
+_SUBDIR_SKIP = {"__init__.py", "helpers.py", "types.py"}
+
+_HEADER = '''"""Static tool manifest - generated by voice_mode/tools/_manifest.py, do not edit.
+
+Maps tool name -> {"module": module path relative to voice_mode.tools,
+"registers": MCP tools the module registers}.
+"""
+'''
+
+
+def _registered_tools(path: Path) -> List[str]:
+    """Names of functions in ``path`` decorated with ``@mcp.tool``."""
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return []
+
+    names = []
+    for node in ast.walk(tree):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for decorator in node.decorator_list:
+            call = decorator if isinstance(decorator, ast.Call) else None
+            target = call.func if call else decorator
+            if not (isinstance(target, ast.Attribute) and target.attr == "tool"
+                    and isinstance(target.value, ast.Name) and target.value.id == "mcp"):
+                continue
+            name = node.name
+            for keyword in call.keywords if call else []:
+                if keyword.arg == "name" and isinstance(keyword.value, ast.Constant):
+                    name = keyword.value.value
+            names.append(name)
+    return names
+
+
+def build_manifest(tools_dir: Optional[Path] = None) -> Dict[str, Dict]:
+    """Scan the tools package and describe every tool module.
+
+    Top-level modules are named after their file; modules in subdirectories
+    use flattened ``subdir_module`` names (e.g. ``kokoro_install``).
+
+    Args:
+        tools_dir: Tools package directory (default: this package)
+
+    Returns:
+        Mapping of tool name to ``{"module": ..., "registers": [...]}``
+    """
+    tools_dir = Path(tools_dir or TOOLS_DIR)
+    manifest = {}
+
+    for file in sorted(tools_dir.glob("*.py")):
+        if file.name != "__init__.py" and not file.name.startswith("_"):
+            manifest[file.stem] = {
+                "module": f".{file.stem}",
+                "registers": _registered_tools(file),
+            }
+
+    for subdir in sorted(tools_dir.iterdir()):
+        if not subdir.is_dir() or subdir.name.startswith(("_", ".")):
+            continue
+        for file in sorted(subdir.glob("*.py")):
+            if file.name in _SUBDIR_SKIP or file.name.startswith("_"):
+                continue
+            manifest[f"{subdir.name}_{file.stem}"] = {
+                "module": f".{subdir.name}.{file.stem}",
+                "registers": _registered_tools(file),
+            }
+
+    return dict(sorted(manifest.items()))
+
+
+def render_manifest(manifest: Dict[str, Dict]) -> str:
+    """Render a manifest as the source of ``_tool_manifest.py``."""
+    lines = [_HEADER, "TOOL_MANIFEST = {"]
+    for name, entry in sorted(manifest.items()):
+        lines.append(
+            f"    {json.dumps(name)}: {{\"module\": {json.dumps(entry['module'])}, "
+            f"\"registers\": {json.dumps(entry['registers'])}}},"
+        )
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def write_manifest(path: Optional[Union[str, Path]] = None, tools_dir: Optional[Path] = None) -> bool:
+    """Regenerate the manifest file if it is out of date.
+
+    Args:
+        path: Output file (default: ``_tool_manifest.py`` next to this module)
+        tools_dir: Tools package directory to scan
+
+    Returns:
+        True if the file was written, False if it was already current
+    """
+    path = Path(path or MANIFEST_FILE)
+    content = render_manifest(build_manifest(tools_dir))
+    try:
+        if path.read_text(encoding="utf-8") == content:
+            return False
+    except OSError:
+        pass
+    path.write_text(content, encoding="utf-8")
+    return True
+
+
+if __name__ == "__main__":
+    changed = write_manifest(sys.argv[1] if len(sys.argv) > 1 else None)
+    print(f"{'Updated' if changed else 'Unchanged'}: {sys.argv[1] if len(sys.argv) > 1 else MANIFEST_FILE}")
@@ -0,0 +1,40 @@
+"""Static tool manifest - generated by voice_mode/tools/_manifest.py, do not edit.
+
+Maps tool name -> {"module": module path relative to voice_mode.tools,
+"registers": MCP tools the module registers}.
+"""
+
+TOOL_MANIFEST = {
+    "configuration_management": {"module": ".configuration_management", "registers": ["update_config", "list_config_keys", "config_reload", "show_config_files"]},
+    "converse": {"module": ".converse", "registers": ["converse"]},
+    "dependencies": {"module": ".dependencies", "registers": ["check_audio_dependencies"]},
+    "devices": {"module": ".devices", "registers": ["check_audio_devices", "voice_status", "list_tts_voices"]},
+    "diagnostics": {"module": ".diagnostics", "registers": ["voice_mode_info"]},
+    "kokoro_install": {"module": ".kokoro.install", "registers": ["kokoro_install"]},
+    "kokoro_uninstall": {"module": ".kokoro.uninstall", "registers": ["kokoro_uninstall"]},
+    "livekit_frontend": {"module": ".livekit.frontend", "registers": ["livekit_frontend_start", "livekit_frontend_stop", "livekit_frontend_status", "livekit_frontend_open", "livekit_frontend_logs", "livekit_frontend_install"]},
+    "livekit_install": {"module": ".livekit.install", "registers": ["livekit_install"]},
+    "livekit_production_server": {"module": ".livekit.production_server", "registers": []},
+    "livekit_uninstall": {"module": ".livekit.uninstall", "registers": ["livekit_uninstall"]},
+    "notify": {"module": ".notify", "registers": ["notify"]},
+    "pronounce": {"module": ".pronounce", "registers": ["pronounce", "pronounce_status"]},
+    "providers": {"module": ".providers", "registers": ["refresh_provider_registry", "get_provider_details"]},
+    "service": {"module": ".service", "registers": ["service"]},
+    "sound_fonts_audio_player": {"module": ".sound_fonts.audio_player", "registers": []},
+    "sound_fonts_hook_handler": {"module": ".sound_fonts.hook_handler", "registers": []},
+    "sound_fonts_player": {"module": ".sound_fonts.player", "registers": []},
+    "statistics": {"module": ".statistics", "registers": ["voice_statistics", "voice_statistics_summary", "voice_statistics_reset", "voice_statistics_export", "voice_statistics_recent"]},
+    "transcription_backends": {"module": ".transcription.backends", "registers": []},
+    "transcription_core": {"module": ".transcription.core", "registers": []},
+    "transcription_formats": {"module": ".transcription.formats", "registers": []},
+    "voice_registry": {"module": ".voice_registry", "registers": ["voice_registry"]},
+    "whisper_install": {"module": ".whisper.install", "registers": ["whisper_install"]},
+    "whisper_list_models": {"module": ".whisper.list_models", "registers": []},
+    "whisper_model_active": {"module": ".whisper.model_active", "registers": []},
+    "whisper_model_benchmark": {"module": ".whisper.model_benchmark", "registers": []},
+    "whisper_model_install": {"module": ".whisper.model_install", "registers": ["whisper_model_install"]},
+    "whisper_model_remove": {"module": ".whisper.model_remove", "registers": []},
+    "whisper_model_tune": {"module": ".whisper.model_tune", "registers": []},
+    "whisper_models": {"module": ".whisper.models", "registers": []},
+    "whisper_uninstall": {"module": ".whisper.uninstall", "registers": ["whisper_uninstall"]},
+}
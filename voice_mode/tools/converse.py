@@ -3,31 +3,31 @@
 import asyncio
 import logging
 import os
+import sys
 import time
 import traceback
 from typing import Optional, Literal, Tuple, Dict, Union
 from pathlib import Path
 from datetime import datetime
 
-import numpy as np
-import sounddevice as sd
-from scipy.io.wavfile import write
-from pydub import AudioSegment
-from openai import AsyncOpenAI
-import httpx
+from voice_mode.utils.lazy import lazy_import, module_available
+
+# The audio stack is imported on first use so the server starts quickly
+np = lazy_import("numpy")
+sd = lazy_import("sounddevice")
+write = lazy_import("scipy.io.wavfile", "write")
+AudioSegment = lazy_import("pydub", "AudioSegment")
+AsyncOpenAI = lazy_import("openai", "AsyncOpenAI")
+httpx = lazy_import("httpx")
 
 # Optional webrtcvad for silence detection
-try:
-    import webrtcvad
-    VAD_AVAILABLE = True
-except ImportError as e:
-    webrtcvad = None
-    VAD_AVAILABLE = False
+VAD_AVAILABLE = module_available("webrtcvad")
+webrtcvad = lazy_import("webrtcvad") if VAD_AVAILABLE else None
 
 from voice_mode.server import mcp
 from voice_mode.conversation_logger import get_conversation_logger
+from voice_mode.utils.services.readiness import service_roots, wait_for_services, watch_readiness
 from voice_mode.config import (
-    audio_operation_lock,
     SAMPLE_RATE,
     CHANNELS,
     DEBUG,
@@ -73,6 +73,7 @@ from voice_mode.core import (
     play_system_audio
 )
 from voice_mode.audio_player import NonBlockingAudioPlayer
+from voice_mode.audio_arbiter import audio_turn
 from voice_mode.statistics_tracking import track_voice_interaction
 from voice_mode.utils import (
     get_event_logger,
@@ -84,6 +85,9 @@ from voice_mode.utils import (
     log_tool_request_end
 )
 from voice_mode.pronounce import get_manager as get_pronounce_manager, is_enabled as pronounce_enabled
+from voice_mode.utils.tracing import bind, current_span, span, traced
+from voice_mode.metrics import CACHE_LOOKUPS, CONVERSE_IN_PROGRESS, DEVICE_OPENS
+from voice_mode.timings import STT_STAGES, TTS_STAGES, TimingStage
 
 logger = logging.getLogger("voicemode")
 
@@ -146,12 +150,84 @@ def should_wait(text: str) -> bool:
 # Track last session end time for measuring AI thinking time
 last_session_end_time = None
 
-# Initialize OpenAI clients - now using provider registry for endpoint discovery
-openai_clients = get_openai_clients(OPENAI_API_KEY or "dummy-key-for-local", None, None)
+# OpenAI clients are created on the first converse call so importing the
+# tool does not pull in openai/httpx - see _get_openai_clients()
+openai_clients = None
+
+
+def _get_openai_clients() -> dict:
+    """Return the shared OpenAI clients, creating them on first use."""
+    global openai_clients
+    if openai_clients is None:
+        openai_clients = get_openai_clients(OPENAI_API_KEY or "dummy-key-for-local", None, None)
+    return openai_clients
 
 # Provider-specific clients are now created dynamically by the provider registry
 
 
+def auto_start_mode() -> Optional[str]:
+    """Which local services startup initialization launches.
+
+    Returns:
+        "services" (Whisper and Kokoro, VOICEMODE_AUTO_START_SERVICES),
+        "kokoro" (Kokoro via uvx, VOICEMODE_AUTO_START_KOKORO or the legacy
+        VOICE_MODE_AUTO_START_KOKORO) or None
+    """
+    if voice_mode.config.AUTO_START_SERVICES:
+        return "services"
+    if voice_mode.config.AUTO_START_KOKORO or (
+            os.getenv("VOICE_MODE_AUTO_START_KOKORO", "").lower() in ("true", "1", "yes", "on")):
+        return "kokoro"
+    return None
+
+
+async def _service_healthy(service_name: str) -> bool:
+    """Whether a local service already answers its health check."""
+    try:
+        async with httpx.AsyncClient(timeout=3.0) as client:
+            response = await client.get(f"{service_roots(service_name)[0]}/health")
+            return response.status_code == 200
+    except Exception:
+        return False
+
+
+async def _auto_start_service(service_name: str) -> None:
+    """Start an installed local service unless it is already running."""
+    if await _service_healthy(service_name):
+        logger.info(f"{service_name.capitalize()} is already running")
+        return None
+    logger.info(f"Auto-starting {service_name.capitalize()}...")
+    # Imported here to avoid loading service management on every start
+    from voice_mode.tools.service import start_service
+    logger.info(await start_service(service_name, wait_ready=False))
+    return None
+
+
+async def _auto_start_kokoro_uvx():
+    """Start Kokoro with uvx (VOICE_MODE_AUTO_START_KOKORO), returning the process."""
+    if await _service_healthy("kokoro"):
+        logger.info("Kokoro TTS is already running externally")
+        return None
+    if "kokoro" in service_processes:
+        return service_processes["kokoro"]
+    logger.info("Auto-starting Kokoro TTS service...")
+    try:
+        import subprocess
+        process = subprocess.Popen(
+            ["uvx", "kokoro-fastapi"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            env={**os.environ}
+        )
+        service_processes["kokoro"] = process
+        logger.info(f"✓ Kokoro TTS launched (PID: {process.pid})")
+        return process
+    except Exception as e:
+        logger.error(f"Error auto-starting Kokoro: {e}")
+        return None
+
+
 async def startup_initialization():
     """Initialize services on startup based on configuration"""
     if voice_mode.config._startup_initialized:
@@ -164,46 +240,21 @@ async def startup_initialization():
     logger.info("Initializing provider registry...")
     await provider_registry.initialize()
 
-    # Check if we should auto-start Kokoro
-    auto_start_kokoro = os.getenv("VOICE_MODE_AUTO_START_KOKORO", "").lower() in ("true", "1", "yes", "on")
-    if auto_start_kokoro:
-        try:
-            # Check if Kokoro is already running
-            async with httpx.AsyncClient(timeout=3.0) as client:
-                base_url = 'http://127.0.0.1:8880'  # Kokoro default
-                health_url = f"{base_url}/health"
-                response = await client.get(health_url)
-
-                if response.status_code == 200:
-                    logger.info("Kokoro TTS is already running externally")
-                else:
-                    raise Exception("Not running")
-        except:
-            # Kokoro is not running, start it
-            logger.info("Auto-starting Kokoro TTS service...")
-            try:
-                # Import here to avoid circular dependency
-                import subprocess
-                if "kokoro" not in service_processes:
-                    process = subprocess.Popen(
-                        ["uvx", "kokoro-fastapi"],
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                        env={**os.environ}
-                    )
-                    service_processes["kokoro"] = process
-
-                    # Wait a moment for it to start
-                    await asyncio.sleep(2.0)
-
-                    # Verify it started
-                    if process.poll() is None:
-                        logger.info(f"✓ Kokoro TTS started successfully (PID: {process.pid})")
-                    else:
-                        logger.error("Failed to start Kokoro TTS")
-            except Exception as e:
-                logger.error(f"Error auto-starting Kokoro: {e}")
+    # Launch local services in parallel. Readiness (health check plus a
+    # warm-up inference) is tracked in the background; converse waits for it
+    # before its first TTS/STT request instead of sleeping here
+    auto_start = auto_start_mode()
+    if auto_start == "services":
+        for name in ("whisper", "kokoro"):
+            watch_readiness(name, launch=lambda name=name: _auto_start_service(name))
+    elif auto_start == "kokoro":
+        watch_readiness("kokoro", launch=_auto_start_kokoro_uvx)
+
+    # Warm connections, devices, chimes and local models in the background;
+    # nothing waits for this, so it never delays the first request
+    if voice_mode.config.WARMUP_ENABLED:
+        from voice_mode.warmup import start_warmup
+        start_warmup()
 
     # Log initial status
     logger.info("Service initialization complete")
@@ -277,6 +328,7 @@ async def get_stt_config(provider: Optional[str] = None):
 
 
 
+@traced("tts")
 async def text_to_speech_with_failover(
     message: str,
     voice: Optional[str] = None,
@@ -292,6 +344,8 @@ async def text_to_speech_with_failover(
     Returns:
         Tuple of (success, tts_metrics, tts_config)
     """
+    current_span().set(chars=len(message), format=audio_format)
+
     # Apply pronunciation rules if enabled
     if pronounce_enabled():
         pronounce_mgr = get_pronounce_manager()
@@ -313,8 +367,9 @@ async def text_to_speech_with_failover(
     )
 
 
+@traced("stt")
 async def speech_to_text(
-    audio_data: np.ndarray,
+    audio_data: "np.ndarray",
     save_audio: bool = False,
     audio_dir: Optional[Path] = None,
     transport: str = "local"
@@ -342,6 +397,8 @@ async def speech_to_text(
     from voice_mode.core import save_debug_file, get_debug_filename
     from voice_mode.simple_failover import simple_stt_failover
 
+    current_span().set(bytes=audio_data.nbytes, saved=bool(save_audio and audio_dir), transport=transport)
+
     # Determine if we should save the file permanently or use a temp file
     if save_audio and audio_dir:
         # Save directly to final location for debugging/analysis
@@ -425,22 +482,23 @@ async def play_audio_feedback(
 
     try:
         # Play appropriate chime with optional delay overrides
-        if text == "listening":
-            await play_chime_start(
-                leading_silence=chime_leading_silence,
-                trailing_silence=chime_trailing_silence
-            )
-        elif text == "finished":
-            await play_chime_end(
-                leading_silence=chime_leading_silence,
-                trailing_silence=chime_trailing_silence
-            )
+        with span("chime", kind=text):
+            if text == "listening":
+                await play_chime_start(
+                    leading_silence=chime_leading_silence,
+                    trailing_silence=chime_trailing_silence
+                )
+            elif text == "finished":
+                await play_chime_end(
+                    leading_silence=chime_leading_silence,
+                    trailing_silence=chime_trailing_silence
+                )
     except Exception as e:
         logger.debug(f"Audio feedback failed: {e}")
         # Don't interrupt the main flow if feedback fails
 
 
-def record_audio(duration: float) -> np.ndarray:
+def record_audio(duration: float) -> "np.ndarray":
     """Record audio from microphone"""
     logger.info(f"🎤 Recording audio for {duration}s...")
     if DEBUG:
@@ -468,6 +526,7 @@ def record_audio(duration: float) -> np.ndarray:
             channels=CHANNELS,
             dtype=np.int16
         )
+        DEVICE_OPENS.inc(direction="input")
         sd.wait()
 
         flattened = recording.flatten()
@@ -552,7 +611,8 @@ def record_audio(duration: float) -> np.ndarray:
             sys.stderr = original_stderr
 
 
-def record_audio_with_silence_detection(max_duration: float, disable_silence_detection: bool = False, min_duration: float = 0.0, vad_aggressiveness: Optional[int] = None) -> Tuple[np.ndarray, bool]:
+@traced("record")
+def record_audio_with_silence_detection(max_duration: float, disable_silence_detection: bool = False, min_duration: float = 0.0, vad_aggressiveness: Optional[int] = None) -> Tuple["np.ndarray", bool]:
     """Record audio from microphone with automatic silence detection.
 
     Uses WebRTC VAD to detect when the user stops speaking and automatically
@@ -658,6 +718,8 @@ def record_audio_with_silence_detection(max_duration: float, disable_silence_det
                                blocksize=chunk_samples):
 
                 logger.debug("Started continuous audio stream")
+                DEVICE_OPENS.inc(direction="input")
+                current_span().event("stream_open")
 
                 while recording_duration < max_duration and not stop_recording:
                     try:
@@ -705,6 +767,7 @@ def record_audio_with_silence_detection(max_duration: float, disable_silence_det
                                     logger.info(f"[VAD_DEBUG] STATE CHANGE: WAITING_FOR_SPEECH -> SPEECH_ACTIVE at t={recording_duration:.1f}s")
                                 speech_detected = True
                                 silence_duration_ms = 0
+                                current_span().event("speech_start", t=round(recording_duration, 3))
                             # No timeout in this state - just keep waiting
                             # The only exit is speech detection or max_duration
                         else:
@@ -729,6 +792,7 @@ def record_audio_with_silence_detection(max_duration: float, disable_silence_det
                                         logger.info(f"[VAD_DEBUG] STOP: silence_duration={silence_duration_ms}ms >= threshold={SILENCE_THRESHOLD_MS}ms")
                                         logger.info(f"[VAD_DEBUG] STOP: recording_duration={recording_duration:.1f}s >= min_duration={effective_min_duration}s")
                                     stop_recording = True
+                                    current_span().event("endpoint", t=round(recording_duration, 3), silence_ms=silence_duration_ms)
                                 elif VAD_DEBUG and recording_duration < effective_min_duration:
                                     if int(recording_duration * 1000) % 500 == 0:  # Log every 500ms
                                         logger.info(f"[VAD_DEBUG] Min duration not met: {recording_duration:.1f}s < {effective_min_duration}s")
@@ -760,6 +824,9 @@ def record_audio_with_silence_detection(max_duration: float, disable_silence_det
                     rms = np.sqrt(np.mean(full_recording.astype(float) ** 2))
                     logger.debug(f"Recording stats - RMS: {rms:.2f}, Speech detected: {speech_detected}")
 
+                current_span().set(vad=effective_vad_aggressiveness, samples=len(full_recording),
+                                   duration_s=round(recording_duration, 3), speech_detected=speech_detected)
+
                 # Return tuple: (audio_data, speech_detected)
                 return (full_recording, speech_detected)
             else:
@@ -1130,9 +1197,16 @@ consult the MCP resources listed above.
         logger.error(error_msg)
         return f"❌ Error: {error_msg}"
 
+    # Pick up edited voicemode.env files (voices, endpoints) before this turn
+    voice_mode.config.reload_configuration_if_changed()
+
     # Run startup initialization if needed
     await startup_initialization()
 
+    # Services launched at startup are still loading their models; wait for
+    # their readiness probe rather than failing over on the first request
+    await wait_for_services(("whisper", "kokoro"))
+
     # Refresh audio device cache to pick up any device changes (AirPods, etc.)
     # This takes ~1ms and ensures we use the current default device
     import sounddevice as sd
@@ -1146,6 +1220,7 @@ consult the MCP resources listed above.
     # Check time since last session for AI thinking time
     global last_session_end_time
     current_time = time.time()
+    openai_clients = _get_openai_clients()
 
     if last_session_end_time and wait_for_response:
         time_since_last = current_time - last_session_end_time
@@ -1178,6 +1253,13 @@ consult the MCP resources listed above.
     result = None
     success = False
 
+    # Root span for the turn; closed in the finally block below with the
+    # exception that ended the turn, if any, so failures are traced as errors
+    turn_span = span("converse", transport=transport, wait_for_response=wait_for_response)
+    turn = turn_span.__enter__()
+    turn_error = (None, None, None)
+    CONVERSE_IN_PROGRESS.inc()
+
     try:
         # Handle notify transport specially
         if transport == "notify":
@@ -1283,7 +1365,7 @@ consult the MCP resources listed above.
             # Local microphone approach with timing
             timings = {}
             try:
-                async with audio_operation_lock:
+                async with audio_turn():
                     # Speak the message
                     tts_start = time.perf_counter()
                     if should_skip_tts:
@@ -1317,36 +1399,27 @@ consult the MCP resources listed above.
                     # Log TTS immediately after it completes
                     if tts_success:
                         try:
-                            # Format TTS timing
-                            tts_timing_parts = []
-                            if 'ttfa' in timings:
-                                tts_timing_parts.append(f"ttfa {timings['ttfa']:.1f}s")
-                            if 'tts_gen' in timings:
-                                tts_timing_parts.append(f"gen {timings['tts_gen']:.1f}s")
-                            if 'tts_play' in timings:
-                                tts_timing_parts.append(f"play {timings['tts_play']:.1f}s")
-                            tts_timing_str = ", ".join(tts_timing_parts) if tts_timing_parts else None
-
                             conversation_logger = get_conversation_logger()
-                            conversation_logger.log_tts(
-                                text=message,
-                                audio_file=os.path.basename(tts_metrics.get('audio_path')) if tts_metrics and tts_metrics.get('audio_path') else None,
-                                model=tts_config.get('model') if tts_config else tts_model,
-                                voice=tts_config.get('voice') if tts_config else voice,
-                                provider=tts_config.get('provider') if tts_config else (tts_provider if tts_provider else 'openai'),
-                                provider_url=tts_config.get('base_url') if tts_config else None,
-                                provider_type=tts_config.get('provider_type') if tts_config else None,
-                                is_fallback=tts_config.get('is_fallback', False) if tts_config else False,
-                                fallback_reason=tts_config.get('fallback_reason') if tts_config else None,
-                                timing=tts_timing_str,
-                                audio_format=audio_format,
-                                transport=transport,
-                                # Add timing metrics
-                                time_to_first_audio=timings.get('ttfa') if timings else None,
-                                generation_time=timings.get('tts_gen') if timings else None,
-                                playback_time=timings.get('tts_play') if timings else None,
-                                total_turnaround_time=timings.get('total') if timings else None
-                            )
+                            with span("log.write", type="tts"):
+                                conversation_logger.log_tts(
+                                    text=message,
+                                    audio_file=os.path.basename(tts_metrics.get('audio_path')) if tts_metrics and tts_metrics.get('audio_path') else None,
+                                    model=tts_config.get('model') if tts_config else tts_model,
+                                    voice=tts_config.get('voice') if tts_config else voice,
+                                    provider=tts_config.get('provider') if tts_config else (tts_provider if tts_provider else 'openai'),
+                                    provider_url=tts_config.get('base_url') if tts_config else None,
+                                    provider_type=tts_config.get('provider_type') if tts_config else None,
+                                    is_fallback=tts_config.get('is_fallback', False) if tts_config else False,
+                                    fallback_reason=tts_config.get('fallback_reason') if tts_config else None,
+                                    timings={k: v for k, v in timings.items() if k in (*TTS_STAGES, TimingStage.TTS_TOTAL)},
+                                    audio_format=audio_format,
+                                    transport=transport,
+                                    # Add timing metrics
+                                    time_to_first_audio=timings.get('ttfa') if timings else None,
+                                    generation_time=timings.get('tts_gen') if timings else None,
+                                    playback_time=timings.get('tts_play') if timings else None,
+                                    total_turnaround_time=timings.get('total') if timings else None
+                                )
                         except Exception as e:
                             logger.error(f"Failed to log TTS to JSONL: {e}")
 
@@ -1393,23 +1466,11 @@ consult the MCP resources listed above.
                         if tts_success and tts_metrics:
                             timing_info = f" (gen: {tts_metrics.get('generation', 0):.1f}s, play: {tts_metrics.get('playback', 0):.1f}s)"
 
-                        # Create timing string for statistics
-                        timing_str = ""
-                        if tts_success and timings:
-                            timing_parts = []
-                            if 'ttfa' in timings:
-                                timing_parts.append(f"ttfa {timings['ttfa']:.1f}s")
-                            if 'tts_gen' in timings:
-                                timing_parts.append(f"tts_gen {timings['tts_gen']:.1f}s")
-                            if 'tts_play' in timings:
-                                timing_parts.append(f"tts_play {timings['tts_play']:.1f}s")
-                            timing_str = ", ".join(timing_parts)
-
                         # Track statistics for speak-only interaction
                         track_voice_interaction(
                             message=message,
                             response="[speak-only]",
-                            timing_str=timing_str,
+                            timings={k: v for k, v in timings.items() if k in TTS_STAGES} if tts_success else {},
                             transport="speak-only",
                             voice_provider=tts_provider,
                             voice_name=voice,
@@ -1423,7 +1484,8 @@ consult the MCP resources listed above.
                         return result
 
                     # Brief pause before listening
-                    await asyncio.sleep(0.5)
+                    with span("converse.pause"):
+                        await asyncio.sleep(0.5)
 
                     # Play "listening" feedback sound
                     await play_audio_feedback(
@@ -1445,7 +1507,7 @@ consult the MCP resources listed above.
                     record_start = time.perf_counter()
                     logger.debug(f"About to call record_audio_with_silence_detection with duration={listen_duration_max}, disable_silence_detection={disable_silence_detection}, min_duration={listen_duration_min}, vad_aggressiveness={vad_aggressiveness}")
                     audio_data, speech_detected = await asyncio.get_event_loop().run_in_executor(
-                        None, record_audio_with_silence_detection, listen_duration_max, disable_silence_detection, listen_duration_min, vad_aggressiveness
+                        None, bind(record_audio_with_silence_detection), listen_duration_max, disable_silence_detection, listen_duration_min, vad_aggressiveness
                     )
                     timings['record'] = time.perf_counter() - record_start
 
@@ -1556,6 +1618,7 @@ consult the MCP resources listed above.
                             # Play the cached audio if available from tts_metrics
                             audio_path = tts_metrics.get('audio_path') if 'tts_metrics' in locals() and tts_metrics else None
                             if audio_path and os.path.exists(audio_path):
+                                CACHE_LOOKUPS.inc(result="hit")
                                 try:
                                     import soundfile as sf
 
@@ -1580,6 +1643,7 @@ consult the MCP resources listed above.
                                         logger.error("Failed to replay audio via TTS regeneration")
                             else:
                                 # No cached audio, regenerate TTS
+                                CACHE_LOOKUPS.inc(result="miss")
                                 logger.info("No cached audio available, regenerating...")
                                 tts_success, new_tts_metrics, _ = await text_to_speech_with_failover(
                                     message=message,
@@ -1609,7 +1673,7 @@ consult the MCP resources listed above.
                             # Record audio
                             record_start = time.perf_counter()
                             audio_data, speech_detected = await asyncio.get_event_loop().run_in_executor(
-                                None, record_audio_with_silence_detection, listen_duration_max, disable_silence_detection, listen_duration_min, vad_aggressiveness
+                                None, bind(record_audio_with_silence_detection), listen_duration_max, disable_silence_detection, listen_duration_min, vad_aggressiveness
                             )
                             record_time = time.perf_counter() - record_start
                             timings['record'] = timings.get('record', 0) + record_time  # Accumulate timing
@@ -1665,7 +1729,7 @@ consult the MCP resources listed above.
                             # Record audio
                             record_start = time.perf_counter()
                             audio_data, speech_detected = await asyncio.get_event_loop().run_in_executor(
-                                None, record_audio_with_silence_detection, listen_duration_max, disable_silence_detection, listen_duration_min, vad_aggressiveness
+                                None, bind(record_audio_with_silence_detection), listen_duration_max, disable_silence_detection, listen_duration_min, vad_aggressiveness
                             )
                             record_time = time.perf_counter() - record_start
                             timings['record'] = timings.get('record', 0) + record_time  # Accumulate timing
@@ -1702,41 +1766,34 @@ consult the MCP resources listed above.
 
                     # Log STT immediately after it completes (even if no speech detected)
                     try:
-                        # Format STT timing
-                        stt_timing_parts = []
-                        if 'record' in timings:
-                            stt_timing_parts.append(f"record {timings['record']:.1f}s")
-                        if 'stt' in timings:
-                            stt_timing_parts.append(f"stt {timings['stt']:.1f}s")
-                        stt_timing_str = ", ".join(stt_timing_parts) if stt_timing_parts else None
-
                         conversation_logger = get_conversation_logger()
                         # Get STT config for provider info
                         stt_config = await get_stt_config()
 
-                        conversation_logger.log_stt(
-                            text=response_text if response_text else "[no speech detected]",
-                            model=stt_config.get('model', 'whisper-1'),
-                            provider=stt_config.get('provider', 'openai'),
-                            provider_url=stt_config.get('base_url'),
-                            provider_type=stt_config.get('provider_type'),
-                            audio_format='mp3',
-                            transport=transport,
-                            timing=stt_timing_str,
-                            silence_detection={
-                                "enabled": not (DISABLE_SILENCE_DETECTION or disable_silence_detection),
-                                "vad_aggressiveness": VAD_AGGRESSIVENESS,
-                                "silence_threshold_ms": SILENCE_THRESHOLD_MS
-                            },
-                            # Add timing metrics
-                            transcription_time=timings.get('stt'),
-                            total_turnaround_time=None  # Will be calculated and added later
-                        )
+                        with span("log.write", type="stt"):
+                            conversation_logger.log_stt(
+                                text=response_text if response_text else "[no speech detected]",
+                                model=stt_config.get('model', 'whisper-1'),
+                                provider=stt_config.get('provider', 'openai'),
+                                provider_url=stt_config.get('base_url'),
+                                provider_type=stt_config.get('provider_type'),
+                                audio_format='mp3',
+                                transport=transport,
+                                timings={k: v for k, v in timings.items() if k in STT_STAGES},
+                                silence_detection={
+                                    "enabled": not (DISABLE_SILENCE_DETECTION or disable_silence_detection),
+                                    "vad_aggressiveness": VAD_AGGRESSIVENESS,
+                                    "silence_threshold_ms": SILENCE_THRESHOLD_MS
+                                },
+                                # Add timing metrics
+                                transcription_time=timings.get('stt'),
+                                total_turnaround_time=None  # Will be calculated and added later
+                            )
                     except Exception as e:
                         logger.error(f"Failed to log STT to JSONL: {e}")
 
                 # Calculate total time (use tts_total instead of sub-metrics)
-                main_timings = {k: v for k, v in timings.items() if k in ['tts_total', 'record', 'stt']}
+                main_timings = {k: v for k, v in timings.items() if k in (TimingStage.TTS_TOTAL, *STT_STAGES)}
                 total_time = sum(main_timings.values())
 
                 # Format timing strings separately for TTS and STT
@@ -1773,7 +1830,7 @@ consult the MCP resources listed above.
                 track_voice_interaction(
                     message=message,
                     response=actual_response,
-                    timing_str=timing_str,
+                    timings={**timings, 'total': total_time},
                     transport=transport,
                     voice_provider=tts_provider,
                     voice_name=voice,
@@ -1838,6 +1895,7 @@ consult the MCP resources listed above.
             return result
 
     except Exception as e:
+        turn_error = sys.exc_info()
         logger.error(f"Unexpected error in converse: {e}")
         if DEBUG:
             logger.error(f"Full traceback: {traceback.format_exc()}")
@@ -1849,6 +1907,12 @@ consult the MCP resources listed above.
         if event_logger:
             log_tool_request_end("converse", success=success)
 
+        turn.set(transport=transport, success=success)
+        # Cancellation and other BaseExceptions are still propagating here
+        in_flight = sys.exc_info()
+        turn_span.__exit__(*(in_flight if in_flight[0] is not None else turn_error))
+        CONVERSE_IN_PROGRESS.dec()
+
         # Update last session end time for tracking AI thinking time
         if wait_for_response:
             last_session_end_time = time.time()
@@ -1,5 +1,6 @@
 """Audio device management tools."""
 
+import asyncio
 import logging
 from typing import Optional
 import sounddevice as sd
@@ -55,11 +56,15 @@ async def voice_status() -> str:
     Provides a unified view of the voice infrastructure configuration and health.
     """
     from voice_mode.provider_discovery import provider_registry
-    from voice_mode.config import TTS_BASE_URLS, STT_BASE_URLS
+    from voice_mode.config import TTS_BASE_URLS, STT_BASE_URLS, WHISPER_PORT, KOKORO_PORT, LIVEKIT_PORT
+    from voice_mode.utils.services.common import probe_services
     
     try:
-        # Ensure registry is initialized
-        await provider_registry.initialize()
+        # Ensure registry is initialized, probing the local services meanwhile
+        _, local_services = await asyncio.gather(
+            provider_registry.initialize(),
+            probe_services({"Whisper": WHISPER_PORT, "Kokoro": KOKORO_PORT, "LiveKit": LIVEKIT_PORT}),
+        )
         
         status_lines = ["Voice Service Status:"]
         status_lines.append("=" * 50)
@@ -95,6 +100,16 @@ async def voice_status() -> str:
             else:
                 status_lines.append(f"  ⚪ {url} (not discovered)")
         
+        # Local services
+        status_lines.append("\nLocal Services:")
+        for name, (state, proc) in local_services.items():
+            if state == "local":
+                status_lines.append(f"  ✅ {name} (PID: {proc.pid})")
+            elif state == "forwarded":
+                status_lines.append(f"  🔄 {name} (port forwarded)")
+            else:
+                status_lines.append(f"  ⚪ {name} (not running)")
+        
         # Configuration
         from voice_mode.config import (
             TTS_VOICES, TTS_MODELS, 
@@ -1,6 +1,21 @@
-"""LiveKit service management tools"""
+"""LiveKit service management tools
 
-from .install import livekit_install
-from .uninstall import livekit_uninstall
+Tool functions are imported on first attribute access, so loading one tool
+module does not register its siblings.
+"""
 
-__all__ = ["livekit_install", "livekit_uninstall"]
\ No newline at end of file
+import importlib
+
+_EXPORTS = {
+    "livekit_install": "install",
+    "livekit_uninstall": "uninstall",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,18 +8,22 @@ import platform
 import subprocess
 import time
 from pathlib import Path
-from typing import Literal, Optional, Dict, Any, Union
+from typing import Literal, Optional, Dict, Any, List, Union
 
 import psutil
 
 from voice_mode.server import mcp
-from voice_mode.config import WHISPER_PORT, KOKORO_PORT, LIVEKIT_PORT, SERVICE_AUTO_ENABLE
-from voice_mode.utils.services.common import find_process_by_port, check_service_status
+from voice_mode.config import WHISPER_PORT, WHISPER_INSTANCES, KOKORO_PORT, LIVEKIT_PORT, SERVICE_AUTO_ENABLE
+from voice_mode.utils.services.common import find_process_by_port, check_service_status, invalidate_port_map, probe_services
 from voice_mode.utils.services.whisper_helpers import find_whisper_server, find_whisper_model
 from voice_mode.utils.services.kokoro_helpers import find_kokoro_fastapi, has_gpu_support
+from voice_mode.utils.services.readiness import wait_until_ready
 
 logger = logging.getLogger("voicemode")
 
+# Services with a readiness probe (health check plus warm-up inference)
+READINESS_PROBED = ("whisper", "kokoro")
+
 
 def load_service_file_version(service_name: str, file_type: str) -> Optional[str]:
     """Load version information for a service file."""
@@ -50,11 +54,14 @@ def get_service_config_vars(service_name: str) -> Dict[str, Any]:
         whisper_bin = find_whisper_server()
         model_file = find_whisper_model()
         working_dir = Path(whisper_bin).parent if whisper_bin else voicemode_dir
+        # whisper_bin is at <install dir>/build/bin/whisper-server
+        install_dir = Path(whisper_bin).parent.parent.parent if whisper_bin else Path(voicemode_dir) / "services" / "whisper"
         
         return {
             "WHISPER_BIN": str(whisper_bin) if whisper_bin else "",
             "WHISPER_PORT": str(WHISPER_PORT),
             "MODEL_FILE": str(model_file) if model_file else "",
+            "START_SCRIPT_PATH": str(install_dir / "bin" / "start-whisper-server.sh"),
             "WORKING_DIR": str(working_dir),
             "LOG_DIR": os.path.join(voicemode_dir, "logs", "whisper"),
         }
@@ -183,18 +190,47 @@ def load_service_template(service_name: str) -> str:
     return template_path.read_text()
 
 
-async def status_service(service_name: str) -> str:
-    """Get status of a service."""
+async def whisper_pool_status() -> List[str]:
+    """One line per Whisper instance with its health check and process."""
+    from voice_mode.whisper_pool import check_instances, get_whisper_pool, instance_threads
+    
+    lines = [f"Pool: {WHISPER_INSTANCES} instances, {instance_threads()} threads each"]
+    pool = get_whisper_pool()
+    counters = {c["base_url"]: c for c in (pool.snapshot() if pool else [])}
+    for health in await check_instances():
+        proc = find_process_by_port(health["port"])
+        pid = f"PID {proc.pid}" if proc else "no local process"
+        if health["healthy"]:
+            line = f"  ✅ :{health['port']} {pid}, health {health['latency_ms']:.0f} ms"
+        else:
+            line = f"  ❌ :{health['port']} {pid}, {health['error']}"
+        requests = counters.get(health["base_url"])
+        if requests and requests["requests"]:
+            line += f", {requests['requests']} requests ({requests['failures']} failed)"
+        lines.append(line)
+    return lines
+
+
+def _service_port(service_name: str) -> int:
     if service_name == "whisper":
-        port = WHISPER_PORT
+        return WHISPER_PORT
     elif service_name == "kokoro":
-        port = KOKORO_PORT
+        return KOKORO_PORT
     elif service_name == "livekit":
-        port = LIVEKIT_PORT
-    else:  # frontend
-        port = 3000
+        return LIVEKIT_PORT
+    return 3000  # frontend
+
+
+async def status_service(service_name: str, probe: Optional[tuple] = None) -> str:
+    """Get status of a service.
+    
+    Args:
+        service_name: Service to report on
+        probe: (status, process) from probe_services(), to skip checking the port again
+    """
+    port = _service_port(service_name)
     
-    status, proc = check_service_status(port)
+    status, proc = probe or await asyncio.to_thread(check_service_status, port)
     
     if status == "not_available":
         return f"❌ {service_name.capitalize()} is not available"
@@ -205,8 +241,11 @@ async def status_service(service_name: str) -> str:
    Remote: Accessible"""
     
     try:
+        # Sample CPU over 100ms without blocking, so concurrent checks overlap
+        proc.cpu_percent(None)
+        await asyncio.sleep(0.1)
         with proc.oneshot():
-            cpu_percent = proc.cpu_percent(interval=0.1)
+            cpu_percent = proc.cpu_percent(None)
             memory_info = proc.memory_info()
             memory_mb = memory_info.rss / 1024 / 1024
             create_time = proc.create_time()
@@ -244,7 +283,7 @@ async def status_service(service_name: str) -> str:
             # Get version and capability info
             try:
                 from voice_mode.utils.services.whisper_version import get_whisper_version_info, check_coreml_model_exists
-                version_info = get_whisper_version_info()
+                version_info = await asyncio.to_thread(get_whisper_version_info)
                 
                 if version_info.get("version"):
                     extra_info_parts.append(f"Version: {version_info['version']}")
@@ -272,12 +311,15 @@ async def status_service(service_name: str) -> str:
                     extra_info_parts.append(f"GPU: {', '.join(gpu_support)}")
             except:
                 pass
+            
+            if WHISPER_INSTANCES > 1:
+                extra_info_parts.extend(await whisper_pool_status())
                 
-        else:  # kokoro
+        elif service_name == "kokoro":
             # Try to get version info
             try:
                 from voice_mode.utils.services.version_info import get_kokoro_version
-                version_info = get_kokoro_version()
+                version_info = await asyncio.to_thread(get_kokoro_version)
                 if version_info.get("api_version"):
                     extra_info_parts.append(f"API Version: {version_info['api_version']}")
                 elif version_info.get("version"):
@@ -312,8 +354,42 @@ async def status_service(service_name: str) -> str:
         return f"{service_name.capitalize()} is running (PID: {proc.pid}) but could not get details"
 
 
-async def start_service(service_name: str) -> str:
-    """Start a service."""
+async def _wait_until_started(service_name: str, port: int, verb: str = "started") -> str:
+    """Wait for a service launched by launchd/systemd and describe the outcome."""
+    if service_name in READINESS_PROBED:
+        ready = await wait_until_ready(service_name)
+        if ready["ready"]:
+            return f"✅ {service_name.capitalize()} {verb}, ready in {ready['elapsed_s']:.1f}s"
+        return f"⚠️ {service_name.capitalize()} {verb} but not ready: {ready['error']}"
+    for i in range(10):
+        if find_process_by_port(port, max_age=0):
+            return f"✅ {service_name.capitalize()} {verb}"
+        await asyncio.sleep(0.5)
+    return f"⚠️ {service_name.capitalize()} {verb} but not yet listening on port {port}"
+
+
+async def status_all_services(service_names: tuple = ("whisper", "kokoro", "livekit")) -> str:
+    """Status of several services, checked concurrently.
+    
+    One port scan serves every service, and the per-service details
+    (CPU sampling, version lookups, health checks) run in parallel.
+    """
+    probes = await probe_services({name: _service_port(name) for name in service_names})
+    results = await asyncio.gather(*(status_service(name, probes[name]) for name in service_names))
+    return "\n\n".join(results)
+
+
+async def start_service(service_name: str, wait_ready: bool = True) -> str:
+    """Start a service.
+
+    Whisper and Kokoro count as started once they pass the readiness probe
+    (health check plus a warm-up inference), so the first request after
+    this returns does not pay for model loading.
+
+    Args:
+        service_name: Service to start
+        wait_ready: Wait for readiness; when False, return once launched
+    """
     # Check if already running
     if service_name == "whisper":
         port = WHISPER_PORT
@@ -323,7 +399,7 @@ async def start_service(service_name: str) -> str:
         port = LIVEKIT_PORT
     else:  # frontend
         port = 3000
-    if find_process_by_port(port):
+    if find_process_by_port(port, max_age=0):
         return f"{service_name.capitalize()} is already running on port {port}"
     
     system = platform.system()
@@ -339,22 +415,18 @@ async def start_service(service_name: str) -> str:
                 text=True
             )
             if result.returncode == 0:
-                # Wait for service to start
-                for i in range(10):
-                    if find_process_by_port(port):
-                        return f"✅ {service_name.capitalize()} started"
-                    await asyncio.sleep(0.5)
-                return f"⚠️ {service_name.capitalize()} loaded but not yet listening on port {port}"
+                if not wait_ready:
+                    return f"✅ {service_name.capitalize()} loaded"
+                return await _wait_until_started(service_name, port)
             else:
                 error = result.stderr or result.stdout
                 if "already loaded" in error.lower():
                     # Service is loaded but maybe not running - try to start it
                     # This can happen if the service crashed
                     subprocess.run(["launchctl", "kickstart", "-k", f"gui/{os.getuid()}/com.voicemode.{service_name}"], capture_output=True)
-                    await asyncio.sleep(2)
-                    if find_process_by_port(port):
+                    if not wait_ready:
                         return f"✅ {service_name.capitalize()} restarted"
-                    return f"⚠️ {service_name.capitalize()} is loaded but failed to start"
+                    return await _wait_until_started(service_name, port, verb="restarted")
                 return f"❌ Failed to start {service_name}: {error}"
     
     elif system == "Linux":
@@ -367,12 +439,9 @@ async def start_service(service_name: str) -> str:
                 text=True
             )
             if result.returncode == 0:
-                # Wait for service to start
-                for i in range(10):
-                    if find_process_by_port(port):
-                        return f"✅ {service_name.capitalize()} started"
-                    await asyncio.sleep(0.5)
-                return f"⚠️ {service_name.capitalize()} started but not yet listening on port {port}"
+                if not wait_ready:
+                    return f"✅ {service_name.capitalize()} started"
+                return await _wait_until_started(service_name, port)
             else:
                 error = result.stderr or result.stdout
                 return f"❌ Failed to start {service_name}: {error}"
@@ -389,8 +458,11 @@ async def start_service(service_name: str) -> str:
         if not model_file:
             return "❌ No Whisper model found. Please run download_model first."
         
-        # Start whisper-server
-        cmd = [str(whisper_bin), "--host", "0.0.0.0", "--port", str(port), "--model", str(model_file)]
+        from voice_mode.whisper_pool import instance_threads
+        
+        # Start whisper-server (the first instance of a pool)
+        cmd = [str(whisper_bin), "--host", "0.0.0.0", "--port", str(port), "--model", str(model_file),
+               "--threads", str(instance_threads())]
         
     elif service_name == "kokoro":
         # Find kokoro installation
@@ -441,24 +513,52 @@ async def start_service(service_name: str) -> str:
         cmd = [livekit_bin, "--dev"]
     
     try:
-        # Start the process
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            cwd=Path(kokoro_dir) if service_name == "kokoro" else None
-        )
+        # Log to files rather than pipes nobody reads while waiting for
+        # readiness; a full pipe would stall the service
+        log_dir = Path.home() / ".voicemode" / "logs"
+        log_dir.mkdir(parents=True, exist_ok=True)
+        err_log = log_dir / f"{service_name}.err.log"
+        with open(log_dir / f"{service_name}.out.log", "ab") as out, open(err_log, "ab") as err:
+            err_start = err.tell()
+            process = subprocess.Popen(
+                cmd,
+                stdout=out,
+                stderr=err,
+                cwd=Path(kokoro_dir) if service_name == "kokoro" else None
+            )
         
-        # Wait a moment to check if it started
-        await asyncio.sleep(2)
+        if service_name == "whisper":
+            # Remaining pool instances on the following ports
+            for index in range(1, WHISPER_INSTANCES):
+                instance_cmd = list(cmd)
+                instance_cmd[instance_cmd.index("--port") + 1] = str(port + index)
+                subprocess.Popen(instance_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        
+        if service_name in READINESS_PROBED:
+            if not wait_ready:
+                return f"✅ {service_name.capitalize()} launched (PID: {process.pid})"
+            # Returns early if the process exits
+            ready = await wait_until_ready(service_name, process=process)
+        else:
+            # Wait a moment to check if it started
+            await asyncio.sleep(2)
+            ready = None
         
         if process.poll() is not None:
             # Process exited
-            stderr = process.stderr.read().decode() if process.stderr else ""
+            with open(err_log, "rb") as f:
+                f.seek(err_start)
+                stderr = f.read().decode(errors="replace")
             return f"❌ {service_name.capitalize()} failed to start: {stderr}"
         
+        if ready is not None:
+            if ready["ready"]:
+                return (f"✅ {service_name.capitalize()} started successfully (PID: {process.pid}), "
+                        f"ready in {ready['elapsed_s']:.1f}s")
+            return f"⚠️ {service_name.capitalize()} process started (PID: {process.pid}) but not ready: {ready['error']}"
+        
         # Verify it's listening
-        if find_process_by_port(port):
+        if find_process_by_port(port, max_age=0):
             return f"✅ {service_name.capitalize()} started successfully (PID: {process.pid})"
         else:
             return f"⚠️ {service_name.capitalize()} process started but not listening on port {port} yet"
@@ -515,23 +615,27 @@ async def stop_service(service_name: str) -> str:
                 return f"❌ Failed to stop {service_name}: {error}"
     
     # Fallback to process termination
-    proc = find_process_by_port(port)
-    if not proc:
+    ports = [port + i for i in range(WHISPER_INSTANCES)] if service_name == "whisper" else [port]
+    invalidate_port_map()
+    procs = [proc for proc in map(find_process_by_port, ports) if proc]
+    if not procs:
         return f"{service_name.capitalize()} is not running"
     
     try:
-        pid = proc.pid
-        proc.terminate()
+        pids = [proc.pid for proc in procs]
+        for proc in procs:
+            proc.terminate()
         
         # Wait for graceful shutdown
-        try:
-            proc.wait(timeout=5)
-        except psutil.TimeoutExpired:
-            # Force kill if needed
-            proc.kill()
-            proc.wait(timeout=5)
+        for proc in procs:
+            try:
+                proc.wait(timeout=5)
+            except psutil.TimeoutExpired:
+                # Force kill if needed
+                proc.kill()
+                proc.wait(timeout=5)
         
-        return f"✅ {service_name.capitalize()} stopped (was PID: {pid})"
+        return f"✅ {service_name.capitalize()} stopped (was PID: {', '.join(map(str, pids))})"
         
     except Exception as e:
         logger.error(f"Error stopping {service_name}: {e}")
@@ -668,10 +772,14 @@ async def enable_service(service_name: str) -> str:
                 if not model_file:
                     return "❌ No Whisper model found. Please run download_model first."
                 
+                # The start script reads voicemode.env (model, threads, instances)
+                start_script_path = Path(get_service_config_vars("whisper")["START_SCRIPT_PATH"])
+                if not start_script_path.exists():
+                    return f"❌ Start script not found: {start_script_path}"
+                
                 content = template.format(
-                    WHISPER_BIN=whisper_bin,
+                    START_SCRIPT_PATH=start_script_path,
                     WHISPER_PORT=WHISPER_PORT,
-                    MODEL_FILE=model_file,
                     WORKING_DIR=Path(whisper_bin).parent
                 )
             elif service_name == "kokoro":
@@ -978,7 +1086,7 @@ async def view_logs(service_name: str, lines: Optional[int] = None) -> str:
 
 @mcp.tool()
 async def service(
-    service_name: Literal["whisper", "kokoro", "livekit", "frontend"],
+    service_name: Literal["whisper", "kokoro", "livekit", "frontend", "all"],
     action: Literal["status", "start", "stop", "restart", "enable", "disable", "logs", "update-service-files"] = "status",
     lines: Optional[Union[int, str]] = None
 ) -> str:
@@ -987,7 +1095,8 @@ async def service(
     Manage Whisper (STT) and Kokoro (TTS) services with a single tool.
     
     Args:
-        service_name: The service to manage ("whisper", "kokoro", or "livekit")
+        service_name: The service to manage ("whisper", "kokoro", or "livekit"), or "all"
+            to show the status of every service at once
         action: The action to perform (default: "status")
             - status: Show if service is running and resource usage
             - start: Start the service
@@ -1004,6 +1113,7 @@ async def service(
     
     Examples:
         service("whisper", "status")  # Check if Whisper is running
+        service("all")                # Status of Whisper, Kokoro and LiveKit
         service("kokoro", "start")    # Start Kokoro service
         service("whisper", "logs", 100)  # View last 100 lines of Whisper logs
     """
@@ -1015,6 +1125,11 @@ async def service(
             logger.warning(f"Invalid lines value '{lines}', using default 50")
             lines = 50
     
+    if service_name == "all":
+        if action != "status":
+            return f"❌ Action '{action}' needs a single service"
+        return await status_all_services()
+    
     # Route to appropriate handler
     if action == "status":
         return await status_service(service_name)
@@ -71,9 +71,9 @@ async def voice_statistics_summary() -> str:
         # Key performance metrics
         if stats.successful_interactions > 0:
             if stats.avg_total_time:
-                lines.append(f"Avg Turnaround: {stats.avg_total_time:.1f}s")
+                lines.append(f"Avg Turnaround: {stats.avg_total_time:.1f}s (p90 {stats.p90_total_time:.1f}s)")
             if stats.avg_ttfa:
-                lines.append(f"Avg Time to First Audio: {stats.avg_ttfa:.1f}s")
+                lines.append(f"Avg Time to First Audio: {stats.avg_ttfa:.1f}s (p90 {stats.p90_ttfa:.1f}s)")
             if stats.avg_tts_generation:
                 lines.append(f"Avg TTS Generation: {stats.avg_tts_generation:.1f}s")
             if stats.avg_stt_processing:
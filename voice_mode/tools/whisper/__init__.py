@@ -1,23 +1,35 @@
-"""Whisper service tools."""
+"""Whisper service tools.
 
-from voice_mode.tools.whisper.install import whisper_install
-from voice_mode.tools.whisper.uninstall import whisper_uninstall
-from voice_mode.tools.whisper.model_install import whisper_model_install
-from voice_mode.tools.whisper.list_models import whisper_models
-from voice_mode.tools.whisper.model_active import whisper_model_active
-from voice_mode.tools.whisper.model_remove import whisper_model_remove
-from voice_mode.tools.whisper.model_benchmark import whisper_model_benchmark
+Tool functions are imported on first attribute access, so loading one tool
+module (e.g. ``whisper_install``) does not register its siblings.
+"""
 
-__all__ = [
-    'whisper_install',
-    'whisper_uninstall', 
-    'whisper_model_install',
-    'whisper_models',
-    'whisper_model_active',
-    'whisper_model_remove',
-    'whisper_model_benchmark'
-]
+import importlib
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    'whisper_install': 'install',
+    'whisper_uninstall': 'uninstall',
+    'whisper_model_install': 'model_install',
+    'whisper_models': 'list_models',
+    'whisper_model_active': 'model_active',
+    'whisper_model_remove': 'model_remove',
+    'whisper_model_benchmark': 'model_benchmark',
+    'whisper_model_tune': 'model_tune',
+}
 
 # Backwards compatibility aliases
-download_model = whisper_model_install  # Deprecated alias
-whisper_list_models = whisper_models    # Deprecated alias
\ No newline at end of file
+_ALIASES = {
+    'download_model': 'whisper_model_install',  # Deprecated alias
+    'whisper_list_models': 'whisper_models',    # Deprecated alias
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    target = _ALIASES.get(name, name)
+    if target in _EXPORTS:
+        module = importlib.import_module(f".{_EXPORTS[target]}", __name__)
+        return getattr(module, target)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
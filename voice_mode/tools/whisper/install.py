@@ -140,15 +140,61 @@ echo "[$(date '+%Y-%m-%d %H:%M:%S')] Using binary: $SERVER_BIN" >> "$STARTUP_LOG
 echo "[$(date '+%Y-%m-%d %H:%M:%S')] Model path: $MODEL_PATH" >> "$STARTUP_LOG"
 echo "[$(date '+%Y-%m-%d %H:%M:%S')] Port: $WHISPER_PORT" >> "$STARTUP_LOG"
 
-# Start whisper-server
-# Using exec to replace this script process with whisper-server
+# Instances: VOICEMODE_WHISPER_INSTANCES servers on consecutive ports from WHISPER_PORT
+INSTANCES="${{VOICEMODE_WHISPER_INSTANCES:-1}}"
+if [ -n "$VOICEMODE_WHISPER_THREADS" ]; then
+    THREADS="$VOICEMODE_WHISPER_THREADS"
+elif [ "$INSTANCES" -gt 1 ]; then
+    # Split the cores between the instances
+    CORES=$(getconf _NPROCESSORS_ONLN 2>/dev/null || sysctl -n hw.ncpu 2>/dev/null || echo 8)
+    THREADS=$(( CORES / INSTANCES ))
+    [ "$THREADS" -lt 1 ] && THREADS=1
+else
+    THREADS=8
+fi
+
+echo "[$(date '+%Y-%m-%d %H:%M:%S')] Instances: $INSTANCES, threads each: $THREADS" >> "$STARTUP_LOG"
+
 cd "$WHISPER_DIR"
-exec "$SERVER_BIN" \\
-    --host 0.0.0.0 \\
-    --port "$WHISPER_PORT" \\
-    --model "$MODEL_PATH" \\
-    --inference-path /v1/audio/transcriptions \\
-    --threads 8
+
+if [ "$INSTANCES" -le 1 ]; then
+    # Start whisper-server
+    # Using exec to replace this script process with whisper-server
+    exec "$SERVER_BIN" \\
+        --host 0.0.0.0 \\
+        --port "$WHISPER_PORT" \\
+        --model "$MODEL_PATH" \\
+        --inference-path /v1/audio/transcriptions \\
+        --threads "$THREADS"
+fi
+
+# Pool: this script stays in the foreground so the service manager starts,
+# stops and restarts all instances together
+PIDS=()
+trap 'exit 0' TERM INT
+trap 'kill "${{PIDS[@]}}" 2>/dev/null' EXIT
+for ((i = 0; i < INSTANCES; i++)); do
+    "$SERVER_BIN" \\
+        --host 0.0.0.0 \\
+        --port "$((WHISPER_PORT + i))" \\
+        --model "$MODEL_PATH" \\
+        --inference-path /v1/audio/transcriptions \\
+        --threads "$THREADS" &
+    PIDS+=($!)
+    echo "[$(date '+%Y-%m-%d %H:%M:%S')] Started instance $i on port $((WHISPER_PORT + i)) (PID $!)" >> "$STARTUP_LOG"
+done
+
+# If any instance dies, exit so the service manager restarts the whole pool
+while true; do
+    for pid in "${{PIDS[@]}}"; do
+        if ! kill -0 "$pid" 2>/dev/null; then
+            echo "[$(date '+%Y-%m-%d %H:%M:%S')] Instance with PID $pid exited; stopping the pool" >> "$STARTUP_LOG"
+            exit 1
+        fi
+    done
+    sleep 2 &
+    wait $!
+done
 """
     
     start_script_path = os.path.join(bin_dir, "start-whisper-server.sh")
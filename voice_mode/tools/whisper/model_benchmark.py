@@ -1,159 +1,439 @@
-"""MCP tool for benchmarking Whisper models."""
+"""Benchmark suite for Whisper models.
 
-from typing import Union, List, Dict, Any, Optional
+Sweeps models, thread counts and beam sizes over a set of sample files,
+repeats every configuration, and summarises load, encode and total time
+with medians and spread. Reports are saved as JSON under
+``BASE_DIR/benchmarks/whisper`` and can be compared with a saved baseline
+to flag regressions.
+"""
+
+import json
+import math
+import os
+import platform
+import statistics
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from voice_mode.config import BASE_DIR
 from voice_mode.tools.whisper.models import (
     get_installed_whisper_models,
     benchmark_whisper_model,
+    get_default_sample_dir,
+    get_whisper_cli,
     is_whisper_model_installed,
     WHISPER_MODEL_REGISTRY
 )
 
+RESULTS_VERSION = 1
+TIMED_STAGES = ("load_time_ms", "encode_time_ms", "decode_time_ms", "total_time_ms", "wall_time_ms")
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+
+
+def get_results_dir() -> Path:
+    """Where benchmark reports are saved."""
+    return Path(BASE_DIR) / "benchmarks" / "whisper"
+
+
+def get_baseline_path() -> Path:
+    """Report that ``--compare`` checks against by default."""
+    return get_results_dir() / "baseline.json"
+
+
+def default_threads() -> List[int]:
+    """Thread counts swept when none are given: all cores, up to 8."""
+    return [min(8, os.cpu_count() or 4)]
+
+
+def find_sample_files(directory: Optional[Path] = None) -> List[Path]:
+    """WAV samples in ``directory`` (default: the whisper.cpp samples)."""
+    directory = Path(directory) if directory else get_default_sample_dir()
+    if not directory.is_dir():
+        return []
+    return sorted(directory.glob("*.wav"))
+
+
+def summarize(values: Sequence[float]) -> Dict[str, float]:
+    """Median, mean, standard deviation and range of repeated measurements."""
+    return {
+        "median": round(statistics.median(values), 2),
+        "mean": round(statistics.fmean(values), 2),
+        "stdev": round(statistics.stdev(values), 2) if len(values) > 1 else 0.0,
+        "min": round(min(values), 2),
+        "max": round(max(values), 2),
+    }
+
+
+def _config_key(config: Dict[str, Any]) -> tuple:
+    # Sample paths differ between machines; the file name identifies the sample
+    return (config["model"], config["threads"], config["beam_size"], Path(config["sample"]).name)
+
+
+def run_benchmark_suite(
+    models: Sequence[str],
+    sample_files: Sequence[Union[str, Path]],
+    threads: Sequence[int],
+    beam_sizes: Sequence[int],
+    runs: int = 3,
+    runner: Optional[Callable[..., Dict[str, Any]]] = None,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """Benchmark every combination of model, sample, thread count and beam size.
 
-async def whisper_model_benchmark(
-    models: Union[str, List[str]] = "installed",
-    sample_file: Optional[str] = None,
-    runs: int = 1
-) -> Dict[str, Any]:
-    """Benchmark Whisper model performance.
-    
     Args:
-        models: 'installed' (default), 'all', specific model name, or list of models
-        sample_file: Optional audio file for testing (uses default JFK sample if None)
-        runs: Number of benchmark runs per model (default: 1)
-        
+        models: Installed models to run
+        sample_files: Audio files to transcribe
+        threads: Thread counts to sweep
+        beam_sizes: Beam sizes to sweep
+        runs: Repetitions per configuration
+        runner: Single-run benchmark (default: ``benchmark_whisper_model``)
+        progress: Called with each configuration's result as it completes
+
+    Returns:
+        One entry per configuration. Successful entries carry a summary
+        (see ``summarize``) for each timed stage and a real-time factor
+        computed from the median total time.
+    """
+    runner = runner or benchmark_whisper_model
+    configs = []
+    for model in models:
+        for sample in sample_files:
+            for thread_count in threads:
+                for beam_size in beam_sizes:
+                    config = {
+                        "model": model,
+                        "sample": str(sample),
+                        "threads": thread_count,
+                        "beam_size": beam_size,
+                    }
+                    measurements = []
+                    for _ in range(runs):
+                        result = runner(model, str(sample), threads=thread_count, beam_size=beam_size)
+                        if not result.get("success"):
+                            config.update(success=False, error=result.get("error", "Benchmark failed"))
+                            break
+                        measurements.append(result)
+                    else:
+                        duration = measurements[0].get("sample_duration_s")
+                        config["success"] = True
+                        config["runs"] = len(measurements)
+                        config["sample_duration_s"] = duration
+                        for stage in TIMED_STAGES:
+                            config[stage] = summarize([m.get(stage) or 0.0 for m in measurements])
+                        median_total = config["total_time_ms"]["median"]
+                        config["real_time_factor"] = (
+                            round(duration * 1000 / median_total, 1) if duration and median_total > 0 else None
+                        )
+                    configs.append(config)
+                    if progress:
+                        progress(config)
+    return configs
+
+
+def build_report(configs: List[Dict[str, Any]], runs: int) -> Dict[str, Any]:
+    """Wrap configuration results with the context needed to compare them later."""
+    return {
+        "version": RESULTS_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "host": {
+            "hostname": platform.node(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "whisper_cli": str(get_whisper_cli()),
+        },
+        "runs": runs,
+        "configurations": configs,
+    }
+
+
+def save_report(report: Dict[str, Any], path: Optional[Path] = None) -> Path:
+    """Write a report as JSON (default: a timestamped file in the results directory)."""
+    if path is None:
+        stamp = report["created"].replace(":", "").replace("-", "")
+        path = get_results_dir() / f"whisper-benchmark-{stamp}.json"
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2) + "\n")
+    return path
+
+
+def load_report(path: Union[str, Path]) -> Dict[str, Any]:
+    """Read a saved report.
+
+    Raises:
+        ValueError: If the file is not a benchmark report
+    """
+    report = json.loads(Path(path).read_text())
+    if not isinstance(report, dict) or "configurations" not in report:
+        raise ValueError(f"{path} is not a Whisper benchmark report")
+    return report
+
+
+def compare_reports(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> Dict[str, Any]:
+    """Compare median total times of configurations present in both reports.
+
+    A configuration regressed when its median total time grew by more than
+    ``threshold`` (a fraction of the baseline median) and by more than twice
+    the larger of the two standard deviations, so run-to-run noise is not
+    reported. Improvements are the mirror image.
+
     Returns:
-        Dict with benchmark results and recommendations
+        ``regressions``, ``improvements`` (each a list of entries with the
+        configuration, both medians and the relative change), ``compared``
+        and ``unmatched`` counts
     """
-    # Determine which models to benchmark
+    baseline_by_key = {
+        _config_key(c): c for c in baseline.get("configurations", []) if c.get("success")
+    }
+    regressions, improvements = [], []
+    compared = unmatched = 0
+    for config in current.get("configurations", []):
+        if not config.get("success"):
+            continue
+        base = baseline_by_key.get(_config_key(config))
+        if base is None:
+            unmatched += 1
+            continue
+        compared += 1
+        now, before = config["total_time_ms"], base["total_time_ms"]
+        delta = now["median"] - before["median"]
+        noise = 2 * max(now["stdev"], before["stdev"])
+        if before["median"] <= 0 or abs(delta) <= noise or abs(delta) <= threshold * before["median"]:
+            continue
+        entry = {
+            "model": config["model"],
+            "sample": Path(config["sample"]).name,
+            "threads": config["threads"],
+            "beam_size": config["beam_size"],
+            "baseline_ms": before["median"],
+            "current_ms": now["median"],
+            "change": round(delta / before["median"], 3),
+        }
+        (regressions if delta > 0 else improvements).append(entry)
+    return {
+        "threshold": threshold,
+        "compared": compared,
+        "unmatched": unmatched,
+        "regressions": regressions,
+        "improvements": improvements,
+    }
+
+
+def _resolve_models(models: Union[str, List[str]]) -> Union[List[str], str]:
+    """Installed models to benchmark, or an error message."""
     if models == "installed":
         model_list = get_installed_whisper_models()
         if not model_list:
-            return {
-                "success": False,
-                "error": "No Whisper models are installed. Install models first with whisper_model_install()"
-            }
+            return "No Whisper models are installed. Install models first with whisper_model_install()"
     elif models == "all":
         # Only benchmark installed models from the full list
-        all_models = list(WHISPER_MODEL_REGISTRY.keys())
-        model_list = [m for m in all_models if is_whisper_model_installed(m)]
+        model_list = [m for m in WHISPER_MODEL_REGISTRY if is_whisper_model_installed(m)]
         if not model_list:
-            return {
-                "success": False,
-                "error": "No Whisper models are installed"
-            }
+            return "No Whisper models are installed"
     elif isinstance(models, str):
-        # Single model specified
         if not is_whisper_model_installed(models):
-            return {
-                "success": False,
-                "error": f"Model {models} is not installed"
-            }
+            return f"Model {models} is not installed"
         model_list = [models]
     elif isinstance(models, list):
-        # List of models specified
-        model_list = []
-        for model in models:
-            if is_whisper_model_installed(model):
-                model_list.append(model)
-            else:
-                # Model not installed, skip silently or could use logger.warning
-                pass
+        # Models that are not installed are skipped
+        model_list = [m for m in models if is_whisper_model_installed(m)]
         if not model_list:
-            return {
-                "success": False,
-                "error": "None of the specified models are installed"
-            }
+            return "None of the specified models are installed"
     else:
-        return {
-            "success": False,
-            "error": f"Invalid models parameter: {models}"
-        }
-    
-    # Run benchmarks
+        return f"Invalid models parameter: {models}"
+    return model_list
+
+
+def _categorize(rtf: Optional[float]) -> str:
+    rtf = rtf or 0
+    if rtf > 20:
+        return "Ultra-fast (good for real-time)"
+    elif rtf > 5:
+        return "Fast (good for interactive use)"
+    elif rtf > 1:
+        return "Moderate (good balance)"
+    return "Slow (best accuracy)"
+
+
+def aggregate_settings(configs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Combine successful configurations across samples.
+
+    Returns:
+        One entry per (model, threads, beam size) with the summed median
+        load, encode and total times, the spread of the total (run-to-run
+        deviations combined in quadrature), the audio it covered, and the
+        resulting real-time factor (None when sample durations are unknown)
+    """
+    combined: Dict[tuple, Dict[str, Any]] = {}
+    for config in configs:
+        if not config.get("success"):
+            continue
+        key = (config["model"], config["threads"], config["beam_size"])
+        entry = combined.setdefault(key, {
+            "model": config["model"], "threads": config["threads"], "beam_size": config["beam_size"],
+            "samples": 0, "audio_s": 0.0, "load_time_ms": 0.0, "encode_time_ms": 0.0,
+            "total_time_ms": 0.0, "total_variance": 0.0, "durations_known": True,
+        })
+        entry["samples"] += 1
+        entry["load_time_ms"] += config["load_time_ms"]["median"]
+        entry["encode_time_ms"] += config["encode_time_ms"]["median"]
+        entry["total_time_ms"] += config["total_time_ms"]["median"]
+        entry["total_variance"] += config["total_time_ms"]["stdev"] ** 2
+        if config.get("sample_duration_s"):
+            entry["audio_s"] += config["sample_duration_s"]
+        else:
+            entry["durations_known"] = False
     results = []
-    failed = []
-    
+    for entry in combined.values():
+        known = entry.pop("durations_known")
+        total = entry["total_time_ms"]
+        entry["total_time_stdev_ms"] = round(math.sqrt(entry.pop("total_variance")), 1)
+        for name in ("load_time_ms", "encode_time_ms", "total_time_ms"):
+            entry[name] = round(entry[name], 1)
+        entry["audio_s"] = round(entry["audio_s"], 3)
+        entry["real_time_factor"] = round(entry["audio_s"] * 1000 / total, 1) if known and total > 0 else None
+        results.append(entry)
+    return results
+
+
+def _best_per_model(configs: List[Dict[str, Any]], model_list: List[str]) -> List[Dict[str, Any]]:
+    """One row per model: its fastest settings over all samples, or its first failure.
+
+    Settings are compared by their total time summed across samples, so no
+    setting wins just by being measured on a shorter sample; settings that
+    completed more samples come first.
+    """
+    settings = aggregate_settings(configs)
+    rows = []
     for model in model_list:
-        best_result = None
-        
-        for run_num in range(runs):
-            result = benchmark_whisper_model(model, sample_file)
-            
-            if result.get("success"):
-                # Keep the best (fastest) result from multiple runs
-                if best_result is None or result["total_time_ms"] < best_result["total_time_ms"]:
-                    best_result = result
-            else:
-                # If any run fails, record the failure
-                if model not in failed:
-                    failed.append(model)
-                    results.append({
-                        "model": model,
-                        "success": False,
-                        "error": result.get("error", "Benchmark failed")
-                    })
-                break
-        
-        if best_result:
-            results.append(best_result)
-    
-    if not results:
+        ok = [s for s in settings if s["model"] == model]
+        if not ok:
+            failure = next((c for c in configs if c["model"] == model), {})
+            rows.append({"model": model, "success": False, "error": failure.get("error", "Benchmark failed")})
+            continue
+        best = min(ok, key=lambda s: (-s["samples"], s["total_time_ms"]))
+        rows.append({
+            "model": model,
+            "success": True,
+            "threads": best["threads"],
+            "beam_size": best["beam_size"],
+            "samples": best["samples"],
+            "load_time_ms": best["load_time_ms"],
+            "encode_time_ms": best["encode_time_ms"],
+            "total_time_ms": best["total_time_ms"],
+            "total_time_stdev_ms": best["total_time_stdev_ms"],
+            "real_time_factor": best["real_time_factor"],
+            "category": _categorize(best["real_time_factor"]),
+        })
+    return rows
+
+
+async def whisper_model_benchmark(
+    models: Union[str, List[str]] = "installed",
+    sample_file: Optional[str] = None,
+    runs: int = 3,
+    sample_files: Optional[List[str]] = None,
+    threads: Optional[List[int]] = None,
+    beam_sizes: Optional[List[int]] = None,
+    save: bool = True,
+    baseline: Optional[str] = None,
+    save_baseline: bool = False,
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """Benchmark Whisper model performance.
+
+    Args:
+        models: 'installed' (default), 'all', specific model name, or list of models
+        sample_file: Single audio file to test with (shorthand for sample_files)
+        runs: Repetitions of each configuration (default: 3)
+        sample_files: Audio files to test with (default: every WAV sample shipped with whisper.cpp)
+        threads: Thread counts to sweep (default: all cores, up to 8)
+        beam_sizes: Beam sizes to sweep (default: [1])
+        save: Save the report as JSON under ``BASE_DIR/benchmarks/whisper``
+        baseline: Report to compare against, or "default" for the saved baseline
+        save_baseline: Also save this report as the default baseline
+        threshold: Relative slowdown of the median total time that counts as a regression
+        progress: Called with each configuration's result as it completes
+
+    Returns:
+        Dict with per-model summaries (``benchmarks``), every configuration's
+        statistics (``configurations``), recommendations, the saved report
+        path and, when a baseline was given, the comparison
+    """
+    model_list = _resolve_models(models)
+    if isinstance(model_list, str):
+        return {"success": False, "error": model_list}
+
+    if sample_files is None:
+        sample_files = [sample_file] if sample_file else find_sample_files()
+    if not sample_files:
         return {
             "success": False,
-            "error": "No benchmarks completed successfully"
+            "error": f"No sample files found in {get_default_sample_dir()}; pass sample files explicitly"
         }
-    
-    # Find successful results for analysis
+    threads = list(threads) if threads else default_threads()
+    beam_sizes = list(beam_sizes) if beam_sizes else [1]
+    runs = max(1, runs)
+
+    baseline_report = None
+    if baseline:
+        baseline_path = get_baseline_path() if baseline == "default" else Path(baseline)
+        try:
+            baseline_report = load_report(baseline_path)
+        except (OSError, ValueError) as e:
+            return {"success": False, "error": f"Cannot read baseline {baseline_path}: {e}"}
+
+    configs = run_benchmark_suite(model_list, sample_files, threads, beam_sizes, runs, progress=progress)
+    if not any(c.get("success") for c in configs):
+        errors = sorted({c.get("error", "Benchmark failed") for c in configs})
+        return {"success": False, "error": "No benchmarks completed successfully: " + "; ".join(errors)}
+
+    report = build_report(configs, runs)
+    results = _best_per_model(configs, model_list)
     successful_results = [r for r in results if r.get("success")]
-    
-    if successful_results:
-        # Find fastest model
-        fastest = min(successful_results, key=lambda x: x["total_time_ms"])
-        
-        # Generate recommendations based on results
-        recommendations = []
-        
-        # Categorize by speed
-        for result in successful_results:
-            rtf = result.get("real_time_factor", 0)
-            if rtf > 20:
-                category = "Ultra-fast (good for real-time)"
-            elif rtf > 5:
-                category = "Fast (good for interactive use)"
-            elif rtf > 1:
-                category = "Moderate (good balance)"
-            else:
-                category = "Slow (best accuracy)"
-            
-            result["category"] = category
-        
-        # Generate specific recommendations
-        if fastest["real_time_factor"] > 10:
-            recommendations.append(f"Use {fastest['model']} for real-time applications")
-        
-        # Find best balance (medium or base if available)
-        balance_models = [r for r in successful_results if r["model"] in ["base", "medium"]]
-        if balance_models:
-            best_balance = min(balance_models, key=lambda x: x["total_time_ms"])
-            recommendations.append(f"Use {best_balance['model']} for balanced speed/accuracy")
-        
-        # Recommend large models for accuracy
-        large_models = [r for r in successful_results if "large" in r["model"]]
-        if large_models:
-            best_large = min(large_models, key=lambda x: x["total_time_ms"])
-            recommendations.append(f"Use {best_large['model']} for best accuracy")
-    else:
-        fastest = None
-        recommendations = ["Unable to generate recommendations - no successful benchmarks"]
-    
-    return {
+    fastest = min(successful_results, key=lambda x: x["total_time_ms"])
+
+    recommendations = []
+    if (fastest["real_time_factor"] or 0) > 10:
+        recommendations.append(f"Use {fastest['model']} for real-time applications")
+    balance_models = [r for r in successful_results if r["model"] in ["base", "medium"]]
+    if balance_models:
+        best_balance = min(balance_models, key=lambda x: x["total_time_ms"])
+        recommendations.append(f"Use {best_balance['model']} for balanced speed/accuracy")
+    large_models = [r for r in successful_results if "large" in r["model"]]
+    if large_models:
+        best_large = min(large_models, key=lambda x: x["total_time_ms"])
+        recommendations.append(f"Use {best_large['model']} for best accuracy")
+    if len(threads) > 1 or len(beam_sizes) > 1:
+        recommendations.append(
+            f"Fastest settings for {fastest['model']}: --threads {fastest['threads']} --beam-size {fastest['beam_size']}"
+        )
+
+    result = {
         "success": True,
         "benchmarks": results,
+        "configurations": configs,
         "models_tested": len(model_list),
-        "models_failed": len(failed),
-        "fastest_model": fastest["model"] if fastest else None,
-        "fastest_time_ms": fastest["total_time_ms"] if fastest else None,
+        "models_failed": len(results) - len(successful_results),
+        "fastest_model": fastest["model"],
+        "fastest_time_ms": fastest["total_time_ms"],
         "recommendations": recommendations,
-        "sample_file": sample_file or "default JFK sample",
-        "runs_per_model": runs
-    }
\ No newline at end of file
+        "sample_files": [str(s) for s in sample_files],
+        "threads": threads,
+        "beam_sizes": beam_sizes,
+        "runs_per_model": runs,
+    }
+    if save:
+        result["results_file"] = str(save_report(report))
+    if save_baseline:
+        result["baseline_file"] = str(save_report(report, get_baseline_path()))
+    if baseline_report is not None:
+        result["comparison"] = compare_reports(report, baseline_report, threshold)
+    return result
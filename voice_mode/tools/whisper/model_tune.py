@@ -0,0 +1,241 @@
+"""Pick the Whisper model and thread count for a latency target.
+
+The tuner benchmarks installed models from the most to the least accurate
+at a few thread counts derived from the CPU topology (physical cores, half
+of them, all logical CPUs when SMT is on, and the performance cores on
+Apple Silicon). The first model whose real-time factor meets the target at
+some thread count wins, so slower models are never benchmarked once a
+better one qualifies. The real-time factor is computed from inference time
+only: whisper-cli's total includes loading the model, which the running
+server pays once at startup rather than per request. The choice is written
+to voicemode.env, the Whisper service is restarted, and the tuning report
+is saved next to the benchmark reports.
+"""
+
+import logging
+import os
+import platform
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import psutil
+
+from voice_mode.config import WHISPER_LANGUAGE, WHISPER_MODEL, WHISPER_THREADS
+from voice_mode.tools.whisper.model_benchmark import (
+    aggregate_settings,
+    build_report,
+    find_sample_files,
+    get_default_sample_dir,
+    get_results_dir,
+    run_benchmark_suite,
+    save_report,
+)
+from voice_mode.tools.whisper.models import (
+    get_installed_whisper_models,
+    update_whisper_config,
+)
+
+logger = logging.getLogger("voicemode")
+
+# Least to most accurate
+MODEL_QUALITY_ORDER = [
+    "tiny", "tiny.en",
+    "base", "base.en",
+    "small", "small.en",
+    "medium", "medium.en",
+    "large-v1", "large-v3-turbo", "large-v2", "large-v3",
+]
+
+RTF_MEASURE = "inference (whisper-cli total minus model load)"
+
+
+def _sysctl_int(name: str) -> Optional[int]:
+    try:
+        result = subprocess.run(["sysctl", "-n", name], capture_output=True, text=True, timeout=2)
+        return int(result.stdout.strip()) if result.returncode == 0 else None
+    except (OSError, ValueError, subprocess.SubprocessError):
+        return None
+
+
+def get_cpu_topology() -> Dict[str, Any]:
+    """Logical CPUs, physical cores and SMT state of this machine.
+
+    Returns:
+        Dict with ``logical``, ``physical``, ``available`` (CPUs this process
+        may run on), ``smt`` and, on Apple Silicon, ``performance`` cores
+    """
+    logical = psutil.cpu_count(logical=True) or os.cpu_count() or 1
+    physical = psutil.cpu_count(logical=False) or logical
+    try:
+        available = len(os.sched_getaffinity(0))
+    except AttributeError:
+        available = logical
+    topology = {
+        "logical": logical,
+        "physical": physical,
+        "available": available,
+        "smt": logical > physical,
+    }
+    if platform.system() == "Darwin":
+        # Efficiency cores slow down every thread that lands on them
+        performance = _sysctl_int("hw.perflevel0.physicalcpu")
+        if performance:
+            topology["performance"] = performance
+    return topology
+
+
+def candidate_threads(topology: Dict[str, Any]) -> List[int]:
+    """Thread counts worth trying for this topology."""
+    physical = topology["physical"]
+    options = {physical, max(1, physical // 2)}
+    if topology.get("smt"):
+        options.add(topology["logical"])
+    if topology.get("performance"):
+        options.add(topology["performance"])
+    limit = topology.get("available") or topology["logical"]
+    return sorted({min(n, limit) for n in options})
+
+
+def candidate_models(installed: Sequence[str], english: bool) -> List[str]:
+    """Installed models from most to least accurate (English-only ones only if ``english``)."""
+    ranked = [m for m in reversed(MODEL_QUALITY_ORDER) if m in installed]
+    if not english:
+        ranked = [m for m in ranked if not m.endswith(".en")]
+    return ranked
+
+
+def tuning_settings(configs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Aggregate settings with the real-time factor of inference alone.
+
+    Returns:
+        aggregate_settings() entries with ``inference_time_ms`` added and
+        ``real_time_factor`` recomputed from it
+    """
+    settings = aggregate_settings(configs)
+    for entry in settings:
+        inference = round(entry["total_time_ms"] - entry["load_time_ms"], 1)
+        entry["inference_time_ms"] = inference
+        if entry["real_time_factor"] is not None:
+            entry["real_time_factor"] = round(entry["audio_s"] * 1000 / inference, 1) if inference > 0 else None
+    return settings
+
+
+async def _refresh_start_script() -> Optional[str]:
+    """Reinstall the service start script if it predates VOICEMODE_WHISPER_THREADS."""
+    whisper_dir = Path.home() / ".voicemode" / "services" / "whisper"
+    script = whisper_dir / "bin" / "start-whisper-server.sh"
+    if not script.exists() or "VOICEMODE_WHISPER_THREADS" in script.read_text():
+        return None
+    from voice_mode.tools.whisper.install import update_whisper_service_files
+
+    result = await update_whisper_service_files(str(whisper_dir), str(whisper_dir.parent.parent))
+    return "Updated the Whisper start script to read VOICEMODE_WHISPER_THREADS" if result.get("success") else None
+
+
+async def whisper_model_tune(
+    target_rtf: float,
+    models: Optional[List[str]] = None,
+    sample_files: Optional[List[str]] = None,
+    threads: Optional[List[int]] = None,
+    runs: int = 3,
+    english: Optional[bool] = None,
+    apply: bool = True,
+    restart: bool = True,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """Find the most accurate model and thread count that meet a real-time factor.
+
+    Args:
+        target_rtf: Required real-time factor (seconds of audio per second of processing)
+        models: Models to consider (default: all installed)
+        sample_files: Audio files to benchmark with (default: whisper.cpp samples)
+        threads: Thread counts to try (default: derived from the CPU topology)
+        runs: Repetitions of each configuration
+        english: Allow English-only models (default: when VOICEMODE_WHISPER_LANGUAGE is "en")
+        apply: Write the choice to voicemode.env
+        restart: Restart the Whisper service after applying
+        progress: Called with each configuration's result as it completes
+
+    Returns:
+        Dict with the choice (``model``, ``threads``, ``real_time_factor``),
+        every tested setting, the saved report path and what was changed
+    """
+    topology = get_cpu_topology()
+    thread_options = sorted(set(threads)) if threads else candidate_threads(topology)
+    if english is None:
+        english = WHISPER_LANGUAGE == "en"
+
+    installed = get_installed_whisper_models()
+    model_list = candidate_models([m for m in installed if not models or m in models], english)
+    if not model_list:
+        return {"success": False, "error": "No matching Whisper models are installed"}
+
+    if not sample_files:
+        sample_files = [str(s) for s in find_sample_files()]
+    if not sample_files:
+        return {
+            "success": False,
+            "error": f"No sample files found in {get_default_sample_dir()}; pass sample files explicitly"
+        }
+
+    configs: List[Dict[str, Any]] = []
+    choice = None
+    for model in model_list:
+        configs += run_benchmark_suite([model], sample_files, thread_options, [1], runs, progress=progress)
+        settings = [s for s in tuning_settings(configs) if s["model"] == model]
+        meeting = [s for s in settings if s["real_time_factor"] is not None and s["real_time_factor"] >= target_rtf]
+        if meeting:
+            choice = max(meeting, key=lambda s: s["real_time_factor"])
+            break
+
+    tested = tuning_settings(configs)
+    report = build_report(configs, runs)
+    report["tuning"] = {
+        "target_rtf": target_rtf,
+        "rtf_measure": RTF_MEASURE,
+        "topology": topology,
+        "thread_options": thread_options,
+        "english": english,
+        "previous": {"model": WHISPER_MODEL, "threads": WHISPER_THREADS},
+        "choice": choice,
+    }
+    stamp = datetime.now().strftime("%Y%m%dT%H%M%S")
+    report_file = save_report(report, get_results_dir() / f"whisper-tune-{stamp}.json")
+
+    result = {
+        "success": choice is not None,
+        "target_rtf": target_rtf,
+        "rtf_measure": RTF_MEASURE,
+        "topology": topology,
+        "thread_options": thread_options,
+        "tested": tested,
+        "report_file": str(report_file),
+        "previous": report["tuning"]["previous"],
+        "changes": [],
+    }
+    if choice is None:
+        fastest = max((s for s in tested if s["real_time_factor"]), key=lambda s: s["real_time_factor"], default=None)
+        result["error"] = f"No installed model reaches {target_rtf}x real time"
+        if fastest:
+            result["error"] += f" (best: {fastest['model']} at {fastest['real_time_factor']}x with {fastest['threads']} threads)"
+        return result
+
+    result.update(model=choice["model"], threads=choice["threads"], real_time_factor=choice["real_time_factor"])
+    logger.info(f"Whisper tuning chose {choice['model']} with {choice['threads']} threads "
+                f"({choice['real_time_factor']}x real time, target {target_rtf}x)")
+    if apply:
+        config_path = update_whisper_config({
+            "VOICEMODE_WHISPER_MODEL": choice["model"],
+            "VOICEMODE_WHISPER_THREADS": str(choice["threads"]),
+        })
+        result["changes"].append(f"Wrote VOICEMODE_WHISPER_MODEL={choice['model']} and "
+                                 f"VOICEMODE_WHISPER_THREADS={choice['threads']} to {config_path}")
+        refreshed = await _refresh_start_script()
+        if refreshed:
+            result["changes"].append(refreshed)
+        if restart:
+            from voice_mode.tools.service import restart_service
+            result["restart"] = await restart_service("whisper")
+    return result
@@ -7,7 +7,13 @@ from typing import Any, Dict, List, Optional, TypedDict
 from voice_mode.config import WHISPER_MODEL_PATH, WHISPER_MODEL
 
 
-class ModelInfo(TypedDict):
+class _ModelChecksum(TypedDict, total=False):
+    # Pinned SHA-256 of the download; without it the hash Hugging Face
+    # publishes for the file is checked instead
+    sha256: str
+
+
+class ModelInfo(_ModelChecksum):
     """Information about a Whisper model."""
     size_mb: int  # Download size in MB
     languages: str  # Language support description
@@ -214,7 +220,18 @@ def set_active_model(model_name: str) -> None:
     
     Updates the voicemode.env configuration file for persistence.
     """
-    from pathlib import Path
+    update_whisper_config({'VOICEMODE_WHISPER_MODEL': model_name})
+
+
+def update_whisper_config(updates: Dict[str, str]) -> Path:
+    """Set Whisper settings in ~/.voicemode/voicemode.env, preserving the rest of the file.
+    
+    Args:
+        updates: Settings to write, e.g. ``{"VOICEMODE_WHISPER_THREADS": "6"}``
+    
+    Returns:
+        Path of the updated file
+    """
     import re
     
     # Configuration file path
@@ -223,23 +240,6 @@ def set_active_model(model_name: str) -> None:
     # Ensure directory exists
     config_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Read existing configuration
-    config = {}
-    if config_path.exists():
-        with open(config_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                match = re.match(r'^([A-Z_]+)=(.*)$', line)
-                if match:
-                    key, value = match.groups()
-                    value = value.strip('"').strip("'")
-                    config[key] = value
-    
-    # Update the model
-    config['VOICEMODE_WHISPER_MODEL'] = model_name
-    
     # Write back to file, preserving structure
     lines = []
     updated_keys = set()
@@ -248,33 +248,29 @@ def set_active_model(model_name: str) -> None:
         with open(config_path, 'r') as f:
             for line in f:
                 stripped = line.strip()
-                if stripped and not stripped.startswith('#'):
-                    match = re.match(r'^([A-Z_]+)=', stripped)
-                    if match:
-                        key = match.group(1)
-                        if key == 'VOICEMODE_WHISPER_MODEL':
-                            lines.append(f"VOICEMODE_WHISPER_MODEL={model_name}\n")
-                            updated_keys.add(key)
-                        elif key in config:
-                            lines.append(f"{key}={config[key]}\n")
-                            updated_keys.add(key)
-                        else:
-                            lines.append(line)
-                    else:
-                        lines.append(line)
+                match = re.match(r'^([A-Z_]+)=', stripped) if stripped and not stripped.startswith('#') else None
+                if match and match.group(1) in updates:
+                    key = match.group(1)
+                    lines.append(f"{key}={updates[key]}\n")
+                    updated_keys.add(key)
                 else:
                     lines.append(line)
     
-    # Add VOICEMODE_WHISPER_MODEL if it wasn't in the file
-    if 'VOICEMODE_WHISPER_MODEL' not in updated_keys:
+    # Add settings that weren't in the file
+    missing = [key for key in updates if key not in updated_keys]
+    if missing:
+        if lines and not lines[-1].endswith('\n'):
+            lines.append('\n')
         if lines and not lines[-1].strip() == '':
             lines.append('\n')
         lines.append("# Whisper Configuration\n")
-        lines.append(f"VOICEMODE_WHISPER_MODEL={model_name}\n")
+        for key in missing:
+            lines.append(f"{key}={updates[key]}\n")
     
     # Write the updated configuration
     with open(config_path, 'w') as f:
         f.writelines(lines)
+    return config_path
 
 
 def remove_whisper_model(model_name: str, remove_coreml: bool = True) -> Dict[str, Any]:
@@ -325,19 +321,61 @@ def remove_whisper_model(model_name: str, remove_coreml: bool = True) -> Dict[st
     }
 
 
-def benchmark_whisper_model(model_name: str, sample_file: Optional[str] = None) -> Dict[str, Any]:
+def get_whisper_cli() -> Path:
+    """Path of the whisper.cpp ``whisper-cli`` binary (it may not exist)."""
+    return Path.home() / ".voicemode" / "services" / "whisper" / "build" / "bin" / "whisper-cli"
+
+
+def get_default_sample_dir() -> Path:
+    """Directory of the audio samples shipped with whisper.cpp."""
+    return Path.home() / ".voicemode" / "services" / "whisper" / "samples"
+
+
+def get_audio_duration(audio_file: Path) -> Optional[float]:
+    """Duration of a WAV file in seconds, or None if it cannot be read as WAV."""
+    import wave
+
+    try:
+        with wave.open(str(audio_file), "rb") as wav:
+            return wav.getnframes() / float(wav.getframerate())
+    except (OSError, EOFError, wave.Error, ZeroDivisionError):
+        return None
+
+
+def parse_whisper_timings(output: str) -> Dict[str, float]:
+    """Stage timings from ``whisper_print_timings`` output.
+
+    Returns:
+        Milliseconds by stage, e.g. ``{"load": 120.5, "encode": 512.0, "total": 900.1}``
+    """
+    import re
+
+    return {stage: float(ms) for stage, ms in re.findall(r"(\w+) time\s*=\s*([\d.]+)\s*ms", output)}
+
+
+def benchmark_whisper_model(
+    model_name: str,
+    sample_file: Optional[str] = None,
+    threads: int = 8,
+    beam_size: int = 1,
+    timeout: float = 300,
+) -> Dict[str, Any]:
     """Run performance benchmark on a whisper model.
     
     Args:
         model_name: Name of the model to benchmark
         sample_file: Optional audio file to use (defaults to JFK sample)
+        threads: Threads for whisper-cli (``--threads``)
+        beam_size: Beam size for whisper-cli (``--beam-size``)
+        timeout: Seconds before the run is abandoned
         
     Returns:
-        Dict with benchmark results
+        Dict with benchmark results. Times are in milliseconds; the real-time
+        factor uses the sample's measured duration.
     """
-    import subprocess
     import re
-    from pathlib import Path
+    import subprocess
+    import time
     
     if not is_whisper_model_installed(model_name):
         return {
@@ -345,8 +383,7 @@ def benchmark_whisper_model(model_name: str, sample_file: Optional[str] = None)
             "error": f"Model {model_name} is not installed"
         }
     
-    # Find whisper-cli binary
-    whisper_bin = Path.home() / ".voicemode" / "services" / "whisper" / "build" / "bin" / "whisper-cli"
+    whisper_bin = get_whisper_cli()
     if not whisper_bin.exists():
         return {
             "success": False,
@@ -355,70 +392,77 @@ def benchmark_whisper_model(model_name: str, sample_file: Optional[str] = None)
     
     # Use sample file or default JFK sample
     if sample_file is None:
-        sample_file = Path.home() / ".voicemode" / "services" / "whisper" / "samples" / "jfk.wav"
-        if not sample_file.exists():
-            return {
-                "success": False,
-                "error": "Default sample file not found"
-            }
+        sample_file = get_default_sample_dir() / "jfk.wav"
+    sample_file = Path(sample_file)
+    if not sample_file.exists():
+        return {
+            "success": False,
+            "error": f"Sample file not found: {sample_file}"
+        }
     
     model_dir = get_model_directory()
     model_info = WHISPER_MODEL_REGISTRY[model_name]
     model_path = model_dir / model_info["filename"]
     
-    # Run benchmark
     try:
+        start = time.perf_counter()
         result = subprocess.run(
             [
                 str(whisper_bin),
                 "--model", str(model_path),
                 "--file", str(sample_file),
-                "--threads", "8",
-                "--beam-size", "1"
+                "--threads", str(threads),
+                "--beam-size", str(beam_size),
             ],
             capture_output=True,
             text=True,
-            timeout=60
+            timeout=timeout
         )
-        
-        # Parse timing information
-        output = result.stderr + result.stdout
-        
-        # Extract timings using regex
-        encode_match = re.search(r'encode time\s*=\s*([\d.]+)\s*ms', output)
-        total_match = re.search(r'total time\s*=\s*([\d.]+)\s*ms', output)
-        load_match = re.search(r'load time\s*=\s*([\d.]+)\s*ms', output)
-        
-        encode_time = float(encode_match.group(1)) if encode_match else 0
-        total_time = float(total_match.group(1)) if total_match else 0
-        load_time = float(load_match.group(1)) if load_match else 0
-        
-        # Calculate real-time factor (11 seconds for JFK sample)
-        rtf = 11000 / total_time if total_time > 0 else 0
-        
-        return {
-            "success": True,
-            "model": model_name,
-            "load_time_ms": load_time,
-            "encode_time_ms": encode_time,
-            "total_time_ms": total_time,
-            "real_time_factor": round(rtf, 1),
-            "sample_duration_s": 11.0
-        }
-        
+        wall_time = (time.perf_counter() - start) * 1000
     except subprocess.TimeoutExpired:
         return {
             "success": False,
-            "error": "Benchmark timed out"
+            "error": f"Benchmark timed out after {timeout:.0f}s"
         }
     except Exception as e:
         return {
             "success": False,
             "error": str(e)
         }
+    
+    output = result.stderr + result.stdout
+    timings = parse_whisper_timings(output)
+    if result.returncode != 0 or "total" not in timings:
+        last_line = output.strip().splitlines()[-1] if output.strip() else ""
+        return {
+            "success": False,
+            "error": f"whisper-cli exited with code {result.returncode}: {last_line}"
+        }
+    
+    duration = get_audio_duration(sample_file)
+    if duration is None:
+        # Not a WAV file: whisper-cli reports what it decoded
+        match = re.search(r"\(\d+ samples, ([\d.]+) sec\)", output)
+        duration = float(match.group(1)) if match else None
+    total_time = timings["total"]
+    
+    return {
+        "success": True,
+        "model": model_name,
+        "sample_file": str(sample_file),
+        "threads": threads,
+        "beam_size": beam_size,
+        "load_time_ms": timings.get("load", 0.0),
+        "mel_time_ms": timings.get("mel", 0.0),
+        "encode_time_ms": timings.get("encode", 0.0),
+        "decode_time_ms": timings.get("decode", 0.0) + timings.get("batchd", 0.0),
+        "total_time_ms": total_time,
+        "wall_time_ms": round(wall_time, 1),
+        "real_time_factor": round(duration * 1000 / total_time, 1) if duration and total_time > 0 else None,
+        "sample_duration_s": round(duration, 3) if duration else None,
+    }
 
 
-# Backwards compatibility - deprecated functions
 def get_current_model() -> str:
     """DEPRECATED: Use get_active_model() instead."""
     warnings.warn(
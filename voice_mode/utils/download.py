@@ -1,14 +1,39 @@
-"""Download utilities with progress indicators."""
+"""Download utilities with progress indicators.
 
+Downloads go to ``<destination>.part`` next to a small ``.part.json`` state
+file recording which byte ranges have arrived. An interrupted download
+resumes from there with HTTP Range requests, large files are fetched as
+several parallel segments when the server supports ranges, and the file is
+only renamed into place once it is complete and its SHA-256 (when known)
+matches.
+"""
+
+import hashlib
+import http.client
+import json
 import os
 import sys
+import threading
 import time
 import urllib.request
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 import click
 
+# Files smaller than this per segment are fetched on a single connection
+MIN_SEGMENT_SIZE = 8 * 1024 * 1024
+CHUNK_SIZE = 256 * 1024
+# Persist segment progress at least this often (bytes per segment)
+CHECKPOINT_INTERVAL = 4 * 1024 * 1024
+RETRIES = 3
+TIMEOUT = 30
+
+
+class DownloadError(Exception):
+    """A download could not be completed or failed verification."""
+
 
 def detect_progress_style() -> str:
     """Auto-detect best progress style based on environment."""
@@ -21,6 +46,14 @@ def detect_progress_style() -> str:
     return 'bar'  # Default to progress bar
 
 
+def default_segments() -> int:
+    """Parallel connections per download (VOICEMODE_DOWNLOAD_SEGMENTS, default 4)."""
+    try:
+        return max(1, int(os.environ.get('VOICEMODE_DOWNLOAD_SEGMENTS', '4')))
+    except ValueError:
+        return 4
+
+
 def format_size(bytes_size: int) -> str:
     """Format bytes into human-readable size."""
     for unit in ['B', 'KB', 'MB', 'GB']:
@@ -30,22 +63,337 @@ def format_size(bytes_size: int) -> str:
     return f"{bytes_size:.1f} TB"
 
 
+def sha256_file(path: Union[str, Path]) -> str:
+    """Hex SHA-256 of a file."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _RedirectRecorder(urllib.request.HTTPRedirectHandler):
+    """Keep the headers of redirect responses.
+
+    Hugging Face answers LFS downloads with a redirect carrying the file's
+    SHA-256 in ``X-Linked-Etag``; the CDN response it points to does not.
+    """
+
+    def __init__(self):
+        self.headers: List[Any] = []
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        self.headers.append(headers)
+        return super().redirect_request(req, fp, code, msg, headers, newurl)
+
+
+def _published_sha256(headers) -> Optional[str]:
+    etag = (headers.get('X-Linked-Etag') or '').strip('"').lower()
+    if etag.startswith('w/'):
+        return None
+    return etag if len(etag) == 64 and all(c in '0123456789abcdef' for c in etag) else None
+
+
+def _probe(url: str) -> Dict[str, Any]:
+    """Find the final URL, size, range support and validator of a download."""
+    recorder = _RedirectRecorder()
+    opener = urllib.request.build_opener(recorder)
+    request = urllib.request.Request(url, headers={'Range': 'bytes=0-0'})
+    with opener.open(request, timeout=TIMEOUT) as response:
+        headers = response.headers
+        info = {
+            'url': response.geturl(),
+            'ranges': response.status == 206,
+            'validator': headers.get('ETag') or headers.get('Last-Modified'),
+            'sha256': None,
+        }
+        if response.status == 206:
+            # Content-Range: bytes 0-0/12345
+            total = (headers.get('Content-Range') or '').rpartition('/')[2]
+            info['size'] = int(total) if total.isdigit() else None
+        else:
+            length = headers.get('Content-Length')
+            info['size'] = int(length) if length and length.isdigit() else None
+    for redirect_headers in [headers] + recorder.headers:
+        info['sha256'] = info['sha256'] or _published_sha256(redirect_headers)
+    return info
+
+
+def _plan_segments(size: int, segments: int) -> List[Dict[str, int]]:
+    count = max(1, min(segments, size // MIN_SEGMENT_SIZE))
+    step = -(-size // count)
+    return [{'start': start, 'end': min(start + step, size) - 1, 'done': 0}
+            for start in range(0, size, step)]
+
+
+def _preallocate(path: Path, size: int) -> None:
+    with open(path, 'r+b' if path.exists() else 'w+b') as f:
+        if os.fstat(f.fileno()).st_size != size:
+            f.truncate(size)
+        if hasattr(os, 'posix_fallocate'):
+            try:
+                # Reserve the blocks now so a full disk fails up front
+                os.posix_fallocate(f.fileno(), 0, size)
+            except OSError:
+                pass
+
+
+class _Transfer:
+    """One download into a ``.part`` file, possibly over several connections."""
+
+    def __init__(self, url: str, destination: Path, segments: int,
+                 progress: Optional[Callable[[int, Optional[int]], None]]):
+        self.url = url
+        self.destination = destination
+        self.part = destination.with_name(destination.name + '.part')
+        self.state_file = destination.with_name(destination.name + '.part.json')
+        self.segments = segments
+        self.progress = progress
+        self.lock = threading.Lock()
+        self.cancelled = threading.Event()
+        self.state: Dict[str, Any] = {}
+
+    def _load_state(self, info: Dict[str, Any]) -> bool:
+        """Reuse a previous attempt at the same file, if there is one."""
+        try:
+            state = json.loads(self.state_file.read_text())
+        except (OSError, ValueError):
+            return False
+        if (state.get('url') != self.url or state.get('size') != info['size']
+                or state.get('validator') != info['validator'] or not self.part.exists()):
+            return False
+        self.state = state
+        return True
+
+    def _save_state(self) -> None:
+        tmp = self.state_file.with_name(self.state_file.name + '.tmp')
+        tmp.write_text(json.dumps(self.state))
+        os.replace(tmp, self.state_file)
+
+    def _report(self) -> None:
+        if self.progress:
+            done = sum(s['done'] for s in self.state['segments'])
+            self.progress(done, self.state['size'])
+
+    def _fetch_segment(self, segment: Dict[str, int], source: str) -> None:
+        """Download the rest of one byte range, retrying from where it stopped."""
+        for attempt in range(RETRIES + 1):
+            if not self.state['ranges']:
+                # Without ranges every attempt starts over
+                segment['done'] = 0
+            start = segment['start'] + segment['done']
+            if segment['end'] >= 0 and start > segment['end']:
+                return
+            headers = {'Range': f"bytes={start}-{segment['end']}"} if self.state['ranges'] else {}
+            try:
+                with urllib.request.urlopen(urllib.request.Request(source, headers=headers),
+                                            timeout=TIMEOUT) as response, \
+                        open(self.part, 'r+b') as f:
+                    if headers and response.status != 206:
+                        raise DownloadError(f"Server ignored the range request (HTTP {response.status})")
+                    f.seek(start)
+                    since_checkpoint = 0
+                    while chunk := response.read(CHUNK_SIZE):
+                        if self.cancelled.is_set():
+                            return
+                        f.write(chunk)
+                        since_checkpoint += len(chunk)
+                        with self.lock:
+                            segment['done'] += len(chunk)
+                            self._report()
+                            if since_checkpoint >= CHECKPOINT_INTERVAL:
+                                f.flush()
+                                self._save_state()
+                                since_checkpoint = 0
+                if segment['end'] < 0 or segment['start'] + segment['done'] > segment['end']:
+                    return
+                raise DownloadError("Connection closed before the range was complete")
+            except http.client.HTTPException as e:
+                # e.g. IncompleteRead when the connection drops mid-body
+                if attempt == RETRIES or self.cancelled.is_set():
+                    raise DownloadError(f"Connection failed: {e!r}") from e
+                time.sleep(min(2 ** attempt, 10))
+            except (urllib.error.URLError, OSError, DownloadError) as e:
+                if (isinstance(e, urllib.error.HTTPError) and e.code < 500) or attempt == RETRIES \
+                        or self.cancelled.is_set():
+                    raise
+                time.sleep(min(2 ** attempt, 10))
+
+    def run(self, sha256: Optional[str]) -> Path:
+        info = _probe(self.url)
+        size = info['size']
+        resumed = info['ranges'] and size is not None and self._load_state(info)
+        if not resumed:
+            if info['ranges'] and size:
+                plan = _plan_segments(size, self.segments)
+            else:
+                # No range support (or unknown size): one stream from the start
+                plan = [{'start': 0, 'end': (size - 1) if size else -1, 'done': 0}]
+            self.state = {'url': self.url, 'size': size, 'validator': info['validator'],
+                          'ranges': bool(info['ranges'] and size), 'segments': plan}
+            self.part.unlink(missing_ok=True)
+        if size:
+            _preallocate(self.part, size)
+        else:
+            self.part.touch()
+        self._save_state()
+        self._report()
+
+        expected = (sha256 or info['sha256'] or '').lower() or None
+        pending = [s for s in self.state['segments']
+                   if s['end'] < 0 or s['start'] + s['done'] <= s['end']]
+        pool = ThreadPoolExecutor(max_workers=max(1, len(pending)))
+        try:
+            futures = [pool.submit(self._fetch_segment, s, info['url']) for s in pending]
+            for future in futures:
+                future.result()
+        except BaseException:
+            # Stop the other segments; what arrived is kept for the next attempt
+            self.cancelled.set()
+            raise
+        finally:
+            pool.shutdown(wait=True)
+            self._save_state()
+
+        if size is not None and os.path.getsize(self.part) != size:
+            raise DownloadError(f"Downloaded {os.path.getsize(self.part)} of {size} bytes")
+        if expected:
+            actual = sha256_file(self.part)
+            if actual != expected:
+                self.part.unlink(missing_ok=True)
+                self.state_file.unlink(missing_ok=True)
+                raise DownloadError(f"SHA-256 mismatch for {self.destination.name}: "
+                                    f"expected {expected}, got {actual}")
+        with open(self.part, 'rb+') as f:
+            os.fsync(f.fileno())
+        os.replace(self.part, self.destination)
+        self.state_file.unlink(missing_ok=True)
+        return self.destination
+
+
+def fetch(
+    url: str,
+    destination: Union[str, Path],
+    sha256: Optional[str] = None,
+    segments: Optional[int] = None,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None,
+) -> Path:
+    """Download a file, resuming earlier attempts and verifying its checksum.
+
+    Args:
+        url: URL to download from
+        destination: Where to save the file
+        sha256: Expected hex SHA-256; defaults to the hash the server
+            publishes for the file (Hugging Face ``X-Linked-Etag``), if any
+        segments: Parallel connections (default: VOICEMODE_DOWNLOAD_SEGMENTS)
+        progress: Called with (bytes done, total bytes or None) as data arrives
+
+    Returns:
+        Path of the completed file
+
+    Raises:
+        DownloadError: The download failed or did not match ``sha256``
+        urllib.error.URLError: The server could not be reached or refused the request
+    """
+    destination = Path(destination)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    transfer = _Transfer(url, destination, segments or default_segments(), progress)
+    return transfer.run(sha256)
+
+
+def _progress_reporter(style: str, destination: Path, description: str, url: str):
+    """Progress callback and finisher for a download_with_progress style."""
+    if style == 'quiet':
+        return None, lambda: None
+
+    if style == 'verbose':
+        state = {'start': time.time(), 'last_percent': -100.0, 'last_time': 0.0, 'first': None}
+        print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Starting download: {destination.name}")
+        print(f"URL: {url}")
+
+        def report(done, total):
+            now = time.time()
+            if state['first'] is None:
+                state['first'] = done
+                if total:
+                    print(f"Size: {format_size(total)}")
+                if done:
+                    print(f"Resuming at {format_size(done)}")
+                return
+            elapsed = max(now - state['start'], 1e-6)
+            speed = (done - state['first']) / elapsed
+            # Print progress every 5% or 5 seconds
+            if total:
+                percent = done / total * 100
+                if percent - state['last_percent'] >= 5 or now - state['last_time'] >= 5:
+                    print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Progress: {percent:.0f}% ({format_size(done)} / {format_size(total)}) - {format_size(speed)}/s")
+                    state['last_percent'], state['last_time'] = percent, now
+            elif now - state['last_time'] >= 5:
+                print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Downloaded: {format_size(done)} - {format_size(speed)}/s")
+                state['last_time'] = now
+
+        def finish():
+            print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Download complete: {destination.name}")
+
+        return report, finish
+
+    bars: Dict[str, Any] = {}
+
+    def report(done, total):
+        if 'bar' not in bars:
+            if total and style != 'spinner':
+                bar = click.progressbar(
+                    length=total,
+                    label=f"{description} ({format_size(total)})",
+                    show_eta=True,
+                    show_percent=True,
+                    show_pos=False,  # Disable raw byte position
+                    width=40,
+                    fill_char='█',
+                    empty_char='░'
+                )
+            else:
+                # Unknown size - use spinner
+                bar = click.progressbar(label=description, length=None, show_percent=False, show_pos=True)
+            bars['bar'] = bar.__enter__()
+            bars['done'] = 0
+        bars['bar'].update(done - bars['done'])
+        bars['done'] = done
+        bars['total'] = total
+
+    def finish():
+        if 'bar' in bars:
+            bars['bar'].__exit__(None, None, None)
+        if bars.get('total') and style != 'spinner':
+            click.echo(" ✓ Complete")
+        else:
+            click.echo(f" ✓ Downloaded {format_size(bars.get('done', 0))}")
+
+    return report, finish
+
+
 def download_with_progress(
     url: str,
     destination: Union[str, Path],
     description: Optional[str] = None,
     style: str = "auto",
-    quiet: bool = False
+    quiet: bool = False,
+    sha256: Optional[str] = None,
+    segments: Optional[int] = None,
 ) -> bool:
     """
     Download file with progress indicator.
 
+    Interrupted downloads leave a ``.part`` file that the next call resumes.
+
     Args:
         url: URL to download from
         destination: Where to save the file
         description: Label for the progress bar
         style: Progress indicator style (auto, bar, spinner, verbose, quiet)
         quiet: Suppress all output
+        sha256: Expected SHA-256 (default: the hash published by the server, if any)
+        segments: Parallel connections (default: VOICEMODE_DOWNLOAD_SEGMENTS)
 
     Returns:
         True if successful, False otherwise
@@ -56,96 +404,15 @@ def download_with_progress(
         style = detect_progress_style()
 
     destination = Path(destination)
-    destination.parent.mkdir(parents=True, exist_ok=True)
 
     if not description:
         description = f"Downloading {destination.name}"
 
+    report, finish = _progress_reporter(style, destination, description, url)
     try:
-        # Open the URL and get headers
-        response = urllib.request.urlopen(url)
-        total_size = int(response.headers.get('Content-Length', 0))
-
-        if style == 'quiet':
-            # Silent download
-            with open(destination, 'wb') as f:
-                while chunk := response.read(8192):
-                    f.write(chunk)
-            return True
-
-        elif style == 'verbose':
-            # Verbose mode for CI/logging
-            print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Starting download: {destination.name}")
-            print(f"URL: {url}")
-            if total_size > 0:
-                print(f"Size: {format_size(total_size)}")
-
-            downloaded = 0
-            start_time = time.time()
-            last_print = 0
-
-            with open(destination, 'wb') as f:
-                while chunk := response.read(8192):
-                    f.write(chunk)
-                    downloaded += len(chunk)
-
-                    # Print progress every 5% or 5 seconds
-                    current_time = time.time()
-                    if total_size > 0:
-                        percent = (downloaded / total_size) * 100
-                        if percent - last_print >= 5 or current_time - start_time >= 5:
-                            speed = downloaded / (current_time - start_time)
-                            print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Progress: {percent:.0f}% ({format_size(downloaded)} / {format_size(total_size)}) - {format_size(speed)}/s")
-                            last_print = percent
-                    elif current_time - start_time >= 5:
-                        speed = downloaded / (current_time - start_time)
-                        print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Downloaded: {format_size(downloaded)} - {format_size(speed)}/s")
-                        start_time = current_time
-
-            print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Download complete: {destination.name}")
-            return True
-
-        elif total_size == 0 or style == 'spinner':
-            # Unknown size - use spinner
-            with click.progressbar(
-                label=description,
-                length=None,
-                show_percent=False,
-                show_pos=True
-            ) as bar:
-                downloaded = 0
-                with open(destination, 'wb') as f:
-                    while chunk := response.read(8192):
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        bar.update(len(chunk))
-
-            click.echo(f" ✓ Downloaded {format_size(downloaded)}")
-            return True
-
-        else:  # style == 'bar' or default
-            # Known size - use progress bar
-            # Add size info to label
-            size_str = format_size(total_size)
-            full_label = f"{description} ({size_str})"
-
-            with click.progressbar(
-                length=total_size,
-                label=full_label,
-                show_eta=True,
-                show_percent=True,
-                show_pos=False,  # Disable raw byte position
-                width=40,
-                fill_char='█',
-                empty_char='░'
-            ) as bar:
-                with open(destination, 'wb') as f:
-                    while chunk := response.read(8192):
-                        f.write(chunk)
-                        bar.update(len(chunk))
-
-            click.echo(" ✓ Complete")
-            return True
+        fetch(url, destination, sha256=sha256, segments=segments, progress=report)
+        finish()
+        return True
 
     except urllib.error.HTTPError as e:
         if not quiet:
@@ -157,10 +424,7 @@ def download_with_progress(
         return False
     except KeyboardInterrupt:
         if not quiet:
-            click.echo(f"\n❌ Download interrupted by user", err=True)
-        # Clean up partial file
-        if destination.exists():
-            destination.unlink()
+            click.echo(f"\n❌ Download interrupted by user (run again to resume)", err=True)
         return False
     except Exception as e:
         if not quiet:
@@ -173,7 +437,9 @@ async def download_with_progress_async(
     destination: Union[str, Path],
     description: Optional[str] = None,
     style: str = "auto",
-    quiet: bool = False
+    quiet: bool = False,
+    sha256: Optional[str] = None,
+    segments: Optional[int] = None,
 ) -> bool:
     """
     Async wrapper for download_with_progress.
@@ -183,5 +449,5 @@ async def download_with_progress_async(
     import asyncio
     return await asyncio.to_thread(
         download_with_progress,
-        url, destination, description, style, quiet
-    )
\ No newline at end of file
+        url, destination, description, style, quiet, sha256, segments
+    )
@@ -9,9 +9,10 @@ import json
 import time
 import threading
 import queue
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, TextIO
 from dataclasses import dataclass, asdict, field
 import logging
 import atexit
@@ -21,20 +22,34 @@ logger = logging.getLogger("voicemode.event-logger")
 
 @dataclass
 class VoiceEvent:
-    """Represents a single event in the voice interaction timeline."""
+    """Represents a single event in the voice interaction timeline.
+    
+    ``timestamp`` is the wall clock for humans and cross-process ordering;
+    ``mono_ns`` is ``time.perf_counter_ns()`` and is what durations are
+    computed from, so clock adjustments don't skew them. Monotonic stamps
+    are only comparable within one process.
+    """
     timestamp: str
     event_type: str
     session_id: Optional[str] = None
     data: Dict[str, Any] = field(default_factory=dict)
+    mono_ns: Optional[int] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert event to dictionary for JSON serialization."""
-        return {
+        result = {
             "timestamp": self.timestamp,
             "event_type": self.event_type,
             "session_id": self.session_id,
             "data": self.data
         }
+        if self.mono_ns is not None:
+            result["mono_ns"] = self.mono_ns
+        return result
+
+
+# Queue markers for the writer thread
+_STOP = object()
 
 
 class EventLogger:
@@ -70,14 +85,34 @@ class EventLogger:
     # Tool Events
     TOOL_REQUEST_START = "TOOL_REQUEST_START"
     TOOL_REQUEST_END = "TOOL_REQUEST_END"
+
+    # Warm-up Events
+    WARMUP_STEP = "WARMUP_STEP"
+    WARMUP_COMPLETE = "WARMUP_COMPLETE"
+    
+    # Session metrics as (name, start event, end event), measured between the
+    # first event of each type in the session
+    METRIC_SPANS = (
+        ("ttfa", TTS_START, TTS_FIRST_AUDIO),
+        ("recording_duration", RECORDING_START, RECORDING_END),
+        ("stt_processing", STT_START, STT_COMPLETE),
+        # User-perceived response time: end of recording to start of TTS playback
+        ("response_time", RECORDING_END, TTS_PLAYBACK_START),
+        ("session_duration", SESSION_START, SESSION_END),
+    )
     
-    def __init__(self, log_dir: Optional[Path] = None, enabled: bool = True):
+    def __init__(self, log_dir: Optional[Path] = None, enabled: bool = True,
+                 flush_interval: float = 1.0, batch_size: int = 256,
+                 max_session_events: int = 1000):
         """
         Initialize the event logger.
         
         Args:
             log_dir: Directory for log files (default: ~/voicemode_logs)
             enabled: Whether event logging is enabled
+            flush_interval: Seconds between flushes of the open log file
+            batch_size: Maximum events written per batch
+            max_session_events: Events kept in memory for the current session
         """
         self.enabled = enabled
         if not self.enabled:
@@ -87,20 +122,25 @@ class EventLogger:
         self.log_dir = log_dir or Path.home() / "voicemode_logs"
         self.log_dir.mkdir(exist_ok=True)
         
-        # Current log file (rotated daily)
+        # Current log file (rotated daily), kept open by the writer thread
         self.log_file: Optional[Path] = None
         self.current_date: Optional[datetime] = None
+        self._file: Optional[TextIO] = None
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        
+        # In-memory event buffer for current session, oldest dropped first
+        self.session_events: deque = deque(maxlen=max_session_events)
+        self.session_id: Optional[str] = None
+        self._first_mono: Dict[str, int] = {}
+        self._session_metrics: Dict[str, float] = {}
+        self._lock = threading.Lock()
         
         # Thread-safe queue for async writing
         self.event_queue: queue.Queue = queue.Queue()
         self.writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
         self.writer_thread.start()
         
-        # In-memory event buffer for current session
-        self.session_events: List[VoiceEvent] = []
-        self.session_id: Optional[str] = None
-        self._lock = threading.Lock()
-        
         # Register cleanup on exit
         atexit.register(self._cleanup)
         
@@ -121,7 +161,8 @@ class EventLogger:
             timestamp=datetime.now(timezone.utc).isoformat(),
             event_type=event_type,
             session_id=self.session_id,
-            data=data or {}
+            data=data or {},
+            mono_ns=time.perf_counter_ns()
         )
         
         # Add to queue for file writing
@@ -131,6 +172,7 @@ class EventLogger:
         with self._lock:
             if self.session_id:
                 self.session_events.append(event)
+                self._update_metrics(event)
         
         logger.debug(f"Event logged: {event_type} (session: {self.session_id})")
     
@@ -149,7 +191,9 @@ class EventLogger:
             
         with self._lock:
             self.session_id = session_id or f"conv_{int(time.time() * 1000)}"
-            self.session_events = []
+            self.session_events.clear()
+            self._first_mono = {}
+            self._session_metrics = {}
         
         self.log_event(self.SESSION_START)
         logger.info(f"Started session: {self.session_id}")
@@ -168,63 +212,36 @@ class EventLogger:
         self.log_event(self.SESSION_END)
         
         with self._lock:
-            metrics = self._calculate_metrics()
+            metrics = dict(self._session_metrics)
             
             # Clear session
             self.session_id = None
-            self.session_events = []
+            self.session_events.clear()
+            self._first_mono = {}
+            self._session_metrics = {}
         
         logger.info("Session ended, metrics calculated")
         return metrics
     
-    def _calculate_metrics(self) -> Dict[str, float]:
-        """Calculate timing metrics from session events."""
-        metrics = {}
-        events_by_type = {}
-        
-        # Group events by type
-        for event in self.session_events:
-            event_type = event.event_type
-            if event_type not in events_by_type:
-                events_by_type[event_type] = []
-            events_by_type[event_type].append(event)
-        
-        # Helper to parse timestamps
-        def parse_ts(event: VoiceEvent) -> datetime:
-            return datetime.fromisoformat(event.timestamp.replace('Z', '+00:00'))
-        
-        # Calculate key metrics
-        # Time to First Audio (TTFA)
-        if self.TTS_START in events_by_type and self.TTS_FIRST_AUDIO in events_by_type:
-            tts_start = parse_ts(events_by_type[self.TTS_START][0])
-            ttfa = parse_ts(events_by_type[self.TTS_FIRST_AUDIO][0])
-            metrics["ttfa"] = (ttfa - tts_start).total_seconds()
-        
-        # Recording duration
-        if self.RECORDING_START in events_by_type and self.RECORDING_END in events_by_type:
-            rec_start = parse_ts(events_by_type[self.RECORDING_START][0])
-            rec_end = parse_ts(events_by_type[self.RECORDING_END][0])
-            metrics["recording_duration"] = (rec_end - rec_start).total_seconds()
-        
-        # STT processing time
-        if self.STT_START in events_by_type and self.STT_COMPLETE in events_by_type:
-            stt_start = parse_ts(events_by_type[self.STT_START][0])
-            stt_complete = parse_ts(events_by_type[self.STT_COMPLETE][0])
-            metrics["stt_processing"] = (stt_complete - stt_start).total_seconds()
-        
-        # User-perceived response time: from end of recording to start of TTS playback
-        if self.RECORDING_END in events_by_type and self.TTS_PLAYBACK_START in events_by_type:
-            rec_end = parse_ts(events_by_type[self.RECORDING_END][0])
-            tts_playback = parse_ts(events_by_type[self.TTS_PLAYBACK_START][0])
-            metrics["response_time"] = (tts_playback - rec_end).total_seconds()
-        
-        # Total conversation time
-        if self.SESSION_START in events_by_type and self.SESSION_END in events_by_type:
-            session_start = parse_ts(events_by_type[self.SESSION_START][0])
-            session_end = parse_ts(events_by_type[self.SESSION_END][0])
-            metrics["session_duration"] = (session_end - session_start).total_seconds()
+    def _update_metrics(self, event: VoiceEvent) -> None:
+        """Fold one session event into the running metrics (lock held)."""
+        event_type = event.event_type
+        if event_type in self._first_mono:
+            return
+        self._first_mono[event_type] = event.mono_ns
         
-        return metrics
+        for name, start_type, end_type in self.METRIC_SPANS:
+            if event_type not in (start_type, end_type) or name in self._session_metrics:
+                continue
+            start = self._first_mono.get(start_type)
+            end = self._first_mono.get(end_type)
+            if start is not None and end is not None:
+                self._session_metrics[name] = (end - start) / 1e9
+    
+    def get_session_metrics(self) -> Dict[str, float]:
+        """Get the metrics measured so far in the current session."""
+        with self._lock:
+            return dict(self._session_metrics)
     
     def get_session_events(self) -> List[VoiceEvent]:
         """Get all events from the current session."""
@@ -232,43 +249,101 @@ class EventLogger:
             return list(self.session_events)
     
     def _writer_loop(self) -> None:
-        """Background thread for writing events to file."""
+        """Background thread that drains the queue in batches to one open file."""
+        last_flush = time.monotonic()
         while True:
             try:
-                # Use timeout to allow thread to exit on shutdown
-                event = self.event_queue.get(timeout=1)
-                self._write_event(event)
+                # Use timeout so an idle logger still flushes periodically
+                item = self.event_queue.get(timeout=self.flush_interval)
             except queue.Empty:
+                self._flush_file()
+                last_flush = time.monotonic()
                 continue
+            
+            batch = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.event_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            events = [i for i in batch if isinstance(i, VoiceEvent)]
+            try:
+                if events:
+                    self._write_events(events)
             except Exception as e:
                 logger.error(f"Error in event writer: {e}")
+            
+            # Markers ask for a flush (threading.Event) or a shutdown (_STOP)
+            markers = [i for i in batch if not isinstance(i, VoiceEvent)]
+            if markers or time.monotonic() - last_flush >= self.flush_interval:
+                self._flush_file()
+                last_flush = time.monotonic()
+            for marker in markers:
+                if marker is _STOP:
+                    self._close_file()
+                    return
+                marker.set()
     
-    def _write_event(self, event: VoiceEvent) -> None:
-        """Write event to log file."""
+    def _write_events(self, events: List[VoiceEvent]) -> None:
+        """Write a batch of events to the current log file."""
         # Check if we need to rotate log file
         today = datetime.now().date()
-        if self.current_date != today:
+        if self.current_date != today or self._file is None:
+            self._close_file()
             self.current_date = today
             log_filename = f"voicemode_events_{today.isoformat()}.jsonl"
             self.log_file = self.log_dir / log_filename
+            self._file = open(self.log_file, 'a')
             logger.info(f"Rotating log file to: {self.log_file}")
         
-        # Append event
         try:
-            with open(self.log_file, 'a') as f:
-                f.write(json.dumps(event.to_dict()) + '\n')
+            self._file.write(''.join(json.dumps(event.to_dict()) + '\n' for event in events))
         except Exception as e:
-            logger.error(f"Failed to write event to log: {e}")
+            logger.error(f"Failed to write {len(events)} events to log: {e}")
+            # Reopen on the next batch in case the file was moved or removed
+            self._close_file()
+    
+    def _flush_file(self) -> None:
+        """Flush buffered lines to disk."""
+        if self._file is not None:
+            try:
+                self._file.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush event log: {e}")
+                self._close_file()
+    
+    def _close_file(self) -> None:
+        """Close the open log file, if any."""
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+            self._file = None
+    
+    def flush(self, timeout: float = 2.0) -> bool:
+        """Wait until queued events are written and flushed.
+        
+        Args:
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            True if the writer caught up within the timeout
+        """
+        if not self.enabled or not self.writer_thread.is_alive():
+            return False
+        done = threading.Event()
+        self.event_queue.put(done)
+        return done.wait(timeout)
     
     def _cleanup(self) -> None:
-        """Cleanup on exit - flush any remaining events."""
-        if not self.enabled:
+        """Cleanup on exit - write remaining events and close the file."""
+        if not self.enabled or not self.writer_thread.is_alive():
             return
-            
-        # Give writer thread time to flush queue
-        timeout = time.time() + 2  # 2 second timeout
-        while not self.event_queue.empty() and time.time() < timeout:
-            time.sleep(0.1)
+        
+        self.event_queue.put(_STOP)
+        self.writer_thread.join(timeout=2)
         
         logger.info("Event logger cleanup complete")
 
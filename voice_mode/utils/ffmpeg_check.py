@@ -1,11 +1,13 @@
 """FFmpeg detection and installation helper for voice-mode."""
 
+import json
 import os
 import platform
 import shutil
 import subprocess
 import sys
-from typing import Optional, Tuple
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
 
 
 def check_ffmpeg() -> Tuple[bool, Optional[str]]:
@@ -28,15 +30,18 @@ def check_ffprobe() -> Tuple[bool, Optional[str]]:
     return (ffprobe_path is not None, ffprobe_path)
 
 
-def get_ffmpeg_version() -> Optional[str]:
+def get_ffmpeg_version(ffmpeg_path: str = 'ffmpeg') -> Optional[str]:
     """Get FFmpeg version if installed.
     
+    Args:
+        ffmpeg_path: FFmpeg binary to run (default: look up on PATH)
+    
     Returns:
         Version string or None if not installed
     """
     try:
         result = subprocess.run(
-            ['ffmpeg', '-version'], 
+            [ffmpeg_path, '-version'], 
             capture_output=True, 
             text=True,
             timeout=5
@@ -51,6 +56,65 @@ def get_ffmpeg_version() -> Optional[str]:
     return None
 
 
+def _binary_key(path: Optional[str]) -> Optional[List]:
+    """Identify a binary by resolved path, mtime and size."""
+    if not path:
+        return None
+    try:
+        real_path = os.path.realpath(path)
+        stat = os.stat(real_path)
+    except OSError:
+        return None
+    return [real_path, stat.st_mtime_ns, stat.st_size]
+
+
+def probe_ffmpeg(cache_file: Optional[Union[str, Path]] = None) -> Dict[str, Optional[str]]:
+    """Locate ffmpeg and ffprobe and read the FFmpeg version.
+    
+    Reading the version runs ``ffmpeg -version``, so the result is cached in
+    ``cache_file`` keyed by each binary's path, mtime and size. Upgrading,
+    moving or removing FFmpeg invalidates the cached entry.
+    
+    Args:
+        cache_file: Optional JSON file to cache the probe result in
+    
+    Returns:
+        Dict with ``ffmpeg`` and ``ffprobe`` paths (None when missing) and
+        the FFmpeg ``version`` (None when unknown)
+    """
+    _, ffmpeg_path = check_ffmpeg()
+    _, ffprobe_path = check_ffprobe()
+    key = [_binary_key(ffmpeg_path), _binary_key(ffprobe_path)]
+    
+    if cache_file:
+        try:
+            with open(cache_file, 'r') as f:
+                cached = json.load(f)
+            if cached.get('key') == key:
+                return cached['result']
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+    
+    result = {
+        'ffmpeg': ffmpeg_path,
+        'ffprobe': ffprobe_path,
+        'version': get_ffmpeg_version(ffmpeg_path) if ffmpeg_path else None,
+    }
+    
+    if cache_file:
+        cache_path = Path(cache_file)
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump({'key': key, 'result': result}, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+    
+    return result
+
+
 def get_install_instructions() -> str:
     """Get platform-specific FFmpeg installation instructions.
     
@@ -0,0 +1,145 @@
+"""Cheap change detection for configuration and rule files.
+
+``FileWatcher`` remembers a stat signature (mtime, size, inode) for a set of
+files and directories and reports when any of them changed, appeared or
+disappeared. Directory signatures change when entries are added, removed
+or renamed, so watching the directories a lookup walked is enough to know
+when a newly created ``.voicemode.env`` would change its result.
+
+On Linux an inotify descriptor watches the containing directories, and a
+check with no pending events costs a single non-blocking ``read``. Elsewhere
+(or if inotify cannot be set up) the signatures are re-read at most once per
+``poll_interval``. Either way a reported change has been confirmed by stat,
+so editors that touch unrelated files in the same directory do not cause
+spurious reloads.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import sys
+import time
+import weakref
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger("voicemode")
+
+Signature = Optional[Tuple[int, int, int]]
+
+# inotify(7) event mask: entries created, deleted, renamed or written in a watched directory
+_IN_MASK = 0x2 | 0x4 | 0x8 | 0x40 | 0x80 | 0x100 | 0x200 | 0x400 | 0x800
+
+_libc = None
+if sys.platform.startswith("linux"):
+    try:
+        _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        _libc.inotify_init1
+    except (OSError, AttributeError):
+        _libc = None
+
+
+def signature(path: Path) -> Signature:
+    """Stat signature of ``path``, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _nearest_directory(path: Path) -> Optional[Path]:
+    for candidate in (path, *path.parents):
+        if candidate.is_dir():
+            return candidate
+    return None
+
+
+class FileWatcher:
+    """Detect changes to a fixed set of paths.
+
+    Args:
+        paths: Files and directories to watch; they need not exist yet
+        poll_interval: Minimum seconds between stat checks without inotify
+        use_inotify: Use inotify when the platform supports it
+    """
+
+    def __init__(self, paths: Iterable[Path] = (), poll_interval: float = 1.0, use_inotify: bool = True):
+        self.poll_interval = poll_interval
+        self._signatures: Dict[Path, Signature] = {}
+        self._last_poll = 0.0
+        self._fd: Optional[int] = None
+        if use_inotify and _libc is not None:
+            fd = _libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd >= 0:
+                self._fd = fd
+                weakref.finalize(self, os.close, fd)
+            else:
+                logger.debug(f"inotify unavailable ({os.strerror(ctypes.get_errno())}); polling for changes")
+        self.watch(paths)
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self._fd is not None
+
+    @property
+    def paths(self) -> list:
+        return list(self._signatures)
+
+    def watch(self, paths: Iterable[Path]) -> None:
+        """Replace the watched paths and take a fresh snapshot."""
+        self._signatures = dict.fromkeys(Path(p) for p in paths)
+        self._add_watches()
+        self._drain()
+        self._signatures = {path: signature(path) for path in self._signatures}
+        self._last_poll = time.monotonic()
+
+    def changed(self) -> bool:
+        """Whether any watched path changed since the last snapshot.
+
+        A True result takes a new snapshot, so each change is reported once.
+        """
+        if self._fd is not None:
+            if not self._drain():
+                return False
+            self._add_watches()  # directories may have been created
+        else:
+            now = time.monotonic()
+            if now - self._last_poll < self.poll_interval:
+                return False
+            self._last_poll = now
+
+        current = {path: signature(path) for path in self._signatures}
+        if current == self._signatures:
+            return False
+        changed = [str(p) for p, sig in current.items() if sig != self._signatures[p]]
+        logger.debug(f"Watched files changed: {', '.join(changed)}")
+        self._signatures = current
+        return True
+
+    def _drain(self) -> bool:
+        """Consume pending inotify events, returning whether there were any."""
+        if self._fd is None:
+            return False
+        seen = False
+        while True:
+            try:
+                if not os.read(self._fd, 65536):
+                    return seen
+            except BlockingIOError:
+                return seen
+            seen = True
+
+    def _add_watches(self) -> None:
+        if self._fd is None:
+            return
+        # Re-adding an existing watch is a no-op, and re-adding after a
+        # directory was deleted and recreated restores it. Symlinked files
+        # are also watched where they point.
+        directories = set()
+        for path in self._signatures:
+            for target in {path, path.resolve()}:
+                directories.add(_nearest_directory(target if target.is_dir() else target.parent))
+        for directory in directories - {None}:
+            _libc.inotify_add_watch(self._fd, os.fsencode(directory), _IN_MASK)
@@ -0,0 +1,178 @@
+"""Deferred imports for modules that are only needed once a tool runs.
+
+The MCP server registers every tool at import time, but the audio stack
+(numpy, sounddevice, pydub, scipy, openai, httpx) is only used inside tool
+calls. Importing it eagerly costs hundreds of milliseconds and initialises
+PortAudio before the first MCP handshake. ``lazy_import`` returns a stand-in
+that performs the real import on first attribute access or call, so modules
+can keep their familiar ``np.``/``sd.`` spelling without paying at start-up.
+"""
+
+import importlib
+import importlib.abc
+import importlib.util
+import logging
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger("voicemode")
+
+_UNSET = object()
+
+
+class LazyImport:
+    """Stand-in for a module (or a module attribute) imported on first use.
+
+    Attribute reads, writes and deletes are forwarded to the real object,
+    which keeps ``unittest.mock.patch("pkg.mod.sd.rec")`` working.
+    """
+
+    __slots__ = ("_lazy_module", "_lazy_attr", "_lazy_target", "_lazy_lock")
+
+    def __init__(self, module: str, attr: Optional[str] = None):
+        object.__setattr__(self, "_lazy_module", module)
+        object.__setattr__(self, "_lazy_attr", attr)
+        object.__setattr__(self, "_lazy_target", _UNSET)
+        object.__setattr__(self, "_lazy_lock", threading.Lock())
+
+    def _resolve(self) -> Any:
+        target = self._lazy_target
+        if target is _UNSET:
+            # First use may come from an executor thread, so import under a lock
+            with self._lazy_lock:
+                target = self._lazy_target
+                if target is _UNSET:
+                    target = importlib.import_module(self._lazy_module)
+                    if self._lazy_attr:
+                        target = getattr(target, self._lazy_attr)
+                    object.__setattr__(self, "_lazy_target", target)
+        return target
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the real import has happened yet."""
+        return self._lazy_target is not _UNSET
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._resolve(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._resolve(), name)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._resolve()(*args, **kwargs)
+
+    def __dir__(self):
+        return dir(self._resolve())
+
+    def __repr__(self) -> str:
+        name = self._lazy_module + (f".{self._lazy_attr}" if self._lazy_attr else "")
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<lazy {name} ({state})>"
+
+
+def lazy_import(module: str, attr: Optional[str] = None) -> Any:
+    """Return a proxy that imports ``module`` (and fetches ``attr``) on first use.
+
+    Args:
+        module: Absolute module name, e.g. ``"numpy"`` or ``"scipy.io.wavfile"``
+        attr: Optional attribute to fetch from the module, e.g. ``"AudioSegment"``
+
+    Returns:
+        A ``LazyImport`` proxy usable in place of the module or attribute
+    """
+    return LazyImport(module, attr)
+
+
+def module_available(module: str) -> bool:
+    """Check whether a module can be imported without importing it.
+
+    Args:
+        module: Absolute module name
+
+    Returns:
+        True if an import spec for the module can be found
+    """
+    try:
+        return importlib.util.find_spec(module) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+# ==================== POST-IMPORT HOOKS ====================
+
+_post_import_hooks: Dict[str, List[Callable[[Any], None]]] = {}
+_hooks_lock = threading.Lock()
+
+
+def _run_post_import_hooks(module: Any) -> None:
+    with _hooks_lock:
+        hooks = _post_import_hooks.pop(module.__name__, [])
+    for hook in hooks:
+        try:
+            hook(module)
+        except Exception as e:
+            logger.debug(f"Post-import hook for {module.__name__} failed: {e}")
+
+
+class _PostImportLoader(importlib.abc.Loader):
+    """Wrap a module's loader to run hooks once the module has executed."""
+
+    def __init__(self, loader):
+        self._loader = loader
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._loader.exec_module(module)
+        _run_post_import_hooks(module)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _PostImportFinder(importlib.abc.MetaPathFinder):
+    """Meta path finder that attaches post-import hooks to pending modules."""
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname not in _post_import_hooks:
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _PostImportLoader(spec.loader)
+        return spec
+
+
+_finder = _PostImportFinder()
+
+
+def when_imported(module: str, hook: Callable[[Any], None]) -> None:
+    """Run ``hook(module)`` once ``module`` is first imported.
+
+    Lets start-up code configure a heavy dependency without importing it.
+    If the module is already imported the hook runs immediately.
+
+    Args:
+        module: Absolute module name
+        hook: Callable receiving the imported module
+    """
+    loaded = sys.modules.get(module)
+    if loaded is not None:
+        hook(loaded)
+        return
+    with _hooks_lock:
+        _post_import_hooks.setdefault(module, []).append(hook)
+        if _finder not in sys.meta_path:
+            sys.meta_path.insert(0, _finder)
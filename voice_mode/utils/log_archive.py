@@ -0,0 +1,419 @@
+"""
+Compressed archival of JSONL log files.
+
+Old exchange and event logs are compressed in place (``foo.jsonl`` becomes
+``foo.jsonl.gz`` or ``foo.jsonl.zst``). Each archive is written as a series
+of independently decompressible frames - gzip members or zstd frames - that
+end on line boundaries, with a small ``.frames`` sidecar recording where each
+frame starts. Sequential readers simply decompress the concatenated stream;
+readers that want the newest lines (tailing, "latest N exchanges") use the
+sidecar to decompress only the last frames.
+
+Everything here is stdlib-only except zstd support, which needs the optional
+``zstandard`` package.
+"""
+
+import gzip
+import io
+import json
+import logging
+import os
+import re
+import time
+import zlib
+from datetime import date, datetime
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger("voicemode.log-archive")
+
+# Compressed suffix -> codec name
+CODEC_SUFFIXES = {
+    ".gz": "gzip",
+    ".zst": "zstd",
+}
+SUFFIX_FOR_CODEC = {codec: suffix for suffix, codec in CODEC_SUFFIXES.items()}
+
+# Sidecar holding frame offsets for an archive
+FRAMES_SUFFIX = ".frames"
+
+# Uncompressed bytes per frame. Small enough that tailing an archive only
+# decompresses a few KB, large enough to keep the compression ratio high.
+DEFAULT_FRAME_SIZE = 256 * 1024
+
+# Chunk size for reverse reads of plain files
+REVERSE_CHUNK_SIZE = 64 * 1024
+
+_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
+
+def codec_for_path(path: Union[str, Path]) -> Optional[str]:
+    """Return the codec used by a log file, or None if it is plain text."""
+    return CODEC_SUFFIXES.get(Path(path).suffix)
+
+
+def logical_name(path: Union[str, Path]) -> str:
+    """File name with any compression suffix removed."""
+    path = Path(path)
+    if path.suffix in CODEC_SUFFIXES:
+        return path.stem
+    return path.name
+
+
+def is_log_file(path: Union[str, Path]) -> bool:
+    """Check whether a path is a plain or compressed JSONL log."""
+    return logical_name(path).endswith(".jsonl")
+
+
+def resolve_log_file(path: Union[str, Path]) -> Optional[Path]:
+    """Find a log file whether or not it has been archived.
+
+    Args:
+        path: Path of the plain ``.jsonl`` file
+
+    Returns:
+        The plain file if it exists, otherwise an existing compressed
+        variant, otherwise None
+    """
+    path = Path(path)
+    if path.exists():
+        return path
+    for suffix in CODEC_SUFFIXES:
+        candidate = path.with_name(path.name + suffix)
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def list_log_files(directory: Union[str, Path], pattern: str) -> List[Path]:
+    """List plain and compressed log files matching a glob pattern.
+
+    Args:
+        directory: Directory to search
+        pattern: Glob for the plain file names, e.g. ``exchanges_*.jsonl``
+
+    Returns:
+        Matching files sorted by logical name (i.e. by date for dated logs)
+    """
+    directory = Path(directory)
+    if not directory.exists():
+        return []
+
+    files = {}
+    for candidate in directory.glob(pattern + "*"):
+        if not is_log_file(candidate) or not Path(logical_name(candidate)).match(pattern):
+            continue
+        name = logical_name(candidate)
+        # Prefer the plain file if an archive run was interrupted
+        if name not in files or codec_for_path(candidate) is None:
+            files[name] = candidate
+    return [files[name] for name in sorted(files)]
+
+
+# ------------------------------------------------------------------ reading
+
+def open_log(path: Union[str, Path], mode: str = "rt") -> Union[io.TextIOBase, BinaryIO]:
+    """Open a plain or compressed log file for reading.
+
+    Args:
+        path: Log file path
+        mode: "rt" for text lines, "rb" for bytes
+
+    Returns:
+        File object yielding the uncompressed content
+    """
+    path = Path(path)
+    codec = codec_for_path(path)
+
+    if codec is None:
+        return open(path, "r" if mode == "rt" else "rb")
+
+    if codec == "gzip":
+        raw = gzip.open(path, "rb")
+    elif codec == "zstd":
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError(f"Reading {path.name} requires the 'zstandard' package")
+        raw = zstandard.ZstdDecompressor().stream_reader(
+            open(path, "rb"), read_across_frames=True, closefd=True
+        )
+        raw = io.BufferedReader(raw)
+    else:
+        raise ValueError(f"Unknown codec: {codec}")
+
+    if mode == "rb":
+        return raw
+    return io.TextIOWrapper(raw, encoding="utf-8")
+
+
+def iter_lines(path: Union[str, Path]) -> Iterator[str]:
+    """Iterate stripped, non-empty lines of a plain or compressed log."""
+    with open_log(path) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield line
+
+
+def _decompress_frame(codec: str, data: bytes) -> bytes:
+    """Decompress a single archive frame."""
+    if codec == "gzip":
+        return zlib.decompress(data, wbits=31)
+    if not ZSTD_AVAILABLE:
+        raise RuntimeError("Reading zstd archives requires the 'zstandard' package")
+    return zstandard.ZstdDecompressor().decompress(data)
+
+
+def read_frame_index(path: Union[str, Path]) -> Optional[List[int]]:
+    """Load frame start offsets for an archive, if a valid sidecar exists."""
+    path = Path(path)
+    sidecar = path.with_name(path.name + FRAMES_SUFFIX)
+    try:
+        with open(sidecar, "r") as f:
+            info = json.load(f)
+        if info.get("size") != path.stat().st_size:
+            return None
+        return list(info["offsets"])
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _reverse_lines_from_chunks(chunks: Iterator[bytes]) -> Iterator[str]:
+    """Split chunks read from the end of a stream into lines, newest first."""
+    remainder = b""
+    for chunk in chunks:
+        parts = (chunk + remainder).split(b"\n")
+        remainder = parts[0]
+        for part in reversed(parts[1:]):
+            line = part.strip()
+            if line:
+                yield line.decode("utf-8", errors="replace")
+    line = remainder.strip()
+    if line:
+        yield line.decode("utf-8", errors="replace")
+
+
+def _plain_chunks_reverse(path: Path, chunk_size: int) -> Iterator[bytes]:
+    """Read a plain file backwards in fixed-size chunks."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        while position > 0:
+            size = min(chunk_size, position)
+            position -= size
+            f.seek(position)
+            yield f.read(size)
+
+
+def _archive_chunks_reverse(path: Path, codec: str, offsets: List[int]) -> Iterator[bytes]:
+    """Decompress archive frames from last to first."""
+    with open(path, "rb") as f:
+        end = path.stat().st_size
+        for start in reversed(offsets):
+            f.seek(start)
+            yield _decompress_frame(codec, f.read(end - start))
+            end = start
+
+
+def iter_lines_reverse(path: Union[str, Path],
+                       chunk_size: int = REVERSE_CHUNK_SIZE) -> Iterator[str]:
+    """Iterate non-empty lines of a log file from last to first.
+
+    Only the tail of the file is read until the caller stops iterating.
+    Archives without a frame index are decompressed in full.
+
+    Args:
+        path: Plain or compressed log file
+        chunk_size: Read size for plain files
+
+    Yields:
+        Stripped lines, newest first
+    """
+    path = Path(path)
+    codec = codec_for_path(path)
+
+    if codec is None:
+        yield from _reverse_lines_from_chunks(_plain_chunks_reverse(path, chunk_size))
+        return
+
+    offsets = read_frame_index(path)
+    if offsets:
+        yield from _reverse_lines_from_chunks(_archive_chunks_reverse(path, codec, offsets))
+        return
+
+    yield from reversed(list(iter_lines(path)))
+
+
+# ---------------------------------------------------------------- archiving
+
+def _compress_frame(codec: str, data: bytes, level: Optional[int]) -> bytes:
+    """Compress one frame as a standalone gzip member or zstd frame."""
+    if codec == "gzip":
+        # mtime=0 keeps output reproducible
+        return gzip.compress(data, compresslevel=level or 6, mtime=0)
+    return zstandard.ZstdCompressor(level=level or 10).compress(data)
+
+
+def compress_file(path: Union[str, Path],
+                  codec: str = "gzip",
+                  frame_size: int = DEFAULT_FRAME_SIZE,
+                  level: Optional[int] = None) -> Path:
+    """Compress a plain log file into a framed archive.
+
+    The archive and its frame index are written to temporary files and
+    renamed into place before the original is removed, so an interruption
+    never loses data.
+
+    Args:
+        path: Plain ``.jsonl`` file
+        codec: "gzip" or "zstd"
+        frame_size: Approximate uncompressed bytes per frame
+        level: Compression level (codec default if None)
+
+    Returns:
+        Path of the archive
+    """
+    path = Path(path)
+    if codec not in SUFFIX_FOR_CODEC:
+        raise ValueError(f"Unknown codec: {codec}")
+    if codec == "zstd" and not ZSTD_AVAILABLE:
+        raise RuntimeError("zstd compression requires the 'zstandard' package")
+
+    target = path.with_name(path.name + SUFFIX_FOR_CODEC[codec])
+    sidecar = target.with_name(target.name + FRAMES_SUFFIX)
+    tmp_target = target.with_name(target.name + ".tmp")
+    tmp_sidecar = sidecar.with_name(sidecar.name + ".tmp")
+
+    offsets = []
+    try:
+        with open(path, "rb") as src, open(tmp_target, "wb") as dst:
+            buffer = []
+            buffered = 0
+            for line in src:
+                buffer.append(line)
+                buffered += len(line)
+                if buffered >= frame_size:
+                    offsets.append(dst.tell())
+                    dst.write(_compress_frame(codec, b"".join(buffer), level))
+                    buffer, buffered = [], 0
+            if buffer:
+                offsets.append(dst.tell())
+                dst.write(_compress_frame(codec, b"".join(buffer), level))
+            dst.flush()
+            os.fsync(dst.fileno())
+            size = dst.tell()
+
+        with open(tmp_sidecar, "w") as f:
+            json.dump({"codec": codec, "size": size, "offsets": offsets}, f)
+
+        os.replace(tmp_target, target)
+        os.replace(tmp_sidecar, sidecar)
+        # Preserve the original modification time for age-based tooling
+        stat = path.stat()
+        os.utime(target, (stat.st_atime, stat.st_mtime))
+        path.unlink()
+    finally:
+        for leftover in (tmp_target, tmp_sidecar):
+            if leftover.exists():
+                leftover.unlink()
+
+    return target
+
+
+def _file_date(path: Path) -> date:
+    """Date a log file covers, from its name or else its mtime."""
+    match = _DATE_RE.search(path.name)
+    if match:
+        try:
+            return date.fromisoformat(match.group(1))
+        except ValueError:
+            pass
+    return datetime.fromtimestamp(path.stat().st_mtime).date()
+
+
+def archive_logs(directory: Union[str, Path],
+                 pattern: str,
+                 older_than_days: int,
+                 codec: str = "gzip",
+                 dry_run: bool = False) -> List[Tuple[Path, Optional[Path]]]:
+    """Compress plain log files older than a number of days.
+
+    Today's file is never touched, whatever ``older_than_days`` says.
+
+    Args:
+        directory: Log directory
+        pattern: Glob for plain log files, e.g. ``exchanges_*.jsonl``
+        older_than_days: Minimum age in days
+        codec: "gzip" or "zstd"
+        dry_run: Only report what would be compressed
+
+    Returns:
+        List of (original, archive) pairs; archive is None for dry runs and
+        failures
+    """
+    directory = Path(directory)
+    if not directory.exists():
+        return []
+
+    today = date.today()
+    results = []
+    for path in sorted(directory.glob(pattern)):
+        if codec_for_path(path) is not None or not path.is_file():
+            continue
+        age = (today - _file_date(path)).days
+        if age < max(older_than_days, 1):
+            continue
+
+        if dry_run:
+            results.append((path, None))
+            continue
+
+        try:
+            start = time.perf_counter()
+            original_size = path.stat().st_size
+            target = compress_file(path, codec=codec)
+            logger.info(
+                f"Archived {path.name}: {original_size} -> {target.stat().st_size} bytes "
+                f"in {time.perf_counter() - start:.2f}s"
+            )
+            results.append((path, target))
+        except Exception as e:
+            logger.error(f"Failed to archive {path}: {e}")
+            results.append((path, None))
+
+    return results
+
+
+# Log file families written by voicemode
+EXCHANGE_LOG_PATTERN = "exchanges_*.jsonl"
+EVENT_LOG_PATTERN = "voicemode_events_*.jsonl"
+
+
+def archive_voicemode_logs(conversations_dir: Union[str, Path],
+                           event_log_dir: Union[str, Path],
+                           older_than_days: int,
+                           codec: str = "gzip",
+                           dry_run: bool = False) -> List[Tuple[Path, Optional[Path]]]:
+    """Archive both exchange logs and event logs.
+
+    Args:
+        conversations_dir: Directory holding ``exchanges_*.jsonl``
+        event_log_dir: Directory holding ``voicemode_events_*.jsonl``
+        older_than_days: Minimum age in days
+        codec: "gzip" or "zstd"
+        dry_run: Only report what would be compressed
+
+    Returns:
+        List of (original, archive) pairs
+    """
+    results = archive_logs(conversations_dir, EXCHANGE_LOG_PATTERN, older_than_days,
+                           codec=codec, dry_run=dry_run)
+    results += archive_logs(event_log_dir, EVENT_LOG_PATTERN, older_than_days,
+                            codec=codec, dry_run=dry_run)
+    return results
@@ -9,30 +9,32 @@ Features:
 - Keyboard shortcuts (Enter to send, Esc to close)
 
 NOTE: On macOS, Tkinter MUST run on the main thread due to Cocoa framework
-requirements. The implementation handles this by spawning a subprocess.
+requirements. Popups are therefore shown by a resident helper process
+(``notify_popup_helper``) that is started on first use and reused, so only
+the first popup pays for interpreter and Tk start-up.
 """
 
 import asyncio
+import atexit
+import itertools
 import json
 import logging
+import os
 import platform
 import queue
-import re
 import subprocess
 import sys
 import threading
-import time
 from dataclasses import dataclass, asdict
+from pathlib import Path
 from typing import Literal, Optional
 
 logger = logging.getLogger("voicemode")
 
-_IS_MACOS = platform.system() == "Darwin"
-
 
 @dataclass
 class ThemeColors:
-    """Color scheme for modern popup appearance."""
+    """Color scheme for modern popup appearance (also used by the helper)."""
 
     # Window
     window_bg: str
@@ -169,570 +171,220 @@ def get_theme_colors(theme: Literal["auto", "light", "dark"]) -> ThemeColors:
     return ThemeColors.light()
 
 
-def _run_popup_subprocess(
-    message: str,
-    config: PopupConfig,
-    history: list[dict],
-    wait_for_response: bool,
-) -> NotifyPopupResult:
-    """Run popup in subprocess with CustomTkinter UI."""
+_CRASHED = object()
 
-    popup_data = {
-        "message": message,
-        "config": asdict(config),
-        "history": history,
-        "wait_for_response": wait_for_response,
-    }
 
-    subprocess_code = '''
-import sys
-import json
-import platform
-import re
-
-data = json.loads(sys.stdin.read())
-message = data["message"]
-config = data["config"]
-history = data["history"]
-wait_for_response = data["wait_for_response"]
+class PopupHelperUnavailable(RuntimeError):
+    """The popup helper process could not be started or exited mid-request."""
 
-import customtkinter as ctk
-
-# Theme detection
-def detect_dark_mode():
-    if platform.system() == "Darwin":
-        import subprocess as sp
-        try:
-            result = sp.run(
-                ["defaults", "read", "-g", "AppleInterfaceStyle"],
-                capture_output=True, text=True, timeout=1
-            )
-            return result.stdout.strip().lower() == "dark"
-        except Exception:
-            return True
-    return True
-
-# Theme colors
-class Colors:
-    def __init__(self, **kwargs):
-        for k, v in kwargs.items():
-            setattr(self, k, v)
-
-def get_colors(theme):
-    is_dark = theme == "dark" or (theme == "auto" and detect_dark_mode())
-    if is_dark:
-        return Colors(
-            window_bg="#1c1c1e",
-            surface_bg="#2c2c2e",
-            text_primary="#ffffff",
-            text_secondary="#98989d",
-            text_placeholder="#555555",
-            user_bubble_bg="#0a84ff",
-            user_bubble_fg="#ffffff",
-            assistant_bubble_bg="#2c2c2e",
-            assistant_bubble_fg="#ffffff",
-            code_bg="#111111",
-            code_fg="#e5e5e7",
-            input_bg="#000000",
-            input_border="#3a3a3c",
-            input_fg="#ffffff",
-            accent="#0a84ff",
-            accent_hover="#409cff",
-        )
-    else:
-        return Colors(
-            window_bg="#f5f5f7",
-            surface_bg="#ffffff",
-            text_primary="#1d1d1f",
-            text_secondary="#6e6e73",
-            text_placeholder="#aeaeb2",
-            user_bubble_bg="#007aff",
-            user_bubble_fg="#ffffff",
-            assistant_bubble_bg="#e9e9eb",
-            assistant_bubble_fg="#1d1d1f",
-            code_bg="#f4f4f4",
-            code_fg="#1d1d1f",
-            input_bg="#ffffff",
-            input_border="#d1d1d6",
-            input_fg="#1d1d1f",
-            accent="#007aff",
-            accent_hover="#0066cc",
-        )
 
-colors = get_colors(config.get("theme", "auto"))
+class PopupHelperClient:
+    """JSON-lines channel to the resident popup helper process.
 
-# Configure CustomTkinter
-ctk.set_appearance_mode("dark" if detect_dark_mode() else "light")
+    The helper (``notify_popup_helper``) is started on first use, keeps
+    CustomTkinter loaded between popups and exits on its own when idle.
+    Requests after an idle exit or a crash start a fresh helper.
 
-# Font configuration
-IS_MACOS = platform.system() == "Darwin"
-FONT_MAIN = ("SF Pro Text" if IS_MACOS else "Segoe UI", config.get("font_size", 14))
-FONT_BOLD = ("SF Pro Text" if IS_MACOS else "Segoe UI", config.get("font_size", 14), "bold")
-FONT_CODE = ("Menlo" if IS_MACOS else "Consolas", config.get("font_size", 14) - 1)
-FONT_SMALL = ("SF Pro Text" if IS_MACOS else "Segoe UI", config.get("font_size", 14) - 2)
-
-result = {"type": "dismissed", "response": None}
-
-
-class MarkdownBubble(ctk.CTkFrame):
-    """Chat bubble with markdown rendering support."""
-
-    def __init__(self, master, text, is_user=False, colors=None, width=380, **kwargs):
-        bg_color = colors.user_bubble_bg if is_user else colors.assistant_bubble_bg
-
-        super().__init__(master, fg_color=bg_color, corner_radius=16, **kwargs)
+    Args:
+        command: Helper command line (default: this interpreter running the helper module)
+        idle_timeout: Seconds the helper stays alive without popups (0 = until we exit)
+        start_timeout: Seconds to wait for the helper to report that Tk is ready
+    """
 
-        self.textbox = ctk.CTkTextbox(
-            self,
-            text_color=colors.user_bubble_fg if is_user else colors.assistant_bubble_fg,
-            fg_color="transparent",
-            font=FONT_MAIN,
-            width=width,
-            wrap="word",
-            activate_scrollbars=False,
-        )
-        self.textbox.pack(padx=14, pady=10)
-
-        # Configure markdown tags
-        self.textbox._textbox.tag_configure(
-            "code",
-            font=FONT_CODE,
-            background=colors.code_bg,
-            foreground=colors.code_fg,
-            lmargin1=8,
-            lmargin2=8,
-            rmargin=8,
-            spacing1=6,
-            spacing3=6,
-        )
-        self.textbox._textbox.tag_configure("bold", font=FONT_BOLD)
-        self.textbox._textbox.tag_configure("inline_code", font=FONT_CODE, background=colors.code_bg, foreground=colors.code_fg)
-
-        self._render_markdown(text)
-        self.textbox.configure(state="disabled")
-
-        # Calculate actual height based on rendered content
-        self._calculate_height(text)
-
-    def _render_markdown(self, text):
-        """Parse and render markdown (code blocks, bold, lists, inline code)."""
-        # Split by code blocks first
-        parts = re.split(r"(```[\\s\\S]*?```)", text)
-
-        for part in parts:
-            if part.startswith("```") and part.endswith("```"):
-                # Code block - strip markers and first line (language hint)
-                code = part[3:-3].strip()
-                if "\\n" in code:
-                    # Remove language hint on first line
-                    first_newline = code.find("\\n")
-                    code = code[first_newline + 1:]
-                self.textbox._textbox.insert("end", "\\n" + code + "\\n", "code")
-            else:
-                # Process inline markdown
-                self._render_inline_markdown(part)
-
-    def _render_inline_markdown(self, text):
-        """Render inline markdown (bold, inline code, lists)."""
-        # Handle lists
-        lines = text.split("\\n")
-        for i, line in enumerate(lines):
-            if line.strip().startswith(("- ", "* ", "+ ")):
-                # Bullet point
-                self.textbox._textbox.insert("end", "  • " + line[2:].strip())
-            elif re.match(r"^\\d+\\.", line.strip()):
-                # Numbered list
-                self.textbox._textbox.insert("end", "  " + line.strip())
-            else:
-                # Process inline formatting: bold, inline code
-                inline_parts = re.split(r"(`[^`]+`|\\*\\*[^*]+\\*\\*)", line)
-                for subpart in inline_parts:
-                    if subpart.startswith("`") and subpart.endswith("`"):
-                        # Inline code
-                        self.textbox._textbox.insert("end", subpart[1:-1], "inline_code")
-                    elif subpart.startswith("**") and subpart.endswith("**"):
-                        # Bold
-                        self.textbox._textbox.insert("end", subpart[2:-2], "bold")
-                    else:
-                        # Plain text
-                        self.textbox._textbox.insert("end", subpart)
-
-            # Add newline except for last line
-            if i < len(lines) - 1:
-                self.textbox._textbox.insert("end", "\\n")
-
-    def _calculate_height(self, text):
-        """Calculate bubble height based on text content."""
-        # Count actual lines in the text
-        lines = text.count("\\n") + 1
-
-        # For code blocks and complex formatting, add extra lines
-        has_code_block = "```" in text
-        has_inline_code = "`" in text
-
-        extra_lines = 2 if has_code_block else 0
-        extra_lines += 1 if has_inline_code else 0
-
-        # Calculate height: base 20px per line + padding
-        line_height = 20
-        padding = 20  # Top + bottom padding
-        estimated_height = (lines + extra_lines) * line_height + padding
-
-        # Apply constraints: min 40px, max 400px
-        final_height = max(40, min(estimated_height, 400))
-        self.textbox.configure(height=final_height)
-
-
-class VoiceModePopup(ctk.CTk):
-    """Modern chat-style popup for VoiceMode notifications."""
-
-    def __init__(self, message, config, history, wait_for_response, colors):
-        super().__init__()
-
-        self.colors = colors
-        self.wait_for_response = wait_for_response
-        self.result = {"type": "dismissed", "response": None}
-
-        # Minimum display duration (5 seconds)
-        self._creation_time = time.time()
-        self._min_display_duration = 5.0  # seconds
-
-        # Window setup
-        width = config.get("width", 500)
-        height = config.get("height", 600)
-
-        self.title(config.get("title", "VoiceMode"))
-        self.geometry(f"{width}x{height}")
-        self.configure(fg_color=colors.window_bg)
-        self.minsize(400, 400)
-
-        # Center window
-        self.update_idletasks()
-        x = (self.winfo_screenwidth() - width) // 2
-        y = (self.winfo_screenheight() - height) // 2 - 50
-        self.geometry(f"{width}x{height}+{x}+{y}")
-
-        # Always on top
-        if config.get("topmost", True):
-            self.wm_attributes("-topmost", True)
-            self.lift()
-            self.focus_force()
-
-        # Close handler
-        self.protocol("WM_DELETE_WINDOW", self._on_dismiss)
-
-        # Layout
-        self.grid_columnconfigure(0, weight=1)
-        self.grid_rowconfigure(1, weight=1)
-
-        # Header
-        header = ctk.CTkFrame(self, fg_color="transparent", height=50)
-        header.grid(row=0, column=0, sticky="ew", padx=20, pady=(16, 10))
-        header.grid_propagate(False)
-
-        ctk.CTkLabel(
-            header,
-            text="✨ VoiceMode Chat",
-            font=FONT_BOLD,
-            text_color=colors.text_primary,
-        ).pack(side="left", anchor="w")
-
-        # Chat area
-        self.chat_area = ctk.CTkScrollableFrame(
-            self,
-            fg_color="transparent",
-            scrollbar_button_color=colors.accent,
-            scrollbar_button_hover_color=colors.accent_hover,
-        )
-        self.chat_area.grid(row=1, column=0, sticky="nsew", padx=10, pady=5)
-
-        # Add history (current session only - no multi-message conversations)
-        if config.get("show_history", True) and history:
-            # Filter to show only the assistant's initial message and user responses
-            # to keep it clean and focused on current session
-            for entry in history[-config.get("history_limit", 3):]:
-                role = entry.get("role", "unknown")
-                content = entry.get("content", "")
-                self._add_message(content, is_user=(role == "user"))
-
-        # Add current message
-        self._add_message(message, is_user=False)
-
-        # Input area
-        if wait_for_response:
-            input_frame = ctk.CTkFrame(self, fg_color="transparent")
-            input_frame.grid(row=2, column=0, sticky="ew", padx=20, pady=(10, 16))
-
-            self.input_field = ctk.CTkTextbox(
-                input_frame,
-                height=60,
-                corner_radius=14,
-                border_width=1.5,
-                border_color=colors.input_border,
-                fg_color=colors.input_bg,
-                text_color=colors.input_fg,
-                font=FONT_MAIN,
-            )
-            self.input_field.pack(fill="both", side="left", expand=True, padx=(0, 12))
-
-            # Send button
-            send_btn = ctk.CTkButton(
-                input_frame,
-                text="→",
-                width=50,
-                height=50,
-                corner_radius=14,
-                fg_color=colors.accent,
-                hover_color=colors.accent_hover,
-                font=("SF Pro Text" if IS_MACOS else "Segoe UI", 20, "bold"),
-                command=self._on_submit,
-            )
-            send_btn.pack(side="right")
-
-            # Keyboard bindings
-            self.input_field.bind("<Return>", self._on_enter)
-            self.input_field.bind("<Shift-Return>", self._on_shift_enter)
-            self.bind("<Escape>", self._on_escape)
-
-            self.input_field.focus_set()
-
-            # Bind text changes to auto-resize input field
-            self.input_field.bind("<<Change>>", self._on_input_change)
-        else:
-            # Non-interactive mode - show dismiss button only
-            footer = ctk.CTkFrame(self, fg_color="transparent", height=50)
-            footer.grid(row=2, column=0, sticky="ew", padx=20, pady=(10, 16))
-
-            ctk.CTkButton(
-                footer,
-                text="Dismiss",
-                corner_radius=12,
-                fg_color=colors.accent,
-                hover_color=colors.accent_hover,
-                font=FONT_MAIN,
-                command=self._on_dismiss,
-            ).pack(side="right")
-
-            # Esc to close
-            self.bind("<Escape>", lambda e: self._on_dismiss())
-
-            # Note: Auto-dismiss after minimum display duration
-
-        # Auto-close handling
-        timeout = config.get("timeout")
-        if timeout:
-            # Schedule timeout, but ensure it respects minimum display duration
-            timeout_ms = int(timeout * 1000)
-            min_display_ms = int(self._min_display_duration * 1000)
-            actual_timeout_ms = max(timeout_ms, min_display_ms)
-            self.after(actual_timeout_ms, self._on_timeout)
-        else:
-            # No explicit timeout, but still auto-close after minimum display duration
-            # Only for non-interactive mode (wait_for_response=False)
-            if not wait_for_response:
-                min_display_ms = int(self._min_display_duration * 1000)
-                self.after(min_display_ms, self._on_timeout)
-
-    def _add_message(self, text, is_user=False):
-        """Add a message bubble to the chat."""
-        container = ctk.CTkFrame(self.chat_area, fg_color="transparent")
-        container.pack(fill="x", pady=8, padx=8)
-
-        if not is_user:
-            # Avatar for assistant
-            avatar_frame = ctk.CTkFrame(container, fg_color="transparent")
-            avatar_frame.pack(side="left", anchor="n", padx=(0, 12))
-
-            ctk.CTkLabel(
-                avatar_frame,
-                text="🤖",
-                font=("SF Pro Text" if IS_MACOS else "Segoe UI", 20),
-            ).pack()
-
-        bubble = MarkdownBubble(
-            container,
-            text,
-            is_user=is_user,
-            colors=self.colors,
-            width=360 if is_user else 380,
+    def __init__(
+        self,
+        command: Optional[list[str]] = None,
+        idle_timeout: float = 600.0,
+        start_timeout: float = 20.0,
+    ):
+        self.command = command or [
+            sys.executable, "-m", "voice_mode.utils.notify_popup_helper",
+            "--idle-timeout", str(idle_timeout),
+        ]
+        self.start_timeout = start_timeout
+        self._process: Optional[subprocess.Popen] = None
+        self._pending: dict[int, queue.Queue] = {}
+        self._exited = threading.Event()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self.starts = 0
+
+    @property
+    def running(self) -> bool:
+        # stdout EOF (seen by the reader) comes before the exit status is reapable
+        return self._process is not None and not self._exited.is_set() and self._process.poll() is None
+
+    def _start(self) -> subprocess.Popen:
+        env = dict(os.environ)
+        package_root = str(Path(__file__).resolve().parents[2])
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+        process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            env=env,
         )
-        bubble.pack(side="right" if is_user else "left", anchor="e" if is_user else "w", padx=5)
-
-        # Scroll to bottom
-        self.after(50, lambda: self.chat_area._parent_canvas.yview_moveto(1.0))
-
-    def _on_submit(self, event=None):
-        global result
-        text = self.input_field.get("1.0", "end-1c").strip()
-        if text:
-            result = {"type": "success", "response": text}
-        else:
-            result = {"type": "empty", "response": ""}
-        self.quit()
-
-    def _on_input_change(self, event=None):
-        """Auto-resize input field based on content."""
-        if not hasattr(self, 'input_field'):
-            return
-
-        # Get line count
-        content = self.input_field.get("1.0", "end-1c")
-        lines = content.count("\\n") + 1
-
-        # Calculate height: min 60, max 200, with 20px per line
-        new_height = min(max(60, lines * 20 + 20), 200)
-
-        # Update height
-        self.input_field.configure(height=new_height)
-
-    def _on_enter(self, event):
-        self._on_submit()
-        return "break"
+        pending: dict[int, queue.Queue] = {}
+        ready: queue.Queue = queue.Queue(1)
+        exited = threading.Event()
+        stderr_tail: list[str] = []
+        threading.Thread(target=self._read_stdout, args=(process, pending, ready, exited), daemon=True).start()
+        threading.Thread(target=self._read_stderr, args=(process, stderr_tail), daemon=True).start()
 
-    def _on_shift_enter(self, event):
-        # Allow default behavior (insert newline)
-        return None
-
-    def _on_escape(self, event=None):
-        global result
-        if self._can_close():
-            result = {"type": "cancelled", "response": None}
-            self.quit()
-
-    def _on_dismiss(self):
-        global result
-        if self._can_close():
-            result = {"type": "dismissed", "response": None}
-            self.quit()
-
-    def _on_timeout(self):
-        global result
-        if self._can_close():
-            result = {"type": "timeout", "response": None}
-            self.quit()
+        try:
+            ok = ready.get(timeout=self.start_timeout)
+        except queue.Empty:
+            ok = False
+        if not ok:
+            process.kill()
+            process.wait()
+            detail = "".join(stderr_tail[-5:]).strip() or f"exit code {process.returncode}"
+            raise PopupHelperUnavailable(f"Popup helper failed to start: {detail}")
+
+        self._process = process
+        self._pending = pending
+        self._exited = exited
+        self.starts += 1
+        logger.debug(f"Popup helper started (pid {process.pid})")
+        return process
+
+    def _read_stdout(self, process: subprocess.Popen, pending: dict, ready: queue.Queue,
+                     exited: threading.Event) -> None:
+        for line in process.stdout:
+            try:
+                message = json.loads(line)
+            except ValueError:
+                logger.debug(f"Popup helper: {line.rstrip()}")
+                continue
+            if message.get("ready"):
+                ready.put(True)
+                continue
+            waiter = pending.get(message.get("id"))
+            if waiter is not None:
+                waiter.put(message)
+            elif message.get("error"):
+                logger.warning(f"Popup helper error: {message['error']}")
+        # Helper exited: idle timeout, crash, or we stopped it
+        exited.set()
+        if ready.empty():
+            ready.put(False)
+        for waiter in list(pending.values()):
+            waiter.put(_CRASHED)
+
+    @staticmethod
+    def _read_stderr(process: subprocess.Popen, tail: list) -> None:
+        for line in process.stderr:
+            tail.append(line)
+            del tail[:-20]
+            logger.debug(f"Popup helper stderr: {line.rstrip()}")
+
+    def request(self, op: str, timeout: Optional[float] = None, retry: bool = True, **payload) -> dict:
+        """Send a request and wait for its answer.
+
+        Args:
+            op: Helper operation (``show``, ``close`` or ``ping``)
+            timeout: Seconds to wait for the answer (None waits forever)
+            retry: Restart the helper and resend once if it dies mid-request
+            **payload: Request fields
+
+        Raises:
+            PopupHelperUnavailable: If the helper cannot be started or keeps dying
+            TimeoutError: If no answer arrives within ``timeout``
+        """
+        for attempt in range(2 if retry else 1):
+            with self._lock:
+                if not self.running:
+                    self._start()
+                request_id = next(self._ids)
+                waiter: queue.Queue = queue.Queue(1)
+                pending = self._pending
+                pending[request_id] = waiter
+                try:
+                    self._process.stdin.write(json.dumps({"id": request_id, "op": op, **payload}) + "\n")
+                    self._process.stdin.flush()
+                except (BrokenPipeError, OSError, ValueError):
+                    waiter.put(_CRASHED)
+            try:
+                reply = waiter.get(timeout=timeout)
+            except queue.Empty:
+                raise TimeoutError(f"Popup helper did not answer {op!r} within {timeout:g}s")
+            finally:
+                pending.pop(request_id, None)
+            if reply is _CRASHED:
+                logger.warning(f"Popup helper exited during {op!r}" + (", restarting" if attempt == 0 and retry else ""))
+                continue
+            if reply.get("error"):
+                raise PopupHelperUnavailable(reply["error"])
+            return reply
+        raise PopupHelperUnavailable(f"Popup helper exited during {op!r}")
+
+    def close_popup(self, result_type: str = "dismissed") -> None:
+        """Close the open popup, if the helper is running."""
+        if self.running:
+            try:
+                self.request("close", timeout=5, retry=False, result_type=result_type)
+            except (PopupHelperUnavailable, TimeoutError) as e:
+                logger.debug(f"Could not close popup: {e}")
+
+    def stop(self) -> None:
+        """Stop the helper; it exits when its stdin closes."""
+        process, self._process = self._process, None
+        if process is None or process.poll() is not None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
 
-    def _can_close(self) -> bool:
-        """Check if minimum display duration has elapsed."""
-        elapsed = time.time() - self._creation_time
-        return elapsed >= self._min_display_duration
 
-    def _auto_close(self):
-        global result
-        result = {"type": "success", "response": None}
-        self.quit()
+_helper: Optional[PopupHelperClient] = None
 
 
-# Run the popup
-app = VoiceModePopup(message, config, history, wait_for_response, colors)
-app.mainloop()
+def get_popup_helper() -> PopupHelperClient:
+    """Return the process-wide popup helper client."""
+    global _helper
+    if _helper is None:
+        from voice_mode.config import NOTIFY_HELPER_IDLE_TIMEOUT
 
-try:
-    app.destroy()
-except Exception:
-    pass
+        _helper = PopupHelperClient(idle_timeout=NOTIFY_HELPER_IDLE_TIMEOUT)
+        atexit.register(_helper.stop)
+    return _helper
 
-print(json.dumps(result))
-'''
 
+def _run_popup(
+    message: str,
+    config: PopupConfig,
+    history: list[dict],
+    wait_for_response: bool,
+) -> NotifyPopupResult:
+    """Show a popup in the resident helper and wait for it to close."""
+    helper = get_popup_helper()
     try:
-        # Log subprocess execution for debugging
-        logger.debug(f"Running popup subprocess with: {sys.executable}")
-
-        process = subprocess.run(
-            [sys.executable, "-c", subprocess_code],
-            input=json.dumps(popup_data),
-            capture_output=True,
-            text=True,
+        reply = helper.request(
+            "show",
             timeout=config.timeout + 10 if config.timeout else 600,
+            message=message,
+            config=asdict(config),
+            history=history,
+            wait_for_response=wait_for_response,
         )
-
-        # Log all subprocess output for debugging
-        if process.stderr:
-            logger.debug(f"Subprocess stderr: {process.stderr}")
-        if process.stdout:
-            logger.debug(f"Subprocess stdout: {process.stdout[:500]}")
-        logger.debug(f"Subprocess return code: {process.returncode}")
-
-        if process.returncode == 0 and process.stdout.strip():
-            result_data = json.loads(process.stdout.strip())
-            return NotifyPopupResult(
-                result_type=result_data.get("type", "dismissed"),
-                response=result_data.get("response"),
-            )
-        else:
-            logger.error(f"Subprocess failed - stderr: {process.stderr}, stdout: {process.stdout}")
-            return NotifyPopupResult(result_type="dismissed", response=None)
-
-    except subprocess.TimeoutExpired:
+        return NotifyPopupResult(
+            result_type=reply.get("type", "dismissed"),
+            response=reply.get("response"),
+        )
+    except TimeoutError:
+        helper.close_popup("timeout")
         return NotifyPopupResult(result_type="timeout", response=None)
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse subprocess output: {e}")
-        return NotifyPopupResult(result_type="dismissed", response=None)
     except Exception as e:
-        logger.error(f"Subprocess popup failed: {e}")
+        logger.error(f"Popup failed: {e}")
         return NotifyPopupResult(result_type="dismissed", response=None)
 
 
-# Global popup management
-_current_popup = None
-_popup_lock = threading.Lock()
-
-
-class NotifyPopup:
-    """Thread-based popup for non-macOS systems."""
-
-    def __init__(
-        self,
-        message: str,
-        config: PopupConfig,
-        history: list[dict],
-        wait_for_response: bool = True,
-    ):
-        self.message = message
-        self.config = config
-        self.history = history or []
-        self.wait_for_response = wait_for_response
-        self.result_queue: queue.Queue[NotifyPopupResult] = queue.Queue()
-        self._thread: Optional[threading.Thread] = None
-        self._closed = False
-
-    def show(self) -> queue.Queue[NotifyPopupResult]:
-        """Show popup in separate thread."""
-        global _current_popup
-
-        with _popup_lock:
-            if _current_popup is not None and _current_popup != self:
-                _current_popup.close(result_type="cancelled")
-            _current_popup = self
-
-        self._thread = threading.Thread(target=self._run_popup, daemon=True)
-        self._thread.start()
-        return self.result_queue
-
-    def close(self, result_type: str = "dismissed", response: Optional[str] = None):
-        """Close the popup."""
-        if self._closed:
-            return
-        self._closed = True
-        self.result_queue.put(NotifyPopupResult(result_type=result_type, response=response))
-
-    def _run_popup(self):
-        """Run the CustomTkinter popup."""
-        # Use subprocess approach even on non-macOS for consistency
-        result = _run_popup_subprocess(
-            self.message,
-            self.config,
-            self.history,
-            self.wait_for_response,
-        )
-        self.result_queue.put(result)
-
-        global _current_popup
-        with _popup_lock:
-            if _current_popup == self:
-                _current_popup = None
-
-
 async def show_popup(
     message: str,
     config: PopupConfig,
@@ -744,11 +396,15 @@ async def show_popup(
     Main entry point for displaying the notify popup.
     """
     loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(
-        None,
-        _run_popup_subprocess,
-        message,
-        config,
-        history or [],
-        wait_for_response,
-    )
+    try:
+        return await loop.run_in_executor(
+            None,
+            _run_popup,
+            message,
+            config,
+            history or [],
+            wait_for_response,
+        )
+    except asyncio.CancelledError:
+        await loop.run_in_executor(None, get_popup_helper().close_popup, "cancelled")
+        raise
@@ -0,0 +1,504 @@
+"""Resident helper process for the notify popup.
+
+Started by ``notify_popup`` with ``python -m voice_mode.utils.notify_popup_helper``.
+It imports CustomTkinter once, keeps a hidden root window alive and shows
+popups as ``CTkToplevel`` windows, so a popup costs a window build rather
+than an interpreter and Tk start-up.
+
+Protocol: JSON lines. The helper prints ``{"ready": true}`` once Tk is up,
+then reads requests from stdin and answers on stdout with the same ``id``:
+
+* ``{"id": 1, "op": "show", "message": ..., "config": {...}, "history": [...],
+  "wait_for_response": true}`` answers when the popup closes with
+  ``{"id": 1, "type": "success", "response": "..."}``. A new ``show``
+  cancels the popup that is still open.
+* ``{"id": 2, "op": "close", "result_type": "cancelled"}`` closes the open
+  popup (which answers its own ``show``) and answers ``{"id": 2, "ok": true}``.
+* ``{"id": 3, "op": "ping"}`` answers ``{"id": 3, "ok": true}``.
+
+The helper exits when stdin closes, or after ``--idle-timeout`` seconds with
+no popup open and no requests.
+
+NOTE: Tk runs on this process's main thread; stdin is read on a background
+thread and handed over through a queue polled with ``after``.
+"""
+
+import argparse
+import json
+import platform
+import queue
+import re
+import sys
+import threading
+import time
+
+from voice_mode.utils.notify_popup import ThemeColors, detect_dark_mode
+
+IS_MACOS = platform.system() == "Darwin"
+POLL_MS = 50
+
+
+class Namespace:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+def get_colors(theme, dark_mode):
+    is_dark = theme == "dark" or (theme == "auto" and dark_mode)
+    return ThemeColors.dark() if is_dark else ThemeColors.light()
+
+
+def get_fonts(font_size):
+    family = "SF Pro Text" if IS_MACOS else "Segoe UI"
+    return Namespace(
+        main=(family, font_size),
+        bold=(family, font_size, "bold"),
+        code=("Menlo" if IS_MACOS else "Consolas", font_size - 1),
+        small=(family, font_size - 2),
+        icon=(family, 20),
+        send=(family, 20, "bold"),
+    )
+
+
+def send(message):
+    sys.stdout.write(json.dumps(message) + "\n")
+    sys.stdout.flush()
+
+
+def build_popup_classes(ctk):
+    """Define the widgets once CustomTkinter has been imported."""
+
+    class MarkdownBubble(ctk.CTkFrame):
+        """Chat bubble with markdown rendering support."""
+
+        def __init__(self, master, text, is_user=False, colors=None, fonts=None, width=380, **kwargs):
+            bg_color = colors.user_bubble_bg if is_user else colors.assistant_bubble_bg
+
+            super().__init__(master, fg_color=bg_color, corner_radius=16, **kwargs)
+
+            self.textbox = ctk.CTkTextbox(
+                self,
+                text_color=colors.user_bubble_fg if is_user else colors.assistant_bubble_fg,
+                fg_color="transparent",
+                font=fonts.main,
+                width=width,
+                wrap="word",
+                activate_scrollbars=False,
+            )
+            self.textbox.pack(padx=14, pady=10)
+
+            # Configure markdown tags
+            self.textbox._textbox.tag_configure(
+                "code",
+                font=fonts.code,
+                background=colors.code_bg,
+                foreground=colors.code_fg,
+                lmargin1=8,
+                lmargin2=8,
+                rmargin=8,
+                spacing1=6,
+                spacing3=6,
+            )
+            self.textbox._textbox.tag_configure("bold", font=fonts.bold)
+            self.textbox._textbox.tag_configure("inline_code", font=fonts.code, background=colors.code_bg, foreground=colors.code_fg)
+
+            self._render_markdown(text)
+            self.textbox.configure(state="disabled")
+
+            # Calculate actual height based on rendered content
+            self._calculate_height(text)
+
+        def _render_markdown(self, text):
+            """Parse and render markdown (code blocks, bold, lists, inline code)."""
+            # Split by code blocks first
+            parts = re.split(r"(```[\s\S]*?```)", text)
+
+            for part in parts:
+                if part.startswith("```") and part.endswith("```"):
+                    # Code block - strip markers and first line (language hint)
+                    code = part[3:-3].strip()
+                    if "\n" in code:
+                        # Remove language hint on first line
+                        first_newline = code.find("\n")
+                        code = code[first_newline + 1:]
+                    self.textbox._textbox.insert("end", "\n" + code + "\n", "code")
+                else:
+                    # Process inline markdown
+                    self._render_inline_markdown(part)
+
+        def _render_inline_markdown(self, text):
+            """Render inline markdown (bold, inline code, lists)."""
+            # Handle lists
+            lines = text.split("\n")
+            for i, line in enumerate(lines):
+                if line.strip().startswith(("- ", "* ", "+ ")):
+                    # Bullet point
+                    self.textbox._textbox.insert("end", "  • " + line[2:].strip())
+                elif re.match(r"^\d+\.", line.strip()):
+                    # Numbered list
+                    self.textbox._textbox.insert("end", "  " + line.strip())
+                else:
+                    # Process inline formatting: bold, inline code
+                    inline_parts = re.split(r"(`[^`]+`|\*\*[^*]+\*\*)", line)
+                    for subpart in inline_parts:
+                        if subpart.startswith("`") and subpart.endswith("`"):
+                            # Inline code
+                            self.textbox._textbox.insert("end", subpart[1:-1], "inline_code")
+                        elif subpart.startswith("**") and subpart.endswith("**"):
+                            # Bold
+                            self.textbox._textbox.insert("end", subpart[2:-2], "bold")
+                        else:
+                            # Plain text
+                            self.textbox._textbox.insert("end", subpart)
+
+                # Add newline except for last line
+                if i < len(lines) - 1:
+                    self.textbox._textbox.insert("end", "\n")
+
+        def _calculate_height(self, text):
+            """Calculate bubble height based on text content."""
+            # Count actual lines in the text
+            lines = text.count("\n") + 1
+
+            # For code blocks and complex formatting, add extra lines
+            has_code_block = "```" in text
+            has_inline_code = "`" in text
+
+            extra_lines = 2 if has_code_block else 0
+            extra_lines += 1 if has_inline_code else 0
+
+            # Calculate height: base 20px per line + padding
+            line_height = 20
+            padding = 20  # Top + bottom padding
+            estimated_height = (lines + extra_lines) * line_height + padding
+
+            # Apply constraints: min 40px, max 400px
+            final_height = max(40, min(estimated_height, 400))
+            self.textbox.configure(height=final_height)
+
+    class VoiceModePopup(ctk.CTkToplevel):
+        """Modern chat-style popup for VoiceMode notifications."""
+
+        def __init__(self, root, request_id, message, config, history, wait_for_response, on_close):
+            super().__init__(root)
+
+            dark_mode = detect_dark_mode()
+            ctk.set_appearance_mode("dark" if dark_mode else "light")
+            colors = get_colors(config.get("theme", "auto"), dark_mode)
+            self.colors = colors
+            self.fonts = get_fonts(config.get("font_size", 14))
+            self.request_id = request_id
+            self.wait_for_response = wait_for_response
+            self._on_close = on_close
+            self._closed = False
+
+            # Minimum display duration (5 seconds)
+            self._creation_time = time.time()
+            self._min_display_duration = 5.0  # seconds
+
+            # Window setup
+            width = config.get("width", 500)
+            height = config.get("height", 600)
+
+            self.title(config.get("title", "VoiceMode"))
+            self.geometry(f"{width}x{height}")
+            self.configure(fg_color=colors.window_bg)
+            self.minsize(400, 400)
+
+            # Center window
+            self.update_idletasks()
+            x = (self.winfo_screenwidth() - width) // 2
+            y = (self.winfo_screenheight() - height) // 2 - 50
+            self.geometry(f"{width}x{height}+{x}+{y}")
+
+            # Always on top
+            if config.get("topmost", True):
+                self.wm_attributes("-topmost", True)
+                self.lift()
+                self.focus_force()
+
+            # Close handler
+            self.protocol("WM_DELETE_WINDOW", self._on_dismiss)
+
+            # Layout
+            self.grid_columnconfigure(0, weight=1)
+            self.grid_rowconfigure(1, weight=1)
+
+            # Header
+            header = ctk.CTkFrame(self, fg_color="transparent", height=50)
+            header.grid(row=0, column=0, sticky="ew", padx=20, pady=(16, 10))
+            header.grid_propagate(False)
+
+            ctk.CTkLabel(
+                header,
+                text="✨ VoiceMode Chat",
+                font=self.fonts.bold,
+                text_color=colors.text_primary,
+            ).pack(side="left", anchor="w")
+
+            # Chat area
+            self.chat_area = ctk.CTkScrollableFrame(
+                self,
+                fg_color="transparent",
+                scrollbar_button_color=colors.accent,
+                scrollbar_button_hover_color=colors.accent_hover,
+            )
+            self.chat_area.grid(row=1, column=0, sticky="nsew", padx=10, pady=5)
+
+            # Add history (current session only - no multi-message conversations)
+            if config.get("show_history", True) and history:
+                for entry in history[-config.get("history_limit", 3):]:
+                    role = entry.get("role", "unknown")
+                    content = entry.get("content", "")
+                    self._add_message(content, is_user=(role == "user"))
+
+            # Add current message
+            self._add_message(message, is_user=False)
+
+            # Input area
+            if wait_for_response:
+                input_frame = ctk.CTkFrame(self, fg_color="transparent")
+                input_frame.grid(row=2, column=0, sticky="ew", padx=20, pady=(10, 16))
+
+                self.input_field = ctk.CTkTextbox(
+                    input_frame,
+                    height=60,
+                    corner_radius=14,
+                    border_width=1.5,
+                    border_color=colors.input_border,
+                    fg_color=colors.input_bg,
+                    text_color=colors.input_fg,
+                    font=self.fonts.main,
+                )
+                self.input_field.pack(fill="both", side="left", expand=True, padx=(0, 12))
+
+                # Send button
+                send_btn = ctk.CTkButton(
+                    input_frame,
+                    text="→",
+                    width=50,
+                    height=50,
+                    corner_radius=14,
+                    fg_color=colors.accent,
+                    hover_color=colors.accent_hover,
+                    font=self.fonts.send,
+                    command=self._on_submit,
+                )
+                send_btn.pack(side="right")
+
+                # Keyboard bindings
+                self.input_field.bind("<Return>", self._on_enter)
+                self.input_field.bind("<Shift-Return>", self._on_shift_enter)
+                self.bind("<Escape>", self._on_escape)
+
+                self.input_field.focus_set()
+
+                # Bind text changes to auto-resize input field
+                self.input_field.bind("<<Change>>", self._on_input_change)
+            else:
+                # Non-interactive mode - show dismiss button only
+                footer = ctk.CTkFrame(self, fg_color="transparent", height=50)
+                footer.grid(row=2, column=0, sticky="ew", padx=20, pady=(10, 16))
+
+                ctk.CTkButton(
+                    footer,
+                    text="Dismiss",
+                    corner_radius=12,
+                    fg_color=colors.accent,
+                    hover_color=colors.accent_hover,
+                    font=self.fonts.main,
+                    command=self._on_dismiss,
+                ).pack(side="right")
+
+                # Esc to close
+                self.bind("<Escape>", lambda e: self._on_dismiss())
+
+            # Auto-close handling
+            timeout = config.get("timeout")
+            min_display_ms = int(self._min_display_duration * 1000)
+            if timeout:
+                # Schedule timeout, but ensure it respects minimum display duration
+                self.after(max(int(timeout * 1000), min_display_ms), self._on_timeout)
+            elif not wait_for_response:
+                # No explicit timeout: non-interactive popups close after the minimum duration
+                self.after(min_display_ms, self._on_timeout)
+
+        def _add_message(self, text, is_user=False):
+            """Add a message bubble to the chat."""
+            container = ctk.CTkFrame(self.chat_area, fg_color="transparent")
+            container.pack(fill="x", pady=8, padx=8)
+
+            if not is_user:
+                # Avatar for assistant
+                avatar_frame = ctk.CTkFrame(container, fg_color="transparent")
+                avatar_frame.pack(side="left", anchor="n", padx=(0, 12))
+
+                ctk.CTkLabel(avatar_frame, text="🤖", font=self.fonts.icon).pack()
+
+            bubble = MarkdownBubble(
+                container,
+                text,
+                is_user=is_user,
+                colors=self.colors,
+                fonts=self.fonts,
+                width=360 if is_user else 380,
+            )
+            bubble.pack(side="right" if is_user else "left", anchor="e" if is_user else "w", padx=5)
+
+            # Scroll to bottom
+            self.after(50, lambda: self.chat_area._parent_canvas.yview_moveto(1.0))
+
+        def finish(self, result_type, response=None):
+            """Answer the show request and destroy the window."""
+            if self._closed:
+                return
+            self._closed = True
+            send({"id": self.request_id, "type": result_type, "response": response})
+            try:
+                self.destroy()
+            except Exception:
+                pass
+            self._on_close(self)
+
+        def _on_submit(self, event=None):
+            text = self.input_field.get("1.0", "end-1c").strip()
+            if text:
+                self.finish("success", text)
+            else:
+                self.finish("empty", "")
+
+        def _on_input_change(self, event=None):
+            """Auto-resize input field based on content."""
+            if not hasattr(self, "input_field"):
+                return
+            content = self.input_field.get("1.0", "end-1c")
+            lines = content.count("\n") + 1
+            # Calculate height: min 60, max 200, with 20px per line
+            self.input_field.configure(height=min(max(60, lines * 20 + 20), 200))
+
+        def _on_enter(self, event):
+            self._on_submit()
+            return "break"
+
+        def _on_shift_enter(self, event):
+            # Allow default behavior (insert newline)
+            return None
+
+        def _on_escape(self, event=None):
+            if self._can_close():
+                self.finish("cancelled")
+
+        def _on_dismiss(self):
+            if self._can_close():
+                self.finish("dismissed")
+
+        def _on_timeout(self):
+            if self._can_close():
+                self.finish("timeout")
+
+        def _can_close(self) -> bool:
+            """Check if minimum display duration has elapsed."""
+            return time.time() - self._creation_time >= self._min_display_duration
+
+    return VoiceModePopup
+
+
+class PopupHelper:
+    """Hidden Tk root serving popup requests from stdin."""
+
+    def __init__(self, idle_timeout):
+        import customtkinter as ctk
+
+        self.idle_timeout = idle_timeout
+        self.requests = queue.Queue()
+        self.popup = None
+        self.last_activity = time.monotonic()
+        self.root = ctk.CTk()
+        self.root.withdraw()
+        self.popup_class = build_popup_classes(ctk)
+
+    def read_stdin(self):
+        for line in sys.stdin:
+            line = line.strip()
+            if line:
+                self.requests.put(line)
+        self.requests.put(None)  # parent went away
+
+    def poll(self):
+        while True:
+            try:
+                line = self.requests.get_nowait()
+            except queue.Empty:
+                break
+            if line is None:
+                self.root.quit()
+                return
+            self.last_activity = time.monotonic()
+            self.handle(line)
+
+        if self.popup is None and self.idle_timeout and time.monotonic() - self.last_activity > self.idle_timeout:
+            self.root.quit()
+            return
+        self.root.after(POLL_MS, self.poll)
+
+    def handle(self, line):
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            op = request.get("op")
+        except (ValueError, AttributeError) as e:
+            send({"id": None, "error": f"invalid request: {e}"})
+            return
+
+        try:
+            if op == "show":
+                if self.popup is not None:
+                    self.popup.finish("cancelled")
+                self.popup = self.popup_class(
+                    self.root,
+                    request_id,
+                    request.get("message", ""),
+                    request.get("config") or {},
+                    request.get("history") or [],
+                    request.get("wait_for_response", True),
+                    self._popup_closed,
+                )
+            elif op == "close":
+                if self.popup is not None:
+                    self.popup.finish(request.get("result_type", "dismissed"), request.get("response"))
+                send({"id": request_id, "ok": True})
+            elif op == "ping":
+                send({"id": request_id, "ok": True})
+            else:
+                send({"id": request_id, "error": f"unknown op: {op}"})
+        except Exception as e:
+            send({"id": request_id, "error": f"{type(e).__name__}: {e}"})
+
+    def _popup_closed(self, popup):
+        if self.popup is popup:
+            self.popup = None
+        self.last_activity = time.monotonic()
+
+    def run(self):
+        threading.Thread(target=self.read_stdin, daemon=True).start()
+        send({"ready": True})
+        self.root.after(POLL_MS, self.poll)
+        self.root.mainloop()
+        if self.popup is not None:
+            self.popup.finish("dismissed")
+        try:
+            self.root.destroy()
+        except Exception:
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VoiceMode notify popup helper")
+    parser.add_argument("--idle-timeout", type=float, default=600.0,
+                        help="Exit after this many idle seconds (0 = never)")
+    args = parser.parse_args()
+    PopupHelper(args.idle_timeout).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,41 +1,90 @@
 """Common utilities for service management tools."""
 
-import psutil
-import socket
-from typing import Optional, Tuple
+import asyncio
 import logging
+import socket
+import time
+from typing import Dict, List, Optional, Tuple
+
+import psutil
 
 logger = logging.getLogger("voicemode")
 
 
-def find_process_by_port(port: int) -> Optional[psutil.Process]:
+# Seconds a port -> PID map is reused; status checks for several services
+# (and repeated checks within one command) share a single scan
+PORT_MAP_TTL = 1.0
+
+_port_map: Dict[int, List[int]] = {}
+_port_map_time = float("-inf")
+
+
+def _scan_listening_ports() -> Dict[int, List[int]]:
+    """Map every listening TCP port to the PIDs listening on it."""
+    ports: Dict[int, List[int]] = {}
+    try:
+        # One system-wide call instead of one per process
+        for conn in psutil.net_connections(kind="inet"):
+            if conn.status == psutil.CONN_LISTEN and conn.pid:
+                pids = ports.setdefault(conn.laddr.port, [])
+                if conn.pid not in pids:
+                    pids.append(conn.pid)
+        return ports
+    except psutil.AccessDenied:
+        # macOS needs root for the system-wide table; fall back to asking each
+        # process, still in a single pass for all ports
+        pass
+    for proc in psutil.process_iter(["pid"]):
+        try:
+            for conn in proc.net_connections(kind="inet"):
+                if conn.status == psutil.CONN_LISTEN:
+                    pids = ports.setdefault(conn.laddr.port, [])
+                    if proc.pid not in pids:
+                        pids.append(proc.pid)
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            continue
+    return ports
+
+
+def listening_ports(max_age: float = PORT_MAP_TTL) -> Dict[int, List[int]]:
+    """Listening TCP ports and their PIDs, from a scan at most ``max_age`` seconds old.
+
+    Args:
+        max_age: Reuse the previous scan if it is younger than this (0 forces a new scan)
+    """
+    global _port_map, _port_map_time
+    now = time.monotonic()
+    if now - _port_map_time >= max_age:
+        _port_map = _scan_listening_ports()
+        _port_map_time = now
+    return _port_map
+
+
+def invalidate_port_map() -> None:
+    """Forget the cached scan, e.g. after starting or stopping a service."""
+    global _port_map_time
+    _port_map_time = float("-inf")
+
+
+def find_process_by_port(port: int, max_age: float = PORT_MAP_TTL) -> Optional[psutil.Process]:
     """Find a process listening on the specified port.
     
     Returns None if port is only accessible via SSH forwarding or other non-local means.
+    
+    Args:
+        port: TCP port to look up
+        max_age: Maximum age in seconds of the port scan to use (0 forces a new scan)
     """
     try:
-        for proc in psutil.process_iter(['pid', 'name']):
+        for pid in listening_ports(max_age).get(port, []):
             try:
-                # Skip if we can't access process info (might be another user's process)
-                if not proc.is_running():
-                    continue
-                
+                proc = psutil.Process(pid)
                 # Skip SSH processes - these are port forwards, not actual services
-                proc_name = proc.name().lower()
-                if proc_name in ['ssh', 'sshd']:
+                if proc.name().lower() in ['ssh', 'sshd']:
                     continue
-                    
-                for conn in proc.net_connections():
-                    if conn.laddr.port == port and conn.status == 'LISTEN':
-                        # Verify this is a real local process
-                        try:
-                            # Try to access basic process info to ensure it's real
-                            _ = proc.pid
-                            _ = proc.create_time()
-                            return proc
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            # Process doesn't actually exist or we can't access it
-                            continue
+                # Verify this is a real local process
+                _ = proc.create_time()
+                return proc
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 continue
     except Exception as e:
@@ -77,4 +126,22 @@ def check_service_status(port: int) -> Tuple[str, Optional[psutil.Process]]:
         return ("forwarded", None)
     
     # Not accessible at all
-    return ("not_available", None)
\ No newline at end of file
+    return ("not_available", None)
+
+
+async def probe_services(ports: Dict[str, int]) -> Dict[str, Tuple[str, Optional[psutil.Process]]]:
+    """check_service_status() for several services at once.
+
+    The port map is built once for all of them, and ports without a local
+    process are probed for forwarding concurrently.
+
+    Args:
+        ports: Port of each service, by service name
+
+    Returns:
+        (status, process) tuple for each service, as check_service_status()
+    """
+    await asyncio.to_thread(listening_ports)
+    return dict(zip(ports, await asyncio.gather(
+        *(asyncio.to_thread(check_service_status, port) for port in ports.values())
+    )))
@@ -0,0 +1,203 @@
+"""Readiness probing for the local Whisper and Kokoro services.
+
+A service counts as ready once its /health endpoint answers 200 *and* a tiny
+inference succeeds (half a second of silence for Whisper, one word for
+Kokoro). Besides proving the model is loaded, that inference is the warm-up:
+the first real request no longer pays for lazy initialisation inside the
+server. Probes back off from 100ms to 2s between attempts.
+
+``watch_readiness()`` runs a probe (optionally after launching the service)
+as a background task that ``wait_for_services()`` - used by converse - and
+``start_service`` both wait on, so nothing relies on fixed sleeps.
+"""
+
+import asyncio
+import io
+import logging
+import subprocess
+import time
+import wave
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from voice_mode.config import KOKORO_DEFAULT_VOICE, KOKORO_PORT, SERVICE_READY_TIMEOUT
+from voice_mode.utils.lazy import lazy_import
+
+httpx = lazy_import("httpx")
+
+logger = logging.getLogger("voicemode")
+
+INITIAL_DELAY = 0.1
+MAX_DELAY = 2.0
+BACKOFF = 1.5
+
+_watches: Dict[str, asyncio.Task] = {}
+
+
+def silent_wav(seconds: float = 0.5) -> io.BytesIO:
+    """A short silent 16-bit mono WAV, enough to make whisper load its model."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(b"\x00\x00" * int(16000 * seconds))
+    buffer.seek(0)
+    buffer.name = "warmup.wav"
+    return buffer
+
+
+def service_roots(service_name: str) -> List[str]:
+    """Root URLs of a local service (every instance of a Whisper pool)."""
+    if service_name == "whisper":
+        from voice_mode.whisper_pool import pool_base_urls
+        return [url[:-len("/v1")] for url in pool_base_urls()]
+    if service_name == "kokoro":
+        return [f"http://127.0.0.1:{KOKORO_PORT}"]
+    raise ValueError(f"No readiness probe for {service_name}")
+
+
+async def _warm_inference(client, service_name: str, root: str) -> None:
+    if service_name == "whisper":
+        response = await client.post(
+            f"{root}/v1/audio/transcriptions",
+            files={"file": ("warmup.wav", silent_wav(), "audio/wav")},
+            data={"model": "whisper-1", "response_format": "text"},
+        )
+    else:
+        response = await client.post(
+            f"{root}/v1/audio/speech",
+            json={"model": "tts-1", "input": "Hi.", "voice": KOKORO_DEFAULT_VOICE, "response_format": "pcm"},
+        )
+    response.raise_for_status()
+
+
+async def _probe_instance(client, service_name: str, root: str, warm: bool, deadline: float,
+                          process: Optional[subprocess.Popen]) -> Dict[str, Any]:
+    start = time.perf_counter()
+    result: Dict[str, Any] = {"root": root, "ready": False, "attempts": 0, "health_s": None,
+                              "warm_ms": None, "error": None}
+    delay = INITIAL_DELAY
+    while True:
+        if process is not None and process.poll() is not None:
+            result["error"] = f"process exited with code {process.returncode}"
+            return result
+        result["attempts"] += 1
+        try:
+            if result["health_s"] is None:
+                response = await client.get(f"{root}/health")
+                if response.status_code != 200:
+                    # whisper-server answers 503 while it loads the model
+                    raise RuntimeError(f"health returned HTTP {response.status_code}")
+                result["health_s"] = round(time.perf_counter() - start, 2)
+            if warm:
+                warm_start = time.perf_counter()
+                await _warm_inference(client, service_name, root)
+                result["warm_ms"] = round((time.perf_counter() - warm_start) * 1000, 1)
+            result["ready"] = True
+            result["error"] = None
+            return result
+        except Exception as e:
+            result["error"] = str(e) or type(e).__name__
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return result
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * BACKOFF, MAX_DELAY)
+
+
+async def wait_until_ready(
+    service_name: str,
+    timeout: Optional[float] = None,
+    warm: bool = True,
+    process: Optional[subprocess.Popen] = None,
+    roots: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Wait until every instance of a service is healthy and has served an inference.
+
+    Args:
+        service_name: "whisper" or "kokoro"
+        timeout: Seconds to wait (default: VOICEMODE_SERVICE_READY_TIMEOUT)
+        warm: Run the tiny inference, not just the health check
+        process: Process that was just launched; its exit ends the wait early
+        roots: Root URLs to probe (default: service_roots())
+
+    Returns:
+        Dict with ``ready``, ``elapsed_s``, per-instance results and the
+        first ``error`` (None when ready)
+    """
+    timeout = SERVICE_READY_TIMEOUT if timeout is None else timeout
+    roots = roots or service_roots(service_name)
+    start = time.perf_counter()
+    deadline = time.monotonic() + timeout
+    # Model inference can take a while on a cold CPU
+    async with httpx.AsyncClient(timeout=httpx.Timeout(max(timeout, 1.0), connect=2.0)) as client:
+        instances = await asyncio.gather(*(
+            _probe_instance(client, service_name, root, warm, deadline, process) for root in roots
+        ))
+    ready = all(i["ready"] for i in instances)
+    result = {
+        "service": service_name,
+        "ready": ready,
+        "elapsed_s": round(time.perf_counter() - start, 2),
+        "instances": instances,
+        "error": None if ready else next(i["error"] for i in instances if not i["ready"]),
+    }
+    if ready:
+        logger.info(f"{service_name.capitalize()} ready in {result['elapsed_s']:.1f}s")
+    else:
+        logger.warning(f"{service_name.capitalize()} not ready after {result['elapsed_s']:.1f}s: {result['error']}")
+    return result
+
+
+def watch_readiness(
+    service_name: str,
+    launch: Optional[Callable[[], Awaitable[Optional[subprocess.Popen]]]] = None,
+    timeout: Optional[float] = None,
+) -> asyncio.Task:
+    """Probe a service in the background; a watch already running is reused.
+
+    Args:
+        service_name: "whisper" or "kokoro"
+        launch: Coroutine function that starts the service first, returning
+            the process it launched (if any)
+        timeout: Seconds to wait for readiness
+
+    Returns:
+        Task resolving to the wait_until_ready() result
+    """
+    loop = asyncio.get_running_loop()
+    task = _watches.get(service_name)
+    if task is not None and not task.done() and task.get_loop() is loop:
+        return task
+
+    async def watch():
+        process = await launch() if launch else None
+        return await wait_until_ready(service_name, timeout=timeout, process=process)
+
+    task = _watches[service_name] = loop.create_task(watch(), name=f"voicemode-ready-{service_name}")
+    return task
+
+
+async def wait_for_services(names: Iterable[str], timeout: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+    """Wait for readiness watches still in progress.
+
+    Services nobody is starting are not waited for, so this costs nothing
+    once startup is over.
+
+    Returns:
+        Readiness results by service name, for the watches that were pending
+    """
+    timeout = SERVICE_READY_TIMEOUT if timeout is None else timeout
+    pending = {name: task for name in names
+               if (task := _watches.get(name)) is not None and not task.done()}
+    if not pending:
+        return {}
+    logger.info(f"Waiting for {', '.join(pending)} to become ready")
+    done, _ = await asyncio.wait([asyncio.shield(t) for t in pending.values()], timeout=timeout)
+    results = {}
+    for name, task in pending.items():
+        if task.done() and not task.cancelled() and task.exception() is None:
+            results[name] = task.result()
+        else:
+            results[name] = {"service": name, "ready": False, "error": "still starting"}
+    return results
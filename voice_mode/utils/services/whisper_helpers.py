@@ -112,17 +112,20 @@ async def download_whisper_model(
             "message": "Model already exists"
         }
     
+    from voice_mode.tools.whisper.models import WHISPER_MODEL_REGISTRY
+
     # Download directly from Hugging Face with progress bar
     model_url = f"https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-{model}.bin"
 
     logger.info(f"Downloading model: {model}")
 
     try:
-        # Download with progress bar
+        # Download with progress bar; resumes a previous partial download
         success = await download_with_progress_async(
             url=model_url,
             destination=model_path,
-            description=f"Downloading Whisper model {model}"
+            description=f"Downloading Whisper model {model}",
+            sha256=WHISPER_MODEL_REGISTRY.get(model, {}).get("sha256")
         )
 
         if not success:
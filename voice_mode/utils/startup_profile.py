@@ -0,0 +1,194 @@
+"""Measure how long the MCP server takes to become ready.
+
+``voicemode --profile-startup`` launches a fresh interpreter with
+``python -X importtime``, imports ``voice_mode.server`` and runs the same
+initialisation ``main()`` does (without starting stdio), then reports the
+per-module import breakdown and time-to-ready.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+# Modules the server defers until the first tool call needs them
+DEFERRED_MODULES = (
+    "numpy", "scipy", "sounddevice", "pydub", "openai", "httpx", "webrtcvad",
+)
+
+_MARKER = "VOICEMODE_STARTUP_PROFILE "
+
+# initialize_server() side effects turned off in the child so profiling
+# neither collides with a running server (metrics port and textfile) nor
+# writes real logs (event log, log archiving, trace-level debug log)
+_QUIET_ENV = {
+    "VOICEMODE_METRICS_FILE": "",
+    "VOICEMODE_METRICS_PORT": "0",
+    "VOICEMODE_SAVE_ALL": "false",
+    "VOICEMODE_EVENT_LOG_ENABLED": "false",
+    "VOICEMODE_LOG_ARCHIVE_DAYS": "0",
+    "VOICEMODE_DEBUG": "false",
+}
+
+_PROBE = f"""
+import json, sys, time
+start = time.perf_counter()
+from voice_mode import server
+imported = time.perf_counter()
+server.initialize_server()
+ready = time.perf_counter()
+print({_MARKER!r} + json.dumps({{
+    "import_seconds": imported - start,
+    "setup_seconds": ready - imported,
+    "deferred_loaded": [m for m in {DEFERRED_MODULES!r} if m in sys.modules],
+}}), flush=True)
+"""
+
+
+@dataclass
+class ImportRecord:
+    """One line of ``-X importtime`` output (times in microseconds)."""
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class StartupProfile:
+    """Result of a startup profiling run."""
+    wall_seconds: float
+    import_seconds: float
+    setup_seconds: float
+    imports: List[ImportRecord] = field(default_factory=list)
+    deferred_loaded: List[str] = field(default_factory=list)
+
+    @property
+    def interpreter_seconds(self) -> float:
+        """Interpreter start-up and process overhead outside our code."""
+        return max(0.0, self.wall_seconds - self.import_seconds - self.setup_seconds)
+
+    def by_package(self) -> Dict[str, float]:
+        """Sum self import time per top-level package, in seconds."""
+        totals: Dict[str, float] = defaultdict(float)
+        for record in self.imports:
+            totals[record.name.split(".")[0]] += record.self_us / 1e6
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def parse_importtime(text: str) -> List[ImportRecord]:
+    """Parse ``python -X importtime`` stderr output.
+
+    Args:
+        text: Captured stderr; non-importtime lines are ignored
+
+    Returns:
+        Import records in the order Python reported them
+    """
+    records = []
+    for line in text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # the header line
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        records.append(ImportRecord(name.strip(), self_us, cumulative_us, depth))
+    return records
+
+
+def profile_startup(python: Optional[str] = None, timeout: float = 120.0) -> StartupProfile:
+    """Start a fresh interpreter, initialise the server and time it.
+
+    Metrics export, event logging and log archiving are disabled in the
+    child, so the run leaves a running server and its logs alone.
+
+    Args:
+        python: Interpreter to use (default: the current one)
+        timeout: Seconds to wait for the child process
+
+    Returns:
+        StartupProfile with timings and the import breakdown
+
+    Raises:
+        RuntimeError: If the child process failed before becoming ready
+    """
+    env = dict(os.environ)
+    env.update(_QUIET_ENV)
+    start = time.perf_counter()
+    result = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", _PROBE],
+        capture_output=True,
+        text=True,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        timeout=timeout,
+    )
+    wall = time.perf_counter() - start
+
+    summary = None
+    for line in result.stdout.splitlines():
+        if line.startswith(_MARKER):
+            summary = json.loads(line[len(_MARKER):])
+    if summary is None:
+        errors = [l for l in result.stderr.splitlines() if not l.startswith("import time:")]
+        detail = "\n".join(errors[-10:]) or f"exit code {result.returncode}"
+        raise RuntimeError(f"Server failed to start:\n{detail}")
+
+    return StartupProfile(
+        wall_seconds=wall,
+        import_seconds=summary["import_seconds"],
+        setup_seconds=summary["setup_seconds"],
+        imports=parse_importtime(result.stderr),
+        deferred_loaded=summary["deferred_loaded"],
+    )
+
+
+def format_profile(profile: StartupProfile, top: int = 15) -> str:
+    """Render a startup profile as a text report.
+
+    Args:
+        profile: Result of profile_startup()
+        top: Number of packages and modules to list
+
+    Returns:
+        Multi-line report
+    """
+    phases = [
+        ("Interpreter start-up", profile.interpreter_seconds),
+        ("Import voice_mode.server", profile.import_seconds),
+        ("Server initialisation", profile.setup_seconds),
+        ("Time to ready", profile.wall_seconds),
+    ]
+    lines = ["VoiceMode startup profile", "=" * 50]
+    for label, seconds in phases:
+        lines.append(f"  {label + ':':<32} {seconds * 1000:8.1f} ms")
+    lines += ["", f"Import time by package (top {top}, self time):"]
+    for package, seconds in list(profile.by_package().items())[:top]:
+        lines.append(f"  {package:<32} {seconds * 1000:8.1f} ms")
+
+    own = sorted(
+        (r for r in profile.imports if r.name.startswith("voice_mode")),
+        key=lambda r: r.self_us,
+        reverse=True,
+    )[:top]
+    if own:
+        lines += ["", f"Slowest voice_mode modules (top {top}, self time):"]
+        for record in own:
+            lines.append(f"  {record.name:<32} {record.self_us / 1000:8.1f} ms")
+
+    lines.append("")
+    if profile.deferred_loaded:
+        lines.append(f"Deferred modules imported at startup: {', '.join(profile.deferred_loaded)}")
+    else:
+        lines.append("Deferred audio modules: none imported at startup")
+    return "\n".join(lines)
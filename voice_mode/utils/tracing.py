@@ -0,0 +1,451 @@
+"""
+Lightweight tracing spans for the voice pipeline.
+
+A span times one stage of a converse turn (TTS request, decode, playback,
+recording, STT upload, ...). Spans nest through a context variable, carry a
+few attributes (endpoint, bytes, format) and are appended as JSON lines to a
+size-rotated file under ``~/.voicemode/logs/traces``. The file can be
+exported to the Chrome trace event format or to OTLP-JSON, both of which
+Perfetto (https://ui.perfetto.dev) opens directly.
+
+Tracing is off unless ``VOICEMODE_TRACING`` is set; when it is off ``span()``
+returns a shared no-op object, so instrumented code pays one function call.
+
+Example:
+    with span("tts.request", endpoint=base_url, format="pcm") as s:
+        data = await fetch()
+        s.set(bytes=len(data))
+"""
+
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+logger = logging.getLogger("voicemode.tracing")
+
+# Name of the active span file; rotated copies get .1, .2, ... (1 is newest)
+SPAN_FILE = "spans.jsonl"
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "voicemode_current_span", default=None
+)
+
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+def _clean_value(value: Any) -> Any:
+    """Keep attribute values to the scalar types both export formats support."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    return str(value)
+
+
+class Span:
+    """A timed stage. Created by ``span()``, not directly."""
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "start_ns", "duration_ns",
+        "thread_id", "status", "attributes", "events", "_start_perf",
+    )
+
+    def __init__(self, name: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = parent.trace_id if parent is not None else _new_id(128)
+        self.span_id = _new_id(64)
+        self.parent_id = parent.span_id if parent is not None else None
+        self.thread_id = threading.get_ident()
+        self.status = "ok"
+        self.attributes = {k: _clean_value(v) for k, v in attributes.items()}
+        self.events: List[Dict[str, Any]] = []
+        self.duration_ns: Optional[int] = None
+        # Wall clock anchors the span in time; the duration comes from the
+        # monotonic clock so NTP adjustments can't produce negative spans
+        self.start_ns = time.time_ns()
+        self._start_perf = time.perf_counter_ns()
+
+    def set(self, **attributes: Any) -> None:
+        """Add or overwrite attributes."""
+        for key, value in attributes.items():
+            self.attributes[key] = _clean_value(value)
+
+    def event(self, name: str, **attributes: Any) -> None:
+        """Record an instant event inside this span (e.g. "speech_start")."""
+        offset = time.perf_counter_ns() - self._start_perf
+        self.events.append({
+            "name": name,
+            "time_ns": self.start_ns + offset,
+            "attributes": {k: _clean_value(v) for k, v in attributes.items()},
+        })
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for the span file."""
+        result = {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "duration_ns": self.duration_ns,
+            "pid": os.getpid(),
+            "tid": self.thread_id,
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+        if self.events:
+            result["events"] = self.events
+        return result
+
+
+class _NoopSpan:
+    """Stand-in returned while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+    def event(self, name: str, **attributes: Any) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class _SpanContext:
+    """Context manager that opens a span and hands it to the tracer on exit."""
+
+    __slots__ = ("_tracer", "_span", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: Dict[str, Any]):
+        self._tracer = tracer
+        self._span = Span(name, _current_span.get(), attributes)
+        self._token = None
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        span = self._span
+        span.duration_ns = time.perf_counter_ns() - span._start_perf
+        if exc_type is not None:
+            span.status = "error"
+            span.attributes["error"] = exc_type.__name__
+        try:
+            _current_span.reset(self._token)
+        except ValueError:
+            # Exited from a different context (e.g. a generator finalized
+            # elsewhere); the span is still recorded
+            pass
+        self._tracer.record(span)
+        return False
+
+
+class Tracer:
+    """Collects finished spans and appends them to a rotating JSONL file.
+
+    Spans are buffered until their root span finishes, so a whole turn is
+    written with a single write call instead of one per stage.
+
+    Args:
+        trace_dir: Directory for the span file
+        enabled: Whether spans are recorded
+        max_bytes: Rotate the span file once it would exceed this size
+        backup_count: Number of rotated files to keep
+    """
+
+    def __init__(self, trace_dir: Union[str, Path], enabled: bool = True,
+                 max_bytes: int = 10 * 1024 * 1024, backup_count: int = 3):
+        self.trace_dir = Path(trace_dir)
+        self.enabled = enabled
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.path = self.trace_dir / SPAN_FILE
+        self._pending: List[str] = []
+        self._lock = threading.Lock()
+
+    def record(self, span: Span) -> None:
+        """Queue a finished span, writing the batch when a root span ends."""
+        line = json.dumps(span.to_dict(), separators=(",", ":"))
+        with self._lock:
+            self._pending.append(line)
+            if span.parent_id is None:
+                self._write_pending()
+
+    def flush(self) -> None:
+        """Write any spans still waiting for their root span."""
+        with self._lock:
+            self._write_pending()
+
+    def _write_pending(self) -> None:
+        if not self._pending:
+            return
+        data = "\n".join(self._pending) + "\n"
+        self._pending.clear()
+        try:
+            self.trace_dir.mkdir(parents=True, exist_ok=True)
+            self._maybe_rotate(len(data))
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(data)
+        except OSError as e:
+            logger.warning(f"Failed to write trace spans: {e}")
+
+    def _maybe_rotate(self, incoming: int) -> None:
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            return
+        if size == 0 or size + incoming <= self.max_bytes:
+            return
+        if self.backup_count <= 0:
+            self.path.unlink()
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            older = self.path.with_name(f"{SPAN_FILE}.{index}")
+            if older.exists():
+                os.replace(older, self.path.with_name(f"{SPAN_FILE}.{index + 1}"))
+        os.replace(self.path, self.path.with_name(f"{SPAN_FILE}.1"))
+
+
+_tracer: Optional[Tracer] = None
+_tracer_initialized = False
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Return the process tracer, creating it from config on first use.
+
+    Returns:
+        The tracer, or None if tracing is disabled
+    """
+    global _tracer, _tracer_initialized
+    if not _tracer_initialized:
+        from voice_mode.config import TRACE_BACKUPS, TRACE_DIR, TRACE_MAX_BYTES, TRACING_ENABLED
+        if TRACING_ENABLED:
+            _tracer = Tracer(TRACE_DIR, max_bytes=TRACE_MAX_BYTES, backup_count=TRACE_BACKUPS)
+            logger.info(f"Tracing enabled, writing spans to {_tracer.path}")
+        _tracer_initialized = True
+    return _tracer
+
+
+def set_tracer(tracer: Optional[Tracer]) -> Optional[Tracer]:
+    """Install a tracer (or None to disable tracing) and return the previous one."""
+    global _tracer, _tracer_initialized
+    previous = _tracer
+    _tracer = tracer
+    _tracer_initialized = True
+    return previous
+
+
+def span(name: str, **attributes: Any) -> Union[_SpanContext, _NoopSpan]:
+    """Open a tracing span around a block.
+
+    Args:
+        name: Dotted stage name, e.g. "tts.request"
+        **attributes: Initial attributes (endpoint, bytes, format, ...)
+
+    Returns:
+        Context manager yielding the span (a no-op when tracing is off)
+    """
+    tracer = _tracer if _tracer_initialized else get_tracer()
+    if tracer is None or not tracer.enabled:
+        return NOOP_SPAN
+    return _SpanContext(tracer, name, attributes)
+
+
+def current_span() -> Union[Span, _NoopSpan]:
+    """Return the innermost open span, or the no-op span."""
+    active = _current_span.get()
+    return active if active is not None else NOOP_SPAN
+
+
+def traced(name: Optional[str] = None, **attributes: Any) -> Callable:
+    """Decorator that wraps each call of a sync or async function in a span.
+
+    Args:
+        name: Span name (defaults to the function's qualified name)
+        **attributes: Static attributes added to every span
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(span_name, **attributes):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name, **attributes):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def bind(func: Callable) -> Callable:
+    """Carry the current span into another thread.
+
+    ``loop.run_in_executor`` does not copy context variables, so spans
+    opened in the worker would otherwise start a new trace.
+
+    Example:
+        await loop.run_in_executor(None, bind(record), duration)
+    """
+    return functools.partial(contextvars.copy_context().run, func)
+
+
+# ==================== EXPORT ====================
+
+def span_files(trace_dir: Union[str, Path]) -> List[Path]:
+    """List span files oldest first (highest rotation index first)."""
+    trace_dir = Path(trace_dir)
+    rotated = []
+    for path in trace_dir.glob(f"{SPAN_FILE}.*"):
+        suffix = path.name[len(SPAN_FILE) + 1:]
+        if suffix.isdigit():
+            rotated.append((int(suffix), path))
+    files = [path for _, path in sorted(rotated, reverse=True)]
+    current = trace_dir / SPAN_FILE
+    if current.exists():
+        files.append(current)
+    return files
+
+
+def iter_spans(trace_dir: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """Yield recorded spans oldest first, skipping malformed lines."""
+    for path in span_files(trace_dir):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.debug(f"Skipping malformed span line in {path}")
+
+
+def last_traces(spans: Iterable[Dict[str, Any]], count: int) -> List[Dict[str, Any]]:
+    """Keep only the spans of the last ``count`` traces (turns)."""
+    spans = list(spans)
+    order: Dict[str, int] = {}
+    for record in spans:
+        order.setdefault(record["trace_id"], len(order))
+    keep = {trace_id for trace_id, index in order.items() if index >= len(order) - count}
+    return [record for record in spans if record["trace_id"] in keep]
+
+
+def to_chrome_trace(spans: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert spans to the Chrome trace event format.
+
+    Spans become complete ("X") events and span events become thread-scoped
+    instant ("i") events. Timestamps are microseconds.
+    """
+    events = []
+    pids = set()
+    for record in spans:
+        pid, tid = record.get("pid", 0), record.get("tid", 0)
+        pids.add(pid)
+        args = dict(record.get("attributes") or {})
+        args["trace_id"] = record["trace_id"]
+        args["span_id"] = record["span_id"]
+        if record.get("status") == "error":
+            args["status"] = "error"
+        events.append({
+            "name": record["name"],
+            "cat": record["name"].split(".", 1)[0],
+            "ph": "X",
+            "ts": record["start_ns"] / 1000,
+            "dur": (record.get("duration_ns") or 0) / 1000,
+            "pid": pid,
+            "tid": tid,
+            "args": args,
+        })
+        for event in record.get("events") or ():
+            events.append({
+                "name": event["name"],
+                "cat": record["name"].split(".", 1)[0],
+                "ph": "i",
+                "s": "t",
+                "ts": event["time_ns"] / 1000,
+                "pid": pid,
+                "tid": tid,
+                "args": event.get("attributes") or {},
+            })
+    for pid in sorted(pids):
+        events.append({"name": "process_name", "ph": "M", "pid": pid,
+                       "args": {"name": f"voicemode ({pid})"}})
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # OTLP-JSON encodes 64-bit integers as strings
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": "" if value is None else str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+def to_otlp_json(spans: Iterable[Dict[str, Any]], service_name: str = "voicemode") -> Dict[str, Any]:
+    """Convert spans to an OTLP-JSON ``ExportTraceServiceRequest``."""
+    otlp_spans = []
+    for record in spans:
+        start = record["start_ns"]
+        end = start + (record.get("duration_ns") or 0)
+        otlp_span = {
+            "traceId": record["trace_id"],
+            "spanId": record["span_id"],
+            "name": record["name"],
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(start),
+            "endTimeUnixNano": str(end),
+            "attributes": _otlp_attributes(record.get("attributes") or {}),
+            "status": {"code": 2} if record.get("status") == "error" else {"code": 0},
+        }
+        if record.get("parent_id"):
+            otlp_span["parentSpanId"] = record["parent_id"]
+        if record.get("events"):
+            otlp_span["events"] = [
+                {
+                    "timeUnixNano": str(event["time_ns"]),
+                    "name": event["name"],
+                    "attributes": _otlp_attributes(event.get("attributes") or {}),
+                }
+                for event in record["events"]
+            ]
+        otlp_spans.append(otlp_span)
+
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": _otlp_attributes({"service.name": service_name})},
+            "scopeSpans": [{
+                "scope": {"name": "voice_mode.tracing"},
+                "spans": otlp_spans,
+            }],
+        }]
+    }
@@ -0,0 +1,228 @@
+"""Background warm-up so the first converse call is as fast as later ones.
+
+The first turn after a server start pays for opening HTTP connections,
+initialising PortAudio, rendering the chimes and - for local services - the
+model load inside Kokoro or whisper.cpp. With ``VOICEMODE_WARMUP=true`` the
+server runs those steps in a background task as soon as it starts.
+
+Each step runs twice: the first (cold) run does the real work and the second
+(warm) run shows what a later turn costs, so the event log records how much
+the warm-up saved. The task never takes the audio lock and nothing waits for
+it, so a converse call that arrives early simply runs alongside it;
+``cancel_warmup()`` stops it at the next await.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Optional
+
+from .config import (
+    OPENAI_API_KEY,
+    SAMPLE_RATE,
+    STT_BASE_URLS,
+    TTS_BASE_URLS,
+    TTS_MODELS,
+    TTS_VOICES,
+    WARMUP_TIMEOUT,
+)
+from .provider_discovery import detect_provider_type, is_local_provider
+from .utils.event_logger import EventLogger, get_event_logger
+from .utils.services.readiness import silent_wav
+
+logger = logging.getLogger("voicemode")
+
+_warmup_task: Optional[asyncio.Task] = None
+_results: List["WarmupStep"] = []
+
+
+@dataclass
+class WarmupStep:
+    """Timings for one warm-up step (milliseconds)."""
+    name: str
+    status: str = "ok"  # ok, error, timeout
+    cold_ms: Optional[float] = None
+    warm_ms: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def delta_ms(self) -> Optional[float]:
+        """Time the warm-up saved a later call of the same step."""
+        if self.cold_ms is None or self.warm_ms is None:
+            return None
+        return self.cold_ms - self.warm_ms
+
+    def to_dict(self) -> dict:
+        """Event-log payload for this step."""
+        return {
+            "step": self.name,
+            "status": self.status,
+            "cold_ms": _round(self.cold_ms),
+            "warm_ms": _round(self.warm_ms),
+            "delta_ms": _round(self.delta_ms),
+            "error": self.error,
+        }
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value, 1)
+
+
+def _endpoint_client(base_url: str):
+    from .simple_failover import get_endpoint_client
+
+    api_key = OPENAI_API_KEY if detect_provider_type(base_url) == "openai" else (OPENAI_API_KEY or "dummy-key-for-local")
+    return get_endpoint_client(base_url, api_key, 0 if is_local_provider(base_url) else 2)
+
+
+async def _warm_connections() -> None:
+    """Open the pooled connections to the primary TTS and STT endpoints."""
+    for base_url in dict.fromkeys(urls[0] for urls in (TTS_BASE_URLS, STT_BASE_URLS) if urls):
+        try:
+            await _endpoint_client(base_url).models.list()
+        except Exception as e:
+            # Not every server implements /models; the connection is open anyway
+            logger.debug(f"Warm-up: {base_url}/models failed: {e}")
+
+
+async def _warm_devices() -> None:
+    """Initialise PortAudio and enumerate audio devices."""
+    def probe():
+        import sounddevice as sd
+        sd.query_devices()
+        return sd.default.device
+
+    await asyncio.get_running_loop().run_in_executor(None, probe)
+
+
+async def _warm_chimes() -> None:
+    """Render the start and end chimes into the chime cache."""
+    from .core import generate_chime
+
+    def render():
+        generate_chime([800, 1000], duration=0.1, sample_rate=SAMPLE_RATE)
+        generate_chime([1000, 800], duration=0.1, sample_rate=SAMPLE_RATE)
+
+    await asyncio.get_running_loop().run_in_executor(None, render)
+
+
+async def _warm_tts() -> None:
+    """Synthesise a single word so the local TTS model is loaded."""
+    client = _endpoint_client(TTS_BASE_URLS[0])
+    await client.audio.speech.create(
+        model=TTS_MODELS[0] if TTS_MODELS else "tts-1",
+        voice=TTS_VOICES[0] if TTS_VOICES else "af_sky",
+        input="Hi.",
+        response_format="pcm",
+    )
+
+
+async def _warm_stt() -> None:
+    """Transcribe half a second of silence so the local STT model is loaded."""
+    client = _endpoint_client(STT_BASE_URLS[0])
+    await client.audio.transcriptions.create(
+        model="whisper-1",
+        file=silent_wav(),
+        response_format="text",
+    )
+
+
+def _default_steps() -> List[tuple]:
+    steps = [
+        ("connections", _warm_connections),
+        ("devices", _warm_devices),
+        ("chimes", _warm_chimes),
+    ]
+    # Model priming only helps local services; remote ones are already warm
+    # and a request there would cost money
+    if TTS_BASE_URLS and is_local_provider(TTS_BASE_URLS[0]):
+        steps.append(("tts", _warm_tts))
+    if STT_BASE_URLS and is_local_provider(STT_BASE_URLS[0]):
+        steps.append(("stt", _warm_stt))
+    return steps
+
+
+async def _run_step(name: str, step: Callable[[], Awaitable[None]], timeout: float) -> WarmupStep:
+    result = WarmupStep(name)
+    try:
+        for attempt in ("cold_ms", "warm_ms"):
+            start = time.perf_counter()
+            await asyncio.wait_for(step(), timeout)
+            setattr(result, attempt, (time.perf_counter() - start) * 1000)
+    except asyncio.TimeoutError:
+        result.status = "timeout"
+        result.error = f"no response within {timeout:g}s"
+    except Exception as e:
+        result.status = "error"
+        result.error = str(e) or type(e).__name__
+    return result
+
+
+async def run_warmup(steps: Optional[List[tuple]] = None, timeout: Optional[float] = None) -> List[WarmupStep]:
+    """Run the warm-up steps in order and log their cold/warm timings.
+
+    Args:
+        steps: ``(name, coroutine function)`` pairs (default: connections,
+            devices, chimes, and tts/stt for local primary endpoints)
+        timeout: Seconds allowed per run of a step (default: VOICEMODE_WARMUP_TIMEOUT)
+
+    Returns:
+        One WarmupStep per step, also available from get_warmup_results()
+    """
+    timeout = WARMUP_TIMEOUT if timeout is None else timeout
+    event_logger = get_event_logger()
+    start = time.perf_counter()
+    _results.clear()
+
+    for name, step in steps if steps is not None else _default_steps():
+        result = await _run_step(name, step, timeout)
+        _results.append(result)
+        if result.status == "ok":
+            logger.info(f"Warm-up {name}: cold {result.cold_ms:.0f}ms, warm {result.warm_ms:.0f}ms")
+        else:
+            logger.info(f"Warm-up {name} {result.status}: {result.error}")
+        if event_logger:
+            event_logger.log_event(EventLogger.WARMUP_STEP, result.to_dict())
+
+    total_ms = (time.perf_counter() - start) * 1000
+    if event_logger:
+        event_logger.log_event(EventLogger.WARMUP_COMPLETE, {
+            "total_ms": _round(total_ms),
+            "cold_ms": _round(sum(r.cold_ms or 0 for r in _results)),
+            "warm_ms": _round(sum(r.warm_ms or 0 for r in _results)),
+            "delta_ms": _round(sum(r.delta_ms or 0 for r in _results)),
+            "failed": [r.name for r in _results if r.status != "ok"],
+        })
+    logger.info(f"Warm-up finished in {total_ms:.0f}ms")
+    return list(_results)
+
+
+def start_warmup(steps: Optional[List[tuple]] = None) -> asyncio.Task:
+    """Start the warm-up in the background; repeated calls return the same task.
+
+    Must be called from a running event loop.
+    """
+    global _warmup_task
+    loop = asyncio.get_running_loop()
+    if _warmup_task is None or _warmup_task.get_loop() is not loop:
+        _warmup_task = loop.create_task(run_warmup(steps), name="voicemode-warmup")
+    return _warmup_task
+
+
+def cancel_warmup() -> bool:
+    """Cancel the warm-up task if it is still running.
+
+    Returns:
+        True if a running task was cancelled
+    """
+    if _warmup_task is None or _warmup_task.done():
+        return False
+    _warmup_task.cancel()
+    logger.debug("Warm-up cancelled")
+    return True
+
+
+def get_warmup_results() -> List[WarmupStep]:
+    """Results of the steps the warm-up has finished so far."""
+    return list(_results)
@@ -0,0 +1,221 @@
+"""
+Client-side load balancing across a pool of local whisper.cpp servers.
+
+With VOICEMODE_WHISPER_INSTANCES=N the Whisper service runs N servers on
+consecutive ports starting at VOICEMODE_WHISPER_PORT, each with its share of
+the CPU cores. A single whisper-server handles one request at a time, so the
+STT path sends each request to the instance expected to answer first: the
+fewest requests in flight, weighted by its recent latency. An instance that
+fails is skipped for a short cooldown and then tried again.
+
+In-flight counts are per process; latency also reflects load from other
+VoiceMode processes sharing the pool, since queued requests take longer.
+"""
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+from . import config
+from .utils.lazy import lazy_import
+
+httpx = lazy_import("httpx")
+
+logger = logging.getLogger("voicemode")
+
+# Weight of the newest latency sample in the moving average
+LATENCY_SMOOTHING = 0.3
+# Seconds a failed instance is skipped before it is tried again
+FAILURE_COOLDOWN = 10.0
+
+_LOCAL_HOSTS = {"127.0.0.1", "localhost", "0.0.0.0", "::1"}
+
+
+class WhisperInstance:
+    """Load and health bookkeeping for one whisper-server."""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.in_flight = 0
+        self.cost: Optional[float] = None  # smoothed seconds per byte (or per request)
+        self.requests = 0
+        self.failures = 0
+        self.down_until = 0.0
+
+    def expected_wait(self, default_cost: float) -> float:
+        """Time until a new request would finish, in units of ``cost``."""
+        return (self.in_flight + 1) * (self.cost if self.cost is not None else default_cost)
+
+
+class WhisperPool:
+    """Least-busy selection across whisper-server instances."""
+
+    def __init__(self, base_urls: List[str]):
+        self.instances = {url: WhisperInstance(url) for url in base_urls}
+        self._lock = threading.Lock()
+
+    @property
+    def base_urls(self) -> List[str]:
+        return list(self.instances)
+
+    def __contains__(self, base_url: str) -> bool:
+        return base_url in self.instances
+
+    def ranked(self) -> List[str]:
+        """Instance URLs, the one expected to answer first leading.
+
+        Instances in their failure cooldown come last, so a request still
+        reaches them when nothing else is up.
+        """
+        now = time.monotonic()
+        with self._lock:
+            known = [i.cost for i in self.instances.values() if i.cost is not None]
+            # Untried instances look as fast as the average, so they get used
+            default_cost = sum(known) / len(known) if known else 0.0
+            order = sorted(
+                enumerate(self.instances.values()),
+                key=lambda item: (item[1].down_until > now, item[1].expected_wait(default_cost),
+                                  item[1].in_flight, item[0]),
+            )
+        return [instance.base_url for _, instance in order]
+
+    def pick(self) -> str:
+        """URL of the instance to send the next request to."""
+        return self.ranked()[0]
+
+    @contextmanager
+    def track(self, base_url: str, size: Optional[int] = None) -> Iterator[None]:
+        """Count a request against an instance and record how it went.
+
+        Args:
+            base_url: Instance the request goes to (untracked if not in the pool)
+            size: Request size in bytes, so latency is compared per byte of audio
+        """
+        instance = self.instances.get(base_url)
+        if instance is None:
+            yield
+            return
+        with self._lock:
+            instance.in_flight += 1
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            with self._lock:
+                instance.failures += 1
+                instance.down_until = time.monotonic() + FAILURE_COOLDOWN
+            logger.debug(f"Whisper instance {base_url} failed; skipping it for {FAILURE_COOLDOWN:.0f}s")
+            raise
+        else:
+            elapsed = time.perf_counter() - start
+            cost = elapsed / size if size else elapsed
+            with self._lock:
+                instance.requests += 1
+                instance.down_until = 0.0
+                instance.cost = cost if instance.cost is None else (
+                    LATENCY_SMOOTHING * cost + (1 - LATENCY_SMOOTHING) * instance.cost)
+        finally:
+            with self._lock:
+                instance.in_flight -= 1
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Per-instance counters for status output."""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {"base_url": i.base_url, "in_flight": i.in_flight, "requests": i.requests,
+                 "failures": i.failures, "cooling_down": i.down_until > now}
+                for i in self.instances.values()
+            ]
+
+
+def pool_base_urls(port: Optional[int] = None, instances: Optional[int] = None) -> List[str]:
+    """Base URLs of the local Whisper instances."""
+    port = config.WHISPER_PORT if port is None else port
+    instances = config.WHISPER_INSTANCES if instances is None else instances
+    return [f"http://127.0.0.1:{port + i}/v1" for i in range(max(1, instances))]
+
+
+def instance_threads(instances: Optional[int] = None) -> int:
+    """Threads each whisper-server gets.
+
+    VOICEMODE_WHISPER_THREADS applies per instance when set; otherwise a pool
+    splits the CPU cores evenly and a single server uses 8 threads.
+    """
+    instances = config.WHISPER_INSTANCES if instances is None else instances
+    if os.getenv("VOICEMODE_WHISPER_THREADS"):
+        return config.WHISPER_THREADS
+    if instances <= 1:
+        return 8
+    return max(1, (os.cpu_count() or 1) // instances)
+
+
+_pool: Optional[WhisperPool] = None
+
+
+def get_whisper_pool() -> Optional[WhisperPool]:
+    """The shared pool, or None when only one Whisper instance is configured."""
+    global _pool
+    if config.WHISPER_INSTANCES <= 1:
+        return None
+    urls = pool_base_urls()
+    if _pool is None or _pool.base_urls != urls:
+        _pool = WhisperPool(urls)
+    return _pool
+
+
+def _is_pool_primary(base_url: str) -> bool:
+    parts = urlsplit(base_url)
+    return parts.hostname in _LOCAL_HOSTS and parts.port == config.WHISPER_PORT
+
+
+def expand_stt_endpoints(base_urls: List[str]) -> List[str]:
+    """Replace the local Whisper endpoint with the pool instances, best first.
+
+    Args:
+        base_urls: Configured STT endpoints (VOICEMODE_STT_BASE_URLS)
+
+    Returns:
+        Endpoints to try in order; unchanged when there is no pool
+    """
+    pool = get_whisper_pool()
+    if pool is None:
+        return list(base_urls)
+    endpoints: List[str] = []
+    for url in base_urls:
+        for candidate in (pool.ranked() if _is_pool_primary(url) else [url]):
+            if candidate not in endpoints:
+                endpoints.append(candidate)
+    return endpoints
+
+
+async def check_instances(base_urls: Optional[List[str]] = None, timeout: float = 2.0) -> List[Dict[str, Any]]:
+    """Query each instance's /health endpoint.
+
+    Returns:
+        One dict per instance with ``base_url``, ``port``, ``healthy``,
+        ``latency_ms`` and ``error`` (None when healthy)
+    """
+    import asyncio
+
+    async def check(client, base_url: str) -> Dict[str, Any]:
+        root = base_url[:-3] if base_url.endswith("/v1") else base_url.rstrip("/")
+        result = {"base_url": base_url, "port": urlsplit(base_url).port, "healthy": False,
+                  "latency_ms": None, "error": None}
+        start = time.perf_counter()
+        try:
+            response = await client.get(f"{root}/health")
+            result["latency_ms"] = round((time.perf_counter() - start) * 1000, 1)
+            result["healthy"] = response.status_code == 200
+            if not result["healthy"]:
+                result["error"] = f"HTTP {response.status_code}"
+        except Exception as e:
+            result["error"] = str(e) or type(e).__name__
+        return result
+
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        return list(await asyncio.gather(*(check(client, url) for url in base_urls or pool_base_urls())))